@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Measure cold start to the first dispatch() with OCI and ADW stubbed out.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.cold_start --route file --route stream --runs 5
+
+Every run starts a fresh interpreter, imports the dispatcher and dispatches one
+small synthetic request. Object Storage downloads and the ADW connection are
+stubbed by an import hook right after their modules load, so the
+real import cost of ``oci``, ``oracledb`` and the ETL modules stays in the
+measurement while no network or database is touched.
+
+Only the standard library may be imported at module level here: anything
+imported before the timer starts would be missing from the measurement.
+"""
+
+import argparse
+import base64
+import importlib.abc
+import importlib.machinery
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+from benchmarks.stubs import StubConnection, stub_adw_connection
+
+ROUTES = ("file", "file_to_ts", "stream", "stream_to_ts", "audit")
+CONFIG = {
+    "DFA_ADW_CONNECTION_SECRET_OCID": "ocid1.vaultsecret.oc1..benchmark",
+    "DFA_CONN_PROTOCOL": "tcps",
+    "DFA_CONN_HOST": "adb.example.com",
+    "DFA_CONN_PORT": "1522",
+    "DFA_CONN_SERVICE_NAME": "benchmark_high",
+    "DFA_CONN_RETRY_COUNT": "1",
+    "DFA_CONN_RETRY_DELAY": "1",
+    "DFA_SIGNER_TYPE": "resource",
+    "DFA_COMPARTMENT_ID": "ocid1.compartment.oc1..benchmark",
+    "DFA_NAMESPACE": "benchmark",
+    "DFA_STREAM_ID": "ocid1.stream.oc1..benchmark",
+    "DFA_STREAM_SERVICE_ENDPOINT": "https://streaming.example.com",
+    "DFA_VAULT_ID": "ocid1.vault.oc1..benchmark",
+}
+HEADERS = {
+    "eventTime": "2025-08-15T17:38:23.645616585Z",
+    "eventTypeVersion": "1.0",
+    "operation": "CREATE",
+    "messageType": "RESOURCE",
+    "tenancyId": "tenant-1",
+    "serviceInstanceId": "svc-1",
+    "correlationId": "snapshot-1",
+}
+AUDIT_HEADERS = {**HEADERS, "messageType": "AUDIT_EVENTS"}
+
+
+def _rows(row_count):
+    return [{"id": f"resource-{index}", "name": f"Resource {index}", "targetId": "t-1"} for index in range(row_count)]
+
+
+def build_snapshot_object(row_count):
+    return "\n".join(json.dumps(row) for row in [{"headers": HEADERS}, *_rows(row_count)]).encode("utf-8")
+
+
+def build_stream_messages(row_count, headers=HEADERS):
+    value = json.dumps({"headers": headers, "data": json.dumps(_rows(row_count))}).encode("utf-8")
+    # Connector Hub double base64-encodes stream values.
+    return [{"value": base64.b64encode(base64.b64encode(value)).decode("ascii")}]
+
+
+def build_request(route, row_count):
+    if route in ("file", "file_to_ts"):
+        return {
+            "data": {
+                "resourceName": "snapshots/resource.snapshot-1.batch-1.jsonl",
+                "additionalDetails": {"bucketName": "benchmark", "namespace": "benchmark"},
+            }
+        }
+    return build_stream_messages(row_count, AUDIT_HEADERS if route == "audit" else HEADERS)
+
+
+class _StubAfterImport(importlib.abc.MetaPathFinder):
+    """Apply a stub to a module as soon as it has executed."""
+
+    def __init__(self, stubs):
+        self.stubs = stubs
+
+    def find_spec(self, fullname, path, target=None):
+        stub = self.stubs.get(fullname)
+        if stub is None:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        exec_module = spec.loader.exec_module
+
+        def exec_and_stub(module):
+            exec_module(module)
+            stub(module)
+
+        spec.loader.exec_module = exec_and_stub
+        return spec
+
+
+def install_stubs(snapshot_object):
+    connection = StubConnection()
+
+    def stub_connection(module):
+        stub_adw_connection(module.AdwConnection, connection)
+
+    def stub_storage(module):
+        def download(self, namespace, bucket_name, object_name):
+            data = SimpleNamespace(content=snapshot_object, raw=io.BytesIO(snapshot_object))
+            return SimpleNamespace(data=data, headers={"etag": "benchmark"})
+
+        module.BaseObjectStorage.download = download
+
+    sys.meta_path.insert(
+        0,
+        _StubAfterImport({"dfa.adw.connection": stub_connection, "common.ocihelpers.storage": stub_storage}),
+    )
+
+
+class _Context:
+    def __init__(self, route):
+        self.config = {**CONFIG, "DFA_FUNCTION_NAME": route}
+
+    def Config(self):
+        return self.config
+
+    def SetResponseHeaders(self, headers, status_code):
+        pass
+
+
+def run_child(route, row_count):
+    request = json.dumps(build_request(route, row_count)).encode("utf-8")
+    install_stubs(build_snapshot_object(row_count))
+    # Normally derived from the connection secret, which the stub never fetches.
+    os.environ.setdefault("DFA_ADW_DFA_SCHEMA", "DFA")
+    os.environ.setdefault("DFA_SECRET_PREFETCH", "false")
+    modules_before = len(sys.modules)
+
+    started = perf_counter()
+    import handlers.dispatcher as dispatcher  # pylint: disable=import-outside-toplevel
+
+    imported = perf_counter()
+    result = dispatcher.dispatch(_Context(route), io.BytesIO(request))
+    dispatched = perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "route": route,
+                "status_code": result.status_code,
+                "dispatcher_import_seconds": imported - started,
+                "first_dispatch_seconds": dispatched - imported,
+                "total_seconds": dispatched - started,
+                "modules_imported": len(sys.modules) - modules_before,
+            }
+        )
+    )
+
+
+def measure(route, runs, row_count):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, ["src", os.getenv("PYTHONPATH")]))}
+    samples = []
+    for _ in range(runs):
+        started = perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cold_start", "--child", route, "--rows", str(row_count)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        sample["process_seconds"] = perf_counter() - started
+        samples.append(sample)
+
+    summary = {"route": route, "runs": runs, "status_code": samples[-1]["status_code"]}
+    summary["modules_imported"] = samples[-1]["modules_imported"]
+    for key in ("dispatcher_import_seconds", "first_dispatch_seconds", "total_seconds", "process_seconds"):
+        summary[key] = round(statistics.median(sample[key] for sample in samples), 4)
+    return summary
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--route", action="append", choices=ROUTES, help="Route to measure; repeatable.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per route; the median is reported.")
+    parser.add_argument("--rows", type=int, default=10, help="Rows in the synthetic request.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--child", choices=ROUTES, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.child:
+        run_child(args.child, args.rows)
+        return
+
+    results = [measure(route, args.runs, args.rows) for route in args.route or ROUTES]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'route':<14}{'status':>8}{'modules':>9}{'import s':>10}{'dispatch s':>12}{'total s':>10}{'process s':>11}")
+    for result in results:
+        print(
+            f"{result['route']:<14}{result['status_code']:>8}{result['modules_imported']:>9}"
+            f"{result['dispatcher_import_seconds']:>10}{result['first_dispatch_seconds']:>12}"
+            f"{result['total_seconds']:>10}{result['process_seconds']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Compare download + parse time for snapshot objects across file formats.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.file_formats --rows 200000 --bandwidth-mbps 200
+
+Objects are synthetic RESOURCE snapshot batches. Download time is modelled from
+the object size and the given bandwidth; parse time is measured by running the
+bytes through FileTransformer's extract path.
+"""
+
+import argparse
+import gzip
+import io
+import json
+from time import perf_counter
+from types import SimpleNamespace
+
+from dfa.etl.file_transformer import FileTransformer, zstandard
+
+
+def build_snapshot_rows(row_count):
+    return [
+        {
+            "id": f"ocid1.resource.oc1..{index:012d}",
+            "name": f"Resource {index}",
+            "displayName": f"Synthetic resource {index}",
+            "targetId": f"ocid1.orchestratedsystem.oc1..{index % 50:06d}",
+            "type": "Group" if index % 3 else "Role",
+            "description": "Generated for the file format benchmark",
+            "attributes": {"owner": f"user-{index % 997}", "risk": index % 5},
+        }
+        for index in range(row_count)
+    ]
+
+
+def build_jsonl(rows):
+    headers = {
+        "eventTime": "2025-08-15T17:38:23.645616585Z",
+        "eventTypeVersion": "1.0",
+        "operation": "CREATE",
+        "messageType": "RESOURCE",
+        "tenancyId": "tenant-1",
+        "serviceInstanceId": "svc-1",
+        "correlationId": "snapshot-1",
+    }
+    return "\n".join(json.dumps(row) for row in [{"headers": headers}, *rows]).encode("utf-8")
+
+
+def build_formats(rows):
+    jsonl = build_jsonl(rows)
+    formats = {
+        ".jsonl": jsonl,
+        ".jsonl.gz": gzip.compress(jsonl, compresslevel=6),
+    }
+    if zstandard is not None:
+        formats[".jsonl.zst"] = zstandard.ZstdCompressor(level=3).compress(jsonl)
+    return formats
+
+
+def parse_object(suffix, payload):
+    transformer = FileTransformer.__new__(FileTransformer)
+    transformer._object_name = f"snapshots/resource.snapshot-1.batch-1{suffix}"
+    transformer._reset_extracted_state()
+    event_data = SimpleNamespace(data=SimpleNamespace(content=payload, raw=io.BytesIO(payload)))
+    return sum(1 for _ in transformer._iter_raw_events(event_data))
+
+
+def run(row_count, bandwidth_mbps, repeat):
+    rows = build_snapshot_rows(row_count)
+    formats = build_formats(rows)
+    plain_size = len(formats[".jsonl"])
+    results = []
+    for suffix, payload in formats.items():
+        parse_seconds = []
+        for _ in range(repeat):
+            started = perf_counter()
+            parsed_rows = parse_object(suffix, payload)
+            parse_seconds.append(perf_counter() - started)
+        download_seconds = len(payload) * 8 / (bandwidth_mbps * 1_000_000)
+        best_parse = min(parse_seconds)
+        results.append(
+            {
+                "format": suffix,
+                "rows": parsed_rows,
+                "bytes": len(payload),
+                "ratio": round(plain_size / len(payload), 2),
+                "download_seconds": round(download_seconds, 4),
+                "parse_seconds": round(best_parse, 4),
+                "total_seconds": round(download_seconds + best_parse, 4),
+            }
+        )
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Rows per synthetic snapshot object.")
+    parser.add_argument("--bandwidth-mbps", type=float, default=200.0, help="Modelled download bandwidth.")
+    parser.add_argument("--repeat", type=int, default=3, help="Parse repetitions; the best run is reported.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = run(args.rows, args.bandwidth_mbps, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'format':<12}{'rows':>10}{'bytes':>14}{'ratio':>8}{'download s':>12}{'parse s':>10}{'total s':>10}")
+    for result in results:
+        print(
+            f"{result['format']:<12}{result['rows']:>10}{result['bytes']:>14}{result['ratio']:>8}"
+            f"{result['download_seconds']:>12}{result['parse_seconds']:>10}{result['total_seconds']:>10}"
+        )
+    if zstandard is None:
+        print("zstandard is not installed; .jsonl.zst was skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,453 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Synthetic Data Feed payloads for benchmarks.
+
+Records follow the shape of real Access Governance exports for every entity
+accepted by ``AbstractTransformer.is_valid_object_type``. Ids are derived from
+the record index, so the same arguments always produce the same bytes.
+``FanOut`` controls the nested lists that turn one raw event into many rows.
+"""
+
+import base64
+import json
+from dataclasses import dataclass
+
+TENANCY_ID = "ocid1.tenancy.oc1..benchmark"
+SERVICE_INSTANCE_ID = "benchmark-service-instance"
+EVENT_TIME = "2025-08-15T17:38:23.645616Z"
+TIMESTAMP_MS = 1754593991312
+TARGET_COUNT = 8
+
+
+@dataclass(frozen=True)
+class FanOut:
+    target_identities_per_identity: int = 3
+    rules_per_policy: int = 4
+    subjects_per_cloud_policy: int = 3
+    resources_per_mapping: int = 20
+    members_per_cloud_group: int = 10
+    permissions_per_assignment: int = 5
+
+
+def _guid(kind, index):
+    return f"{kind}-{index:08x}-0000-4000-8000-{index:012x}"
+
+
+def _target_id(index):
+    return _guid("target", index % TARGET_COUNT)
+
+
+def _global_identity_id(index):
+    return f"globalId.ICF.{_target_id(index)}.{index:032x}"
+
+
+def _target_identity_id(index, position):
+    return f"targetId.account.ICF.{_target_id(index + position)}.{index:024x}{position:08x}"
+
+
+def _ref(index, resource_type):
+    return {
+        "displayName": f"Owner {index % 97}",
+        "resourceType": resource_type,
+        "value": _global_identity_id(index % 97),
+    }
+
+
+def _audit_fields(index, resource_type):
+    return {
+        "createdBy": _global_identity_id(index % 97),
+        "createdByRef": _ref(index, resource_type),
+        "createdOn": TIMESTAMP_MS,
+        "updatedBy": _global_identity_id(index % 97),
+        "updatedByRef": _ref(index, resource_type),
+        "updatedOn": TIMESTAMP_MS,
+        "agManaged": True,
+        "owner": {"displayName": f"Owner {index % 97}", "value": _global_identity_id(index % 97)},
+        "ownerShipCollectionId": _guid("ownership", index % 53),
+    }
+
+
+def identity(index, fan_out):
+    user_name = f"USER{index:07d}"
+    return {
+        "globalIdentity": {
+            "id": _global_identity_id(index),
+            "identity": {
+                "addresses": [{"country": "US"}],
+                "agRisk": {"value": index % 10},
+                "agStatus": "AG_ACTIVE",
+                "agSubType": "WORKFORCE",
+                "agOrganizations": [],
+                "customAttributes": {"isCorrelated": True, "fullDN": f"CN={user_name},OU=employees,DC=example,DC=com"},
+                "displayName": user_name,
+                "emails": [{"value": f"{user_name.lower()}@example.com"}],
+                "location": "US",
+                "name": {"familyName": f"Family{index}", "givenName": f"Given{index}"},
+                "primaryEmail": f"{user_name.lower()}@example.com",
+                "status": "Active",
+                "userName": user_name,
+            },
+            "targetIdentities": [
+                {
+                    "targetId": _target_id(index + position),
+                    "externalId": f"{index:016x}{position:016x}",
+                    "id": _target_identity_id(index, position),
+                    "identity": {
+                        "customAttributes": {"commonName": user_name, "company": "Example", "country": "US"},
+                        "name": {},
+                        "primaryEmail": f"{user_name.lower()}@example.com",
+                        "status": "true",
+                    },
+                }
+                for position in range(fan_out.target_identities_per_identity)
+            ],
+        }
+    }
+
+
+def resource(index, fan_out):
+    return {
+        "id": f"resource.{_target_id(index)}.{index}.{index:032x}",
+        "externalId": str(index),
+        "targetId": _target_id(index),
+        "tenancyId": TENANCY_ID,
+        "resourceName": f"Resource {index}",
+        "resourceType": "Application" if index % 3 else "Badge",
+        "description": f"Synthetic resource {index}",
+    }
+
+
+def orchestrated_system(index, fan_out):
+    return {
+        "id": _target_id(index) if index < TARGET_COUNT else _guid("target", index),
+        "externalId": f"external-{index}",
+        "name": f"orchestrated-system-{index}",
+        "type": "ICF",
+        "state": "ACTIVE",
+        "schedule": "every 24 hrs",
+        "createdBy": "Benchmark Owner",
+        "updatedBy": "Benchmark Owner",
+        "timeCreated": TIMESTAMP_MS,
+        "timeUpdated": TIMESTAMP_MS,
+        "targetMode": "AUTHORITATIVE",
+        "ownershipCollectionId": _guid("ownership", index % 53),
+        "primaryOwner": "Benchmark Owner",
+    }
+
+
+def cloud_group(index, fan_out):
+    target_id = _target_id(index)
+    return {
+        "id": f"group.OCI.{target_id}.{index:032x}",
+        "domainId": f"resource.OCI.{target_id}.domain",
+        "compartmentId": f"resource.OCI.{target_id}.compartment",
+        "externalId": f"ocid1.group.oc1..{index:032x}",
+        "targetId": target_id,
+        "name": f"cloud-group-{index}",
+        "add": {
+            "identities": [
+                {
+                    "id": _global_identity_id(index * fan_out.members_per_cloud_group + member),
+                    "externalId": f"{member:032x}",
+                    "targetIdentityId": _target_identity_id(index, member),
+                }
+                for member in range(fan_out.members_per_cloud_group)
+            ]
+        },
+        "remove": {"identities": []},
+    }
+
+
+def cloud_policy(index, fan_out):
+    target_id = _target_id(index)
+    return {
+        "id": f"tapolicy.OCI.{target_id}.{index:032x}",
+        "cloudType": "OCI",
+        "compartmentId": TENANCY_ID,
+        "externalId": f"ocid1.policy.oc1..{index:032x}",
+        "targetId": target_id,
+        "policyStatementId": f"tapolicystmt.OCI.{target_id}.{index:032x}",
+        "name": f"Policy_{index}",
+        "description": f"Synthetic cloud policy {index}",
+        "statement": f"allow group group_{index} to manage object-family in tenancy",
+        "subjects": [
+            {"id": f"ocid1.group.oc1..{index:024x}{subject:08x}", "name": f"group_{index}_{subject}", "type": "GROUP"}
+            for subject in range(fan_out.subjects_per_cloud_policy)
+        ],
+        "verb": "MANAGE",
+        "resourceType": "Bucket,DataTransferJob",
+        "location": {"compartment": "benchmark"},
+    }
+
+
+def policy_statement_resource_mapping(index, fan_out):
+    target_id = _target_id(index)
+    return {
+        "compartmentId": f"ocid1.compartment.oc1..{index % 11:032x}",
+        "id": f"tapolicy.OCI.{target_id}.{index:032x}",
+        "externalId": f"ocid1.policy.oc1..{index:032x}",
+        "policyStatementId": f"tapolicystmt.OCI.{target_id}.{index:032x}",
+        "targetId": target_id,
+        "resources": [
+            {
+                "id": f"resource.OCI.{target_id}.{index:024x}{position:08x}",
+                "externalId": f"ocid1.bucket.oc1.iad.{index:024x}{position:08x}",
+            }
+            for position in range(fan_out.resources_per_mapping)
+        ],
+    }
+
+
+def global_identity_collection(index, fan_out):
+    return {
+        "id": _guid("collection", index),
+        "externalId": f"group.OCI.{index}",
+        "name": f"IdentityCollection{index}",
+        "displayName": f"Identity Collection {index}",
+        "identityCollectionType": "OCI_GROUP",
+        "isManagedAtTarget": "false",
+        "status": "ACTIVE",
+        **_audit_fields(index, "IDENTITY_GROUP"),
+        "agRisk": {"value": index % 10},
+        "agManaged": False,
+        "managedByIds": [],
+        "tags": ["benchmark"],
+    }
+
+
+def access_bundle(index, fan_out):
+    target_id = _target_id(index)
+    return {
+        "id": _guid("bundle", index),
+        "externalId": SERVICE_INSTANCE_ID,
+        "name": f"Access Bundle {index}",
+        "description": "",
+        "requestableBy": "ANY",
+        "status": "ACTIVE",
+        "approvalWorkflow": {"id": "NO_APPROVAL_REQUIRED"},
+        "targetId": target_id,
+        "accessBundleType": "ACCESS_BUNDLE",
+        "permissionIds": [f"groups.OCI.{target_id}.{index:024x}{position:08x}" for position in range(3)],
+        "accessGuardrailIds": [_guid("guardrail", index % 7)],
+        **_audit_fields(index, "AccessBundle"),
+    }
+
+
+def permission(index, fan_out):
+    target_id = _target_id(index)
+    return {
+        "id": f"roles.OCI.{target_id}.{index:032x}",
+        "externalId": f"{index:032x}",
+        "name": f"permission_{index}",
+        "description": f"Synthetic permission {index}",
+        "displayName": f"Permission {index}",
+        "permissionTypeId": f"etype.OCI.{target_id}.role",
+        "resourceId": f"resource.OCI.{target_id}.{index % 101:032x}",
+        "targetId": target_id,
+        "customAttributes": {
+            "compartmentName": "benchmark",
+            "domainName": "Default",
+            "granteeType": "App",
+            "isCertifiable": True,
+            "isReviewable": True,
+            "operationType": "CREATE_OR_UPDATE",
+            "tags": [],
+        },
+    }
+
+
+def permission_assignment(index, fan_out):
+    return {
+        "targetIdentityId": _target_identity_id(index, 0),
+        "globalIdentityId": _global_identity_id(index),
+        "add": [
+            {
+                "id": _guid("assignment", index * fan_out.permissions_per_assignment + position),
+                "targetId": _target_id(index),
+                "targetType": "ICF",
+                "granttype": "DIRECT",
+                "permissionType": "Group",
+                "permissionId": f"groups.ICF.{_target_id(index)}.{position:032x}",
+                "permissionName": f"Group {position}",
+                "resourceId": f"resource.ICF.{_target_id(index)}.{position % 5:032x}",
+                "resourceDisplayName": f"Resource {position % 5}",
+                "userLogin": f"user{index:07d}",
+            }
+            for position in range(fan_out.permissions_per_assignment)
+        ],
+    }
+
+
+def policy(index, fan_out):
+    return {
+        "id": _guid("policy", index),
+        "name": f"policy_{index}",
+        "externalId": SERVICE_INSTANCE_ID,
+        "description": "",
+        "displayName": f"Policy {index}",
+        "status": "ACTIVE",
+        "policyType": "STANDARD_POLICY",
+        "policyVersion": "3",
+        "policyRules": [
+            {
+                "id": _guid("rule", index * fan_out.rules_per_policy + rule),
+                "externalId": SERVICE_INSTANCE_ID,
+                "assignmentId": _guid("assignment", index * fan_out.rules_per_policy + rule),
+                "identityGroupId": _guid("collection", (index + rule) % 211),
+                "parsedOn": TIMESTAMP_MS,
+                "policyRuleVersion": "1",
+                "roleId": _guid("role", (index + rule) % 307),
+                "ruleAction": "Assign",
+                "ruleStatement": f"Assign role [role_{rule}] to identity-group [collection_{index}]",
+                "ruleStatus": "ACTIVE",
+                "ruleType": "RBAC_RULE",
+                "createdBy": _global_identity_id(index % 97),
+                "createdOn": TIMESTAMP_MS,
+                "updatedBy": "AG_System",
+                "updatedOn": TIMESTAMP_MS,
+            }
+            for rule in range(fan_out.rules_per_policy)
+        ],
+        **_audit_fields(index, "Policy"),
+        "agRisk": {"value": 0},
+    }
+
+
+def role(index, fan_out):
+    return {
+        "id": _guid("role", index),
+        "externalId": SERVICE_INSTANCE_ID,
+        "name": f"role_{index}",
+        "description": "",
+        "requestableBy": "NONE",
+        "status": "ACTIVE",
+        "approvalWorkflow": {"id": ""},
+        "accessBundleIds": [_guid("bundle", (index + position) % 499) for position in range(2)],
+        **_audit_fields(index, "Role"),
+    }
+
+
+def access_guardrail(index, fan_out):
+    return {
+        "id": _guid("guardrail", index),
+        "externalId": _guid("guardrail", index),
+        "name": f"Guardrail {index}",
+        "description": "Synthetic guardrail",
+        "etag": f"{index:040x}",
+        "tags": "",
+        "isDetectiveViolationCheckEnabled": False,
+        "lifecycleState": "ACTIVE",
+        "rules": [
+            {
+                "conditions": [
+                    {
+                        "basicCondition": {
+                            "dataType": "String",
+                            "displayName": "Country location",
+                            "lhs": "location",
+                            "operator": "Eq",
+                            "rhs": ["Argentina"],
+                            "rhsUiDetails": [],
+                        },
+                        "childConditions": [],
+                        "type": "IDENTITY_ATTRIBUTE",
+                    }
+                ],
+                "id": _guid("guardrail-rule", index),
+                "operator": "OR",
+                "type": "DEFAULT",
+            }
+        ],
+        "actionOnFailure": {
+            "actionType": "REVOKE_IMMEDIATELY",
+            "revokeLaterAfterNumberOfDays": 0,
+            "risk": "HIGH",
+            "shouldUserManagerBeNotified": False,
+        },
+        **_audit_fields(index, "ACCESS_GUARDRAIL"),
+    }
+
+
+def approval_workflow(index, fan_out):
+    return {
+        "id": f"Guid_{_guid('workflow', index)}",
+        "name": f"workflow-{index}",
+        "description": "Synthetic approval workflow",
+        "status": "Active",
+        "createdBy": "Benchmark Owner",
+        "createdOn": TIMESTAMP_MS,
+        "updatedBy": "Benchmark Owner",
+        "updatedOn": TIMESTAMP_MS,
+        "summary": "{[beneficiary-manager]}{[beneficiary][owner]}{[manager-chain]}",
+    }
+
+
+def ownership_collection(index, fan_out):
+    return {
+        "ownershipCollectionId": _guid("ownership", index),
+        "entityId": _global_identity_id(index % 97),
+        "isPrimary": "true",
+        "entityName": f"Owner {index % 97}",
+        "externalId": SERVICE_INSTANCE_ID,
+        "usageName": f"usage-{index}",
+        "timeCreated": TIMESTAMP_MS,
+        "lastModified": TIMESTAMP_MS,
+    }
+
+
+ENTITY_GENERATORS = {
+    "IDENTITY": identity,
+    "CLOUD_GROUP": cloud_group,
+    "CLOUD_POLICY": cloud_policy,
+    "RESOURCE": resource,
+    "POLICY_STATEMENT_RESOURCE_MAPPING": policy_statement_resource_mapping,
+    "GLOBAL_IDENTITY_COLLECTION": global_identity_collection,
+    "ACCESS_BUNDLE": access_bundle,
+    "PERMISSION": permission,
+    "PERMISSION_ASSIGNMENT": permission_assignment,
+    "POLICY": policy,
+    "ROLE": role,
+    "ACCESS_GUARDRAIL": access_guardrail,
+    "APPROVAL_WORKFLOW": approval_workflow,
+    "OWNERSHIP_COLLECTION": ownership_collection,
+    "ORCHESTRATED_SYSTEM": orchestrated_system,
+}
+
+
+def build_headers(entity, operation="CREATE", snapshot_id="benchmark-snapshot"):
+    return {
+        "eventTime": EVENT_TIME,
+        "eventTypeVersion": "1.0",
+        "operation": operation,
+        "messageType": entity,
+        "status": "IN_PROGRESS",
+        "tenancyId": TENANCY_ID,
+        "serviceInstanceId": SERVICE_INSTANCE_ID,
+        "correlationId": snapshot_id,
+    }
+
+
+def build_records(entity, record_count, fan_out=FanOut()):
+    generator = ENTITY_GENERATORS[entity]
+    return [generator(index, fan_out) for index in range(record_count)]
+
+
+def build_snapshot_jsonl(entity, record_count, fan_out=FanOut(), operation="CREATE"):
+    """Return one snapshot batch object: a header line followed by one record per line."""
+    lines = [json.dumps({"headers": build_headers(entity, operation)})]
+    lines.extend(json.dumps(record) for record in build_records(entity, record_count, fan_out))
+    return "\n".join(lines).encode("utf-8")
+
+
+def build_connector_hub_batch(entity, record_count, fan_out=FanOut(), records_per_message=10, operation="UPDATE"):
+    """Return a Connector Hub batch in the double base64-encoded form the stream handler receives."""
+    records = build_records(entity, record_count, fan_out)
+    messages = []
+    for start in range(0, len(records), records_per_message):
+        value = {
+            "headers": build_headers(entity, operation),
+            "data": json.dumps(records[start : start + records_per_message]),
+        }
+        encoded = base64.b64encode(json.dumps(value).encode("utf-8"))
+        messages.append({"value": base64.b64encode(encoded).decode("ascii")})
+    return messages
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Profile the cumulative import cost of one dispatcher route.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.import_profile --route file --top 25
+
+Runs a fresh interpreter with ``-X importtime`` that imports the dispatcher and
+resolves the route's handler, then prints the modules with the highest
+cumulative import time. Use ``--route none`` to profile the dispatcher alone.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+IMPORT_TIME_PREFIX = "import time:"
+
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into ``{"module", "self_us", "cumulative_us", "depth"}`` rows."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header line
+        name = fields[2].rstrip()
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_us": int(fields[0]),
+                "cumulative_us": int(fields[1]),
+                "depth": (len(name) - len(name.lstrip())) // 2,
+            }
+        )
+    return modules
+
+
+def profile_route(route):
+    probe = "import handlers.dispatcher as dispatcher\n"
+    if route != "none":
+        probe += f"assert dispatcher.resolve_handler({route!r}) is not None\n"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, ["src", os.getenv("PYTHONPATH")]))},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = parse_importtime(result.stderr)
+    # Top-level entries are the only ones whose cumulative times do not overlap.
+    total_us = sum(module["cumulative_us"] for module in modules if module["depth"] == 0)
+    return {"route": route, "modules": len(modules), "total_us": total_us, "imports": modules}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--route", default="file", help="DFA_FUNCTION_NAME to resolve, or 'none'.")
+    parser.add_argument("--top", type=int, default=20, help="Number of modules to print.")
+    parser.add_argument("--json", action="store_true", help="Print the full profile as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    profile = profile_route(args.route)
+    if args.json:
+        print(json.dumps(profile, indent=2))
+        return
+
+    print(f"route {profile['route']}: {profile['modules']} modules, {profile['total_us'] / 1000:.1f} ms total")
+    print(f"{'cumulative ms':>14}{'self ms':>10}  module")
+    for module in sorted(profile["imports"], key=lambda item: item["cumulative_us"], reverse=True)[: args.top]:
+        print(f"{module['cumulative_us'] / 1000:>14.1f}{module['self_us'] / 1000:>10.1f}  {module['module']}")
+
+
+if __name__ == "__main__":
+    main()
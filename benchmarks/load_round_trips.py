@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Count database round trips per entity for each load strategy.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.load_round_trips --records 500 --existing-percent 30
+    PYTHONPATH=src python -m benchmarks.load_round_trips --entity POLICY --latency-ms 2 --json
+
+Synthetic snapshot records are transformed by FileTransformer and loaded by
+the entity's query builders through ``RecordingConnection``. Strategies:
+
+    state-upsert       UPDATE into the state table (insert first, update on ORA-00001)
+    state-delete       DELETE from the state table
+    timeseries-insert  CREATE into the time series table
+
+``--existing-percent`` seeds that share of the rows into the fake key store
+first, so upserts hit the duplicate-key fallback. ``--latency-ms`` sleeps per
+round trip to show how the counts translate into wall-clock time.
+``--sql-profile`` also prints the top statements by elapsed time per run to stderr.
+"""
+
+import argparse
+import json
+import os
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+os.environ.setdefault("DFA_LOG_LEVEL", "WARNING")
+os.environ.setdefault("DFA_ADW_DFA_SCHEMA", "DFA")
+os.environ.setdefault("DFA_SIGNER_TYPE", "resource")
+
+# pylint: disable=wrong-import-position
+from benchmarks.generators import ENTITY_GENERATORS, FanOut, build_snapshot_jsonl
+from common.tracing.sql_profiler import SQL_PROFILER
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.base_query_builder import get_query_builder
+from dfa.etl.file_transformer import FileTransformer
+
+STRATEGIES = {
+    "state-upsert": ("UPDATE", False),
+    "state-delete": ("DELETE", False),
+    "timeseries-insert": ("CREATE", True),
+}
+STAT_COLUMNS = ("round_trips", "executemany", "execute", "ping", "commit", "rows_bound", "bind_bytes", "batch_errors")
+
+
+def prepare_chunks(entity, record_count, fan_out, operation, is_timeseries):
+    transformer = FileTransformer("benchmark", "benchmark", f"snapshots/{entity.lower()}.batch-1.jsonl", is_timeseries)
+    transformer._reset_extracted_state()
+    payload = build_snapshot_jsonl(entity, record_count, fan_out, operation)
+    transformer._set_raw_event_data(SimpleNamespace(data=SimpleNamespace(content=payload)))
+    transformer.transform_data()
+    return transformer.get_event_object_type(), list(transformer.chunk_prepared_events())
+
+
+def measure(entity, strategy, record_count, fan_out, existing_percent, latency_seconds, sql_profile=False):
+    operation, is_timeseries = STRATEGIES[strategy]
+    event_object_type, chunks = prepare_chunks(entity, record_count, fan_out, operation, is_timeseries)
+    table_manager = get_query_builder(event_object_type, operation, [], is_timeseries).table_manager
+
+    key_store = FakeKeyStore(unique_keys_for_tables(table_manager))
+    events = [event for chunk in chunks for event in chunk]
+    seeded = len(events) if operation == "DELETE" else len(events) * existing_percent // 100
+    key_store.seed(table_manager.get_table_name(), events[:seeded])
+
+    connection = RecordingConnection(key_store, latency_seconds=latency_seconds)
+    AdwConnection.install_connection(connection)
+    connection.reset_stats()
+    SQL_PROFILER.configure(sql_profile)
+    SQL_PROFILER.reset()
+    started = perf_counter()
+    try:
+        for chunk in chunks:
+            get_query_builder(event_object_type, operation, chunk, is_timeseries).execute_sql_for_events()
+    finally:
+        elapsed = perf_counter() - started
+        AdwConnection.close()
+        SQL_PROFILER.configure(None)
+    if sql_profile:
+        print(SQL_PROFILER.report(title=f"SQL profile for {strategy} {entity}"), file=sys.stderr)
+
+    stats = connection.stats()
+    return {
+        "entity": entity,
+        "strategy": strategy,
+        "table": table_manager.get_table_name(),
+        "chunks": len(chunks),
+        "rows": len(events),
+        "seeded_rows": seeded,
+        **{name: stats[name] for name in STAT_COLUMNS},
+        "seconds": round(elapsed, 4),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entity", action="append", choices=sorted(ENTITY_GENERATORS), help="Entity; repeatable.")
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES), help="Strategy; repeatable.")
+    parser.add_argument("--records", type=int, default=200, help="Raw records per entity.")
+    parser.add_argument("--existing-percent", type=int, default=0, help="Share of rows already in the state table.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per round trip.")
+    parser.add_argument("--sql-profile", action="store_true", help="Print the top statements for each run.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = [
+        measure(
+            entity, strategy, args.records, FanOut(), args.existing_percent, args.latency_ms / 1000, args.sql_profile
+        )
+        for strategy in args.strategy or STRATEGIES
+        for entity in args.entity or ENTITY_GENERATORS
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'strategy':<19}{'entity':<36}{'rows':>7}" + "".join(f"{name:>13}" for name in STAT_COLUMNS))
+    for result in results:
+        print(
+            f"{result['strategy']:<19}{result['entity']:<36}{result['rows']:>7}"
+            + "".join(f"{result[name]:>13}" for name in STAT_COLUMNS)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Measure the memory prepared rows hold, as dict rows and as compact rows.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.row_memory --records 2000
+    PYTHONPATH=src python -m benchmarks.row_memory --entity POLICY --json
+
+A synthetic snapshot is parsed and transformed by FileTransformer once with
+``DFA_COMPACT_ROWS=false`` and once with compact rows. ``tracemalloc`` measures
+what the prepared rows keep allocated after the raw events are dropped, so the
+figures include the row containers and every value they reference but no
+temporaries.
+"""
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+from types import SimpleNamespace
+
+os.environ.setdefault("DFA_LOG_LEVEL", "WARNING")
+os.environ.setdefault("DFA_ADW_DFA_SCHEMA", "DFA")
+
+# pylint: disable=wrong-import-position
+from benchmarks.generators import ENTITY_GENERATORS, FanOut, build_snapshot_jsonl
+from dfa.etl.file_transformer import FileTransformer
+
+DEFAULT_ENTITIES = ("IDENTITY", "PERMISSION_ASSIGNMENT")
+ROW_LAYOUTS = {"dict": "false", "compact": "true"}
+
+
+def prepared_row_bytes(entity, payload, compact_rows):
+    os.environ["DFA_COMPACT_ROWS"] = compact_rows
+    transformer = FileTransformer("benchmark", "benchmark", f"snapshots/{entity.lower()}.batch-1.jsonl")
+    transformer._reset_extracted_state()
+    transformer._set_raw_event_data(SimpleNamespace(data=SimpleNamespace(content=payload)))
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        transformer.transform_data()
+        transformer._raw_events = []
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return transformer.get_prepared_row_count(), after - before
+
+
+def measure(entity, record_count, fan_out):
+    payload = build_snapshot_jsonl(entity, record_count, fan_out)
+    result = {"entity": entity, "records": record_count}
+    for layout, compact_rows in ROW_LAYOUTS.items():
+        rows, retained_bytes = prepared_row_bytes(entity, payload, compact_rows)
+        result["rows"] = rows
+        result[f"{layout}_bytes_per_row"] = round(retained_bytes / rows) if rows else 0
+    if result["dict_bytes_per_row"]:
+        result["saved_percent"] = round(100 * (1 - result["compact_bytes_per_row"] / result["dict_bytes_per_row"]), 1)
+    return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entity", action="append", choices=sorted(ENTITY_GENERATORS), help="Entity; repeatable.")
+    parser.add_argument("--records", type=int, default=1000, help="Raw records per entity.")
+    parser.add_argument("--target-identities", type=int, default=FanOut.target_identities_per_identity)
+    parser.add_argument("--assignment-permissions", type=int, default=FanOut.permissions_per_assignment)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fan_out = FanOut(
+        target_identities_per_identity=args.target_identities,
+        permissions_per_assignment=args.assignment_permissions,
+    )
+    previous_setting = os.environ.get("DFA_COMPACT_ROWS")
+    try:
+        results = [measure(entity, args.records, fan_out) for entity in args.entity or DEFAULT_ENTITIES]
+    finally:
+        if previous_setting is None:
+            os.environ.pop("DFA_COMPACT_ROWS", None)
+        else:
+            os.environ["DFA_COMPACT_ROWS"] = previous_setting
+
+    if args.json:
+        print(json.dumps({"results": results}, indent=2))
+        return
+    print(f"{'entity':<36}{'rows':>9}{'dict B/row':>12}{'compact B/row':>15}{'saved %':>9}")
+    for result in results:
+        print(
+            f"{result['entity']:<36}{result['rows']:>9}{result['dict_bytes_per_row']:>12}"
+            f"{result['compact_bytes_per_row']:>15}{result.get('saved_percent', 0):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""In-process stand-ins for the ADW connection used by the benchmarks.
+
+Standard library only, so benchmarks that time imports can use them.
+"""
+
+
+class StubCursor:
+    """Accept every statement and count the bind rows handed to ``executemany``."""
+
+    rowcount = 0
+
+    def __init__(self):
+        self.executemany_calls = 0
+        self.bind_rows = 0
+
+    def executemany(self, statement, rows, **kwargs):
+        self.executemany_calls += 1
+        self.bind_rows += len(rows)
+
+    def fetchone(self):
+        return (1,)
+
+    def fetchall(self):
+        return []
+
+    def getbatcherrors(self):
+        return []
+
+    def __getattr__(self, _):
+        return lambda *args, **kwargs: None
+
+
+class StubConnection:
+    def __init__(self):
+        self.cursor_instance = StubCursor()
+
+    def cursor(self):
+        return self.cursor_instance
+
+    def __getattr__(self, _):
+        return lambda *args, **kwargs: None
+
+
+def stub_adw_connection(connection_class, connection):
+    """Point ``AdwConnection``'s cursor, connection and transaction methods at ``connection``."""
+    connection_class.get_connection = classmethod(lambda cls, username=None: connection)
+    connection_class.get_cursor = classmethod(lambda cls, username=None: connection.cursor_instance)
+    connection_class.commit = classmethod(lambda cls: None)
+    connection_class.rollback = classmethod(lambda cls, suppress_errors=False: None)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""Measure rows/sec per entity through extract, transform and bind building.
+
+Example:
+    PYTHONPATH=src python -m benchmarks.transform_load --records 2000 --output results.json
+    PYTHONPATH=src python -m benchmarks.transform_load --entity IDENTITY --baseline results.json
+
+Each entity is run through the file path (a synthetic JSONL snapshot object
+parsed and transformed by FileTransformer) and the stream path (a synthetic
+Connector Hub batch decoded and transformed by StreamTransformer). The bind
+stage runs the entity's query builder against an in-process cursor stub, so it
+covers SQL generation, input sizes and bind rows but no database round trips.
+
+``--baseline`` compares rows/sec against an earlier ``--output`` file and exits
+with status 1 when any entity is slower by more than ``--max-regression`` percent.
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+from time import perf_counter
+from types import SimpleNamespace
+
+# Logged lines per chunk would otherwise dominate small runs.
+os.environ.setdefault("DFA_LOG_LEVEL", "WARNING")
+os.environ.setdefault("DFA_ADW_DFA_SCHEMA", "DFA")
+os.environ.setdefault("DFA_SIGNER_TYPE", "resource")
+os.environ.setdefault("DFA_STREAM_ID", "ocid1.stream.oc1..benchmark")
+os.environ.setdefault("DFA_STREAM_SERVICE_ENDPOINT", "https://streaming.example.com")
+
+# pylint: disable=wrong-import-position
+from benchmarks.generators import ENTITY_GENERATORS, FanOut, build_connector_hub_batch, build_snapshot_jsonl
+from benchmarks.stubs import StubConnection, stub_adw_connection
+from common.ocihelpers.stream import DataEnablementStream
+from dfa.adw.connection import AdwConnection
+from dfa.adw.query_builders.base_query_builder import get_query_builder
+from dfa.etl.file_transformer import FileTransformer
+from dfa.etl.stream_transformer import StreamTransformer
+
+SOURCES = ("file", "stream")
+STAGES = ("extract_seconds", "transform_seconds", "bind_seconds")
+
+
+def _timed(stage_seconds, stage, function, *args):
+    started = perf_counter()
+    result = function(*args)
+    stage_seconds[stage] = perf_counter() - started
+    return result
+
+
+def run_file(entity, payload, connection, is_timeseries):
+    transformer = FileTransformer("benchmark", "benchmark", f"snapshots/{entity.lower()}.batch-1.jsonl", is_timeseries)
+    transformer._reset_extracted_state()
+    event_data = SimpleNamespace(data=SimpleNamespace(content=payload))
+    stage_seconds = {}
+
+    _timed(stage_seconds, "extract_seconds", transformer._set_raw_event_data, event_data)
+    _timed(stage_seconds, "transform_seconds", transformer.transform_data)
+
+    def build_binds():
+        for chunk in transformer.chunk_prepared_events():
+            get_query_builder(
+                transformer.get_event_object_type(),
+                transformer.get_operation_type(),
+                chunk,
+                is_timeseries,
+            ).execute_sql_for_events()
+
+    _timed(stage_seconds, "bind_seconds", build_binds)
+    return len(transformer.get_raw_events()), len(transformer.get_prepared_events()), stage_seconds
+
+
+def run_stream(entity, messages, connection, is_timeseries):
+    messages = copy.deepcopy(messages)
+    transformer = StreamTransformer(is_timeseries)
+    stage_seconds = {}
+
+    def extract():
+        decoded = DataEnablementStream.decode_connector_hub_source_stream_messages(messages)
+        return DataEnablementStream.sort_connector_hub_source_stream_messages(decoded)
+
+    sorted_messages = _timed(stage_seconds, "extract_seconds", extract)
+    _timed(stage_seconds, "transform_seconds", transformer.transform_messages, sorted_messages)
+    _timed(stage_seconds, "bind_seconds", transformer.load_data)
+    # Decoding happens in place, so each message now holds its parsed record list.
+    raw_events = sum(len(message["value"].get("data", [])) for message in messages)
+    return raw_events, len(transformer.get_prepared_events()), stage_seconds
+
+
+def measure(entity, source, record_count, fan_out, repeat, is_timeseries=False):
+    if source == "file":
+        payload, runner = build_snapshot_jsonl(entity, record_count, fan_out), run_file
+    else:
+        payload, runner = build_connector_hub_batch(entity, record_count, fan_out), run_stream
+
+    best = None
+    for _ in range(repeat):
+        connection = StubConnection()
+        stub_adw_connection(AdwConnection, connection)
+        raw_events, prepared_rows, stage_seconds = runner(entity, payload, connection, is_timeseries)
+        total_seconds = sum(stage_seconds.values())
+        if best is None or total_seconds < best["total_seconds"]:
+            best = {
+                "entity": entity,
+                "source": source,
+                "timeseries": is_timeseries,
+                "records": record_count,
+                "raw_events": raw_events,
+                "prepared_rows": prepared_rows,
+                "bind_rows": connection.cursor_instance.bind_rows,
+                **{stage: round(stage_seconds[stage], 5) for stage in STAGES},
+                "total_seconds": round(total_seconds, 5),
+                "rows_per_second": round(prepared_rows / total_seconds) if total_seconds else 0,
+            }
+    return best
+
+
+def result_key(result):
+    return f"{result['source']}:{result['entity']}{':timeseries' if result.get('timeseries') else ''}"
+
+
+def compare_to_baseline(results, baseline, max_regression_percent):
+    """Return one comparison row per result that also appears in ``baseline``."""
+    baseline_by_key = {result_key(result): result for result in baseline}
+    comparisons = []
+    for result in results:
+        previous = baseline_by_key.get(result_key(result))
+        if previous is None or not previous.get("rows_per_second"):
+            continue
+        change_percent = (result["rows_per_second"] - previous["rows_per_second"]) / previous["rows_per_second"] * 100
+        comparisons.append(
+            {
+                "key": result_key(result),
+                "baseline_rows_per_second": previous["rows_per_second"],
+                "rows_per_second": result["rows_per_second"],
+                "change_percent": round(change_percent, 1),
+                "regressed": change_percent < -max_regression_percent,
+            }
+        )
+    return comparisons
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entity", action="append", choices=sorted(ENTITY_GENERATORS), help="Entity; repeatable.")
+    parser.add_argument("--source", action="append", choices=SOURCES, help="Transformer path; repeatable.")
+    parser.add_argument("--records", type=int, default=1000, help="Raw records per entity.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per entity; the fastest is reported.")
+    parser.add_argument("--timeseries", action="store_true", help="Load into the time series tables instead.")
+    parser.add_argument("--target-identities", type=int, default=FanOut.target_identities_per_identity)
+    parser.add_argument("--policy-rules", type=int, default=FanOut.rules_per_policy)
+    parser.add_argument("--cloud-policy-subjects", type=int, default=FanOut.subjects_per_cloud_policy)
+    parser.add_argument("--mapping-resources", type=int, default=FanOut.resources_per_mapping)
+    parser.add_argument("--group-members", type=int, default=FanOut.members_per_cloud_group)
+    parser.add_argument("--assignment-permissions", type=int, default=FanOut.permissions_per_assignment)
+    parser.add_argument("--output", help="Write the results as JSON to this path, e.g. to use as a baseline.")
+    parser.add_argument("--baseline", help="Earlier --output file to compare rows/sec against.")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="Allowed rows/sec drop in percent.")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fan_out = FanOut(
+        target_identities_per_identity=args.target_identities,
+        rules_per_policy=args.policy_rules,
+        subjects_per_cloud_policy=args.cloud_policy_subjects,
+        resources_per_mapping=args.mapping_resources,
+        members_per_cloud_group=args.group_members,
+        permissions_per_assignment=args.assignment_permissions,
+    )
+    results = [
+        measure(entity, source, args.records, fan_out, args.repeat, args.timeseries)
+        for source in args.source or SOURCES
+        for entity in args.entity or ENTITY_GENERATORS
+    ]
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    comparisons = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            comparisons = compare_to_baseline(results, json.load(f), args.max_regression)
+
+    if args.json:
+        print(json.dumps({"results": results, "comparisons": comparisons}, indent=2))
+    else:
+        print(
+            f"{'source':<8}{'entity':<36}{'raw':>8}{'rows':>9}{'extract s':>11}"
+            f"{'transform s':>13}{'bind s':>9}{'rows/s':>10}"
+        )
+        for result in results:
+            print(
+                f"{result['source']:<8}{result['entity']:<36}{result['raw_events']:>8}{result['prepared_rows']:>9}"
+                f"{result['extract_seconds']:>11}{result['transform_seconds']:>13}{result['bind_seconds']:>9}"
+                f"{result['rows_per_second']:>10}"
+            )
+        for comparison in comparisons:
+            marker = "REGRESSED" if comparison["regressed"] else ""
+            print(
+                f"{comparison['key']:<44}{comparison['baseline_rows_per_second']:>10} -> "
+                f"{comparison['rows_per_second']:>10} ({comparison['change_percent']:+.1f}%) {marker}"
+            )
+
+    if any(comparison["regressed"] for comparison in comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Load every object under an Object Storage prefix into ADW in one process.
+
+Example:
+    PYTHONPATH=src python scripts/bulk_ingest.py \
+      --namespace mytenancy --bucket-name dfa-exports --prefix snapshots/2025-08-15/ \
+      --config-file config.ini --section DEFAULT --download-workers 16 --loader-connections 4
+
+Use this for backfills and replays instead of one Functions invocation per
+object. Snapshot completion markers are finalized after their batches load.
+The summary report is printed as JSON; the exit status is non-zero if any
+object failed.
+"""
+
+import argparse
+import json
+import sys
+
+from dfa.bootstrap.envvars import bootstrap_local_machine_environment_variables
+from dfa.etl.bulk_ingest import BulkFileIngest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--namespace", required=True, help="Object Storage namespace.")
+    parser.add_argument("--bucket-name", required=True, help="Bucket holding the exported objects.")
+    parser.add_argument("--prefix", required=True, help="Object name prefix to ingest.")
+    parser.add_argument("--search-for", default="", help="Only ingest object names containing this string.")
+    parser.add_argument("--timeseries", action="store_true", help="Load into the time series tables.")
+    parser.add_argument("--download-workers", type=int, help="Concurrent downloads (DFA_BULK_DOWNLOAD_WORKERS).")
+    parser.add_argument("--loader-connections", type=int, help="Concurrent ADW loaders (DFA_BULK_LOADER_CONNECTIONS).")
+    parser.add_argument("--config-file", help="Optional local DFA config.ini file to load first.")
+    parser.add_argument("--section", help="Optional config.ini section (requires --config-file).")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.section and not args.config_file:
+        raise ValueError("--section requires --config-file")
+    if args.config_file:
+        bootstrap_local_machine_environment_variables(args.config_file, args.section)
+
+    report = BulkFileIngest(
+        args.namespace,
+        args.bucket_name,
+        args.prefix,
+        search_for=args.search_for,
+        is_timeseries=args.timeseries,
+        download_workers=args.download_workers,
+        loader_connections=args.loader_connections,
+    ).run()
+    print(json.dumps(report.as_dict(), indent=2))
+    return 1 if report.objects_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
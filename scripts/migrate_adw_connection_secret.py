@@ -37,6 +37,7 @@ def main():
     if secrets._connection_secret_exists(args.secret_name):
         print(f"Using existing consolidated ADW connection secret {args.secret_name!r}.")
     else:
+        secrets.prefetch_legacy_connection_secrets()
         secrets._create_connection_secret(
             args.secret_name,
             dfa_user_password=secrets.get_dfa_user_password(),
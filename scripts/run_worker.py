@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Run the file, stream and audit pipelines as a long-running worker outside OCI Functions.
+
+Examples:
+    PYTHONPATH=src python scripts/run_worker.py --source directory --path /var/dfa/work \
+      --config-file config.ini --section DEFAULT --processes 4
+
+    PYTHONPATH=src python scripts/run_worker.py --source object-storage \
+      --namespace mytenancy --bucket-name dfa-exports --prefix snapshots/ --kind file
+
+Directory and queue-file items are JSON documents of the form
+``{"kind": "file" | "file_to_ts" | "stream" | "stream_to_ts" | "stream_consume" | "audit", "body": ...}``
+where ``body`` is the payload the matching Functions handler would receive
+(``stream_consume`` pulls from the stream itself; its body is ``{}`` or
+``{"isTimeseries": true, "maxBatches": 5}``).
+SIGINT/SIGTERM drain the worker: in-flight items finish, then it exits and
+prints the per-worker throughput summary as JSON.
+"""
+
+import argparse
+import json
+import sys
+
+from dfa.bootstrap.envvars import bootstrap_local_machine_environment_variables
+from dfa.worker.runner import DEFAULT_POLL_INTERVAL_SECONDS, WorkerPool
+from dfa.worker.sources import DirectoryWorkSource, ObjectStorageWorkSource, QueueFileWorkSource
+from dfa.worker.tasks import WORK_KIND_FILE, WORK_KIND_FILE_TO_TS
+
+SOURCE_DIRECTORY = "directory"
+SOURCE_QUEUE_FILE = "queue-file"
+SOURCE_OBJECT_STORAGE = "object-storage"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--source",
+        required=True,
+        choices=(SOURCE_DIRECTORY, SOURCE_QUEUE_FILE, SOURCE_OBJECT_STORAGE),
+        help="Where work items come from.",
+    )
+    parser.add_argument("--path", help="Work directory or JSONL queue file (directory and queue-file sources).")
+    parser.add_argument("--namespace", help="Object Storage namespace (object-storage source).")
+    parser.add_argument("--bucket-name", help="Bucket to poll (object-storage source).")
+    parser.add_argument("--prefix", default="", help="Object name prefix to poll (object-storage source).")
+    parser.add_argument(
+        "--kind",
+        default=WORK_KIND_FILE,
+        choices=(WORK_KIND_FILE, WORK_KIND_FILE_TO_TS),
+        help="Pipeline for objects found by the object-storage source.",
+    )
+    parser.add_argument("--processes", type=int, help="Worker processes (DFA_WORKER_PROCESSES, default CPU count).")
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL_SECONDS,
+        help="Seconds to wait before polling an empty source again.",
+    )
+    parser.add_argument("--exit-when-idle", action="store_true", help="Exit once the source has no more work.")
+    parser.add_argument("--config-file", help="Optional local DFA config.ini file to load first.")
+    parser.add_argument("--section", help="Optional config.ini section (requires --config-file).")
+    return parser.parse_args()
+
+
+def build_source(args):
+    if args.source == SOURCE_OBJECT_STORAGE:
+        if not args.namespace or not args.bucket_name:
+            raise ValueError("--source object-storage requires --namespace and --bucket-name")
+        return ObjectStorageWorkSource(args.namespace, args.bucket_name, args.prefix, kind=args.kind)
+
+    if not args.path:
+        raise ValueError(f"--source {args.source} requires --path")
+    if args.source == SOURCE_DIRECTORY:
+        return DirectoryWorkSource(args.path)
+    return QueueFileWorkSource(args.path)
+
+
+def main():
+    args = parse_args()
+    if args.section and not args.config_file:
+        raise ValueError("--section requires --config-file")
+    if args.config_file:
+        bootstrap_local_machine_environment_variables(args.config_file, args.section)
+
+    summary = WorkerPool(
+        build_source(args),
+        processes=args.processes,
+        poll_interval=args.poll_interval,
+        exit_when_idle=args.exit_when_idle,
+    ).run()
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
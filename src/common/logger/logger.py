@@ -1,8 +1,13 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
+import atexit
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from time import monotonic
 
 dfa_loggers: dict[str, logging.Logger] = {}
 OCI_SDK_LOGGER_NAMES = (
@@ -14,6 +19,173 @@ OCI_SDK_LOGGER_NAMES = (
     "urllib3",
     "urllib3.connectionpool",
 )
+LOG_FORMAT = "%(name)s - %(levelname)s - %(message)s"
+DEFAULT_LOG_QUEUE_SIZE = 10000
+DEFAULT_LOG_REPEAT_LIMIT = 10
+DEFAULT_LOG_REPEAT_WINDOW_SECONDS = 60.0
+DEFAULT_LOG_FLUSH_TIMEOUT_SECONDS = 2.0
+
+
+def _get_number_env(name: str, default, cast=int):
+    try:
+        value = cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+class RepeatedMessageFilter(logging.Filter):
+    """Pass at most ``DFA_LOG_REPEAT_LIMIT`` records per registered message template per window.
+
+    Only templates registered with ``limit_repeated_messages`` are limited; the
+    window is ``DFA_LOG_REPEAT_WINDOW_SECONDS`` long and also restarts on
+    ``flush_logs``. Suppressed records are counted per template and reported by
+    ``flush_logs``. A limit of ``0`` lets every record through.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._templates: set[str] = set()
+        self._passed: dict[str, int] = {}
+        self._dropped: dict[str, int] = {}
+        self._window_started = monotonic()
+
+    def limit(self, *templates: str):
+        with self._lock:
+            self._templates.update(templates)
+
+    def filter(self, record):
+        if record.msg not in self._templates:
+            return True
+        limit = _get_number_env("DFA_LOG_REPEAT_LIMIT", DEFAULT_LOG_REPEAT_LIMIT)
+        if limit == 0:
+            return True
+        window_seconds = _get_number_env("DFA_LOG_REPEAT_WINDOW_SECONDS", DEFAULT_LOG_REPEAT_WINDOW_SECONDS, float)
+        with self._lock:
+            if monotonic() - self._window_started >= window_seconds:
+                self._passed.clear()
+                self._window_started = monotonic()
+            passed = self._passed.get(record.msg, 0)
+            if passed < limit:
+                self._passed[record.msg] = passed + 1
+                return True
+            self._dropped[record.msg] = self._dropped.get(record.msg, 0) + 1
+            return False
+
+    def drain_dropped(self) -> dict[str, int]:
+        """Return and clear the suppressed counts, and start a new window."""
+        with self._lock:
+            dropped, self._dropped = self._dropped, {}
+            self._passed.clear()
+            self._window_started = monotonic()
+        return dropped
+
+
+REPEATED_MESSAGES = RepeatedMessageFilter()
+
+
+def limit_repeated_messages(*templates: str):
+    """Rate-limit log records whose unformatted message is one of ``templates``."""
+    REPEATED_MESSAGES.limit(*templates)
+
+
+class _FlushMarker(logging.LogRecord):
+    def __init__(self):
+        super().__init__("dfa.logger", logging.NOTSET, __file__, 0, "", None, None)
+        self.done = threading.Event()
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """Drop records instead of blocking when the writer falls behind."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _WriterListener(QueueListener):
+    def handle(self, record):
+        if isinstance(record, _FlushMarker):
+            record.done.set()
+            return
+        super().handle(record)
+
+
+class _AsyncLogWriter:
+    """One background thread writing every DFA logger's records to stderr."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queue = None
+        self.handler = None
+        self._listener = None
+
+    def get_handler(self) -> QueueHandler:
+        with self._lock:
+            if self.handler is None:
+                self.queue = queue.Queue(maxsize=_get_number_env("DFA_LOG_QUEUE_SIZE", DEFAULT_LOG_QUEUE_SIZE))
+                stream_handler = logging.StreamHandler()
+                stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+                self._listener = _WriterListener(self.queue, stream_handler)
+                self._listener.start()
+                self.handler = _BoundedQueueHandler(self.queue)
+                atexit.register(self.stop)
+            return self.handler
+
+    def flush(self, timeout_seconds: float) -> bool:
+        """Wait until everything queued so far has been written."""
+        with self._lock:
+            if self._listener is None:
+                return True
+            marker = _FlushMarker()
+            try:
+                self.queue.put(marker, timeout=timeout_seconds)
+            except queue.Full:
+                return False
+        return marker.done.wait(timeout_seconds)
+
+    def take_dropped(self) -> int:
+        with self._lock:
+            if self.handler is None:
+                return 0
+            dropped, self.handler.dropped = self.handler.dropped, 0
+            return dropped
+
+    def stop(self):
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+
+ASYNC_LOG_WRITER = _AsyncLogWriter()
+
+
+def _is_async_logging_enabled() -> bool:
+    return os.getenv("DFA_LOG_ASYNC", "false").lower() == "true"
+
+
+def flush_logs(timeout_seconds: float = DEFAULT_LOG_FLUSH_TIMEOUT_SECONDS):
+    """Report suppressed and dropped records, then wait for queued records to be written.
+
+    Call at the end of every invocation; it is cheap when nothing was suppressed
+    and logging is synchronous.
+    """
+    summary_logger = Logger("dfa.logger").get_logger()
+    for template, count in sorted(REPEATED_MESSAGES.drain_dropped().items()):
+        summary_logger.warning("Suppressed %d repeated log record(s): %r", count, template)
+    dropped = ASYNC_LOG_WRITER.take_dropped()
+    if dropped:
+        summary_logger.warning("Dropped %d log record(s) because the log queue was full", dropped)
+    if not ASYNC_LOG_WRITER.flush(timeout_seconds):
+        summary_logger.warning("Timed out after %.1fs waiting for queued log records", timeout_seconds)
 
 
 class Logger:
@@ -32,11 +204,15 @@ class Logger:
             self.__logger.propagate = False
             # Add a stream handler only once
             if not self.__logger.handlers:
-                sh = logging.StreamHandler()
-                sh.setLevel(level)
-                sh_formatter = logging.Formatter("%(name)s - %(levelname)s - %(message)s")
-                sh.setFormatter(sh_formatter)
-                self.__logger.addHandler(sh)
+                if _is_async_logging_enabled():
+                    self.__logger.addHandler(ASYNC_LOG_WRITER.get_handler())
+                else:
+                    sh = logging.StreamHandler()
+                    sh.setLevel(level)
+                    sh_formatter = logging.Formatter(LOG_FORMAT)
+                    sh.setFormatter(sh_formatter)
+                    self.__logger.addHandler(sh)
+            self.__logger.addFilter(REPEATED_MESSAGES)
 
             oci_level_name = os.getenv("DFA_OCI_LOG_LEVEL", "WARNING").upper()
             oci_level = getattr(logging, oci_level_name, logging.WARNING)
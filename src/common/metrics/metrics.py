@@ -0,0 +1,281 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import atexit
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from common.logger.logger import Logger
+
+DEFAULT_METRICS_SINKS = "log"
+DEFAULT_HTTP_BATCH_SIZE = 20
+DEFAULT_HTTP_TIMEOUT_SECONDS = 5
+
+
+def _get_positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def post_json(endpoint: str, body: bytes, timeout_seconds: float):
+    """POST a JSON ``body`` to ``endpoint`` and return the HTTP status."""
+    import urllib.request  # pylint: disable=import-outside-toplevel
+
+    request = urllib.request.Request(endpoint, data=body, method="POST", headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+        return response.status
+
+
+def _tag_key(tags: dict[str, Any]) -> tuple:
+    return tuple(sorted((name, str(value)) for name, value in tags.items() if value is not None))
+
+
+class Histogram:
+    __slots__ = ("count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "min": round(self.minimum, 6) if self.minimum is not None else None,
+            "max": round(self.maximum, 6) if self.maximum is not None else None,
+        }
+
+
+class MetricsSink(ABC):
+    """Receives one payload per ``MetricsRegistry.flush``."""
+
+    @abstractmethod
+    def emit(self, payload: dict[str, Any]):
+        pass
+
+    def close(self):
+        pass
+
+
+class JsonLogSink(MetricsSink):
+    """Write each payload as a single JSON log line."""
+
+    logger = Logger("dfa.metrics").get_logger()
+
+    def emit(self, payload):
+        self.logger.info("%s", json.dumps(payload, default=str, separators=(",", ":")))
+
+
+class InMemorySink(MetricsSink):
+    """Keep payloads in memory, e.g. for tests."""
+
+    def __init__(self):
+        self.payloads: list[dict[str, Any]] = []
+
+    def emit(self, payload):
+        self.payloads.append(payload)
+
+
+class HttpBatchSink(MetricsSink):
+    """POST buffered payloads as a JSON array to ``endpoint`` once ``batch_size`` are queued.
+
+    Anything still buffered is posted on ``close`` (also registered at process exit).
+    ``post`` replaces the HTTP call, for example with a local stand-in collector.
+    """
+
+    logger = Logger("dfa.metrics").get_logger()
+
+    def __init__(
+        self,
+        endpoint: str,
+        batch_size: int = DEFAULT_HTTP_BATCH_SIZE,
+        timeout_seconds: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
+        post: Optional[Callable[[str, bytes, float], Any]] = None,
+    ):
+        self.endpoint = endpoint
+        self.batch_size = batch_size
+        self.timeout_seconds = timeout_seconds
+        self._post = post or post_json
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _send(self, payloads: list[dict[str, Any]]):
+        if not payloads:
+            return
+        try:
+            self._post(self.endpoint, json.dumps(payloads, default=str).encode("utf-8"), self.timeout_seconds)
+        except Exception as e:
+            self.logger.warning("Failed to post %d metrics payload(s) to %s: %s", len(payloads), self.endpoint, e)
+
+    def emit(self, payload):
+        with self._lock:
+            self._buffer.append(payload)
+            if len(self._buffer) < self.batch_size:
+                return
+            payloads, self._buffer = self._buffer, []
+        self._send(payloads)
+
+    def close(self):
+        with self._lock:
+            payloads, self._buffer = self._buffer, []
+        self._send(payloads)
+
+
+def build_sinks_from_env() -> list[MetricsSink]:
+    """Build the sinks named in ``DFA_METRICS_SINKS`` (``log``, ``memory``, ``http`` or ``none``)."""
+    logger = Logger(__name__).get_logger()
+    sinks: list[MetricsSink] = []
+    for name in os.getenv("DFA_METRICS_SINKS", DEFAULT_METRICS_SINKS).split(","):
+        name = name.strip().lower()
+        if name in ("", "none"):
+            continue
+        if name == "log":
+            sinks.append(JsonLogSink())
+        elif name == "memory":
+            sinks.append(InMemorySink())
+        elif name == "http":
+            endpoint = os.getenv("DFA_METRICS_ENDPOINT")
+            if not endpoint:
+                logger.warning("DFA_METRICS_SINKS includes http but DFA_METRICS_ENDPOINT is not set")
+                continue
+            sinks.append(
+                HttpBatchSink(
+                    endpoint,
+                    batch_size=_get_positive_int_env("DFA_METRICS_BATCH_SIZE", DEFAULT_HTTP_BATCH_SIZE),
+                    timeout_seconds=_get_positive_int_env("DFA_METRICS_TIMEOUT_SECONDS", DEFAULT_HTTP_TIMEOUT_SECONDS),
+                )
+            )
+        else:
+            logger.warning("Ignoring unknown metrics sink %s", name)
+    return sinks
+
+
+class MetricsRegistry:
+    """Process-wide counters and histograms, flushed to the configured sinks once per invocation.
+
+    Metrics are keyed by name and tags, e.g. ``increment("rows_out", 10, entity="IDENTITY")``.
+    Sinks come from ``DFA_METRICS_SINKS`` unless set with ``set_sinks``.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(self, sinks: Optional[list[MetricsSink]] = None):
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+        self._sinks = sinks
+
+    def increment(self, name: str, value: float = 1, **tags):
+        key = (name, _tag_key(tags))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **tags):
+        key = (name, _tag_key(tags))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **tags):
+        """Observe the seconds spent in the block under ``name``."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - started, **tags)
+
+    def counter_value(self, name: str, **tags) -> float:
+        """Sum ``name`` over every tag set that includes ``tags``."""
+        wanted = set(_tag_key(tags))
+        with self._lock:
+            return sum(
+                value
+                for (counter_name, tag_key), value in self._counters.items()
+                if counter_name == name and wanted.issubset(tag_key)
+            )
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        with self._lock:
+            return {
+                "counters": [
+                    {"name": name, "tags": dict(tag_key), "value": value}
+                    for (name, tag_key), value in sorted(self._counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "tags": dict(tag_key), **histogram.as_dict()}
+                    for (name, tag_key), histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+                ],
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def get_sinks(self) -> list[MetricsSink]:
+        with self._lock:
+            if self._sinks is None:
+                self._sinks = build_sinks_from_env()
+            return list(self._sinks)
+
+    def set_sinks(self, sinks: Optional[list[MetricsSink]]):
+        """Replace the sinks; ``None`` rebuilds them from the environment on the next flush."""
+        with self._lock:
+            self._sinks = sinks
+
+    def flush(self, **context) -> dict[str, Any]:
+        """Send the current metrics with ``context`` to every sink, then start over."""
+        payload = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **context,
+            **self.snapshot(),
+        }
+        self.reset()
+        if not payload["counters"] and not payload["histograms"]:
+            return payload
+        for sink in self.get_sinks():
+            try:
+                sink.emit(payload)
+            except Exception as e:
+                self.logger.warning("Metrics sink %s failed: %s", type(sink).__name__, e)
+        return payload
+
+    @contextmanager
+    def invocation(self, function_name: str):
+        """Time one handler invocation and flush its metrics when it ends, even on failure."""
+        started = perf_counter()
+        failed = False
+        try:
+            yield self
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.observe("invocation_seconds", perf_counter() - started)
+            if failed:
+                self.increment("invocation_failures")
+            self.flush(function=function_name)
+
+
+METRICS = MetricsRegistry()
@@ -6,6 +6,7 @@ import os
 import oci
 
 from common.logger.logger import Logger
+from common.ocihelpers.clients import OCI_CLIENT_REGISTRY
 from dfa.bootstrap.image_version import resolve_image_version
 
 
@@ -16,10 +17,7 @@ class BaseArtifact:
     __client = None
 
     def __set_config(self):
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            self.__config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
-        else:
-            self.__config = {}
+        self.__config = OCI_CLIENT_REGISTRY.get_config()
 
     def __get_config(self):
         if self.__config is None:
@@ -28,37 +26,7 @@ class BaseArtifact:
         return self.__config
 
     def __set_signer(self):
-        token = None
-
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self.__get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self._signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self.__get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self._signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self._signer = oci.auth.signers.get_resource_principals_signer()
+        self._signer = OCI_CLIENT_REGISTRY.get_signer()
 
     def __get_signer(self):
         if self._signer is None:
@@ -67,7 +35,9 @@ class BaseArtifact:
         return self._signer
 
     def __set_client(self):
-        self.__client = oci.artifacts.ArtifactsClient(config=self.__get_config(), signer=self.__get_signer())
+        self.__client = OCI_CLIENT_REGISTRY.get_client(
+            oci.artifacts.ArtifactsClient, config=self.__get_config(), signer=self.__get_signer()
+        )
 
     def _get_client(self):
         if self.__client is None:
@@ -0,0 +1,161 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import threading
+from collections import Counter
+from typing import Any, Optional
+
+import oci
+
+from common.logger.logger import Logger
+
+DEFAULT_TOKEN_REFRESH_AHEAD_SECONDS = 300
+
+
+def _get_non_negative_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+class OciClientRegistry:
+    """Process-wide cache of OCI configs, signers and service clients.
+
+    Every ``common.ocihelpers`` class resolves its signer and clients here, so a
+    warm process builds the resource-principal signer once and keeps reusing the
+    same clients (and their HTTP connection pools) across invocations and
+    helpers. Session tokens are refreshed in place ``DFA_OCI_TOKEN_REFRESH_AHEAD_SECONDS``
+    before they expire, which keeps every client holding the signer valid.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._configs: dict[tuple, dict] = {}
+        self._signers: dict[tuple, Any] = {}
+        self._clients: dict[tuple, tuple[Any, Any]] = {}
+        self._counters: Counter = Counter()
+
+    @staticmethod
+    def _signer_key(signer_type: Optional[str]) -> tuple:
+        signer_type = os.getenv("DFA_SIGNER_TYPE") if signer_type is None else signer_type
+        if signer_type != "user":
+            return (signer_type,)
+        return (
+            signer_type,
+            os.environ["DFA_CONFIG_LOCATION"],
+            os.environ["DFA_CONFIG_PROFILE"],
+            os.getenv("OCI_AUTH_TYPE"),
+        )
+
+    def get_config(self, signer_type: Optional[str] = None) -> dict:
+        key = self._signer_key(signer_type)
+        with self._lock:
+            config = self._configs.get(key)
+            if config is None:
+                if key[0] == "user":
+                    config = oci.config.from_file(key[1], key[2])
+                else:
+                    config = {}
+                self._configs[key] = config
+            return config
+
+    def _create_signer(self, key: tuple):
+        if key[0] != "user":
+            return oci.auth.signers.get_resource_principals_signer()
+
+        config = self.get_config(key[0])
+        auth_type = key[3]
+        if auth_type == "security_token_file":
+            with open(config["security_token_file"], "r", encoding="utf-8") as f:
+                token = f.read()
+            private_key = oci.signer.load_private_key_from_file(config["key_file"])
+            return oci.auth.signers.SecurityTokenSigner(token, private_key)
+
+        if auth_type == "delegation_token_file":
+            with open(config["delegation_token_file"], "r", encoding="utf-8") as f:
+                token = f.read()
+            return oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
+
+        self.logger.exception(
+            "Please specify a valid OCI_AUTH_TYPE in config.ini. "
+            "Accepted values are 'security_token_file' and 'delegation_token_file'."
+        )
+        raise Exception(
+            "Specify a valid OCI_AUTH_TYPE in config.ini. "
+            "Accepted values are 'security_token_file' and 'delegation_token_file'."
+        )
+
+    def _refresh_token_if_expiring(self, signer):
+        security_token = getattr(signer, "security_token", None)
+        if not hasattr(security_token, "valid_with_jitter") or not hasattr(signer, "refresh_security_token"):
+            return
+
+        refresh_ahead_seconds = _get_non_negative_int_env(
+            "DFA_OCI_TOKEN_REFRESH_AHEAD_SECONDS", DEFAULT_TOKEN_REFRESH_AHEAD_SECONDS
+        )
+        if security_token.valid_with_jitter(refresh_ahead_seconds):
+            return
+
+        with self._lock:
+            # Another thread may have refreshed it while this one waited for the lock.
+            if signer.security_token.valid_with_jitter(refresh_ahead_seconds):
+                return
+            self.logger.info("OCI session token expires within %ss; refreshing", refresh_ahead_seconds)
+            signer.refresh_security_token()
+            self._counters["token_refreshes"] += 1
+
+    def get_signer(self, signer_type: Optional[str] = None):
+        key = self._signer_key(signer_type)
+        with self._lock:
+            signer = self._signers.get(key)
+            if signer is None:
+                signer = self._signers[key] = self._create_signer(key)
+                self._counters["signer_creations"] += 1
+        self._refresh_token_if_expiring(signer)
+        return signer
+
+    def get_client(self, client_class, config: Optional[dict] = None, signer=None, **client_kwargs):
+        """Return the shared ``client_class`` instance for this signer and endpoint.
+
+        Clients are keyed by class, signer and ``service_endpoint``; other keyword
+        arguments such as ``retry_strategy`` only apply to the first creation.
+        """
+        signer = self.get_signer() if signer is None else signer
+        self._refresh_token_if_expiring(signer)
+        key = (client_class, id(signer), client_kwargs.get("service_endpoint"))
+        with self._lock:
+            cached = self._clients.get(key)
+            # The signer is kept with the client so its id cannot be reused by another signer.
+            if cached is not None and cached[0] is signer:
+                self._counters["client_reuses"] += 1
+                return cached[1]
+
+            client = client_class(
+                config=self.get_config() if config is None else config, signer=signer, **client_kwargs
+            )
+            self._clients[key] = (signer, client)
+            self._counters["client_creations"] += 1
+            return client
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                name: self._counters[name]
+                for name in ("signer_creations", "client_creations", "client_reuses", "token_refreshes")
+            }
+
+    def clear(self):
+        """Drop every cached config, signer and client, e.g. after credentials change."""
+        with self._lock:
+            self._configs.clear()
+            self._signers.clear()
+            self._clients.clear()
+            self._counters.clear()
+
+
+OCI_CLIENT_REGISTRY = OciClientRegistry()
@@ -6,6 +6,7 @@ import os
 import oci
 
 from common.logger.logger import Logger
+from common.ocihelpers.clients import OCI_CLIENT_REGISTRY
 
 
 class BaseConnector:
@@ -21,10 +22,7 @@ class BaseConnector:
     _stream_to_state_sch_name = None
 
     def __set_config(self):
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            self.__config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
-        else:
-            self.__config = {}
+        self.__config = OCI_CLIENT_REGISTRY.get_config()
 
     def __get_config(self):
         if self.__config is None:
@@ -33,37 +31,7 @@ class BaseConnector:
         return self.__config
 
     def __set_signer(self):
-        token = None
-
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self.__get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self.__signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self.__get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self.__signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self.__signer = oci.auth.signers.get_resource_principals_signer()
+        self.__signer = OCI_CLIENT_REGISTRY.get_signer()
 
     def __get_signer(self):
         if self.__signer is None:
@@ -71,7 +39,9 @@ class BaseConnector:
         return self.__signer
 
     def __set_client(self):
-        self.__client = oci.sch.ServiceConnectorClient(config=self.__get_config(), signer=self.__get_signer())
+        self.__client = OCI_CLIENT_REGISTRY.get_client(
+            oci.sch.ServiceConnectorClient, config=self.__get_config(), signer=self.__get_signer()
+        )
 
     def _get_client(self):
         if self.__client is None:
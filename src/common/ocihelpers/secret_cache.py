@@ -0,0 +1,177 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Callable, Hashable, Optional
+
+from common.logger.logger import Logger
+
+DEFAULT_SECRET_CACHE_TTL_SECONDS = 3600
+DEFAULT_SECRET_REFRESH_AHEAD_SECONDS = 300
+DEFAULT_SECRET_PREFETCH_WORKERS = 4
+
+
+def _get_non_negative_float_env(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+@dataclass
+class _SecretCacheEntry:
+    value: Any
+    loaded_at: float
+    refreshing: bool = False
+
+
+class SecretCache:
+    """Thread-safe TTL cache for vault secret values.
+
+    Concurrent lookups of the same key share one fetch. A value read within
+    ``DFA_SECRET_REFRESH_AHEAD_SECONDS`` of its ``DFA_SECRET_CACHE_TTL_SECONDS``
+    expiry is still returned, and a background refresh replaces it so warm
+    invocations do not wait on the vault. A TTL of ``0`` keeps values until
+    they are invalidated.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(self, max_workers: int = DEFAULT_SECRET_PREFETCH_WORKERS):
+        self._max_workers = max_workers
+        self._entries: dict[Hashable, _SecretCacheEntry] = {}
+        self._in_flight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def ttl_seconds() -> float:
+        return _get_non_negative_float_env("DFA_SECRET_CACHE_TTL_SECONDS", DEFAULT_SECRET_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def refresh_ahead_seconds() -> float:
+        return _get_non_negative_float_env("DFA_SECRET_REFRESH_AHEAD_SECONDS", DEFAULT_SECRET_REFRESH_AHEAD_SECONDS)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="dfa-secret-fetch",
+                )
+            return self._executor
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], future: Future):
+        try:
+            value = loader()
+        except Exception as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            future.set_exception(e)
+            return
+
+        with self._lock:
+            self._entries[key] = _SecretCacheEntry(value=value, loaded_at=monotonic())
+            self._in_flight.pop(key, None)
+        future.set_result(value)
+
+    def _lookup_locked(self, key: Hashable, now: float) -> tuple[Optional[_SecretCacheEntry], bool]:
+        """Return the cached entry if it is still servable, and whether it should be refreshed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+
+        ttl_seconds = self.ttl_seconds()
+        if ttl_seconds == 0:
+            return entry, False
+
+        age = now - entry.loaded_at
+        if age >= ttl_seconds:
+            return None, False
+        return entry, age >= ttl_seconds - self.refresh_ahead_seconds() and not entry.refreshing
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any]):
+        def refresh():
+            future: Future = Future()
+            self._load(key, loader, future)
+            if future.exception() is not None:
+                self.logger.warning("Background refresh of secret %s failed: %s", key, future.exception())
+
+        self._get_executor().submit(refresh)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry, should_refresh = self._lookup_locked(key, monotonic())
+            if entry is not None:
+                if should_refresh:
+                    entry.refreshing = True
+                value = entry.value
+            else:
+                future = self._in_flight.get(key)
+                owns_load = future is None
+                if owns_load:
+                    future = self._in_flight[key] = Future()
+
+        if entry is not None:
+            if should_refresh:
+                self._refresh_in_background(key, loader)
+            return value
+
+        if owns_load:
+            self._load(key, loader, future)
+        return future.result()
+
+    def prefetch(
+        self,
+        loaders: dict[Hashable, Callable[[], Any]],
+        wait_for_results: bool = True,
+    ) -> dict[Hashable, Future]:
+        """Fetch every missing or expired key concurrently.
+
+        Returns one future per key. With ``wait_for_results`` the call blocks until
+        all of them have finished; fetch errors stay on the futures.
+        """
+        futures: dict[Hashable, Future] = {}
+        to_load: list[tuple[Hashable, Callable[[], Any], Future]] = []
+        now = monotonic()
+        with self._lock:
+            for key, loader in loaders.items():
+                entry, _ = self._lookup_locked(key, now)
+                if entry is not None:
+                    futures[key] = Future()
+                    futures[key].set_result(entry.value)
+                elif key in self._in_flight:
+                    futures[key] = self._in_flight[key]
+                else:
+                    future = Future()
+                    self._in_flight[key] = future
+                    futures[key] = future
+                    to_load.append((key, loader, future))
+
+        executor = self._get_executor() if to_load else None
+        for key, loader, future in to_load:
+            executor.submit(self._load, key, loader, future)
+
+        if wait_for_results:
+            wait(futures.values())
+        return futures
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry, _ = self._lookup_locked(key, monotonic())
+            return entry is not None
@@ -7,6 +7,7 @@ from abc import ABC
 import oci
 
 from common.logger.logger import Logger
+from common.ocihelpers.clients import OCI_CLIENT_REGISTRY
 
 
 class BaseObjectStorage(ABC):
@@ -20,10 +21,7 @@ class BaseObjectStorage(ABC):
         self._check_environment()
 
     def __set_config(self):
-        if self._signer_type == "user":
-            self.__config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
-        else:
-            self.__config = {}
+        self.__config = OCI_CLIENT_REGISTRY.get_config(self._signer_type)
 
     def __get_config(self):
         if self.__config is None:
@@ -32,37 +30,7 @@ class BaseObjectStorage(ABC):
         return self.__config
 
     def __set_signer(self):
-        token = None
-
-        if self._signer_type == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self.__get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self.__signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self.__get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self.__signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self.__signer = oci.auth.signers.get_resource_principals_signer()
+        self.__signer = OCI_CLIENT_REGISTRY.get_signer(self._signer_type)
 
     def __get_signer(self):
         if self.__signer is None:
@@ -71,7 +39,9 @@ class BaseObjectStorage(ABC):
         return self.__signer
 
     def __set_client(self):
-        self.__client = oci.object_storage.ObjectStorageClient(config=self.__get_config(), signer=self.__get_signer())
+        self.__client = OCI_CLIENT_REGISTRY.get_client(
+            oci.object_storage.ObjectStorageClient, config=self.__get_config(), signer=self.__get_signer()
+        )
 
     def _get_client(self):
         if self.__client is None:
@@ -125,6 +95,17 @@ class BaseObjectStorage(ABC):
         )
         return event_object
 
+    def download_range(self, events_namespace, events_bucket_name, events_object_name, start, end):
+        """Download the inclusive byte range ``start``-``end`` of an object."""
+        event_object = self._get_client().get_object(
+            namespace_name=events_namespace,
+            bucket_name=events_bucket_name,
+            object_name=events_object_name,
+            range=f"bytes={start}-{end}",
+            retry_strategy=self.__get_retry_strategy(),
+        )
+        return event_object
+
     def upload_buffer(self, namespace, bucket_name, object_name, buffer):
         self._get_client().put_object(
             namespace_name=namespace,
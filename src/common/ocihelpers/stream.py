@@ -4,13 +4,28 @@
 import base64
 import json
 import os
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import oci
 
 from common.logger.logger import Logger
+from common.metrics.metrics import METRICS
+from common.ocihelpers.clients import OCI_CLIENT_REGISTRY
 from dfa.adw.connection import AdwConnection
 from dfa.adw.query_builders.base_query_builder import StreamOffsetTrackerQueryBuilder
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+
+DEFAULT_STREAM_PARTITION_THREADS = 8
+DEFAULT_STREAM_MAX_BATCHES = 10
+
+
+def _get_positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
 
 
 def _b64decode_padded(value):
@@ -36,7 +51,8 @@ class BaseStream:
         self._check_environment()
 
     def _set_stream_client(self):
-        self._stream_client = oci.streaming.StreamClient(
+        self._stream_client = OCI_CLIENT_REGISTRY.get_client(
+            oci.streaming.StreamClient,
             config=self._get_config(),
             signer=self._get_signer(),
             service_endpoint=self._service_endpoint,
@@ -49,10 +65,7 @@ class BaseStream:
         return self._stream_client
 
     def _set_config(self):
-        self._config = {}
-
-        if self._signer_type == "user":
-            self._config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
+        self._config = OCI_CLIENT_REGISTRY.get_config(self._signer_type)
 
     def _get_config(self):
         if self._config is None:
@@ -61,36 +74,7 @@ class BaseStream:
         return self._config
 
     def _set_signer(self):
-        token = None
-        if self._signer_type == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self._get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self._signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self._get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self._signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self._signer = oci.auth.signers.get_resource_principals_signer()
+        self._signer = OCI_CLIENT_REGISTRY.get_signer(self._signer_type)
 
     def _get_signer(self):
         if self._signer is None:
@@ -98,62 +82,80 @@ class BaseStream:
 
         return self._signer
 
-    def _set_cursor(self, offset_type=oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET):
-        if offset_type == oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET:
-            stream_offset = 0
+    def _get_partitions(self) -> list[str]:
+        """Return the stream's partition ids, from ``DFA_STREAM_PARTITIONS`` or the stream's definition."""
+        partition_count = _get_positive_int_env("DFA_STREAM_PARTITIONS", 0)
+        if partition_count == 0:
+            stream_admin_client = OCI_CLIENT_REGISTRY.get_client(
+                oci.streaming.StreamAdminClient, config=self._get_config(), signer=self._get_signer()
+            )
+            partition_count = stream_admin_client.get_stream(self._stream_id).data.partitions or 1
+        return [str(partition) for partition in range(partition_count)]
+
+    def _get_stream_offset(self, partition="0"):
+        """Return the offset to resume ``partition`` after: an unfinished range's start or the latest end offset."""
+        stream_offset = 0
 
-            query = StreamOffsetTrackerQueryBuilder().get_statement_for_latest_unfinished_stream_offset_range(
-                self._transformer_name
+        query, binds = StreamOffsetTrackerQueryBuilder().get_statement_for_latest_unfinished_stream_offset_range(
+            self._transformer_name, partition
+        )
+        AdwConnection.get_cursor().execute(query, binds)
+
+        ## current_stream_offset returned as tuple 0 - offset, 1 - end_offset
+        current_stream_offset = AdwConnection.get_cursor().fetchone()
+
+        if current_stream_offset is None:
+            self.logger.info(
+                "No unfinished ranges found - getting last completed offset range for %s application partition %s",
+                self._transformer_name,
+                partition,
             )
-            AdwConnection.get_cursor().execute(query)
+            query, binds = StreamOffsetTrackerQueryBuilder().get_statement_for_select_max_offset_for_transformer(
+                self._transformer_name, partition
+            )
+
+            AdwConnection.get_cursor().execute(query, binds)
 
-            ## current_stream_offset returned as tuple 0 - id, 1 - offset, 2 end_offset
+            ## current_stream_offset returned as tuple 0 - end_offset
             current_stream_offset = AdwConnection.get_cursor().fetchone()
-            offset_return_index = 1
-
-            if current_stream_offset is None:
-                self.logger.info(
-                    "No unfinished ranges found - getting last completed offset range for %s application",
-                    self._transformer_name,
-                )
-                query = StreamOffsetTrackerQueryBuilder().get_statement_for_select_max_offset_for_transformer(
-                    self._transformer_name
-                )
-
-                AdwConnection.get_cursor().execute(query)
-
-                ## current_stream_offset returned as tuple 0 - end_offset
-                current_stream_offset = AdwConnection.get_cursor().fetchone()
-                offset_return_index = 0
-            else:
-                self.logger.info(
-                    "Unfinished ranges found - getting last completed offset range for %s application with %s ID",
-                    self._transformer_name,
-                    current_stream_offset[0],
-                )
-
-            if current_stream_offset is not None:
-                stream_offset = current_stream_offset[offset_return_index]
-
-            self.logger.info("Stream offset set to %s", stream_offset)
+        else:
+            self.logger.info(
+                "Unfinished range starting at offset %s found for %s application partition %s",
+                current_stream_offset[0],
+                self._transformer_name,
+                partition,
+            )
+
+        if current_stream_offset is not None:
+            stream_offset = current_stream_offset[0]
+
+        self.logger.info("Stream offset for partition %s set to %s", partition, stream_offset)
+        return stream_offset
+
+    def _create_cursor(self, offset_type, partition="0", stream_offset=None):
+        if offset_type == oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET:
             cursor_details = oci.streaming.models.CreateCursorDetails(
-                partition="0", type=offset_type, offset=stream_offset
+                partition=partition, type=offset_type, offset=stream_offset
             )
         else:
             cursor_details = oci.streaming.models.CreateCursorDetails(
-                partition="0",
+                partition=partition,
                 type=offset_type,
             )
-        self.logger.info(cursor_details)
+        self.logger.info("Creating %s cursor for partition %s", offset_type, partition)
 
-        self._cursor = self._get_stream_client().create_cursor(
-            stream_id=self._stream_id, create_cursor_details=cursor_details
-        )
+        return self._get_stream_client().create_cursor(stream_id=self._stream_id, create_cursor_details=cursor_details)
+
+    def _set_cursor(self, offset_type=oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET, partition="0"):
+        stream_offset = None
+        if offset_type == oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET:
+            stream_offset = self._get_stream_offset(partition)
+        self._cursor = self._create_cursor(offset_type, partition, stream_offset)
 
         return True
 
-    def _get_cursor(self, offset_type):
-        self._set_cursor(offset_type)
+    def _get_cursor(self, offset_type, partition="0"):
+        self._set_cursor(offset_type, partition)
 
         return self._cursor
 
@@ -166,12 +168,14 @@ class BaseStream:
             )
             raise e
 
-    def _get_messages_by_offset(self):
+    def _get_messages_by_offset(self, partition="0"):
         messages = (
             self._get_stream_client()
             .get_messages(
                 stream_id=self._stream_id,
-                cursor=self._get_cursor(oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET).data.value,
+                cursor=self._get_cursor(
+                    oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET, partition
+                ).data.value,
                 limit=int(os.environ["AUDIT_FILE_SIZE"]),
             )
             .data
@@ -179,12 +183,14 @@ class BaseStream:
 
         return self.decode_data_feed_messages(messages)
 
-    def _get_messages_by_trim_horizon(self):
+    def _get_messages_by_trim_horizon(self, partition="0"):
         messages = (
             self._get_stream_client()
             .get_messages(
                 stream_id=self._stream_id,
-                cursor=self._get_cursor(oci.streaming.models.CreateCursorDetails.TYPE_TRIM_HORIZON).data.value,
+                cursor=self._get_cursor(
+                    oci.streaming.models.CreateCursorDetails.TYPE_TRIM_HORIZON, partition
+                ).data.value,
                 limit=int(os.environ["AUDIT_FILE_SIZE"]),
             )
             .data
@@ -192,6 +198,13 @@ class BaseStream:
 
         return self.decode_data_feed_messages(messages)
 
+    def _get_messages_page(self, cursor):
+        """Return ``(messages, next_cursor)`` for one page read from ``cursor``."""
+        response = self._get_stream_client().get_messages(
+            stream_id=self._stream_id, cursor=cursor, limit=int(os.environ["AUDIT_FILE_SIZE"])
+        )
+        return self.decode_data_feed_messages(response.data), response.headers.get("opc-next-cursor")
+
     def decode_data_feed_messages(self, messages):
         for encoded_message in messages:
             decoded_value = _b64decode_padded(_b64decode_padded(encoded_message.value).decode()).decode()
@@ -203,72 +216,153 @@ class BaseStream:
 
 
 class DataEnablementStream(BaseStream):
+    """Pull consumer over every partition of the data enablement stream.
+
+    ``hydrate`` reads one page from each partition concurrently, starting after
+    the offset the tracker table holds for this application and partition, and
+    records one offset range per partition. While the caller transforms and
+    loads that batch, the next page of every partition is prefetched from the
+    cursors the read returned; the next ``hydrate`` after
+    ``complete_offset_range_processing`` uses it instead of reading again.
+    """
+
     _stream_id = None
     _service_endpoint = None
-    _latest_batch_start_offset = 0
-    _latest_batch_end_offset = 0
     _latest_batch: list[Any] = []
+    _latest_batch_ranges: dict[str, tuple[int, int]] = {}
     _messages: list[Any] = []
 
     def __init__(self, transformer_name):
         self._transformer_name = transformer_name
         self._stream_id = os.environ["DFA_STREAM_ID"]
         self._service_endpoint = os.environ["DFA_STREAM_SERVICE_ENDPOINT"]
+        self._partitions: Optional[list[str]] = None
+        self._prefetched_pages: Optional[Future] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._offset_tracker_ready = False
         super().__init__()
 
-    def hydrate(self):
-        message_threshold = 0
+    def _ensure_offset_tracker(self):
+        if self._offset_tracker_ready:
+            return
+        if SCHEMA_READINESS.ensure_ready(StreamOffsetTrackerQueryBuilder.table_manager):
+            AdwConnection.commit()
+        self._offset_tracker_ready = True
+
+    def _get_consumer_partitions(self):
+        if self._partitions is None:
+            self._partitions = self._get_partitions()
+            self.logger.info("Consuming %d stream partition(s)", len(self._partitions))
+        return self._partitions
+
+    def _read_partition(self, partition, cursor=None, stream_offset=None):
+        """Return ``(messages, next_cursor)`` for one page of ``partition``.
+
+        Reads from ``cursor`` when given; otherwise after ``stream_offset``, falling
+        back to the trim horizon when the stream no longer has that offset.
+        """
+        if cursor is not None:
+            return self._get_messages_page(cursor)
         try:
-
-            self.logger.info("Pull messages using default get_messages method")
-            self._messages = self._get_messages_by_offset()
-
-            self.logger.info(
-                "Successfully retrieved %d messages from stream.  Now moving on to else...",
-                len(self._messages),
-            )
-
-            if len(self._messages) == 0:
-                self.logger.info("No more messages to process - end processing...")
-
+            cursor = self._create_cursor(
+                oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET, partition, stream_offset
+            ).data.value
+            return self._get_messages_page(cursor)
         except oci.exceptions.ServiceError as service_exception:
             self.logger.info(
-                "Cannot retrieve any messages from stream. Lost track of the offset %s?",
+                "Cannot retrieve any messages from partition %s. Lost track of the offset %s?",
+                partition,
                 service_exception.message,
             )
             self.logger.info("The system will need to get a time horizon cursor to reset the offset in the system.")
-            self.logger.info("Retrieve the messages - then switch back to an after_offset cursor")
-            self._messages = self._get_messages_by_trim_horizon()
+            cursor = self._create_cursor(oci.streaming.models.CreateCursorDetails.TYPE_TRIM_HORIZON, partition)
+            return self._get_messages_page(cursor.data.value)
 
-            if len(self._messages) == 0:
-                self.logger.info("No more messages to process - end processing...")
+    def _read_partitions(self, positions):
+        """Read one page from every partition in ``positions`` (``{partition: (cursor, offset)}``) concurrently."""
+        threads = min(
+            len(positions), _get_positive_int_env("DFA_STREAM_PARTITION_THREADS", DEFAULT_STREAM_PARTITION_THREADS)
+        )
+        if threads <= 1:
+            return {partition: self._read_partition(partition, *position) for partition, position in positions.items()}
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="dfa-stream-partition") as pool:
+            futures = {
+                partition: pool.submit(self._read_partition, partition, *position)
+                for partition, position in positions.items()
+            }
+            return {partition: future.result() for partition, future in futures.items()}
+
+    def _prefetch_next_pages(self, next_cursors):
+        positions = {partition: (cursor, None) for partition, cursor in next_cursors.items() if cursor}
+        if not positions:
+            return
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dfa-stream-prefetch")
+        self._prefetched_pages = self._prefetch_executor.submit(self._read_partitions, positions)
+
+    def _take_prefetched_pages(self):
+        prefetched_pages, self._prefetched_pages = self._prefetched_pages, None
+        if prefetched_pages is None:
+            return None
+        try:
+            return prefetched_pages.result()
+        except oci.exceptions.ServiceError as service_exception:
+            self.logger.info("Discarding prefetched stream pages - %s", service_exception.message)
+            return None
+
+    def _stop_prefetching(self):
+        prefetched_pages, self._prefetched_pages = self._prefetched_pages, None
+        if prefetched_pages is not None:
+            prefetched_pages.cancel()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
+    def hydrate(self, prefetch=True):
+        self._ensure_offset_tracker()
+
+        pages = self._take_prefetched_pages()
+        if pages is None:
+            self.logger.info("Pull messages using default get_messages method")
+            pages = self._read_partitions(
+                {partition: (None, self._get_stream_offset(partition)) for partition in self._get_consumer_partitions()}
+            )
 
-        finally:
-            if len(self._messages) > message_threshold:
-                self.logger.info("Successfully retrieved %d messages", len(self._messages))
-                self._latest_batch = self._messages
-
-                self._latest_batch_start_offset = self._messages[0].offset
-                self._latest_batch_end_offset = self._messages[len(self._messages) - 1].offset
-                self.logger.info(
-                    "Saving start (%s) and end (%s) offset information",
-                    self._latest_batch_start_offset,
-                    self._latest_batch_end_offset,
-                )
-
-                query = StreamOffsetTrackerQueryBuilder().get_insert_statement_for_stream_offset(
-                    self._latest_batch_start_offset,
-                    self._latest_batch_end_offset,
-                    self._transformer_name,
-                )
-                AdwConnection.get_cursor().execute(query)
-                AdwConnection.commit()
-            else:
-                self.logger.info(
-                    "Not enough messages received: %d to meet the threshold: %d. Not processing for now...",
-                    len(self._messages),
-                    message_threshold,
-                )
+        self._messages = []
+        self._latest_batch_ranges = {}
+        for partition, (messages, _) in pages.items():
+            METRICS.increment("stream_messages", len(messages), partition=partition)
+            if messages:
+                self._latest_batch_ranges[partition] = (messages[0].offset, messages[-1].offset)
+                self._messages.extend(messages)
+        if prefetch:
+            self._prefetch_next_pages({partition: next_cursor for partition, (_, next_cursor) in pages.items()})
+
+        if len(self._messages) == 0:
+            self.logger.info("No more messages to process - end processing...")
+            return True
+
+        self.logger.info(
+            "Successfully retrieved %d messages from %d partition(s)",
+            len(self._messages),
+            len(self._latest_batch_ranges),
+        )
+        self._latest_batch = self._messages
+        for partition, (start_offset, end_offset) in self._latest_batch_ranges.items():
+            self.logger.info(
+                "Saving start (%s) and end (%s) offset information for partition %s",
+                start_offset,
+                end_offset,
+                partition,
+            )
+            query, binds = StreamOffsetTrackerQueryBuilder().get_insert_statement_for_stream_offset(
+                start_offset,
+                end_offset,
+                self._transformer_name,
+                partition,
+            )
+            AdwConnection.get_cursor().execute(query, binds)
+        AdwConnection.commit()
 
         return True
 
@@ -280,22 +374,63 @@ class DataEnablementStream(BaseStream):
 
     def complete_offset_range_processing(self):
         self.logger.info("Completing open offset now...")
-        offset_completion_update = StreamOffsetTrackerQueryBuilder().get_statement_for_offset_range_completion(
-            self._latest_batch_start_offset,
-            self._latest_batch_end_offset,
-            self._transformer_name,
-        )
-        AdwConnection.get_cursor().execute(offset_completion_update)
+        for partition, (start_offset, end_offset) in self._latest_batch_ranges.items():
+            query, binds = StreamOffsetTrackerQueryBuilder().get_statement_for_offset_range_completion(
+                start_offset,
+                end_offset,
+                self._transformer_name,
+                partition,
+            )
+            AdwConnection.get_cursor().execute(query, binds)
         AdwConnection.commit()
 
         self._latest_batch = []
+        self._latest_batch_ranges = {}
+
+        return True
+
+    def compact_offset_ranges(self):
+        """Fold this application's completed offset ranges into one checkpoint row per partition."""
+        self._ensure_offset_tracker()
+        for statement, binds in StreamOffsetTrackerQueryBuilder().get_statements_for_offset_compaction(
+            self._transformer_name
+        ):
+            AdwConnection.get_cursor().execute(statement, binds)
+        AdwConnection.commit()
 
         return True
 
-    def get_sorted_latest_events(self):
+    def consume(self, process_batch: Callable[[dict], Any], max_batches: Optional[int] = None) -> int:
+        """Hand sorted batches to ``process_batch`` until the partitions are drained or ``max_batches`` ran.
+
+        A batch's offset ranges are completed only after ``process_batch`` returns,
+        so a failed batch is read again by the next consumer. ``max_batches``
+        defaults to ``DFA_STREAM_MAX_BATCHES``. The completed ranges are compacted
+        once the loop ends, and any page prefetch still in flight is dropped.
+        Returns the number of batches processed.
+        """
+        max_batches = max_batches or _get_positive_int_env("DFA_STREAM_MAX_BATCHES", DEFAULT_STREAM_MAX_BATCHES)
+        processed_batches = 0
+        try:
+            while processed_batches < max_batches:
+                # The last allowed batch has no successor, so don't read ahead for it.
+                sorted_messages = self.get_sorted_latest_events(prefetch=processed_batches + 1 < max_batches)
+                if len(self._latest_batch) == 0:
+                    break
+                with METRICS.timer("stream_batch_seconds"):
+                    process_batch(sorted_messages)
+                self.complete_offset_range_processing()
+                processed_batches += 1
+            if processed_batches > 0:
+                self.compact_offset_ranges()
+        finally:
+            self._stop_prefetching()
+        return processed_batches
+
+    def get_sorted_latest_events(self, prefetch=True):
         sorted_messages = {}
         if len(self._latest_batch) == 0:
-            self.hydrate()
+            self.hydrate(prefetch)
 
         # Sort messages based on event object type and operation
         for message in self._latest_batch:
@@ -367,20 +502,22 @@ class DataEnablementStream(BaseStream):
 
     @classmethod
     def decode_connector_hub_source_stream_messages(cls, messages):
-        for encoded_message in messages:
-            decoded_value = _b64decode_padded(_b64decode_padded(encoded_message["value"]).decode()).decode()
-            encoded_message["value"] = json.loads(decoded_value)
-            if "data" in encoded_message["value"]:
-                encoded_message["value"]["data"] = json.loads(encoded_message["value"]["data"])
+        with METRICS.timer("decode_seconds", source="connector_hub"):
+            for encoded_message in messages:
+                decoded_value = _b64decode_padded(_b64decode_padded(encoded_message["value"]).decode()).decode()
+                encoded_message["value"] = json.loads(decoded_value)
+                if "data" in encoded_message["value"]:
+                    encoded_message["value"]["data"] = json.loads(encoded_message["value"]["data"])
 
         return messages
 
     @classmethod
     def decode_source_stream_messages(cls, messages):
-        for encoded_message in messages:
-            decoded_value = _b64decode_padded(encoded_message["value"])
-            encoded_message["value"] = json.loads(decoded_value)
-            if "data" in encoded_message["value"]:
-                encoded_message["value"]["data"] = json.loads(encoded_message["value"]["data"])
+        with METRICS.timer("decode_seconds", source="stream"):
+            for encoded_message in messages:
+                decoded_value = _b64decode_padded(encoded_message["value"])
+                encoded_message["value"] = json.loads(decoded_value)
+                if "data" in encoded_message["value"]:
+                    encoded_message["value"]["data"] = json.loads(encoded_message["value"]["data"])
 
         return messages
@@ -7,11 +7,14 @@ import json
 import os
 import secrets
 import string
+from concurrent.futures import ThreadPoolExecutor
 from typing import ClassVar
 
 import oci
 
 from common.logger.logger import Logger
+from common.ocihelpers.clients import OCI_CLIENT_REGISTRY
+from common.ocihelpers.secret_cache import SecretCache
 
 
 def build_default_oci_retry_strategy():
@@ -37,10 +40,7 @@ class DfaVault:
     __kms_mgmt_client = None
 
     def __set_config(self):
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            self.__config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
-        else:
-            self.__config = {}
+        self.__config = OCI_CLIENT_REGISTRY.get_config()
 
     def __get_config(self):
         if self.__config is None:
@@ -49,37 +49,7 @@ class DfaVault:
         return self.__config
 
     def __set_signer(self):
-        token = None
-
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self.__get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self._signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self.__get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self._signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self._signer = oci.auth.signers.get_resource_principals_signer()
+        self._signer = OCI_CLIENT_REGISTRY.get_signer()
 
     def __get_signer(self):
         if self._signer is None:
@@ -88,7 +58,8 @@ class DfaVault:
         return self._signer
 
     def __set_kms_vault_client(self):
-        self.__kms_vault_client = oci.key_management.KmsVaultClient(
+        self.__kms_vault_client = OCI_CLIENT_REGISTRY.get_client(
+            oci.key_management.KmsVaultClient,
             config=self.__get_config(),
             signer=self.__get_signer(),
             retry_strategy=build_default_oci_retry_strategy(),
@@ -102,7 +73,8 @@ class DfaVault:
 
     def __set_kms_mgmt_client(self):
         vault_details = self.get_vault_details()
-        self.__kms_mgmt_client = oci.key_management.KmsManagementClient(
+        self.__kms_mgmt_client = OCI_CLIENT_REGISTRY.get_client(
+            oci.key_management.KmsManagementClient,
             config=self.__get_config(),
             signer=self.__get_signer(),
             service_endpoint=vault_details.management_endpoint,
@@ -236,8 +208,8 @@ class DfaBaseSecret:
     __vault_client = None
     __secret_client = None
     _secret_ocid_cache: ClassVar[dict[str, str]] = {}
-    _secret_value_cache: ClassVar[dict[str, str]] = {}
-    _wallet_value_cache: ClassVar[dict[str, bytes]] = {}
+    # Secret values expire and refresh in the background; OCIDs never change for a name.
+    _secret_cache: ClassVar[SecretCache] = SecretCache()
 
     def _secret_exists(self, secret_name):
         exists_flag = False
@@ -267,33 +239,50 @@ class DfaBaseSecret:
 
         return secret_ocid
 
-    def _get_secret_value(self, secret_ocid):
-        if secret_ocid in self._secret_value_cache:
-            return self._secret_value_cache[secret_ocid]
-
+    def _fetch_secret_value(self, secret_ocid):
         response = self.__get_secret_client().get_secret_bundle(secret_ocid)
         base64_secret_content = response.data.secret_bundle_content.content
         base64_secret_bytes = base64_secret_content.encode("ascii")
         base64_message_bytes = base64.b64decode(base64_secret_bytes)
-        secret_value = base64_message_bytes.decode("ascii")
-        self._secret_value_cache[secret_ocid] = secret_value
-
-        return secret_value
-
-    def _get_wallet_value(self, secret_ocid):
-        if secret_ocid in self._wallet_value_cache:
-            return self._wallet_value_cache[secret_ocid]
+        return base64_message_bytes.decode("ascii")
 
+    def _fetch_wallet_value(self, secret_ocid):
         response = self.__get_secret_client().get_secret_bundle(secret_ocid)
         base64_secret_content = response.data.secret_bundle_content.content
+        return base64.b64decode(base64.b64decode(base64_secret_content))
 
-        wallet_value = base64.b64decode(base64.b64decode(base64_secret_content))
-        self._wallet_value_cache[secret_ocid] = wallet_value
+    def _get_secret_value(self, secret_ocid):
+        return self._secret_cache.get(("text", secret_ocid), lambda: self._fetch_secret_value(secret_ocid))
 
-        return wallet_value
+    def _get_wallet_value(self, secret_ocid):
+        return self._secret_cache.get(("wallet", secret_ocid), lambda: self._fetch_wallet_value(secret_ocid))
+
+    def _prefetch_secret_values(self, text_secret_names=(), wallet_secret_names=(), wait_for_results=True):
+        """Resolve and fetch several secrets concurrently into the shared cache."""
+        # Build the clients once up front instead of racing to build them on every fetch thread.
+        self.__get_vault_client()
+        self.__get_secret_client()
+
+        secret_names = [*text_secret_names, *wallet_secret_names]
+        with ThreadPoolExecutor(max_workers=max(len(secret_names), 1), thread_name_prefix="dfa-secret-ocid") as pool:
+            secret_ocids = dict(zip(secret_names, pool.map(self._get_secret_ocid, secret_names)))
+
+        loaders = {}
+        for secret_name in text_secret_names:
+            secret_ocid = secret_ocids[secret_name]
+            loaders[("text", secret_ocid)] = lambda secret_ocid=secret_ocid: self._fetch_secret_value(secret_ocid)
+        for secret_name in wallet_secret_names:
+            secret_ocid = secret_ocids[secret_name]
+            loaders[("wallet", secret_ocid)] = lambda secret_ocid=secret_ocid: self._fetch_wallet_value(secret_ocid)
+        return self._secret_cache.prefetch(loaders, wait_for_results=wait_for_results)
+
+    def _invalidate_secret(self, secret_ocid):
+        self._secret_cache.invalidate(("text", secret_ocid))
+        self._secret_cache.invalidate(("wallet", secret_ocid))
 
     def __set_vault_client(self):
-        self.__vault_client = oci.vault.VaultsClient(
+        self.__vault_client = OCI_CLIENT_REGISTRY.get_client(
+            oci.vault.VaultsClient,
             config=self.__get_config(),
             signer=self.__get_signer(),
             retry_strategy=build_default_oci_retry_strategy(),
@@ -306,7 +295,8 @@ class DfaBaseSecret:
         return self.__vault_client
 
     def __set_secret_client(self):
-        self.__secret_client = oci.secrets.SecretsClient(
+        self.__secret_client = OCI_CLIENT_REGISTRY.get_client(
+            oci.secrets.SecretsClient,
             config=self.__get_config(),
             signer=self.__get_signer(),
             retry_strategy=build_default_oci_retry_strategy(),
@@ -319,10 +309,7 @@ class DfaBaseSecret:
         return self.__secret_client
 
     def __set_config(self):
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            self.__config = oci.config.from_file(os.environ["DFA_CONFIG_LOCATION"], os.environ["DFA_CONFIG_PROFILE"])
-        else:
-            self.__config = {}
+        self.__config = OCI_CLIENT_REGISTRY.get_config()
 
     def __get_config(self):
         if self.__config is None:
@@ -331,37 +318,7 @@ class DfaBaseSecret:
         return self.__config
 
     def __set_signer(self):
-        token = None
-
-        if os.environ["DFA_SIGNER_TYPE"] == "user":
-            if os.environ["OCI_AUTH_TYPE"] == "security_token_file":
-                config = self.__get_config()
-                token_file = config["security_token_file"]
-
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-
-                private_key = oci.signer.load_private_key_from_file(config["key_file"])
-                self._signer = oci.auth.signers.SecurityTokenSigner(token, private_key)
-
-            elif os.environ["OCI_AUTH_TYPE"] == "delegation_token_file":
-                config = self.__get_config()
-                token_file = config["delegation_token_file"]
-                with open(token_file, "r", encoding="utf-8") as f:
-                    token = f.read()
-                self._signer = oci.auth.signers.InstancePrincipalsDelegationTokenSigner(delegation_token=token)
-
-            else:
-                self.logger.exception(
-                    "Please specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-                raise Exception(
-                    "Specify a valid OCI_AUTH_TYPE in config.ini. "
-                    "Accepted values are 'security_token_file' and 'delegation_token_file'."
-                )
-        else:
-            self._signer = oci.auth.signers.get_resource_principals_signer()
+        self._signer = OCI_CLIENT_REGISTRY.get_signer()
 
     def __get_signer(self):
         if self._signer is None:
@@ -397,15 +354,24 @@ class DfaBaseSecret:
 class AdwSecrets(DfaBaseSecret):
     admin_password_name = None
 
-    def get_connection_material(self):
+    @staticmethod
+    def _get_connection_secret_ocid():
+        secret_ocid = os.getenv("DFA_ADW_CONNECTION_SECRET_OCID")
+        if not secret_ocid:
+            raise ValueError("DFA_ADW_CONNECTION_SECRET_OCID must be configured")
+        return secret_ocid
+
+    def get_connection_material(self, force_refresh=False):
         """Return consolidated ADW credentials, if configured.
 
         Its wallet member is base64 encoded to keep the JSON secret text-safe.
+        ``force_refresh`` drops the cached bundle first, e.g. after the
+        credentials were rotated.
         """
         self.logger.info("Pulling ADW connection material from the OCI vault")
-        secret_ocid = os.getenv("DFA_ADW_CONNECTION_SECRET_OCID")
-        if not secret_ocid:
-            raise ValueError("DFA_ADW_CONNECTION_SECRET_OCID must be configured")
+        secret_ocid = self._get_connection_secret_ocid()
+        if force_refresh:
+            self._invalidate_secret(secret_ocid)
 
         try:
             material = json.loads(self._get_secret_value(secret_ocid))
@@ -417,6 +383,26 @@ class AdwSecrets(DfaBaseSecret):
         except (ValueError, json.JSONDecodeError, UnicodeDecodeError, binascii.Error) as error:
             raise ValueError("Invalid consolidated ADW connection secret") from error
 
+    def prefetch_connection_material(self):
+        """Start fetching the consolidated secret in the background and return its future."""
+        secret_ocid = self._get_connection_secret_ocid()
+        futures = self._secret_cache.prefetch(
+            {("text", secret_ocid): lambda: self._fetch_secret_value(secret_ocid)},
+            wait_for_results=False,
+        )
+        return futures[("text", secret_ocid)]
+
+    def prefetch_legacy_connection_secrets(self):
+        """Fetch the per-item password, wallet and PEM secrets concurrently instead of one by one."""
+        return self._prefetch_secret_values(
+            text_secret_names=(
+                os.environ["DFA_ADW_DFA_USER_PASSWORD_SECRET_NAME"],
+                os.environ["DFA_ADW_WALLET_PASSWORD_SECRET_NAME"],
+                os.environ["DFA_ADW_EWALLET_PEM_SECRET_NAME"],
+            ),
+            wallet_secret_names=(os.environ["DFA_ADW_WALLET_SECRET_NAME"],),
+        )
+
     def _connection_secret_exists(self, secret_name):
         return self._secret_exists(secret_name)
 
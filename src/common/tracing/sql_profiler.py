@@ -0,0 +1,175 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Optional
+
+from common.logger.logger import Logger
+from common.tracing.tracing import normalize_sql, sql_fingerprint
+
+DEFAULT_SQL_PROFILE_TOP = 10
+REPORT_STATEMENT_WIDTH = 100
+
+
+class StatementStats:
+    __slots__ = ("fingerprint", "statement", "executions", "rows", "elapsed_seconds", "batch_errors")
+
+    def __init__(self, fingerprint: str, statement: str):
+        self.fingerprint = fingerprint
+        self.statement = statement
+        self.executions = 0
+        self.rows = 0
+        self.elapsed_seconds = 0.0
+        self.batch_errors = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "executions": self.executions,
+            "rows": self.rows,
+            "elapsed_seconds": round(self.elapsed_seconds, 6),
+            "batch_errors": self.batch_errors,
+        }
+
+
+class ProfilingCursor:
+    """Wrap an oracledb cursor and report every statement it runs to a ``SqlProfiler``.
+
+    Anything not timed here (``fetchone``, ``setinputsizes``, ``connection`` ...) is
+    passed straight through to the wrapped cursor.
+    """
+
+    def __init__(self, cursor, profiler: "SqlProfiler"):
+        self._cursor = cursor
+        self._profiler = profiler
+        self._last_statement: Optional[str] = None
+
+    def execute(self, statement, *args, **kwargs):
+        self._last_statement = statement
+        started = perf_counter()
+        try:
+            return self._cursor.execute(statement, *args, **kwargs)
+        finally:
+            rowcount = getattr(self._cursor, "rowcount", None)
+            self._profiler.record(
+                statement, rowcount if isinstance(rowcount, int) and rowcount > 0 else 0, perf_counter() - started
+            )
+
+    def executemany(self, statement, parameters, *args, **kwargs):
+        self._last_statement = statement
+        started = perf_counter()
+        try:
+            return self._cursor.executemany(statement, parameters, *args, **kwargs)
+        finally:
+            rows = len(parameters) if isinstance(parameters, (list, tuple)) else parameters
+            self._profiler.record(statement, rows if isinstance(rows, int) else 0, perf_counter() - started)
+
+    def getbatcherrors(self):
+        batch_errors = self._cursor.getbatcherrors()
+        if batch_errors and self._last_statement is not None:
+            self._profiler.record_batch_errors(self._last_statement, len(batch_errors))
+        return batch_errors
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class SqlProfiler:
+    """Opt-in per-invocation profile of the SQL run through ``AdwConnection`` cursors.
+
+    With ``DFA_SQL_PROFILE=true`` every cursor handed out by ``AdwConnection.get_cursor``
+    is a ``ProfilingCursor``. Statements are grouped by the fingerprint of their
+    normalized text, so catalog checks that differ only in quoted table names add up
+    to one line. ``invocation`` logs the ``DFA_SQL_PROFILE_TOP`` statements with the
+    most elapsed time when it ends.
+    """
+
+    logger = Logger("dfa.sql_profile").get_logger()
+
+    def __init__(self, enabled: Optional[bool] = None):
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._statements: dict[str, StatementStats] = {}
+
+    def is_enabled(self) -> bool:
+        if self._enabled is not None:
+            return self._enabled
+        return os.getenv("DFA_SQL_PROFILE", "false").lower() == "true"
+
+    def configure(self, enabled: Optional[bool] = None):
+        """Turn profiling on or off; ``None`` falls back to ``DFA_SQL_PROFILE``."""
+        self._enabled = enabled
+
+    def wrap_cursor(self, cursor):
+        return ProfilingCursor(cursor, self) if self.is_enabled() else cursor
+
+    def _get_stats(self, statement: str) -> StatementStats:
+        fingerprint = sql_fingerprint(statement)
+        stats = self._statements.get(fingerprint)
+        if stats is None:
+            stats = self._statements[fingerprint] = StatementStats(fingerprint, normalize_sql(statement))
+        return stats
+
+    def record(self, statement: str, rows: int, elapsed_seconds: float):
+        with self._lock:
+            stats = self._get_stats(statement)
+            stats.executions += 1
+            stats.rows += rows
+            stats.elapsed_seconds += elapsed_seconds
+
+    def record_batch_errors(self, statement: str, count: int):
+        with self._lock:
+            self._get_stats(statement).batch_errors += count
+
+    def top(self, limit: Optional[int] = None) -> list[StatementStats]:
+        with self._lock:
+            statements = sorted(self._statements.values(), key=lambda stats: stats.elapsed_seconds, reverse=True)
+        return statements if limit is None else statements[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._statements.clear()
+
+    def report(self, limit: Optional[int] = None, title: str = "SQL profile") -> str:
+        if limit is None:
+            try:
+                limit = int(os.getenv("DFA_SQL_PROFILE_TOP", str(DEFAULT_SQL_PROFILE_TOP)))
+            except ValueError:
+                limit = DEFAULT_SQL_PROFILE_TOP
+        statements = self.top()
+        lines = [
+            f"{title}: {len(statements)} statement(s), "
+            f"{sum(stats.executions for stats in statements)} execution(s), "
+            f"{sum(stats.elapsed_seconds for stats in statements):.3f}s",
+            f"{'seconds':>10} {'execs':>7} {'rows':>9} {'errors':>7}  {'fingerprint':<16}  statement",
+        ]
+        for stats in statements[: max(limit, 0)]:
+            statement = stats.statement
+            if len(statement) > REPORT_STATEMENT_WIDTH:
+                statement = statement[: REPORT_STATEMENT_WIDTH - 3] + "..."
+            lines.append(
+                f"{stats.elapsed_seconds:>10.4f} {stats.executions:>7} {stats.rows:>9} {stats.batch_errors:>7}  "
+                f"{stats.fingerprint:<16}  {statement}"
+            )
+        return "\n".join(lines)
+
+    @contextmanager
+    def invocation(self, function_name: str):
+        """Log the top-N report for the statements run in the block, even on failure."""
+        if not self.is_enabled():
+            yield self
+            return
+        self.reset()
+        try:
+            yield self
+        finally:
+            if self._statements:
+                self.logger.info("%s", self.report(title=f"SQL profile for {function_name}"))
+            self.reset()
+
+
+SQL_PROFILER = SqlProfiler()
@@ -0,0 +1,300 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from common.logger.logger import Logger
+from common.metrics.metrics import post_json
+
+DEFAULT_TRACE_SAMPLE_RATE = 1.0
+DEFAULT_TRACE_MAX_SPANS = 5000
+DEFAULT_TRACE_TIMEOUT_SECONDS = 5
+SERVICE_NAME = "dfa"
+
+_SQL_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Return ``sql`` upper-cased with literals replaced by ``?`` and whitespace collapsed."""
+    return _WHITESPACE_PATTERN.sub(" ", _SQL_LITERAL_PATTERN.sub("?", sql)).strip().upper()
+
+
+def sql_fingerprint(sql: str) -> str:
+    """Return a short stable id for ``sql`` with literals and whitespace normalized."""
+    return hashlib.sha1(normalize_sql(sql).encode("utf-8")).hexdigest()[:16]
+
+
+def sql_attributes(sql: str) -> dict[str, str]:
+    return {"db.operation": sql.lstrip().split(" ", 1)[0].upper(), "db.statement.fingerprint": sql_fingerprint(sql)}
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class _NoopSpan:
+    """Returned when the calling context is not inside a sampled trace."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, **attributes):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class _Trace:
+    def __init__(self, tracer: "Tracer", max_spans: int):
+        self.tracer = tracer
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.max_spans = max_spans
+        self.spans: list["Span"] = []
+        self.dropped_spans = 0
+        self.lock = threading.Lock()
+
+    def add(self, span: "Span"):
+        with self.lock:
+            # The root span ends last, so one slot stays reserved for it.
+            if span.parent_span_id is None or len(self.spans) < self.max_spans - 1:
+                self.spans.append(span)
+            else:
+                self.dropped_spans += 1
+
+
+class Span:
+    __slots__ = ("_trace", "name", "span_id", "parent_span_id", "attributes", "start_ns", "end_ns", "error", "_token")
+
+    def __init__(self, trace: _Trace, name: str, parent_span_id: Optional[str], attributes: dict[str, Any]):
+        self._trace = trace
+        self.name = name
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.start_ns = 0
+        self.end_ns = 0
+        self.error: Optional[str] = None
+        self._token = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        self.attributes.update(attributes)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        self._trace.add(self)
+        if self.parent_span_id is None:
+            self._trace.tracer._export(self._trace)
+        return False
+
+    def to_otlp(self, trace_id: str) -> dict[str, Any]:
+        span = {
+            "traceId": trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_span_id is not None:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("dfa_current_span", default=None)
+
+
+class SpanExporter(ABC):
+    """Receives one OTLP/JSON ``ExportTraceServiceRequest`` document per finished trace."""
+
+    @abstractmethod
+    def export(self, document: dict[str, Any]):
+        pass
+
+
+class FileSpanExporter(SpanExporter):
+    """Append each trace to ``path`` as one JSON line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, document):
+        line = json.dumps(document, separators=(",", ":"))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class HttpSpanExporter(SpanExporter):
+    """POST each trace to an OTLP/HTTP JSON endpoint such as ``http://localhost:4318/v1/traces``."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout_seconds: float = DEFAULT_TRACE_TIMEOUT_SECONDS,
+        post: Optional[Callable[[str, bytes, float], Any]] = None,
+    ):
+        self.endpoint = endpoint
+        self.timeout_seconds = timeout_seconds
+        self._post = post or post_json
+
+    def export(self, document):
+        self._post(self.endpoint, json.dumps(document).encode("utf-8"), self.timeout_seconds)
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keep exported documents in memory, e.g. for tests."""
+
+    def __init__(self):
+        self.documents: list[dict[str, Any]] = []
+
+    def export(self, document):
+        self.documents.append(document)
+
+    def spans(self) -> list[dict[str, Any]]:
+        return [
+            span
+            for document in self.documents
+            for resource_spans in document["resourceSpans"]
+            for scope_spans in resource_spans["scopeSpans"]
+            for span in scope_spans["spans"]
+        ]
+
+
+def build_exporters_from_env() -> list[SpanExporter]:
+    """Build exporters for ``DFA_TRACE_FILE`` and ``DFA_TRACE_ENDPOINT``; tracing is off without either."""
+    exporters: list[SpanExporter] = []
+    if os.getenv("DFA_TRACE_FILE"):
+        exporters.append(FileSpanExporter(os.environ["DFA_TRACE_FILE"]))
+    if os.getenv("DFA_TRACE_ENDPOINT"):
+        exporters.append(HttpSpanExporter(os.environ["DFA_TRACE_ENDPOINT"]))
+    return exporters
+
+
+def _get_float_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+class Tracer:
+    """Nested spans for one invocation, exported as OpenTelemetry JSON when the root span ends.
+
+    ``trace`` opens the root span and decides, once per invocation, whether it is
+    sampled (``DFA_TRACE_SAMPLE_RATE``). ``span`` opens a child of the current span
+    in the same thread or task and costs a context-variable lookup when the
+    invocation is not sampled. At most ``DFA_TRACE_MAX_SPANS`` spans are kept per
+    trace; the rest are counted on the root span as ``dfa.dropped_spans``.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(self, exporters: Optional[list[SpanExporter]] = None, sample_rate: Optional[float] = None):
+        self._exporters = exporters
+        self._sample_rate = sample_rate
+        self._lock = threading.Lock()
+
+    def get_exporters(self) -> list[SpanExporter]:
+        with self._lock:
+            if self._exporters is None:
+                self._exporters = build_exporters_from_env()
+            return list(self._exporters)
+
+    def configure(self, exporters: Optional[list[SpanExporter]] = None, sample_rate: Optional[float] = None):
+        """Replace exporters and sample rate; ``None`` falls back to the environment."""
+        with self._lock:
+            self._exporters = exporters
+            self._sample_rate = sample_rate
+
+    def _is_sampled(self) -> bool:
+        sample_rate = self._sample_rate
+        if sample_rate is None:
+            sample_rate = _get_float_env("DFA_TRACE_SAMPLE_RATE", DEFAULT_TRACE_SAMPLE_RATE)
+        return sample_rate >= 1 or random.random() < sample_rate
+
+    def trace(self, name: str, **attributes):
+        """Open the root span for an invocation, or a child span if a trace is already active."""
+        if _current_span.get() is not None:
+            return self.span(name, **attributes)
+        if not self.get_exporters() or not self._is_sampled():
+            return NOOP_SPAN
+        max_spans = int(_get_float_env("DFA_TRACE_MAX_SPANS", DEFAULT_TRACE_MAX_SPANS))
+        return Span(_Trace(self, max(1, max_spans)), name, None, attributes)
+
+    def span(self, name: str, **attributes):
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        return Span(parent._trace, name, parent.span_id, attributes)
+
+    @staticmethod
+    def current_span():
+        return _current_span.get() or NOOP_SPAN
+
+    def _export(self, trace: _Trace):
+        with trace.lock:
+            spans = list(trace.spans)
+            dropped_spans = trace.dropped_spans
+        if dropped_spans:
+            spans[-1].set_attribute("dfa.dropped_spans", dropped_spans)
+        document = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes({"service.name": SERVICE_NAME})},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "dfa.tracing"},
+                            "spans": [span.to_otlp(trace.trace_id) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        for exporter in self.get_exporters():
+            try:
+                exporter.export(document)
+            except Exception as e:
+                self.logger.warning("Trace exporter %s failed: %s", type(exporter).__name__, e)
+
+
+TRACER = Tracer()
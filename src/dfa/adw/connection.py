@@ -2,14 +2,24 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 import atexit
+import hashlib
 import os
 import shutil
 import tempfile
+import threading
+from contextlib import contextmanager
 
 import oracledb
 
 from common.logger.logger import Logger
+from common.metrics.metrics import METRICS
 from common.ocihelpers.vault import AdwSecrets
+from common.tracing.sql_profiler import SQL_PROFILER
+from common.tracing.tracing import TRACER
+
+
+class _ThreadConnectionState:
+    """Connection slot owned by one thread inside ``AdwConnection.thread_scope``."""
 
 
 class AdwConnection:
@@ -18,63 +28,101 @@ class AdwConnection:
     __cursor = None
     __username = None
     __wallet_dir = None
+    __wallet_digest = None
+    _thread_local = threading.local()
+    _wallet_lock = threading.Lock()
     MAX_CONN_RETRY_COUNT = 3
     MAX_CONN_RETRY_DELAY = 3
     MAX_CONN_TCP_CONNECT_TIMEOUT = 10
+    # Errors after which the vault copy of the credentials or wallet is re-read once.
+    CREDENTIAL_ERROR_CODES = ("ORA-01017", "ORA-28000", "ORA-28001", "ORA-29024", "ORA-28759", "DPY-6005")
+
+    @classmethod
+    def _state(cls):
+        """Return the connection slot for the calling thread.
+
+        Outside ``thread_scope`` every thread shares the class-level connection, as
+        the single-invocation handlers expect.
+        """
+        scoped_state = getattr(cls._thread_local, "state", None)
+        return cls if scoped_state is None else scoped_state
+
+    @classmethod
+    @contextmanager
+    def thread_scope(cls):
+        """Give the calling thread its own connection and cursor until the block exits."""
+        previous_state = getattr(cls._thread_local, "state", None)
+        state = _ThreadConnectionState()
+        state.__connection = None
+        state.__cursor = None
+        state.__username = None
+        cls._thread_local.state = state
+        try:
+            yield
+        finally:
+            cls.rollback(suppress_errors=True)
+            cls._close_all()
+            cls._thread_local.state = previous_state
 
     @classmethod
     def _reset_connection(cls):
-        if cls.__cursor is not None:
+        state = cls._state()
+        if state.__cursor is not None:
             try:
-                cls.__cursor.close()
+                state.__cursor.close()
             except Exception as e:
                 cls.logger.warning("Failed to close stale cursor: %s", e)
             finally:
-                cls.__cursor = None
+                state.__cursor = None
 
-        if cls.__connection is not None:
+        if state.__connection is not None:
             try:
-                cls.__connection.close()
+                state.__connection.close()
             except Exception as e:
                 cls.logger.warning("Failed to close stale connection: %s", e)
             finally:
-                cls.__connection = None
-                cls.__username = None
+                state.__connection = None
+                state.__username = None
 
     @classmethod
     def _reset_cursor(cls):
-        if cls.__cursor is not None:
+        state = cls._state()
+        if state.__cursor is not None:
             try:
-                cls.__cursor.close()
+                state.__cursor.close()
             except Exception as e:
                 cls.logger.warning("Failed to close stale cursor: %s", e)
             finally:
-                cls.__cursor = None
+                state.__cursor = None
 
     @classmethod
     def _ensure_connection_is_usable(cls):
-        if cls.__connection is None:
+        state = cls._state()
+        if state.__connection is None:
             return
 
         try:
-            cls.__connection.ping()
+            METRICS.increment("db_round_trips", call="ping")
+            with TRACER.span("adw.ping"):
+                state.__connection.ping()
         except Exception as e:
             cls.logger.warning("ADW connection is no longer usable; reconnecting: %s", e)
             cls._reset_connection()
 
     @classmethod
     def _ensure_cursor_is_usable(cls):
-        if cls.__cursor is None:
+        state = cls._state()
+        if state.__cursor is None:
             return
 
         try:
-            cursor_connection = cls.__cursor.connection
+            cursor_connection = state.__cursor.connection
         except Exception as e:
             cls.logger.warning("ADW cursor is no longer usable; recreating: %s", e)
             cls._reset_cursor()
             return
 
-        if cursor_connection is not cls.__connection:
+        if cursor_connection is not state.__connection:
             cls.logger.info("ADW cursor belongs to a stale connection; recreating")
             cls._reset_cursor()
 
@@ -90,118 +138,212 @@ class AdwConnection:
     def _get_password(connection_material):
         return connection_material["dfa_user_password"]
 
+    @classmethod
+    def _is_credential_error(cls, error: Exception) -> bool:
+        message = str(error)
+        return any(code in message for code in cls.CREDENTIAL_ERROR_CODES)
+
+    @staticmethod
+    def _write_wallet_files(wallet_dir, connection_material):
+        with open(os.path.join(wallet_dir, "cwallet.sso"), "wb") as f:
+            f.write(connection_material["wallet"])
+        with open(os.path.join(wallet_dir, "ewallet.pem"), "w", encoding="utf-8") as f:
+            f.write(connection_material["ewallet_pem"])
+
+    @classmethod
+    def _ensure_wallet_dir(cls, connection_material):
+        """Return a directory holding the wallet in ``connection_material``.
+
+        The files are only rewritten when the wallet content changes. With
+        ``DFA_WALLET_DIR`` set, the wallet is kept under a content-addressed
+        subdirectory there so later processes on the same host reuse it.
+        """
+        wallet_digest = hashlib.sha256(
+            connection_material["wallet"] + connection_material["ewallet_pem"].encode("utf-8")
+        ).hexdigest()
+        with cls._wallet_lock:
+            if cls.__wallet_dir is not None and cls.__wallet_digest == wallet_digest:
+                return cls.__wallet_dir
+
+            wallet_root = os.getenv("DFA_WALLET_DIR")
+            if wallet_root:
+                wallet_dir = os.path.join(wallet_root, f"dfa_wallet_{wallet_digest[:16]}")
+                if not os.path.isdir(wallet_dir):
+                    os.makedirs(wallet_root, exist_ok=True)
+                    staging_dir = tempfile.mkdtemp(prefix="dfa_wallet_staging_", dir=wallet_root)
+                    cls._write_wallet_files(staging_dir, connection_material)
+                    try:
+                        os.rename(staging_dir, wallet_dir)
+                    except OSError:
+                        # Another process published the same wallet first.
+                        shutil.rmtree(staging_dir, ignore_errors=True)
+            elif cls.__wallet_dir is not None and os.path.isdir(cls.__wallet_dir):
+                wallet_dir = cls.__wallet_dir
+                cls._write_wallet_files(wallet_dir, connection_material)
+            else:
+                wallet_dir = tempfile.mkdtemp(prefix="dfa_wallet_")
+                os.chmod(wallet_dir, 0o700)
+                cls._write_wallet_files(wallet_dir, connection_material)
+                # Cleanup temp wallet directory on process exit
+                atexit.register(shutil.rmtree, wallet_dir, ignore_errors=True)
+
+            cls.__wallet_dir = wallet_dir
+            cls.__wallet_digest = wallet_digest
+            return wallet_dir
+
+    @classmethod
+    def _connect(cls, username, connection_material):
+        wallet_directory = cls._ensure_wallet_dir(connection_material)
+        password = cls._get_password(connection_material)
+        wallet_password = connection_material["wallet_password"]
+
+        params = {
+            "retry_count": cls._get_bounded_int_env(
+                "DFA_CONN_RETRY_COUNT", cls.MAX_CONN_RETRY_COUNT, cls.MAX_CONN_RETRY_COUNT
+            ),
+            "retry_delay": cls._get_bounded_int_env(
+                "DFA_CONN_RETRY_DELAY", cls.MAX_CONN_RETRY_DELAY, cls.MAX_CONN_RETRY_DELAY
+            ),
+            "tcp_connect_timeout": cls._get_bounded_int_env(
+                "DFA_CONN_TCP_CONNECT_TIMEOUT",
+                cls.MAX_CONN_TCP_CONNECT_TIMEOUT,
+                cls.MAX_CONN_TCP_CONNECT_TIMEOUT,
+            ),
+        }
+        query = "&".join([f"{k}={v}" for k, v in params.items()])
+        dsn = (
+            f'{os.environ["DFA_CONN_PROTOCOL"]}://'
+            f'{os.environ["DFA_CONN_HOST"]}:{os.environ["DFA_CONN_PORT"]}/'
+            f'{os.environ["DFA_CONN_SERVICE_NAME"]}?{query}'
+        )
+
+        return oracledb.connect(
+            user=username,
+            password=password,
+            dsn=dsn,
+            wallet_password=wallet_password,
+            wallet_location=wallet_directory,
+        )
+
+    @classmethod
+    def prefetch_connection_material(cls):
+        """Start loading the connection secret in the background during handler bootstrap.
+
+        Does nothing when a connection already exists or ``DFA_SECRET_PREFETCH`` is ``false``.
+        """
+        if os.getenv("DFA_SECRET_PREFETCH", "true").lower() == "false":
+            return None
+        if cls._state().__connection is not None or not os.getenv("DFA_ADW_CONNECTION_SECRET_OCID"):
+            return None
+        try:
+            return AdwSecrets().prefetch_connection_material()
+        except Exception as e:
+            cls.logger.warning("Failed to start ADW connection secret prefetch: %s", e)
+            return None
+
     @classmethod
     def get_connection(cls, username: str | None = None):
+        state = cls._state()
         username = os.environ["DFA_ADW_DFA_SCHEMA"] if username is None else username
-        if cls.__connection is not None and cls.__username != username:
-            cls.logger.info("ADW username changed from %s to %s; reconnecting", cls.__username, username)
+        if state.__connection is not None and state.__username != username:
+            cls.logger.info("ADW username changed from %s to %s; reconnecting", state.__username, username)
             cls._reset_connection()
 
         cls._ensure_connection_is_usable()
-        if cls.__connection is None:
+        if state.__connection is None:
             cls.logger.info("Initializing ADW connection (loading wallet and secrets)")
 
-            secrets_mgr = AdwSecrets()
-            connection_material = secrets_mgr.get_connection_material()
-            if not isinstance(connection_material, dict):
-                raise ValueError("Invalid consolidated ADW connection secret")
-            if cls.__wallet_dir is None:
-                cls.__wallet_dir = tempfile.mkdtemp(prefix="dfa_wallet_")
-                os.chmod(cls.__wallet_dir, 0o700)
-                # Write wallet files into the temp directory
-                with open(os.path.join(cls.__wallet_dir, "cwallet.sso"), "wb") as f:
-                    f.write(connection_material["wallet"])
-                with open(os.path.join(cls.__wallet_dir, "ewallet.pem"), "w", encoding="utf-8") as f:
-                    f.write(connection_material["ewallet_pem"])
-                # Cleanup temp wallet directory on process exit
-                atexit.register(shutil.rmtree, cls.__wallet_dir, ignore_errors=True)
-
-            wallet_directory = cls.__wallet_dir
-            password = cls._get_password(connection_material)
-            wallet_password = connection_material["wallet_password"]
-
-            params = {
-                "retry_count": cls._get_bounded_int_env(
-                    "DFA_CONN_RETRY_COUNT", cls.MAX_CONN_RETRY_COUNT, cls.MAX_CONN_RETRY_COUNT
-                ),
-                "retry_delay": cls._get_bounded_int_env(
-                    "DFA_CONN_RETRY_DELAY", cls.MAX_CONN_RETRY_DELAY, cls.MAX_CONN_RETRY_DELAY
-                ),
-                "tcp_connect_timeout": cls._get_bounded_int_env(
-                    "DFA_CONN_TCP_CONNECT_TIMEOUT",
-                    cls.MAX_CONN_TCP_CONNECT_TIMEOUT,
-                    cls.MAX_CONN_TCP_CONNECT_TIMEOUT,
-                ),
-            }
-            query = "&".join([f"{k}={v}" for k, v in params.items()])
-            dsn = (
-                f'{os.environ["DFA_CONN_PROTOCOL"]}://'
-                f'{os.environ["DFA_CONN_HOST"]}:{os.environ["DFA_CONN_PORT"]}/'
-                f'{os.environ["DFA_CONN_SERVICE_NAME"]}?{query}'
-            )
-
-            cls.__connection = oracledb.connect(
-                user=username,
-                password=password,
-                dsn=dsn,
-                wallet_password=wallet_password,
-                wallet_location=wallet_directory,
-            )
+            with TRACER.span("adw.connect", username=username):
+                secrets_mgr = AdwSecrets()
+                connection_material = secrets_mgr.get_connection_material()
+                if not isinstance(connection_material, dict):
+                    raise ValueError("Invalid consolidated ADW connection secret")
+                try:
+                    state.__connection = cls._connect(username, connection_material)
+                except oracledb.Error as e:
+                    if not cls._is_credential_error(e):
+                        raise
+                    cls.logger.warning(
+                        "ADW rejected the cached credentials or wallet; reloading them from the vault: %s", e
+                    )
+                    connection_material = secrets_mgr.get_connection_material(force_refresh=True)
+                    state.__connection = cls._connect(username, connection_material)
             atexit.register(cls._close_all)
-            cls.__username = username
+            state.__username = username
 
             cls.logger.info("ADW connection established")
 
-        return cls.__connection
+        return state.__connection
+
+    @classmethod
+    def install_connection(cls, connection, username: str | None = None):
+        """Use an already open ``connection``, such as ``RecordingConnection``, for ``username``.
+
+        Later ``get_connection``/``get_cursor`` calls ping and reuse it exactly as they
+        would a connection opened from the vault material.
+        """
+        cls._close_all()
+        state = cls._state()
+        state.__connection = connection
+        state.__username = os.environ["DFA_ADW_DFA_SCHEMA"] if username is None else username
+        return connection
 
     @classmethod
     def get_cursor(cls, username: str | None = None):
+        state = cls._state()
         connection = cls.get_connection(username)
         cls._ensure_cursor_is_usable()
-        if cls.__cursor is None:
-            cls.__cursor = connection.cursor()
+        if state.__cursor is None:
+            state.__cursor = SQL_PROFILER.wrap_cursor(connection.cursor())
 
-        return cls.__cursor
+        return state.__cursor
 
     @classmethod
     def _close_all(cls):
-        if cls.__cursor:
+        state = cls._state()
+        if state.__cursor:
             try:
-                cls.__cursor.close()
-                cls.__cursor = None
+                state.__cursor.close()
+                state.__cursor = None
             except Exception as e:
                 cls.logger.warning("Failed to close cursor: %s", e)
-                cls.__cursor = None
+                state.__cursor = None
         else:
-            cls.__cursor = None
+            state.__cursor = None
 
-        if cls.__connection:
+        if state.__connection:
             try:
-                cls.__connection.close()
-                cls.__connection = None
+                state.__connection.close()
+                state.__connection = None
             except Exception as e:
                 cls.logger.warning("Failed to close connection: %s", e)
-                cls.__connection = None
+                state.__connection = None
             finally:
-                cls.__username = None
+                state.__username = None
         else:
-            cls.__connection = None
-            cls.__username = None
+            state.__connection = None
+            state.__username = None
 
     @classmethod
     def commit(cls):
-        if cls.__connection is not None:
+        state = cls._state()
+        if state.__connection is not None:
             try:
-                cls.__connection.commit()
+                METRICS.increment("db_round_trips", call="commit")
+                with TRACER.span("adw.commit"):
+                    state.__connection.commit()
             except Exception as e:
                 cls.logger.warning("Failed to commit: %s", e)
                 raise
 
     @classmethod
     def rollback(cls, suppress_errors: bool = False):
-        if cls.__connection is not None:
+        state = cls._state()
+        if state.__connection is not None:
             try:
-                cls.__connection.rollback()
+                METRICS.increment("db_round_trips", call="rollback")
+                with TRACER.span("adw.rollback"):
+                    state.__connection.rollback()
             except Exception as e:
                 cls.logger.warning("Failed to roll back: %s", e)
                 if not suppress_errors:
@@ -0,0 +1,324 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+"""In-memory stand-in for an ADW connection that records every database call.
+
+``RecordingConnection`` can be installed with ``AdwConnection.install_connection``
+so the real query builders and table managers run unchanged against it. It keeps
+the rows written by INSERT, UPDATE, MERGE and DELETE statements in a
+``FakeKeyStore`` keyed by each table's unique columns, reports duplicate keys as
+``ORA-00001`` batch errors, and can inject further batch errors and a fixed
+latency per round trip. Standard library only, so it can be used by benchmarks
+that avoid importing the Oracle driver.
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from time import sleep
+from typing import Any, Callable, Optional
+
+_DML_TABLE_PATTERN = re.compile(
+    r"^\s*(INSERT\s+INTO|UPDATE|DELETE\s+FROM|MERGE\s+INTO)\s+(?:\"[^\"]+\"\.)?\"([^\"]+)\"",
+    re.IGNORECASE,
+)
+_CATALOG_VIEWS = ("ALL_OBJECTS", "ALL_INDEXES", "ALL_CONSTRAINTS", "ALL_TABLES", "ALL_USERS", "DBA_USERS")
+
+
+@dataclass(frozen=True)
+class FakeBatchError:
+    """Mirrors the attributes the query builders read from ``oracledb`` batch errors."""
+
+    offset: int
+    full_code: str
+    message: str
+
+    @property
+    def code(self) -> int:
+        return int(self.full_code.split("-")[-1])
+
+
+@dataclass(frozen=True)
+class RecordedCall:
+    method: str
+    statement: Optional[str] = None
+    row_count: int = 0
+    bind_bytes: int = 0
+
+
+@dataclass
+class _BatchErrorRule:
+    table: Optional[str]
+    predicate: Callable[[dict[str, Any]], bool]
+    full_code: str
+    message: str
+
+
+def estimate_bind_bytes(value: Any) -> int:
+    """Approximate the bytes a bind value puts on the wire."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, datetime):
+        return 11
+    if isinstance(value, date):
+        return 7
+    if isinstance(value, (int, float)):
+        return 8
+    return len(str(value).encode("utf-8"))
+
+
+def unique_keys_for_tables(*table_managers) -> dict[str, list[str]]:
+    """Return ``{table_name: key columns}`` from table managers' unique constraint definitions."""
+    unique_keys = {}
+    for table_manager in table_managers:
+        get_constraint_details = getattr(table_manager, "get_unique_contraint_definition_details", None)
+        constraint_details = (get_constraint_details() if get_constraint_details else None) or {}
+        if constraint_details.get("columns"):
+            unique_keys[table_manager.get_table_name()] = [column.upper() for column in constraint_details["columns"]]
+    return unique_keys
+
+
+@dataclass
+class FakeKeyStore:
+    """Rows per table, keyed by the table's unique columns.
+
+    Tables without configured ``unique_keys`` accept every insert and ignore
+    updates and deletes.
+    """
+
+    unique_keys: dict[str, list[str]] = field(default_factory=dict)
+    rows: dict[str, dict[tuple, dict[str, Any]]] = field(default_factory=dict)
+    _error_rules: list[_BatchErrorRule] = field(default_factory=list)
+
+    def _key(self, table: str, row: dict[str, Any]) -> Optional[tuple]:
+        key_columns = self.unique_keys.get(table)
+        if not key_columns:
+            return None
+        return tuple(row.get(column) for column in key_columns)
+
+    def seed(self, table: str, rows: list[dict[str, Any]]):
+        """Pre-populate ``table`` so later inserts of the same keys violate the constraint."""
+        for row in rows:
+            row = {name.upper(): value for name, value in row.items()}
+            key = self._key(table, row)
+            if key is not None:
+                self.rows.setdefault(table, {})[key] = row
+
+    def fail_rows(
+        self,
+        predicate: Callable[[dict[str, Any]], bool],
+        table: Optional[str] = None,
+        full_code: str = "ORA-12899",
+        message: str = "ORA-12899: value too large for column",
+    ):
+        """Report a batch error for every bound row matching ``predicate`` (optionally only for ``table``)."""
+        self._error_rules.append(_BatchErrorRule(table, predicate, full_code, message))
+
+    def count(self, table: str) -> int:
+        return len(self.rows.get(table, {}))
+
+    def apply(self, operation: str, table: str, row: dict[str, Any]) -> Optional[tuple[str, str]]:
+        """Apply one bound row and return ``(full_code, message)`` when it fails."""
+        for rule in self._error_rules:
+            if rule.table in (None, table) and rule.predicate(row):
+                return rule.full_code, rule.message
+
+        key = self._key(table, row)
+        if key is None:
+            return None
+        table_rows = self.rows.setdefault(table, {})
+        if operation == "INSERT":
+            if key in table_rows:
+                return "ORA-00001", f"ORA-00001: unique constraint violated on {table}"
+            table_rows[key] = dict(row)
+        elif operation == "UPDATE":
+            if key in table_rows:
+                table_rows[key].update(row)
+        elif operation == "MERGE":
+            table_rows.setdefault(key, {}).update(row)
+        elif operation == "DELETE":
+            table_rows.pop(key, None)
+        return None
+
+
+class RecordingCursor:
+    """DB-API cursor double that records calls and applies DML to a ``FakeKeyStore``.
+
+    Queries against the data dictionary return ``(1,)`` so tables and indexes look
+    present, other ``COUNT`` queries return ``(0,)``, and anything else returns no
+    row unless ``query_results`` maps a substring of the statement to a result.
+    """
+
+    def __init__(self, connection: "RecordingConnection"):
+        self.connection = connection
+        self.rowcount = 0
+        self._batch_errors: list[FakeBatchError] = []
+        self._result_rows: list[tuple] = []
+
+    def _record(self, method, statement=None, rows=()):
+        bind_bytes = sum(estimate_bind_bytes(value) for row in rows for value in _row_values(row))
+        self.connection._record(RecordedCall(method, statement, len(rows), bind_bytes))
+
+    def setinputsizes(self, *args, **kwargs):
+        self.connection._record(RecordedCall("setinputsizes"), round_trip=False)
+
+    def execute(self, statement, parameters=None, **kwargs):
+        rows = [parameters] if parameters else []
+        self._record("execute", statement, rows)
+        self._batch_errors = []
+        self._result_rows = self.connection._query_result(statement)
+        self.rowcount = 0
+        dml = _DML_TABLE_PATTERN.match(statement)
+        if dml and isinstance(parameters, dict):
+            error = self.connection.key_store.apply(_operation(dml.group(1)), dml.group(2), parameters)
+            if error is not None:
+                raise self.connection.database_error(error[1])
+            self.rowcount = 1
+
+    def executemany(self, statement, parameters, batcherrors=False, **kwargs):
+        rows = list(parameters)
+        self._record("executemany", statement, rows)
+        self._batch_errors = []
+        self._result_rows = []
+        self.rowcount = 0
+        dml = _DML_TABLE_PATTERN.match(statement)
+        if dml is None:
+            self.rowcount = len(rows)
+            return
+
+        operation, table = _operation(dml.group(1)), dml.group(2)
+        for offset, row in enumerate(rows):
+            error = self.connection.key_store.apply(operation, table, _row_dict(row))
+            if error is None:
+                self.rowcount += 1
+                continue
+            if not batcherrors:
+                raise self.connection.database_error(error[1])
+            self._batch_errors.append(FakeBatchError(offset, *error))
+        self.connection._count("batch_errors", len(self._batch_errors))
+
+    def getbatcherrors(self):
+        return list(self._batch_errors)
+
+    def fetchone(self):
+        return self._result_rows.pop(0) if self._result_rows else None
+
+    def fetchall(self):
+        rows, self._result_rows = self._result_rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+class RecordingConnection:
+    """Connection double for ``AdwConnection`` that counts round trips, binds and transactions.
+
+    ``latency_seconds`` is slept once per round trip (execute, executemany,
+    commit, rollback and ping) to model network distance to the database.
+    """
+
+    def __init__(
+        self,
+        key_store: Optional[FakeKeyStore] = None,
+        latency_seconds: float = 0.0,
+        query_results: Optional[dict[str, list[tuple]]] = None,
+        database_error: Callable[[str], Exception] = RuntimeError,
+    ):
+        self.key_store = FakeKeyStore() if key_store is None else key_store
+        self.latency_seconds = latency_seconds
+        self.query_results = dict(query_results or {})
+        self.database_error = database_error
+        self.calls: list[RecordedCall] = []
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def _record(self, call: RecordedCall, round_trip: bool = True):
+        with self._lock:
+            self.calls.append(call)
+            self._counters[call.method] = self._counters.get(call.method, 0) + 1
+            self._counters["rows_bound"] = self._counters.get("rows_bound", 0) + call.row_count
+            self._counters["bind_bytes"] = self._counters.get("bind_bytes", 0) + call.bind_bytes
+            if round_trip:
+                self._counters["round_trips"] = self._counters.get("round_trips", 0) + 1
+        if round_trip and self.latency_seconds:
+            sleep(self.latency_seconds)
+
+    def _query_result(self, statement: str) -> list[tuple]:
+        for fragment, rows in self.query_results.items():
+            if fragment in statement:
+                return list(rows)
+        upper_statement = statement.upper()
+        is_count = "COUNT(" in upper_statement.replace(" ", "")
+        if any(view in upper_statement for view in _CATALOG_VIEWS):
+            # Catalog counts report every object as present; catalog listings are empty.
+            return [(1,)] if is_count else []
+        if is_count:
+            return [(0,)]
+        return []
+
+    def cursor(self):
+        return RecordingCursor(self)
+
+    def ping(self):
+        self._record(RecordedCall("ping"))
+
+    def commit(self):
+        self._record(RecordedCall("commit"))
+
+    def rollback(self):
+        self._record(RecordedCall("rollback"))
+
+    def close(self):
+        self._record(RecordedCall("close"), round_trip=False)
+
+    def statements(self, method: Optional[str] = None) -> list[str]:
+        """Return the recorded SQL text, optionally only for ``execute`` or ``executemany``."""
+        return [
+            call.statement
+            for call in self.calls
+            if call.statement is not None and (method is None or call.method == method)
+        ]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                name: self._counters.get(name, 0)
+                for name in (
+                    "round_trips",
+                    "execute",
+                    "executemany",
+                    "rows_bound",
+                    "bind_bytes",
+                    "commit",
+                    "rollback",
+                    "ping",
+                    "setinputsizes",
+                    "batch_errors",
+                )
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.calls.clear()
+            self._counters.clear()
+
+
+def _operation(verb: str) -> str:
+    return verb.split()[0].upper()
+
+
+def _row_dict(row) -> dict[str, Any]:
+    return row if isinstance(row, dict) else dict(enumerate(row))
+
+
+def _row_values(row):
+    return row.values() if isinstance(row, dict) else row
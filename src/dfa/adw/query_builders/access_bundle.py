@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.access_bundle import AccessBundleStateTable, AccessBundleTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class AccessBundleStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ACCESS_BUNDLE", "CREATE", False)
 class AccessBundleStateCreateQueryBuilder(AccessBundleStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(AccessBundleStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class AccessBundleStateCreateQueryBuilder(AccessBundleStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_BUNDLE", "UPDATE", False)
 class AccessBundleStateUpdateQueryBuilder(AccessBundleStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class AccessBundleStateUpdateQueryBuilder(AccessBundleStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_BUNDLE", "DELETE", False)
 class AccessBundleStateDeleteQueryBuilder(AccessBundleStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class AccessBundleTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ACCESS_BUNDLE", "CREATE", True)
 class AccessBundleTimeSeriesCreateQueryBuilder(AccessBundleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_BUNDLE", "UPDATE", True)
 class AccessBundleTimeSeriesUpdateQueryBuilder(AccessBundleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_BUNDLE", "DELETE", True)
 class AccessBundleTimeSeriesDeleteQueryBuilder(AccessBundleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.access_guardrail import AccessGuardrailStateTable, AccessGuardrailTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class AccessGuardrailStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "CREATE", False)
 class AccessGuardrailStateCreateQueryBuilder(AccessGuardrailStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(AccessGuardrailStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class AccessGuardrailStateCreateQueryBuilder(AccessGuardrailStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "UPDATE", False)
 class AccessGuardrailStateUpdateQueryBuilder(AccessGuardrailStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class AccessGuardrailStateUpdateQueryBuilder(AccessGuardrailStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "DELETE", False)
 class AccessGuardrailStateDeleteQueryBuilder(AccessGuardrailStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class AccessGuardrailTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "CREATE", True)
 class AccessGuardrailTimeSeriesCreateQueryBuilder(AccessGuardrailTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "UPDATE", True)
 class AccessGuardrailTimeSeriesUpdateQueryBuilder(AccessGuardrailTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ACCESS_GUARDRAIL", "DELETE", True)
 class AccessGuardrailTimeSeriesDeleteQueryBuilder(AccessGuardrailTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
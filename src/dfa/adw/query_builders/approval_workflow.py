@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.approval_workflow import ApprovalWorkflowStateTable, ApprovalWorkflowTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class ApprovalWorkflowStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "CREATE", False)
 class ApprovalWorkflowStateCreateQueryBuilder(ApprovalWorkflowStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(ApprovalWorkflowStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class ApprovalWorkflowStateCreateQueryBuilder(ApprovalWorkflowStateQueryBuilder)
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "UPDATE", False)
 class ApprovalWorkflowStateUpdateQueryBuilder(ApprovalWorkflowStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class ApprovalWorkflowStateUpdateQueryBuilder(ApprovalWorkflowStateQueryBuilder)
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "DELETE", False)
 class ApprovalWorkflowStateDeleteQueryBuilder(ApprovalWorkflowStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class ApprovalWorkflowTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "CREATE", True)
 class ApprovalWorkflowTimeSeriesCreateQueryBuilder(ApprovalWorkflowTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "UPDATE", True)
 class ApprovalWorkflowTimeSeriesUpdateQueryBuilder(ApprovalWorkflowTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("APPROVAL_WORKFLOW", "DELETE", True)
 class ApprovalWorkflowTimeSeriesDeleteQueryBuilder(ApprovalWorkflowTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
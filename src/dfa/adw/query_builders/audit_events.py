@@ -7,6 +7,7 @@ from pypika import Table
 
 from dfa.adw.connection import AdwConnection
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder, InsertManyQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.audit_events import AuditEventsTable
 
 
@@ -22,6 +23,7 @@ class AuditEventsStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("AUDIT_EVENTS", "CREATE", False)
 class AuditEventsStateCreateQueryBuilder(AuditEventsStateQueryBuilder):
     def executemany_sql_for_events(self):
         self.logger.info("Using bulk insert operations for %d audit events", len(self.events))
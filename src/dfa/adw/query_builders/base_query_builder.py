@@ -2,23 +2,30 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 # pylint: disable=too-many-lines
 
-import importlib.util
-import inspect
-import os
 import re
 from datetime import datetime, timedelta, timezone
-from functools import lru_cache
-from pathlib import Path
 from time import sleep
 from typing import Any, Optional, cast
 
 import oracledb
 from pypika import CustomFunction, Order, Parameter, Query, Table
-from pypika.functions import ToDate
 
-from common.logger.logger import Logger
+from common.logger.logger import Logger, limit_repeated_messages
+from common.metrics.metrics import METRICS
+from common.tracing.tracing import TRACER, sql_attributes
 from dfa.adw.connection import AdwConnection
-from dfa.adw.tables.base_table import SnapshotBatchTrackerTable, StreamOffsetTrackerTable
+from dfa.adw.query_builders.registry import QUERY_BUILDER_REGISTRY
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.base_table import (
+    BaseStateTable,
+    SnapshotBatchTrackerTable,
+    SnapshotChunkCheckpointTable,
+    StreamOffsetTrackerTable,
+)
+from dfa.adw.tables.compact_row import CompactRow, column_values, shared_column_index
+
+BATCH_ERROR_LOG_MESSAGE = "batch error: %s"
+limit_repeated_messages(BATCH_ERROR_LOG_MESSAGE)
 
 
 class InsertManyQueryBuilder:
@@ -207,62 +214,169 @@ class DeleteManyQueryBuilder:
         return delete_sql.get_sql()
 
 
+def _utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime, the form the tracker's DATE columns hold."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class StreamOffsetTrackerQueryBuilder(Table):
+    """Statements for the stream offset tracker; each method returns ``(statement, binds)``.
+
+    Ranges are keyed by application, partition and start offset. Lookups order by
+    the offsets themselves, which the key and ``DFA_SOT_END_OFFSET_IDX`` cover,
+    instead of by ``ID``.
+    """
+
     table_manager = StreamOffsetTrackerTable()
+    UNFINISHED_RANGE_RETRY_AFTER = timedelta(hours=6)
 
     def __init__(self):
         super().__init__(self.table_manager.get_table_name())
 
-    def get_statement_for_select_max_offset_for_transformer(self, transformer):
+    def _where_application_partition(self, query):
+        return query.where(self.APPLICATION == Parameter(":APPLICATION")).where(
+            self.STREAM_PARTITION == Parameter(":STREAM_PARTITION")
+        )
+
+    def get_statement_for_select_max_offset_for_transformer(self, transformer, partition="0"):
         statement = (
-            Query.from_(self)
-            .select("END_OFFSET")
-            .where(getattr(self, "APPLICATION") == transformer)
-            .orderby("ID", order=Order.desc)
+            self._where_application_partition(Query.from_(self).select(self.END_OFFSET))
+            .orderby(self.END_OFFSET, order=Order.desc)
             .get_sql()
         )
         statement += " FETCH FIRST 1 ROW ONLY"
 
-        return statement
-
-    def get_insert_statement_for_stream_offset(self, offset, end_offset, application):
-        offset_data = (offset, end_offset, application)
-        statement = Query.into(self).columns("OFFSET", "END_OFFSET", "APPLICATION").insert(*offset_data).get_sql()
-        return statement
-
-    def get_statement_for_latest_unfinished_stream_offset_range(self, application):
-        start_date = datetime.now()
-        start_date = start_date.astimezone(timezone.utc)
-        start_date = start_date - timedelta(hours=6)
+        return statement, {"APPLICATION": transformer, "STREAM_PARTITION": partition}
+
+    def get_insert_statement_for_stream_offset(self, offset, end_offset, application, partition="0"):
+        """Record ``offset``..``end_offset`` as in progress; a range read again from the same offset is reopened."""
+        statement = f"""
+            MERGE INTO "{self.get_table_name()}" t
+            USING (
+                SELECT :APPLICATION AS "APPLICATION", :STREAM_PARTITION AS "STREAM_PARTITION",
+                    :START_OFFSET AS "OFFSET"
+                FROM DUAL
+            ) s
+            ON (t."APPLICATION" = s."APPLICATION" AND t."STREAM_PARTITION" = s."STREAM_PARTITION"
+                AND t."OFFSET" = s."OFFSET")
+            WHEN MATCHED THEN UPDATE SET
+                t."END_OFFSET" = :END_OFFSET,
+                t."START_DATE" = :START_DATE,
+                t."END_DATE" = NULL
+            WHEN NOT MATCHED THEN INSERT ("APPLICATION", "STREAM_PARTITION", "OFFSET", "END_OFFSET", "START_DATE")
+            VALUES (s."APPLICATION", s."STREAM_PARTITION", s."OFFSET", :END_OFFSET, :START_DATE)
+        """
+        binds = {
+            "APPLICATION": application,
+            "STREAM_PARTITION": partition,
+            "START_OFFSET": offset,
+            "END_OFFSET": end_offset,
+            "START_DATE": _utc_now(),
+        }
+        return statement, binds
 
+    def get_statement_for_latest_unfinished_stream_offset_range(self, application, partition="0"):
+        """Select ``(OFFSET, END_OFFSET)`` of the latest range left unfinished for longer than the retry delay."""
         select_sql = (
-            Query.from_(self)
-            .select(self.ID, self.OFFSET, self.END_OFFSET)
+            self._where_application_partition(Query.from_(self).select(self.OFFSET, self.END_OFFSET))
             .where(self.END_DATE.isnull())
-            .where(self.APPLICATION == application)
-            .where(self.START_DATE < ToDate(start_date.strftime("%d-%b-%y %H:%M:%S"), "DD-MON-RR HH24:MI:SS"))
-            .orderby("ID", order=Order.desc)
+            .where(self.START_DATE < Parameter(":START_DATE"))
+            .orderby(self.OFFSET, order=Order.desc)
             .get_sql()
         )
+        binds = {
+            "APPLICATION": application,
+            "STREAM_PARTITION": partition,
+            "START_DATE": _utc_now() - self.UNFINISHED_RANGE_RETRY_AFTER,
+        }
 
-        return select_sql
+        return select_sql, binds
 
-    def get_statement_for_offset_range_completion(self, offset, end_offset, application):
-        end_date_now = datetime.now()
-        end_date_now = end_date_now.astimezone(timezone.utc)
+    def get_statement_for_offset_range_completion(self, offset, end_offset, application, partition="0"):
         statement = (
-            Query.update(self)
-            .set(
-                self.END_DATE,
-                ToDate(end_date_now.strftime("%d-%b-%y %H:%M:%S"), "DD-MON-RR HH24:MI:SS"),
-            )
-            .where(self.OFFSET == offset)
-            .where(self.END_OFFSET == end_offset)
-            .where(self.APPLICATION == application)
+            self._where_application_partition(Query.update(self).set(self.END_DATE, Parameter(":END_DATE")))
+            .where(self.OFFSET == Parameter(":START_OFFSET"))
+            .where(self.END_OFFSET == Parameter(":END_OFFSET"))
             .get_sql()
         )
+        binds = {
+            "APPLICATION": application,
+            "STREAM_PARTITION": partition,
+            "START_OFFSET": offset,
+            "END_OFFSET": end_offset,
+            "END_DATE": _utc_now(),
+        }
 
-        return statement
+        return statement, binds
+
+    def get_statements_for_offset_compaction(self, application):
+        """Return the statements that fold ``application``'s completed ranges into one checkpoint row per partition.
+
+        The first merges the highest completed end offset of every partition into
+        its checkpoint row. The second deletes the completed ranges the checkpoint
+        now covers. An unfinished range is kept, even below the checkpoint, unless
+        it is past the retry delay and a single completed range re-read all of its
+        offsets; otherwise its messages may never have been loaded.
+        """
+        table = f'"{self.get_table_name()}"'
+        merge_sql = f"""
+            MERGE INTO {table} t
+            USING (
+                SELECT "APPLICATION", "STREAM_PARTITION", MAX("END_OFFSET") AS "END_OFFSET",
+                    MAX("END_DATE") AS "END_DATE"
+                FROM {table}
+                WHERE "APPLICATION" = :APPLICATION AND "END_DATE" IS NOT NULL AND "OFFSET" <> :CHECKPOINT_OFFSET
+                GROUP BY "APPLICATION", "STREAM_PARTITION"
+            ) s
+            ON (t."APPLICATION" = s."APPLICATION" AND t."STREAM_PARTITION" = s."STREAM_PARTITION"
+                AND t."OFFSET" = :CHECKPOINT_OFFSET)
+            WHEN MATCHED THEN UPDATE SET
+                t."END_OFFSET" = GREATEST(t."END_OFFSET", s."END_OFFSET"),
+                t."END_DATE" = s."END_DATE"
+            WHEN NOT MATCHED THEN INSERT (
+                "APPLICATION", "STREAM_PARTITION", "OFFSET", "END_OFFSET", "START_DATE", "END_DATE"
+            ) VALUES (
+                s."APPLICATION", s."STREAM_PARTITION", :CHECKPOINT_OFFSET, s."END_OFFSET", s."END_DATE", s."END_DATE"
+            )
+        """
+        # One statement, so the EXISTS sees the completed ranges this DELETE removes.
+        delete_sql = f"""
+            DELETE FROM {table} t
+            WHERE t."APPLICATION" = :APPLICATION
+              AND t."OFFSET" <> :CHECKPOINT_OFFSET
+              AND (
+                  (
+                      t."END_DATE" IS NOT NULL
+                      AND t."END_OFFSET" <= (
+                          SELECT p."END_OFFSET" FROM {table} p
+                          WHERE p."APPLICATION" = t."APPLICATION" AND p."STREAM_PARTITION" = t."STREAM_PARTITION"
+                            AND p."OFFSET" = :CHECKPOINT_OFFSET
+                      )
+                  )
+                  OR (
+                      t."END_DATE" IS NULL
+                      AND (t."START_DATE" IS NULL OR t."START_DATE" < :START_DATE)
+                      AND EXISTS (
+                          SELECT 1 FROM {table} c
+                          WHERE c."APPLICATION" = t."APPLICATION" AND c."STREAM_PARTITION" = t."STREAM_PARTITION"
+                            AND c."OFFSET" <> :CHECKPOINT_OFFSET AND c."END_DATE" IS NOT NULL
+                            AND c."OFFSET" <= t."OFFSET" AND c."END_OFFSET" >= t."END_OFFSET"
+                      )
+                  )
+              )
+        """
+        checkpoint_offset = self.table_manager.CHECKPOINT_OFFSET
+        return [
+            (merge_sql, {"APPLICATION": application, "CHECKPOINT_OFFSET": checkpoint_offset}),
+            (
+                delete_sql,
+                {
+                    "APPLICATION": application,
+                    "CHECKPOINT_OFFSET": checkpoint_offset,
+                    "START_DATE": _utc_now() - self.UNFINISHED_RANGE_RETRY_AFTER,
+                },
+            ),
+        ]
 
 
 class BaseQueryBuilder:
@@ -273,6 +387,7 @@ class BaseQueryBuilder:
     STALE_ROW_DELETE_MAX_ATTEMPTS = 3
     STALE_ROW_DELETE_RETRY_DELAY_SECONDS = 30
     _snapshot_batch_tracker_table = SnapshotBatchTrackerTable()
+    _snapshot_chunk_checkpoint_table = SnapshotChunkCheckpointTable()
 
     def _table(self) -> Table:
         return cast(Table, self)
@@ -289,24 +404,29 @@ class BaseQueryBuilder:
         events: list[dict[str, Any]],
     ):
         input_sizes = {}
+        column_index = shared_column_index(events)
         for column in columns_definition:
             column_name = column["column_name"]
             data_type = column["data_type"].upper()
 
             if data_type.startswith("VARCHAR") or data_type == "CLOB":
+                position = None
+                if column_index is not None:
+                    position = column_index.get(column_name, column_index.get(column_name.lower()))
+                if position is not None:
+                    values = column_values(events, position)
+                else:
+                    values = [self._get_event_value(event, column_name) for event in events]
                 max_value_length = max(
-                    (
-                        len(str(value))
-                        for event in events
-                        for value in (self._get_event_value(event, column_name),)
-                        if value is not None
-                    ),
+                    (len(value) if isinstance(value, str) else len(str(value)) for value in self._distinct(values)),
                     default=1,
                 )
                 max_column_length = column["data_length"] or self.MAX_DIRECT_STRING_BIND_SIZE
                 bind_size = max(1, min(max_value_length, max_column_length))
             elif data_type == "NUMBER":
                 bind_size = oracledb.NUMBER
+            elif data_type == "TIMESTAMP WITH TIME ZONE":
+                bind_size = oracledb.DB_TYPE_TIMESTAMP_TZ
             else:
                 bind_size = None
 
@@ -314,6 +434,20 @@ class BaseQueryBuilder:
 
         return input_sizes
 
+    @staticmethod
+    def _distinct(values: list[Any]) -> Any:
+        """Return the non-null ``values`` with repeats collapsed.
+
+        Fan-out rows share the same string objects, and ``str`` caches its hash,
+        so this is cheap and each shared value is measured once.
+        """
+        try:
+            distinct = set(values)
+        except TypeError:
+            return [value for value in values if value is not None]
+        distinct.discard(None)
+        return distinct
+
     @staticmethod
     def _get_bind_names_for_sql(sql: str) -> set[str]:
         return set(re.findall(r"(?<!:):([A-Za-z_][A-Za-z0-9_]*)", sql))
@@ -327,10 +461,6 @@ class BaseQueryBuilder:
         bind_names = cls._get_bind_names_for_sql(sql)
         return {name: size for name, size in input_sizes.items() if name in bind_names}
 
-    @staticmethod
-    def _uppercase_bind_rows(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        return [{name.upper(): value for name, value in event.items()} for event in events]
-
     @classmethod
     def _bind_rows_for_sql(
         cls,
@@ -338,21 +468,79 @@ class BaseQueryBuilder:
         sql: str,
     ) -> list[dict[str, Any]]:
         bind_names = cls._get_bind_names_for_sql(sql)
-        return [
-            {name: value for name, value in row.items() if name in bind_names}
-            for row in cls._uppercase_bind_rows(events)
-        ]
+        # Build each bind row in one pass; rows of a table share their keys, so each is uppercased once.
+        uppercase_names: dict[str, str] = {}
+        projections: dict[int, list[tuple[int, str]]] = {}
+        bind_rows = []
+        for event in events:
+            if isinstance(event, CompactRow):
+                positions = projections.get(id(event.column_index))
+                if positions is None:
+                    positions = projections[id(event.column_index)] = [
+                        (position, name.upper())
+                        for name, position in event.column_index.items()
+                        if name.upper() in bind_names
+                    ]
+                bind_row = event.project(positions)
+                if bind_row is not None:
+                    bind_rows.append(bind_row)
+                    continue
+            bind_row = {}
+            for name, value in event.items():
+                bind_name = uppercase_names.get(name)
+                if bind_name is None:
+                    bind_name = uppercase_names[name] = name.upper()
+                if bind_name in bind_names:
+                    bind_row[bind_name] = value
+            bind_rows.append(bind_row)
+        return bind_rows
+
+    def _executemany_with_batch_errors(
+        self,
+        statement: str,
+        events: list[dict[str, Any]],
+        input_sizes: dict[str, Any],
+        operation: str,
+    ) -> list[Any]:
+        """Bind ``events`` to ``statement``, run it with batch errors enabled and record load metrics."""
+        tags = {"table": self.table_manager.get_table_name(), "operation": operation}
+        with METRICS.timer("bind_seconds", **tags), TRACER.span("adw.bind", rows=len(events), **tags):
+            statement_input_sizes = self._filter_input_sizes_for_sql(input_sizes, statement)
+            bind_rows = self._bind_rows_for_sql(events, statement)
+        with METRICS.timer("execute_seconds", **tags):
+            with TRACER.span("adw.setinputsizes", **tags):
+                AdwConnection.get_cursor().setinputsizes(**statement_input_sizes)
+            with TRACER.span("adw.executemany", rows=len(bind_rows), **tags, **sql_attributes(statement)) as span:
+                AdwConnection.get_cursor().executemany(statement, bind_rows, batcherrors=True)
+                batch_errors = list(AdwConnection.get_cursor().getbatcherrors())
+                span.set_attribute("batch_errors", len(batch_errors))
+
+        METRICS.increment("db_round_trips", call="executemany")
+        METRICS.increment("rows_bound", len(bind_rows), **tags)
+        for batch_error in batch_errors:
+            METRICS.increment(
+                "batch_errors", table=tags["table"], code=getattr(batch_error, "full_code", None) or "unknown"
+            )
+        return batch_errors
 
     @staticmethod
-    def _normalize_cleanup_timestamp(completion_timestamp: str) -> str:
-        for timestamp_format in ("%d-%b-%y %H:%M:%S.%f", "%d-%b-%y %I:%M:%S.%f %p"):
-            try:
-                parsed_timestamp = datetime.strptime(completion_timestamp, timestamp_format)
-                return parsed_timestamp.strftime("%d-%b-%y %H:%M:%S.%f")
-            except ValueError:
-                continue
+    def _normalize_cleanup_timestamp(completion_timestamp: datetime | str) -> datetime:
+        """Return ``completion_timestamp`` as an aware UTC datetime; naive values are already UTC."""
+        if isinstance(completion_timestamp, datetime):
+            parsed_timestamp = completion_timestamp
+        else:
+            for timestamp_format in ("%d-%b-%y %H:%M:%S.%f", "%d-%b-%y %I:%M:%S.%f %p"):
+                try:
+                    parsed_timestamp = datetime.strptime(completion_timestamp, timestamp_format)
+                    break
+                except ValueError:
+                    continue
+            else:
+                raise ValueError(f"Unsupported cleanup timestamp format: {completion_timestamp}")
 
-        raise ValueError(f"Unsupported cleanup timestamp format: {completion_timestamp}")
+        if parsed_timestamp.tzinfo is None:
+            return parsed_timestamp.replace(tzinfo=timezone.utc)
+        return parsed_timestamp.astimezone(timezone.utc)
 
     def _get_cleanup_scope_values(
         self, tenancy_id: str | None = None, service_instance_id: str | None = None
@@ -370,12 +558,13 @@ class BaseQueryBuilder:
 
     def _ensure_helper_table_exists(self, table_manager):
         try:
-            table_manager.create()
-            AdwConnection.commit()
+            if SCHEMA_READINESS.ensure_ready(table_manager):
+                AdwConnection.commit()
         except oracledb.DatabaseError as e:
             AdwConnection.rollback()
             self.logger.warning(
-                "Failed to create snapshot batch tracker table %s",
+                "Failed to create helper table %s: %s",
+                table_manager.get_table_name(),
                 e,
             )
 
@@ -402,7 +591,7 @@ class BaseQueryBuilder:
         self,
         snapshot_id: str,
         batch_id: str,
-        event_timestamp: str,
+        event_timestamp: datetime,
         tenancy_id: str | None = None,
         service_instance_id: str | None = None,
     ):
@@ -423,14 +612,15 @@ class BaseQueryBuilder:
                 :SERVICE_INSTANCE_ID,
                 :SNAPSHOT_ID,
                 :BATCH_ID,
-                TO_TIMESTAMP(:UPDATED_AT, 'DD-MON-RR HH24:MI:SS.FF6')
+                :UPDATED_AT
             )
         """
+        # UPDATED_AT is a plain TIMESTAMP holding UTC, so bind the naive UTC value.
         bind_values = {
             **self._get_cleanup_scope_values(tenancy_id, service_instance_id),
             "SNAPSHOT_ID": snapshot_id,
             "BATCH_ID": batch_id,
-            "UPDATED_AT": event_timestamp,
+            "UPDATED_AT": self._normalize_cleanup_timestamp(event_timestamp).replace(tzinfo=None),
         }
         try:
             AdwConnection.get_cursor().execute(
@@ -451,7 +641,7 @@ class BaseQueryBuilder:
         self,
         snapshot_id: str,
         batch_id: str,
-        event_timestamp: str,
+        event_timestamp: datetime,
         tenancy_id: str | None = None,
         service_instance_id: str | None = None,
     ):
@@ -463,6 +653,43 @@ class BaseQueryBuilder:
             service_instance_id=service_instance_id,
         )
 
+    def is_snapshot_batch_completed(
+        self,
+        snapshot_id: str,
+        batch_id: str,
+        tenancy_id: str | None = None,
+        service_instance_id: str | None = None,
+    ) -> bool:
+        tracker_table = self._snapshot_batch_tracker_table
+        query_sql = f"""
+            SELECT COUNT(*)
+            FROM {tracker_table.get_schema()}.{tracker_table.get_table_name()}
+            WHERE ENTITY_TYPE = :ENTITY_TYPE
+              AND TENANCY_ID = :TENANCY_ID
+              AND SERVICE_INSTANCE_ID = :SERVICE_INSTANCE_ID
+              AND SNAPSHOT_ID = :SNAPSHOT_ID
+              AND BATCH_ID = :BATCH_ID
+        """
+        try:
+            AdwConnection.get_cursor().execute(
+                query_sql,
+                {
+                    **self._get_cleanup_scope_values(tenancy_id, service_instance_id),
+                    "SNAPSHOT_ID": snapshot_id,
+                    "BATCH_ID": batch_id,
+                },
+            )
+            completed_count = AdwConnection.get_cursor().fetchone()[0]
+        except oracledb.DatabaseError as e:
+            self.logger.warning(
+                "Failed to look up snapshot batch completion for snapshot_id=%s, batch_id=%s: %s",
+                snapshot_id,
+                batch_id,
+                e,
+            )
+            return False
+        return isinstance(completed_count, int) and completed_count > 0
+
     def _snapshot_get_completed_batch_count(
         self,
         snapshot_id: str,
@@ -492,7 +719,7 @@ class BaseQueryBuilder:
         snapshot_id: str,
         tenancy_id: str | None = None,
         service_instance_id: str | None = None,
-    ) -> str | None:
+    ) -> datetime | None:
         tracker_table = self._snapshot_batch_tracker_table
         query_sql = f"""
             SELECT MIN(UPDATED_AT)
@@ -513,10 +740,7 @@ class BaseQueryBuilder:
         if earliest_updated_at is None:
             return None
 
-        if isinstance(earliest_updated_at, datetime):
-            return earliest_updated_at.strftime("%d-%b-%y %H:%M:%S.%f")
-
-        return str(earliest_updated_at)
+        return self._normalize_cleanup_timestamp(earliest_updated_at)
 
     def _try_acquire_snapshot_cleanup_lock(
         self,
@@ -586,6 +810,128 @@ class BaseQueryBuilder:
             snapshot_id,
         )
 
+    def get_chunk_checkpoint(
+        self,
+        bucket_name: str,
+        object_name: str,
+        etag: str,
+    ) -> tuple[int, int] | None:
+        """Return the ``(chunk_index, row_offset)`` committed for an object version, if any."""
+        checkpoint_table = self._snapshot_chunk_checkpoint_table
+        self._ensure_helper_table_exists(checkpoint_table)
+
+        query_sql = f"""
+            SELECT CHUNK_INDEX, ROW_OFFSET
+            FROM {checkpoint_table.get_schema()}.{checkpoint_table.get_table_name()}
+            WHERE BUCKET_NAME = :BUCKET_NAME
+              AND OBJECT_NAME = :OBJECT_NAME
+              AND ETAG = :ETAG
+        """
+        try:
+            AdwConnection.get_cursor().execute(
+                query_sql,
+                {
+                    "BUCKET_NAME": bucket_name,
+                    "OBJECT_NAME": object_name,
+                    "ETAG": etag,
+                },
+            )
+            checkpoint = AdwConnection.get_cursor().fetchone()
+        except oracledb.DatabaseError as e:
+            self.logger.warning(
+                "Failed to read chunk checkpoint for object %s: %s",
+                object_name,
+                e,
+            )
+            return None
+
+        if checkpoint is None:
+            return None
+        return int(checkpoint[0]), int(checkpoint[1])
+
+    def register_chunk_checkpoint(
+        self,
+        bucket_name: str,
+        object_name: str,
+        etag: str,
+        chunk_index: int,
+        row_offset: int,
+    ):
+        checkpoint_table = self._snapshot_chunk_checkpoint_table
+        self._ensure_helper_table_exists(checkpoint_table)
+        merge_sql = f"""
+            MERGE INTO {checkpoint_table.get_schema()}.{checkpoint_table.get_table_name()} t
+            USING (
+                SELECT :BUCKET_NAME AS BUCKET_NAME, :OBJECT_NAME AS OBJECT_NAME, :ETAG AS ETAG FROM DUAL
+            ) s
+            ON (t.BUCKET_NAME = s.BUCKET_NAME AND t.OBJECT_NAME = s.OBJECT_NAME AND t.ETAG = s.ETAG)
+            WHEN MATCHED THEN UPDATE SET
+                t.CHUNK_INDEX = :CHUNK_INDEX,
+                t.ROW_OFFSET = :ROW_OFFSET,
+                t.UPDATED_AT = SYSTIMESTAMP
+            WHEN NOT MATCHED THEN INSERT (
+                BUCKET_NAME,
+                OBJECT_NAME,
+                ETAG,
+                CHUNK_INDEX,
+                ROW_OFFSET,
+                UPDATED_AT
+            ) VALUES (
+                s.BUCKET_NAME,
+                s.OBJECT_NAME,
+                s.ETAG,
+                :CHUNK_INDEX,
+                :ROW_OFFSET,
+                SYSTIMESTAMP
+            )
+        """
+        try:
+            AdwConnection.get_cursor().execute(
+                merge_sql,
+                {
+                    "BUCKET_NAME": bucket_name,
+                    "OBJECT_NAME": object_name,
+                    "ETAG": etag,
+                    "CHUNK_INDEX": chunk_index,
+                    "ROW_OFFSET": row_offset,
+                },
+            )
+            AdwConnection.commit()
+        except Exception as e:
+            AdwConnection.rollback()
+            self.logger.warning(
+                "Failed to register chunk checkpoint %d for object %s: %s",
+                chunk_index,
+                object_name,
+                e,
+            )
+
+    def clear_chunk_checkpoints(self, bucket_name: str, object_name: str):
+        """Delete checkpoints for every version of an object once it has fully loaded."""
+        checkpoint_table = self._snapshot_chunk_checkpoint_table
+        self._ensure_helper_table_exists(checkpoint_table)
+        delete_sql = f"""
+            DELETE FROM {checkpoint_table.get_schema()}.{checkpoint_table.get_table_name()}
+            WHERE BUCKET_NAME = :BUCKET_NAME
+              AND OBJECT_NAME = :OBJECT_NAME
+        """
+        try:
+            AdwConnection.get_cursor().execute(
+                delete_sql,
+                {
+                    "BUCKET_NAME": bucket_name,
+                    "OBJECT_NAME": object_name,
+                },
+            )
+            AdwConnection.commit()
+        except Exception as e:
+            AdwConnection.rollback()
+            self.logger.warning(
+                "Failed to clear chunk checkpoints for object %s: %s",
+                object_name,
+                e,
+            )
+
     def finalize_snapshot_cleanup_if_ready(
         self,
         snapshot_id: str,
@@ -678,11 +1024,21 @@ class BaseQueryBuilder:
 
     def delete_rows_older_than_event_timestamp(
         self,
-        completion_timestamp: str,
+        completion_timestamp: datetime | str,
         tenancy_id: str | None = None,
         service_instance_id: str | None = None,
         commit: bool = True,
     ):
+        normalized_layout = self._get_normalized_layout()
+        if normalized_layout is not None:
+            for table_manager in (normalized_layout.child, normalized_layout.parent):
+                self._normalized_part_query_builder(table_manager, []).delete_rows_older_than_event_timestamp(
+                    completion_timestamp, tenancy_id, service_instance_id, commit=False
+                )
+            if commit:
+                AdwConnection.commit()
+            return
+
         self.logger.info(
             "Removing stale rows from %s older than %s",
             self.table_manager.get_table_name(),
@@ -691,11 +1047,9 @@ class BaseQueryBuilder:
 
         normalized_completion_timestamp = self._normalize_cleanup_timestamp(completion_timestamp)
         delete_sql = (
-            f'DELETE FROM "{self.table_manager.get_table_name()}" '
-            'WHERE "EVENT_TIMESTAMP" < '
-            "TO_TIMESTAMP(:COMPLETION_TIMESTAMP, 'DD-MON-RR HH24:MI:SS.FF6')"
+            f'DELETE FROM "{self.table_manager.get_table_name()}" WHERE "EVENT_TIMESTAMP" < :COMPLETION_TIMESTAMP'
         )
-        bind_values: dict[str, str] = {"COMPLETION_TIMESTAMP": normalized_completion_timestamp}
+        bind_values: dict[str, Any] = {"COMPLETION_TIMESTAMP": normalized_completion_timestamp}
         if tenancy_id is not None:
             delete_sql += ' AND "TENANCY_ID" = :TENANCY_ID'
             bind_values["TENANCY_ID"] = tenancy_id
@@ -704,7 +1058,15 @@ class BaseQueryBuilder:
             delete_sql += ' AND "SERVICE_INSTANCE_ID" = :SERVICE_INSTANCE_ID'
             bind_values["SERVICE_INSTANCE_ID"] = service_instance_id
 
-        AdwConnection.get_cursor().execute(delete_sql, bind_values)
+        with TRACER.span(
+            "adw.snapshot_cleanup", table=self.table_manager.get_table_name(), **sql_attributes(delete_sql)
+        ) as span:
+            AdwConnection.get_cursor().setinputsizes(COMPLETION_TIMESTAMP=oracledb.DB_TYPE_TIMESTAMP_TZ)
+            AdwConnection.get_cursor().execute(delete_sql, bind_values)
+            deleted_rows = AdwConnection.get_cursor().rowcount
+            if isinstance(deleted_rows, int):
+                METRICS.increment("snapshot_cleanup_rows", deleted_rows, table=self.table_manager.get_table_name())
+                span.set_attribute("rows", deleted_rows)
         if commit:
             AdwConnection.commit()
 
@@ -727,15 +1089,7 @@ class BaseQueryBuilder:
             self.table_manager.get_column_list_definition_for_table_ddl(),
             self.events,
         )
-        input_sizes = self._filter_input_sizes_for_sql(input_sizes, insert_statement)
-        AdwConnection.get_cursor().setinputsizes(**input_sizes)
-        AdwConnection.get_cursor().executemany(
-            insert_statement,
-            self._bind_rows_for_sql(self.events, insert_statement),
-            batcherrors=True,
-        )
-
-        batch_errors = list(AdwConnection.get_cursor().getbatcherrors())
+        batch_errors = self._executemany_with_batch_errors(insert_statement, self.events, input_sizes, "insert")
         if batch_errors:
             self.logger.warning(
                 "%s time series inserts encountered %d batch error(s)",
@@ -753,7 +1107,7 @@ class BaseQueryBuilder:
                 if len(top_msgs) >= 5:
                     break
             for m in top_msgs:
-                self.logger.warning("batch error: %s", m)
+                self.logger.warning(BATCH_ERROR_LOG_MESSAGE, m)
 
         AdwConnection.commit()
 
@@ -792,15 +1146,7 @@ class BaseQueryBuilder:
             self.table_manager.get_column_list_definition_for_table_ddl(),
             active_events,
         )
-        insert_input_sizes = self._filter_input_sizes_for_sql(input_sizes, insert_sql)
-        AdwConnection.get_cursor().setinputsizes(**insert_input_sizes)
-        AdwConnection.get_cursor().executemany(
-            insert_sql,
-            self._bind_rows_for_sql(active_events, insert_sql),
-            batcherrors=True,
-        )
-
-        batch_errors = list(AdwConnection.get_cursor().getbatcherrors())
+        batch_errors = self._executemany_with_batch_errors(insert_sql, active_events, input_sizes, "insert")
         if batch_errors:
             constraint_violating_rows = []
             other_batch_errors = []
@@ -826,7 +1172,7 @@ class BaseQueryBuilder:
                     if len(top_msgs) >= 5:
                         break
                 for m in top_msgs:
-                    self.logger.warning("batch error: %s", m)
+                    self.logger.warning(BATCH_ERROR_LOG_MESSAGE, m)
 
             if constraint_violating_rows:
                 self.logger.info(
@@ -844,14 +1190,15 @@ class BaseQueryBuilder:
                     nullable_columns,
                 )
                 if update_sql is not None:
-                    update_input_sizes = self._filter_input_sizes_for_sql(input_sizes, update_sql)
-                    AdwConnection.get_cursor().setinputsizes(**update_input_sizes)
-                    AdwConnection.get_cursor().executemany(
-                        update_sql,
-                        self._bind_rows_for_sql(constraint_violating_rows, update_sql),
-                        batcherrors=True,
+                    METRICS.increment(
+                        "update_fallback_rows",
+                        len(constraint_violating_rows),
+                        table=self.table_manager.get_table_name(),
                     )
-                    update_batch_errors = list(AdwConnection.get_cursor().getbatcherrors())
+                    with TRACER.span("adw.update_fallback", rows=len(constraint_violating_rows)):
+                        update_batch_errors = self._executemany_with_batch_errors(
+                            update_sql, constraint_violating_rows, input_sizes, "update"
+                        )
                     for batch_error in update_batch_errors[:5]:
                         self.logger.warning(
                             "%s update fallback failed - %s",
@@ -864,10 +1211,27 @@ class BaseQueryBuilder:
         query_builder.logger = self.logger
         return query_builder.executemany_sql_for_events()
 
+    def _get_normalized_layout(self):
+        if not isinstance(self.table_manager, BaseStateTable):
+            return None
+        return self.table_manager.get_normalized_layout()
+
+    def _normalized_part_query_builder(self, table_manager, events: list[dict[str, Any]]):
+        query_builder = NormalizedPartQueryBuilder(table_manager, events)
+        query_builder.logger = self.logger
+        return query_builder
+
     def executemany_state_merge_for_events(
         self,
         events: list[dict[str, Any]] | None = None,
     ):
+        normalized_layout = self._get_normalized_layout()
+        if normalized_layout is not None:
+            parent_rows, child_rows = normalized_layout.split_rows(self.events if events is None else events)
+            for table_manager, rows in ((normalized_layout.parent, parent_rows), (normalized_layout.child, child_rows)):
+                self._normalized_part_query_builder(table_manager, rows).executemany_state_merge_for_events()
+            return None
+
         constraint_details = self.table_manager.get_unique_contraint_definition_details()
         nullable_columns = self.table_manager.get_nullable_constraint_columns()
         return self.executemany_merge_for_events(
@@ -892,6 +1256,30 @@ class BaseQueryBuilder:
             )
             return
 
+        normalized_layout = self._get_normalized_layout()
+        if normalized_layout is not None:
+            # Children first; parents go with them when the keys identify parents, otherwise once orphaned.
+            table_managers = [normalized_layout.child]
+            if normalized_layout.covers_parent_columns(where_columns):
+                table_managers.append(normalized_layout.parent)
+            for table_manager in table_managers:
+                self._normalized_part_query_builder(table_manager, active_events).executemany_delete_for_events(
+                    where_columns, nullable_columns=nullable_columns, require_newer_event=require_newer_event
+                )
+            if len(table_managers) == 1:
+                scopes = {
+                    (self._get_event_value(event, "tenancy_id"), self._get_event_value(event, "service_instance_id"))
+                    for event in active_events
+                }
+                scope_rows = [
+                    {"TENANCY_ID": tenancy_id, "SERVICE_INSTANCE_ID": service_instance_id}
+                    for tenancy_id, service_instance_id in sorted(scopes, key=str)
+                ]
+                self._normalized_part_query_builder(normalized_layout.parent, scope_rows).delete_orphaned_rows(
+                    normalized_layout
+                )
+            return
+
         self.logger.info(
             "Using bulk delete from %s for %d events (keys: %s)",
             self.table_manager.get_table_name(),
@@ -899,6 +1287,7 @@ class BaseQueryBuilder:
             ",".join([c.lower() for c in where_columns]),
         )
         if hasattr(self.table_manager, "ensure_delete_indexes"):
+            SCHEMA_READINESS.load_catalog(self.table_manager.get_schema())
             self.table_manager.ensure_delete_indexes()
 
         delete_sql = DeleteManyQueryBuilder().get_operation_sql(
@@ -911,15 +1300,7 @@ class BaseQueryBuilder:
             self.table_manager.get_column_list_definition_for_table_ddl(),
             active_events,
         )
-        input_sizes = self._filter_input_sizes_for_sql(input_sizes, delete_sql)
-        AdwConnection.get_cursor().setinputsizes(**input_sizes)
-        AdwConnection.get_cursor().executemany(
-            delete_sql,
-            self._bind_rows_for_sql(active_events, delete_sql),
-            batcherrors=True,
-        )
-
-        batch_errors = list(AdwConnection.get_cursor().getbatcherrors())
+        batch_errors = self._executemany_with_batch_errors(delete_sql, active_events, input_sizes, "delete")
         if batch_errors:
             self.logger.warning(
                 "%s delete encountered %d batch error(s)",
@@ -936,33 +1317,39 @@ class BaseQueryBuilder:
                 if len(top_msgs) >= 5:
                     break
             for m in top_msgs:
-                self.logger.warning("batch error: %s", m)
+                self.logger.warning(BATCH_ERROR_LOG_MESSAGE, m)
+
+        AdwConnection.commit()
+
+
+class NormalizedPartQueryBuilder(Table, BaseQueryBuilder):
+    """Loads the parent or child table of a normalized state layout with the generic state helpers."""
 
+    def __init__(self, table_manager, events: list[dict[str, Any]]):
+        super().__init__(table_manager.get_table_name())
+        self.table_manager = table_manager
+        self.events = events
+
+    def delete_orphaned_rows(self, normalized_layout):
+        """Delete parent rows no child row references any more, for the tenancy and service instance of each event."""
+        self.logger.info(
+            "Removing %s rows without %s rows for %d scope(s)",
+            self.table_manager.get_table_name(),
+            normalized_layout.child.get_table_name(),
+            len(self.events),
+        )
+        batch_errors = self._executemany_with_batch_errors(
+            normalized_layout.get_orphaned_parent_delete_sql(), self.events, {}, "delete"
+        )
+        for batch_error in batch_errors[:5]:
+            self.logger.warning(BATCH_ERROR_LOG_MESSAGE, getattr(batch_error, "message", str(batch_error)))
         AdwConnection.commit()
 
 
-@lru_cache(maxsize=None)
 def _resolve_query_builder_class(event_object_type, operation, is_timeseries):
-    if is_timeseries and event_object_type != "AUDIT_EVENTS":
-        class_name = f"{event_object_type.lower().title().replace('_', '')}\
-TimeSeries{operation.lower().title().replace('_', '')}QueryBuilder"
-    else:
-        class_name = f"{event_object_type.lower().title().replace('_', '')}\
-State{operation.lower().title().replace('_', '')}QueryBuilder"
-
-    query_builders = Path(__file__).parent
-    for file in os.listdir(query_builders):
-        full_path = os.path.join(query_builders, file)
-        if os.path.isfile(full_path) and file.endswith(".py") and not file.startswith("__"):
-            module_name = file[:-3]
-            if module_name.lower() == event_object_type.lower():
-                spec = importlib.util.spec_from_file_location(module_name, full_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                for cls_name, cls_obj in inspect.getmembers(module):
-                    if inspect.isclass(cls_obj) and cls_name == class_name:
-                        return cls_obj
-    return None
+    # Audit events only have a state table.
+    is_timeseries = bool(is_timeseries) and event_object_type.upper() != "AUDIT_EVENTS"
+    return QUERY_BUILDER_REGISTRY.resolve(event_object_type, operation.upper(), is_timeseries)
 
 
 def get_query_builder(
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.cloud_group import CloudGroupStateTable, CloudGroupTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class CloudGroupStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("CLOUD_GROUP", "CREATE", False)
 class CloudGroupStateCreateQueryBuilder(CloudGroupStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(CloudGroupStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class CloudGroupStateCreateQueryBuilder(CloudGroupStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_GROUP", "UPDATE", False)
 class CloudGroupStateUpdateQueryBuilder(CloudGroupStateQueryBuilder):
     def executemany_sql_for_events(self):
         group_membership_adds = []
@@ -55,6 +58,7 @@ class CloudGroupStateUpdateQueryBuilder(CloudGroupStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_GROUP", "DELETE", False)
 class CloudGroupStateDeleteQueryBuilder(CloudGroupStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for cloud group delete request")
@@ -91,16 +95,19 @@ class CloudGroupTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("CLOUD_GROUP", "CREATE", True)
 class CloudGroupTimeSeriesCreateQueryBuilder(CloudGroupTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_GROUP", "UPDATE", True)
 class CloudGroupTimeSeriesUpdateQueryBuilder(CloudGroupTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_GROUP", "DELETE", True)
 class CloudGroupTimeSeriesDeleteQueryBuilder(CloudGroupTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
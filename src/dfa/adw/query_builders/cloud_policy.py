@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.cloud_policy import CloudPolicyStateTable, CloudPolicyTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class CloudPolicyStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("CLOUD_POLICY", "CREATE", False)
 class CloudPolicyStateCreateQueryBuilder(CloudPolicyStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(CloudPolicyStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class CloudPolicyStateCreateQueryBuilder(CloudPolicyStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_POLICY", "UPDATE", False)
 class CloudPolicyStateUpdateQueryBuilder(CloudPolicyStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class CloudPolicyStateUpdateQueryBuilder(CloudPolicyStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_POLICY", "DELETE", False)
 class CloudPolicyStateDeleteQueryBuilder(CloudPolicyStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["policy_statement_id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class CloudPolicyTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("CLOUD_POLICY", "CREATE", True)
 class CloudPolicyTimeSeriesCreateQueryBuilder(CloudPolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_POLICY", "UPDATE", True)
 class CloudPolicyTimeSeriesUpdateQueryBuilder(CloudPolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("CLOUD_POLICY", "DELETE", True)
 class CloudPolicyTimeSeriesDeleteQueryBuilder(CloudPolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
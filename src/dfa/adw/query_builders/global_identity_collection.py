@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.global_identity_collection import (
     GlobalIdentityCollectionStateTable,
     GlobalIdentityCollectionTimeSeriesTable,
@@ -24,6 +25,7 @@ class GlobalIdentityCollectionStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "CREATE", False)
 class GlobalIdentityCollectionStateCreateQueryBuilder(GlobalIdentityCollectionStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(GlobalIdentityCollectionStateUpdateQueryBuilder(self.events))
@@ -32,6 +34,7 @@ class GlobalIdentityCollectionStateCreateQueryBuilder(GlobalIdentityCollectionSt
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "UPDATE", False)
 class GlobalIdentityCollectionStateUpdateQueryBuilder(GlobalIdentityCollectionStateQueryBuilder):
     def executemany_sql_for_events(self):
         self.logger.info(
@@ -65,6 +68,7 @@ class GlobalIdentityCollectionStateUpdateQueryBuilder(GlobalIdentityCollectionSt
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "DELETE", False)
 class GlobalIdentityCollectionStateDeleteQueryBuilder(GlobalIdentityCollectionStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for global identity collection delete request")
@@ -101,16 +105,19 @@ class GlobalIdentityCollectionTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilde
         pass
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "CREATE", True)
 class GlobalIdentityCollectionTimeSeriesCreateQueryBuilder(GlobalIdentityCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "UPDATE", True)
 class GlobalIdentityCollectionTimeSeriesUpdateQueryBuilder(GlobalIdentityCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("GLOBAL_IDENTITY_COLLECTION", "DELETE", True)
 class GlobalIdentityCollectionTimeSeriesDeleteQueryBuilder(GlobalIdentityCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
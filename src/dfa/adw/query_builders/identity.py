@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.identity import IdentityStateTable, IdentityTimeSeriesTable
 
 
@@ -21,16 +22,19 @@ class IdentityTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("IDENTITY", "CREATE", True)
 class IdentityTimeSeriesCreateQueryBuilder(IdentityTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("IDENTITY", "UPDATE", True)
 class IdentityTimeSeriesUpdateQueryBuilder(IdentityTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("IDENTITY", "DELETE", True)
 class IdentityTimeSeriesDeleteQueryBuilder(IdentityTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
@@ -48,6 +52,7 @@ class IdentityStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("IDENTITY", "CREATE", False)
 class IdentityStateCreateQueryBuilder(IdentityStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(IdentityStateUpdateQueryBuilder(self.events))
@@ -56,6 +61,7 @@ class IdentityStateCreateQueryBuilder(IdentityStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("IDENTITY", "UPDATE", False)
 class IdentityStateUpdateQueryBuilder(IdentityStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -64,6 +70,7 @@ class IdentityStateUpdateQueryBuilder(IdentityStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("IDENTITY", "DELETE", False)
 class IdentityStateDeleteQueryBuilder(IdentityStateQueryBuilder):
     def execute_sql_for_events(self):
         global_identity_deletes = []
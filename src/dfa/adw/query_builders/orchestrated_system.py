@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.orchestrated_system import OrchestratedSystemStateTable, OrchestratedSystemTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class OrchestratedSystemStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "CREATE", False)
 class OrchestratedSystemStateCreateQueryBuilder(OrchestratedSystemStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(OrchestratedSystemStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class OrchestratedSystemStateCreateQueryBuilder(OrchestratedSystemStateQueryBuil
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "UPDATE", False)
 class OrchestratedSystemStateUpdateQueryBuilder(OrchestratedSystemStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class OrchestratedSystemStateUpdateQueryBuilder(OrchestratedSystemStateQueryBuil
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "DELETE", False)
 class OrchestratedSystemStateDeleteQueryBuilder(OrchestratedSystemStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class OrchestratedSystemTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "CREATE", True)
 class OrchestratedSystemTimeSeriesCreateQueryBuilder(OrchestratedSystemTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "UPDATE", True)
 class OrchestratedSystemTimeSeriesUpdateQueryBuilder(OrchestratedSystemTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ORCHESTRATED_SYSTEM", "DELETE", True)
 class OrchestratedSystemTimeSeriesDeleteQueryBuilder(OrchestratedSystemTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
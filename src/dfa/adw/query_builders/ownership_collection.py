@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.ownership_collection import OwnershipCollectionStateTable, OwnershipCollectionTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class OwnershipCollectionStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "CREATE", False)
 class OwnershipCollectionStateCreateQueryBuilder(OwnershipCollectionStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(OwnershipCollectionStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class OwnershipCollectionStateCreateQueryBuilder(OwnershipCollectionStateQueryBu
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "UPDATE", False)
 class OwnershipCollectionStateUpdateQueryBuilder(OwnershipCollectionStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class OwnershipCollectionStateUpdateQueryBuilder(OwnershipCollectionStateQueryBu
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "DELETE", False)
 class OwnershipCollectionStateDeleteQueryBuilder(OwnershipCollectionStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for ownership collection delete request")
@@ -55,16 +59,19 @@ class OwnershipCollectionTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "CREATE", True)
 class OwnershipCollectionTimeSeriesCreateQueryBuilder(OwnershipCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "UPDATE", True)
 class OwnershipCollectionTimeSeriesUpdateQueryBuilder(OwnershipCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("OWNERSHIP_COLLECTION", "DELETE", True)
 class OwnershipCollectionTimeSeriesDeleteQueryBuilder(OwnershipCollectionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.permission import PermissionStateTable, PermissionTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class PermissionStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("PERMISSION", "CREATE", False)
 class PermissionStateCreateQueryBuilder(PermissionStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(PermissionStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class PermissionStateCreateQueryBuilder(PermissionStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION", "UPDATE", False)
 class PermissionStateUpdateQueryBuilder(PermissionStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class PermissionStateUpdateQueryBuilder(PermissionStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION", "DELETE", False)
 class PermissionStateDeleteQueryBuilder(PermissionStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(["id", "service_instance_id", "tenancy_id"])
@@ -54,16 +58,19 @@ class PermissionTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("PERMISSION", "CREATE", True)
 class PermissionTimeSeriesCreateQueryBuilder(PermissionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION", "UPDATE", True)
 class PermissionTimeSeriesUpdateQueryBuilder(PermissionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION", "DELETE", True)
 class PermissionTimeSeriesDeleteQueryBuilder(PermissionTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
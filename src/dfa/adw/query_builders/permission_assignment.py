@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.permission_assignment import PermissionAssignmentStateTable, PermissionAssignmentTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class PermissionAssignmentStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "CREATE", False)
 class PermissionAssignmentStateCreateQueryBuilder(PermissionAssignmentStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(PermissionAssignmentStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class PermissionAssignmentStateCreateQueryBuilder(PermissionAssignmentStateQuery
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "UPDATE", False)
 class PermissionAssignmentStateUpdateQueryBuilder(PermissionAssignmentStateQueryBuilder):
     def executemany_sql_for_events(self):
         permission_assignment_adds = []
@@ -55,6 +58,7 @@ class PermissionAssignmentStateUpdateQueryBuilder(PermissionAssignmentStateQuery
         self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "DELETE", False)
 class PermissionAssignmentStateDeleteQueryBuilder(PermissionAssignmentStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for permission assignment delete request")
@@ -115,16 +119,19 @@ class PermissionAssignmentTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "CREATE", True)
 class PermissionAssignmentTimeSeriesCreateQueryBuilder(PermissionAssignmentTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "UPDATE", True)
 class PermissionAssignmentTimeSeriesUpdateQueryBuilder(PermissionAssignmentTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("PERMISSION_ASSIGNMENT", "DELETE", True)
 class PermissionAssignmentTimeSeriesDeleteQueryBuilder(PermissionAssignmentTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
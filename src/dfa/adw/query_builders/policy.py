@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.policy import PolicyStateTable, PolicyTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class PolicyStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("POLICY", "CREATE", False)
 class PolicyStateCreateQueryBuilder(PolicyStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(PolicyStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class PolicyStateCreateQueryBuilder(PolicyStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY", "UPDATE", False)
 class PolicyStateUpdateQueryBuilder(PolicyStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class PolicyStateUpdateQueryBuilder(PolicyStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY", "DELETE", False)
 class PolicyStateDeleteQueryBuilder(PolicyStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for policy delete request")
@@ -55,16 +59,19 @@ class PolicyTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("POLICY", "CREATE", True)
 class PolicyTimeSeriesCreateQueryBuilder(PolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY", "UPDATE", True)
 class PolicyTimeSeriesUpdateQueryBuilder(PolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY", "DELETE", True)
 class PolicyTimeSeriesDeleteQueryBuilder(PolicyTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.policy_statement_resource_mapping import (
     PolicyStatementResourceMappingStateTable,
     PolicyStatementResourceMappingTimeSeriesTable,
@@ -24,6 +25,7 @@ class PolicyStatementResourceMappingStateQueryBuilder(Table, ABC, BaseQueryBuild
         pass
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "CREATE", False)
 class PolicyStatementResourceMappingStateCreateQueryBuilder(PolicyStatementResourceMappingStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(PolicyStatementResourceMappingStateUpdateQueryBuilder(self.events))
@@ -32,6 +34,7 @@ class PolicyStatementResourceMappingStateCreateQueryBuilder(PolicyStatementResou
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "UPDATE", False)
 class PolicyStatementResourceMappingStateUpdateQueryBuilder(PolicyStatementResourceMappingStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -40,6 +43,7 @@ class PolicyStatementResourceMappingStateUpdateQueryBuilder(PolicyStatementResou
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "DELETE", False)
 class PolicyStatementResourceMappingStateDeleteQueryBuilder(PolicyStatementResourceMappingStateQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_delete_for_events(
@@ -59,16 +63,19 @@ class PolicyStatementResourceMappingTimeSeriesQueryBuilder(Table, ABC, BaseQuery
         pass
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "CREATE", True)
 class PolicyStatementResourceMappingTimeSeriesCreateQueryBuilder(PolicyStatementResourceMappingTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "UPDATE", True)
 class PolicyStatementResourceMappingTimeSeriesUpdateQueryBuilder(PolicyStatementResourceMappingTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("POLICY_STATEMENT_RESOURCE_MAPPING", "DELETE", True)
 class PolicyStatementResourceMappingTimeSeriesDeleteQueryBuilder(PolicyStatementResourceMappingTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
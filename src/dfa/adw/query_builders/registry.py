@@ -0,0 +1,8 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+from dfa.registry import LazyClassRegistry
+
+# Keys are (event_object_type, operation, is_timeseries).
+QUERY_BUILDER_REGISTRY = LazyClassRegistry("dfa.adw.query_builders")
+register_query_builder = QUERY_BUILDER_REGISTRY.register
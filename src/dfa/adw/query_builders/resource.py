@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.resource import ResourceStateTable, ResourceTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class ResourceStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("RESOURCE", "CREATE", False)
 class ResourceStateCreateQueryBuilder(ResourceStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(ResourceStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class ResourceStateCreateQueryBuilder(ResourceStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("RESOURCE", "UPDATE", False)
 class ResourceStateUpdateQueryBuilder(ResourceStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class ResourceStateUpdateQueryBuilder(ResourceStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("RESOURCE", "DELETE", False)
 class ResourceStateDeleteQueryBuilder(ResourceStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Bulk delete for resource delete request")
@@ -55,16 +59,19 @@ class ResourceTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("RESOURCE", "CREATE", True)
 class ResourceTimeSeriesCreateQueryBuilder(ResourceTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("RESOURCE", "UPDATE", True)
 class ResourceTimeSeriesUpdateQueryBuilder(ResourceTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("RESOURCE", "DELETE", True)
 class ResourceTimeSeriesDeleteQueryBuilder(ResourceTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from pypika import Table
 
 from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.query_builders.registry import register_query_builder
 from dfa.adw.tables.role import RoleStateTable, RoleTimeSeriesTable
 
 
@@ -21,6 +22,7 @@ class RoleStateQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ROLE", "CREATE", False)
 class RoleStateCreateQueryBuilder(RoleStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.execute_delegated_query_builder(RoleStateUpdateQueryBuilder(self.events))
@@ -29,6 +31,7 @@ class RoleStateCreateQueryBuilder(RoleStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ROLE", "UPDATE", False)
 class RoleStateUpdateQueryBuilder(RoleStateQueryBuilder):
     def executemany_sql_for_events(self):
         return self.executemany_state_merge_for_events()
@@ -37,6 +40,7 @@ class RoleStateUpdateQueryBuilder(RoleStateQueryBuilder):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ROLE", "DELETE", False)
 class RoleStateDeleteQueryBuilder(RoleStateQueryBuilder):
     def execute_sql_for_events(self):
         self.logger.info("Row delete for role delete request")
@@ -55,16 +59,19 @@ class RoleTimeSeriesQueryBuilder(Table, ABC, BaseQueryBuilder):
         pass
 
 
+@register_query_builder("ROLE", "CREATE", True)
 class RoleTimeSeriesCreateQueryBuilder(RoleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ROLE", "UPDATE", True)
 class RoleTimeSeriesUpdateQueryBuilder(RoleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
 
 
+@register_query_builder("ROLE", "DELETE", True)
 class RoleTimeSeriesDeleteQueryBuilder(RoleTimeSeriesQueryBuilder):
     def execute_sql_for_events(self):
         return self.executemany_sql_for_events()
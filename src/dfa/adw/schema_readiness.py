@@ -0,0 +1,114 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import threading
+from typing import Optional
+
+import oracledb
+
+from common.logger.logger import Logger
+from dfa.adw.connection import AdwConnection
+
+CATALOG_SQL = """
+    SELECT 'TABLE', TABLE_NAME FROM ALL_TABLES WHERE OWNER = :OWNER
+    UNION ALL
+    SELECT 'INDEX', INDEX_NAME FROM ALL_INDEXES WHERE OWNER = :OWNER
+    UNION ALL
+    SELECT 'CONSTRAINT', CONSTRAINT_NAME FROM ALL_CONSTRAINTS WHERE OWNER = :OWNER AND CONSTRAINT_TYPE IN ('P', 'U')
+"""
+
+
+class SchemaReadiness:
+    """Process-wide record of which DFA tables and supporting objects are known to exist.
+
+    The first check for a schema lists its tables, indexes and key constraints with
+    one catalog query. Tables whose ``get_required_catalog_objects`` are all listed
+    are ready without further queries; the rest go through ``create()`` once. Both
+    results are kept for the life of the process, so warm invocations issue no
+    catalog queries on the load path. Setting ``DFA_SCHEMA_VERSION`` to a new stamp
+    starts a fresh cache.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._catalogs: dict[tuple[str, str], frozenset[tuple[str, str]]] = {}
+        self._ready_tables: set[tuple[str, str, str]] = set()
+
+    @staticmethod
+    def _stamp() -> str:
+        return os.getenv("DFA_SCHEMA_VERSION", "")
+
+    def _query_catalog(self, schema: str) -> frozenset[tuple[str, str]]:
+        try:
+            AdwConnection.get_cursor().execute(CATALOG_SQL, {"OWNER": schema})
+            rows = AdwConnection.get_cursor().fetchall()
+        except oracledb.DatabaseError as e:
+            # Per-object checks still run for anything missing from an empty catalog.
+            self.logger.warning("Failed to list catalog objects for schema %s: %s", schema, e)
+            return frozenset()
+        return frozenset((str(object_type), str(object_name).upper()) for object_type, object_name in rows)
+
+    def load_catalog(self, schema: str) -> frozenset[tuple[str, str]]:
+        """Return the objects listed for ``schema``, querying the catalog on first use."""
+        key = (schema, self._stamp())
+        with self._lock:
+            catalog = self._catalogs.get(key)
+        if catalog is None:
+            catalog = self._query_catalog(schema)
+            with self._lock:
+                catalog = self._catalogs.setdefault(key, catalog)
+        return catalog
+
+    def has_object(self, schema: str, object_type: str, object_name: str) -> bool:
+        """Return whether an already loaded catalog lists the object; never queries."""
+        with self._lock:
+            catalog = self._catalogs.get((schema, self._stamp()))
+        return catalog is not None and (object_type, object_name.upper()) in catalog
+
+    def is_ready(self, table_manager) -> bool:
+        key = (table_manager.get_schema(), table_manager.get_table_name(), self._stamp())
+        with self._lock:
+            return key in self._ready_tables
+
+    def _mark_ready(self, table_manager):
+        key = (table_manager.get_schema(), table_manager.get_table_name(), self._stamp())
+        with self._lock:
+            self._ready_tables.add(key)
+
+    def ensure_ready(self, table_manager) -> bool:
+        """Make sure ``table_manager``'s table and supporting objects exist.
+
+        Returns ``True`` when ``create()`` ran, so the caller can commit, and
+        ``False`` when the table was already known to be ready.
+        """
+        if self.is_ready(table_manager):
+            return False
+
+        catalog = self.load_catalog(table_manager.get_schema())
+        required_objects = table_manager.get_required_catalog_objects()
+        if all((object_type, object_name.upper()) in catalog for object_type, object_name in required_objects):
+            self._mark_ready(table_manager)
+            return False
+
+        table_manager.create()
+        self._mark_ready(table_manager)
+        return True
+
+    def forget(self, schema: str, table_name: Optional[str] = None):
+        """Drop cached state for ``schema``, e.g. after its tables were dropped."""
+        with self._lock:
+            self._catalogs = {key: value for key, value in self._catalogs.items() if key[0] != schema}
+            self._ready_tables = {
+                key for key in self._ready_tables if key[0] != schema or table_name not in (None, key[1])
+            }
+
+    def reset(self):
+        with self._lock:
+            self._catalogs.clear()
+            self._ready_tables.clear()
+
+
+SCHEMA_READINESS = SchemaReadiness()
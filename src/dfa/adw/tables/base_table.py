@@ -4,12 +4,18 @@
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Optional
 
 import oracledb
 
 from common.logger.logger import Logger
 from dfa.adw.connection import AdwConnection
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.compact_row import CompactRow, is_compact_rows_enabled
+
+
+def is_normalized_schema_enabled() -> bool:
+    return os.getenv("DFA_NORMALIZED_SCHEMA", "false").lower() == "true"
 
 
 class BaseTable(ABC):
@@ -17,6 +23,7 @@ class BaseTable(ABC):
     _table_name: ClassVar[Optional[str]] = None
     _schema: ClassVar[Optional[str]] = None
     _ensured_index_names: ClassVar[set[str]] = set()
+    _default_row_templates: ClassVar[dict[str, tuple[dict[str, int], tuple]]] = {}
     _event_timestamp_index_names: ClassVar[dict[str, str]] = {
         "AUDIT_EVENTS": "DFA_AE_ET_IDX",
         "IDENTITY_STATE": "DFA_ID_ST_ET_IDX",
@@ -71,7 +78,7 @@ class BaseTable(ABC):
         pass
 
     def create(self):
-        if not self._table_exists():
+        if not (SCHEMA_READINESS.has_object(self.get_schema(), "TABLE", self.get_table_name()) or self._table_exists()):
             self._before_create()
 
             self.logger.info("Creating table %s", self.get_table_name())
@@ -123,6 +130,9 @@ class BaseTable(ABC):
         index_count = AdwConnection.get_cursor().fetchone()[0]
         return isinstance(index_count, int) and index_count > 0
 
+    def _catalog_lists_index(self, index_name):
+        return SCHEMA_READINESS.has_object(self.get_schema(), "INDEX", index_name)
+
     def _create_index(self, index_definition):
         self.logger.info(
             "Generating DDL to add index %s to table %s",
@@ -136,7 +146,7 @@ class BaseTable(ABC):
             index_cache_key = f"{self.get_schema()}.{self.get_table_name()}.{index_definition['name']}"
             if index_cache_key in self._ensured_index_names:
                 continue
-            if self._index_exists(index_definition["name"]):
+            if self._catalog_lists_index(index_definition["name"]) or self._index_exists(index_definition["name"]):
                 self._ensured_index_names.add(index_cache_key)
                 continue
             try:
@@ -150,6 +160,12 @@ class BaseTable(ABC):
     def ensure_supporting_objects(self):
         self.ensure_indexes()
 
+    def get_required_catalog_objects(self):
+        """Return the ``(object_type, name)`` pairs ``create()`` makes sure exist."""
+        return [("TABLE", self.get_table_name())] + [
+            ("INDEX", index_definition["name"]) for index_definition in self.get_index_definition_details()
+        ]
+
     def get_create_table_sql(self):
         return self._get_create_ddl()
 
@@ -216,6 +232,7 @@ class BaseTable(ABC):
             delete_sql = self._get_delete_ddl()
 
             AdwConnection.get_cursor().execute(delete_sql)
+            SCHEMA_READINESS.forget(self.get_schema(), self.get_table_name())
         else:
             self.logger.info("Table %s does not exist - skipping delete", self.get_table_name())
 
@@ -255,22 +272,66 @@ class BaseTable(ABC):
 
         return column_names_for_table_ddl
 
+    def _get_default_row_template(self) -> tuple[dict[str, int], tuple]:
+        column_definitions_json = self._column_definitions()
+        template = BaseTable._default_row_templates.get(column_definitions_json)
+        if template is None:
+            column_names = []
+            default_values = []
+            for definition in json.loads(column_definitions_json):
+                column_names.append(definition["column_name"].lower())
+                if definition["data_type"] == "CLOB":
+                    default_values.append(json.dumps({}))
+                elif definition["data_type"].startswith("VARCHAR"):
+                    default_values.append("")
+                else:
+                    default_values.append(None)
+            template = (
+                {column_name: position for position, column_name in enumerate(column_names)},
+                tuple(default_values),
+            )
+            BaseTable._default_row_templates[column_definitions_json] = template
+        return template
+
     def get_default_row(self):
-        column_definitions = json.loads(self._column_definitions())
-        default_row = {}
-        for definition in column_definitions:
-            if definition["data_type"] == "CLOB":
-                default_row[definition["column_name"].lower()] = json.dumps({})
-            elif definition["data_type"].startswith("VARCHAR"):
-                default_row[definition["column_name"].lower()] = ""
-            else:
-                default_row[definition["column_name"].lower()] = None
-        return default_row
+        """Return a new row holding every column's default, as a ``CompactRow`` unless ``DFA_COMPACT_ROWS=false``."""
+        column_index, default_values = self._get_default_row_template()
+        if is_compact_rows_enabled():
+            return CompactRow(column_index, list(default_values))
+        return dict(zip(column_index, default_values))
 
 
 class BaseStateTable(BaseTable, ABC):
     _ensured_delete_index_names: ClassVar[set[str]] = set()
     _nullable_unique_index_sentinel: ClassVar[str] = "__DFA_NULL__"
+    _normalized_layouts: ClassVar[dict[str, Any]] = {}
+
+    def _build_normalized_layout(self):
+        """Return the ``NormalizedStateLayout`` this table is split into, or ``None`` if it stays denormalized."""
+        return None
+
+    def get_normalized_layout(self):
+        """Return this table's parent/child layout when ``DFA_NORMALIZED_SCHEMA=true``, else ``None``."""
+        if not is_normalized_schema_enabled():
+            return None
+        table_name = self.get_table_name()
+        if table_name not in BaseStateTable._normalized_layouts:
+            BaseStateTable._normalized_layouts[table_name] = self._build_normalized_layout()
+        return BaseStateTable._normalized_layouts[table_name]
+
+    def create(self):
+        normalized_layout = self.get_normalized_layout()
+        if normalized_layout is None:
+            super().create()
+        else:
+            normalized_layout.create()
+
+    def delete(self):
+        normalized_layout = self.get_normalized_layout()
+        if normalized_layout is None:
+            super().delete()
+        else:
+            normalized_layout.delete()
 
     @abstractmethod
     def get_unique_contraint_definition_details(self):
@@ -358,7 +419,7 @@ class BaseStateTable(BaseTable, ABC):
             index_cache_key = f"{self.get_schema()}.{self.get_table_name()}.{index_definition['name']}"
             if index_cache_key in self._ensured_delete_index_names:
                 continue
-            if self._index_exists(index_definition["name"]):
+            if self._catalog_lists_index(index_definition["name"]) or self._index_exists(index_definition["name"]):
                 self._ensured_delete_index_names.add(index_cache_key)
                 continue
             try:
@@ -373,6 +434,14 @@ class BaseStateTable(BaseTable, ABC):
         super().ensure_supporting_objects()
         self.ensure_delete_indexes()
 
+    def get_required_catalog_objects(self):
+        normalized_layout = self.get_normalized_layout()
+        if normalized_layout is not None:
+            return normalized_layout.get_required_catalog_objects()
+        return super().get_required_catalog_objects() + [
+            ("INDEX", index_definition["name"]) for index_definition in self.get_delete_index_definition_details()
+        ]
+
     def _after_create(self):
 
         index_ddl = self._build_unique_index_ddl()
@@ -387,9 +456,68 @@ class BaseStateTable(BaseTable, ABC):
             self._create_delete_index(delete_index_definition)
 
 
-class StreamOffsetTrackerTable(BaseTable):
+class BasePrimaryKeyTable(BaseTable, ABC):
+    _primary_key_name: ClassVar[Optional[str]] = None
+    _primary_key_columns: ClassVar[tuple[str, ...]] = ()
+
+    def _primary_key_exists(self):
+        exists_sql = """
+            SELECT COUNT(*)
+            FROM ALL_CONSTRAINTS
+            WHERE OWNER = :OWNER
+              AND TABLE_NAME = :TABLE_NAME
+              AND CONSTRAINT_NAME = :CONSTRAINT_NAME
+              AND CONSTRAINT_TYPE = 'P'
+        """
+        AdwConnection.get_cursor().execute(
+            exists_sql,
+            {
+                "OWNER": self.get_schema(),
+                "TABLE_NAME": self.get_table_name(),
+                "CONSTRAINT_NAME": self._primary_key_name,
+            },
+        )
+        return AdwConnection.get_cursor().fetchone()[0] == 1
+
+    def ensure_supporting_objects(self):
+        if SCHEMA_READINESS.has_object(self.get_schema(), "CONSTRAINT", self._primary_key_name) or (
+            self._primary_key_exists()
+        ):
+            return
+
+        self._before_primary_key()
+        primary_key_columns_ddl = '"' + '", "'.join(self._primary_key_columns) + '"'
+        AdwConnection.get_cursor().execute(f"""
+                ALTER TABLE {self.get_schema()}.{self.get_table_name()}
+                ADD CONSTRAINT "{self._primary_key_name}"
+                PRIMARY KEY ({primary_key_columns_ddl})
+                USING INDEX ENABLE
+            """)
+
+    def _before_primary_key(self):
+        pass
+
+    def get_required_catalog_objects(self):
+        return super().get_required_catalog_objects() + [("CONSTRAINT", self._primary_key_name)]
+
+    def _after_create(self):
+        self.ensure_supporting_objects()
+
+
+class StreamOffsetTrackerTable(BasePrimaryKeyTable):
+    """Stream offset ranges, keyed by application, partition and start offset.
+
+    Completed ranges are collapsed into one checkpoint row per application and
+    partition (``OFFSET`` = ``CHECKPOINT_OFFSET``), so lookups read the same
+    handful of rows however long the consumer has been running.
+    """
+
     _table_name = "stream_offset_tracker"
     _schema = None
+    _primary_key_name = "PK_STREAM_OFFSET_TRACKER"
+    _primary_key_columns = ("APPLICATION", "STREAM_PARTITION", "OFFSET")
+    CHECKPOINT_OFFSET = -1
+    _ensured_partition_columns: ClassVar[set[str]] = set()
 
     def _column_definitions(self):
         return """
@@ -399,15 +527,74 @@ class StreamOffsetTrackerTable(BaseTable):
                 {"field_name":"APPLICATION","column_id":11,"column_name":"APPLICATION","column_expression":null,"skip_column":false,"data_type":"VARCHAR2","data_length":200,"data_format":null},
                 {"field_name":"START_DATE","column_id":10,"column_name":"START_DATE","column_expression":null,"skip_column":false,"data_type":"DATE","data_length":null,"data_format":"DD/MM/RR"},
                 {"field_name":"END_DATE","column_id":10,"column_name":"END_DATE","column_expression":null,"skip_column":false,"data_type":"DATE","data_length":null,"data_format":"DD/MM/RR"},
-                {"field_name":"END_OFFSET","column_id":4,"column_name":"END_OFFSET","column_expression":null,"skip_column":false,"data_type":"NUMBER","data_length":null,"data_format":null}
+                {"field_name":"END_OFFSET","column_id":4,"column_name":"END_OFFSET","column_expression":null,"skip_column":false,"data_type":"NUMBER","data_length":null,"data_format":null},
+                {"field_name":"STREAM_PARTITION","column_id":12,"column_name":"STREAM_PARTITION","column_expression":null,"skip_column":false,"data_type":"VARCHAR2","data_length":20,"data_format":null}
             ]
             """
 
+    def _partition_column_exists(self):
+        exists_sql = """
+            SELECT COUNT(*)
+            FROM ALL_TAB_COLUMNS
+            WHERE OWNER = :OWNER
+              AND TABLE_NAME = :TABLE_NAME
+              AND COLUMN_NAME = 'STREAM_PARTITION'
+        """
+        AdwConnection.get_cursor().execute(
+            exists_sql, {"OWNER": self.get_schema(), "TABLE_NAME": self.get_table_name()}
+        )
+        column_count = AdwConnection.get_cursor().fetchone()[0]
+        return isinstance(column_count, int) and column_count > 0
+
+    def ensure_partition_column(self):
+        """Add ``STREAM_PARTITION`` to trackers created before offsets were kept per partition.
+
+        Existing rows were all read from partition ``0``, which the column default records.
+        """
+        cache_key = f"{self.get_schema()}.{self.get_table_name()}"
+        if cache_key in self._ensured_partition_columns:
+            return
+        if not self._partition_column_exists():
+            self.logger.info("Adding STREAM_PARTITION to %s", self.get_table_name())
+            AdwConnection.get_cursor().execute(
+                f"ALTER TABLE {self.get_schema()}.{self.get_table_name()} "
+                "ADD (STREAM_PARTITION VARCHAR2(20) DEFAULT '0')"
+            )
+        self._ensured_partition_columns.add(cache_key)
+
+    def get_index_definition_details(self):
+        return [{"name": "DFA_SOT_END_OFFSET_IDX", "columns": ["APPLICATION", "STREAM_PARTITION", "END_OFFSET"]}]
+
+    def _before_primary_key(self):
+        # Trackers created before the key may repeat a range (a re-read from the trim horizon) or hold
+        # rows without a key; keep one row per key, preferring a completed one.
+        self.logger.info("Removing duplicate offset ranges from %s before adding its key", self.get_table_name())
+        qualified_table = f"{self.get_schema()}.{self.get_table_name()}"
+        AdwConnection.get_cursor().execute(f"""
+                DELETE FROM {qualified_table}
+                WHERE "APPLICATION" IS NULL OR "OFFSET" IS NULL OR ROWID IN (
+                    SELECT ROW_ID FROM (
+                        SELECT ROWID AS ROW_ID, ROW_NUMBER() OVER (
+                            PARTITION BY "APPLICATION", "STREAM_PARTITION", "OFFSET"
+                            ORDER BY "END_DATE" DESC NULLS LAST, "END_OFFSET" DESC
+                        ) AS RANGE_NUMBER
+                        FROM {qualified_table}
+                    )
+                    WHERE RANGE_NUMBER > 1
+                )
+            """)
+
+    def ensure_supporting_objects(self):
+        self.ensure_partition_column()
+        self.ensure_indexes()
+        super().ensure_supporting_objects()
+
 
-class SnapshotBatchTrackerTable(BaseTable):
+class SnapshotBatchTrackerTable(BasePrimaryKeyTable):
     _table_name = "snapshot_batch_tracker"
     _schema = None
     _primary_key_name = "PK_SNAPSHOT_BATCH_TRACKER"
+    _primary_key_columns = ("ENTITY_TYPE", "TENANCY_ID", "SERVICE_INSTANCE_ID", "SNAPSHOT_ID", "BATCH_ID")
 
     def _column_definitions(self):
         return """
@@ -421,43 +608,21 @@ class SnapshotBatchTrackerTable(BaseTable):
             ]
             """
 
-    def _primary_key_exists(self):
-        exists_sql = """
-            SELECT COUNT(*)
-            FROM ALL_CONSTRAINTS
-            WHERE OWNER = :OWNER
-              AND TABLE_NAME = :TABLE_NAME
-              AND CONSTRAINT_NAME = :CONSTRAINT_NAME
-              AND CONSTRAINT_TYPE = 'P'
-        """
-        AdwConnection.get_cursor().execute(
-            exists_sql,
-            {
-                "OWNER": self.get_schema(),
-                "TABLE_NAME": self.get_table_name(),
-                "CONSTRAINT_NAME": self._primary_key_name,
-            },
-        )
-        return AdwConnection.get_cursor().fetchone()[0] == 1
 
-    def ensure_supporting_objects(self):
-        if self._primary_key_exists():
-            return
+class SnapshotChunkCheckpointTable(BasePrimaryKeyTable):
+    _table_name = "snapshot_chunk_checkpoint"
+    _schema = None
+    _primary_key_name = "PK_SNAPSHOT_CHUNK_CHECKPOINT"
+    _primary_key_columns = ("BUCKET_NAME", "OBJECT_NAME", "ETAG")
 
-        AdwConnection.get_cursor().execute(
-            f"""
-                ALTER TABLE {self.get_schema()}.{self.get_table_name()}
-                ADD CONSTRAINT "{self._primary_key_name}"
-                PRIMARY KEY (
-                    "ENTITY_TYPE",
-                    "TENANCY_ID",
-                    "SERVICE_INSTANCE_ID",
-                    "SNAPSHOT_ID",
-                    "BATCH_ID"
-                )
-                USING INDEX ENABLE
+    def _column_definitions(self):
+        return """
+            [
+                {"field_name":"BUCKET_NAME","column_name":"BUCKET_NAME","column_expression":null,"skip_column":false,"data_type":"VARCHAR2","data_length":255,"data_format":null},
+                {"field_name":"OBJECT_NAME","column_name":"OBJECT_NAME","column_expression":null,"skip_column":false,"data_type":"VARCHAR2","data_length":1024,"data_format":null},
+                {"field_name":"ETAG","column_name":"ETAG","column_expression":null,"skip_column":false,"data_type":"VARCHAR2","data_length":255,"data_format":null},
+                {"field_name":"CHUNK_INDEX","column_name":"CHUNK_INDEX","column_expression":null,"skip_column":false,"data_type":"NUMBER","data_length":null,"data_format":null},
+                {"field_name":"ROW_OFFSET","column_name":"ROW_OFFSET","column_expression":null,"skip_column":false,"data_type":"NUMBER","data_length":null,"data_format":null},
+                {"field_name":"UPDATED_AT","column_name":"UPDATED_AT","column_expression":null,"skip_column":false,"data_type":"TIMESTAMP","data_length":null,"data_format":null}
+            ]
             """
-        )
-
-    def _after_create(self):
-        self.ensure_supporting_objects()
@@ -2,6 +2,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.normalized import NormalizedStateLayout
 
 
 class CloudPolicyTimeSeriesTable(BaseTable):
@@ -59,3 +60,15 @@ class CloudPolicyStateTable(BaseStateTable, CloudPolicyTimeSeriesTable):
                 "columns": ["POLICY_STATEMENT_ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"],
             }
         ]
+
+    def _build_normalized_layout(self):
+        return NormalizedStateLayout(
+            self,
+            parent_key=("ID", "POLICY_STATEMENT_ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"),
+            child_name="SUBJECT",
+            child_columns=(
+                "SUBJECT_ID",
+                "SUBJECT_NAME",
+                "SUBJECT_TYPE",
+            ),
+        )
@@ -0,0 +1,140 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from typing import Any, Iterator, Optional
+
+
+def is_compact_rows_enabled() -> bool:
+    return os.getenv("DFA_COMPACT_ROWS", "true").lower() != "false"
+
+
+def shared_column_index(rows: list[Any]) -> Optional[dict[str, int]]:
+    """Return the column index every row in ``rows`` shares, or ``None`` unless all are plain CompactRows of one table."""
+    if not rows or type(rows[0]) is not CompactRow:
+        return None
+    index = rows[0].column_index
+    for row in rows:
+        if type(row) is not CompactRow or row._index is not index or row._extra:
+            return None
+    return index
+
+
+def column_values(rows: list["CompactRow"], position: int) -> list[Any]:
+    """Return the value at ``position`` of every row; ``rows`` must share one column index."""
+    return [row._values[position] for row in rows]
+
+
+class _CompactItemsView(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        row = self._mapping
+        yield from zip(row._index, row._values)
+        if row._extra:
+            yield from row._extra.items()
+
+
+class _CompactValuesView(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        row = self._mapping
+        yield from row._values
+        if row._extra:
+            yield from row._extra.values()
+
+
+class CompactRow(MutableMapping):
+    """A prepared row stored as a value list against a column index shared by every row of a table.
+
+    Behaves like the ``dict`` rows it replaces for everything transformers and
+    query builders do with them: item access and assignment (``operation_type``
+    overrides), ``in``, ``get``, iteration in column order, ``copy`` for fan-out
+    and equality with plain dicts. Keys that are not table columns go to a
+    small per-row overflow dict; table columns cannot be removed. A row costs
+    one object and one list instead of a dict sized for every column, and
+    ``copy`` only copies the list.
+    """
+
+    __slots__ = ("_index", "_values", "_extra")
+
+    def __init__(self, index: dict[str, int], values: list[Any], extra: Optional[dict[str, Any]] = None):
+        self._index = index
+        self._values = values
+        self._extra = extra
+
+    @property
+    def column_index(self) -> dict[str, int]:
+        """The ``{column: position}`` index shared by every row built from the same table."""
+        return self._index
+
+    def __getitem__(self, key):
+        position = self._index.get(key)
+        if position is not None:
+            return self._values[position]
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        position = self._index.get(key)
+        if position is not None:
+            self._values[position] = value
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._index:
+            raise TypeError(f"Cannot remove table column {key!r} from a CompactRow")
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __contains__(self, key):
+        return key in self._index or (self._extra is not None and key in self._extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._index
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return len(self._values) + (len(self._extra) if self._extra else 0)
+
+    def get(self, key, default=None):
+        position = self._index.get(key)
+        if position is not None:
+            return self._values[position]
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def items(self):
+        return _CompactItemsView(self)
+
+    def values(self):
+        return _CompactValuesView(self)
+
+    def project(self, positions: list[tuple[int, str]]) -> Optional[dict[str, Any]]:
+        """Return ``{name: value}`` for ``(position, name)`` pairs, or ``None`` if the row has extra keys."""
+        if self._extra:
+            return None
+        values = self._values
+        return {name: values[position] for position, name in positions}
+
+    def copy(self) -> "CompactRow":
+        return CompactRow(self._index, self._values.copy(), dict(self._extra) if self._extra else None)
+
+    def __reduce__(self):
+        return CompactRow, (self._index, self._values, self._extra)
+
+    def __sizeof__(self):
+        extra_size = self._extra.__sizeof__() if self._extra is not None else 0
+        return object.__sizeof__(self) + self._values.__sizeof__() + extra_size
+
+    def __repr__(self):
+        return f"CompactRow({dict(self.items())!r})"
@@ -2,6 +2,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.normalized import NormalizedStateLayout
 
 
 class IdentityTimeSeriesTable(BaseTable):
@@ -67,3 +68,23 @@ class IdentityStateTable(BaseStateTable, IdentityTimeSeriesTable):
                 "columns": ["ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"],
             },
         ]
+
+    def _build_normalized_layout(self):
+        # Target accounts blank the global identity attributes, so they stay on the target rows.
+        return NormalizedStateLayout(
+            self,
+            parent_key=("ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"),
+            child_name="TARGET",
+            child_columns=(
+                "IDENTITY_ATTRIBUTES",
+                "TI_EXTERNAL_ID",
+                "TI_ID",
+                "TI_TARGET_ID",
+                "TI_DOMAIN_ID",
+                "TI_IDENTITY_NAME",
+                "TI_IDENTITY_STATUS",
+                "TI_OPERATION_TYPE",
+                "TI_EVENT_TIMESTAMP",
+                "TI_ATTRIBUTES",
+            ),
+        )
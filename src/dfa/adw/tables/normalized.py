@@ -0,0 +1,204 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import json
+from typing import Any
+
+from common.logger.logger import Logger
+from dfa.adw.connection import AdwConnection
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+
+# Columns every child row keeps so it can be merged, deleted and cleaned up on its own.
+ROW_COLUMNS = ("EVENT_OBJECT_TYPE", "OPERATION_TYPE", "EVENT_TIMESTAMP", "SERVICE_INSTANCE_ID", "TENANCY_ID")
+
+
+class NormalizedPartTable(BaseStateTable):
+    """The parent or child half of a normalized state table.
+
+    Column definitions, delete indexes and the event timestamp index are taken
+    from the denormalized table; constraint and index names get ``suffix``
+    appended so both halves can live next to the view that reuses the original
+    table name.
+    """
+
+    def __init__(
+        self,
+        source: BaseStateTable,
+        table_name: str,
+        column_names: tuple[str, ...],
+        unique_columns: tuple[str, ...],
+        nullable_columns: list[str],
+        suffix: str,
+    ):
+        self._source = source
+        self._table_name = table_name
+        self._column_names = column_names
+        self._unique_columns = unique_columns
+        self._nullable_columns = nullable_columns
+        self._suffix = suffix
+        self._definitions_json = json.dumps(
+            [
+                definition
+                for definition in source.get_column_list_definition_for_table_ddl()
+                if definition["column_name"] in column_names
+            ]
+        )
+
+    def _column_definitions(self):
+        return self._definitions_json
+
+    def get_schema(self):
+        return self._source.get_schema()
+
+    def get_unique_contraint_definition_details(self):
+        source_constraint = self._source.get_unique_contraint_definition_details()
+        return {"name": f"{source_constraint['name']}_{self._suffix}", "columns": list(self._unique_columns)}
+
+    def get_nullable_constraint_columns(self):
+        return list(self._nullable_columns)
+
+    def get_delete_index_definition_details(self):
+        return [
+            {"name": f"{index_definition['name']}_{self._suffix}", "columns": index_definition["columns"]}
+            for index_definition in self._source.get_delete_index_definition_details()
+            # The parent's unique index already covers a delete index on exactly its key.
+            if set(index_definition["columns"]) <= set(self._column_names)
+            and tuple(index_definition["columns"]) != self._unique_columns
+        ]
+
+    def get_index_definition_details(self):
+        return [
+            {"name": f"{index_definition['name']}_{self._suffix}", "columns": index_definition["columns"]}
+            for index_definition in self._source.get_index_definition_details()
+        ]
+
+
+class NormalizedStateLayout:
+    """A fan-out state table stored as a parent table plus a child table.
+
+    Transformers emit one denormalized row per child (rule, subject, resource or
+    target identity), repeating every parent column. ``split_rows`` turns a load
+    chunk into one row per parent key for ``<ENTITY>_BASE_STATE`` and narrow
+    child rows for ``<ENTITY>_<CHILD>_STATE``. Child rows keep the parent key,
+    their own columns and ``ROW_COLUMNS``; the parent keeps everything else.
+
+    ``create`` adds both tables and a view under the original table name that
+    joins them back into the denormalized shape, so readers keep working. Rows
+    whose parent key is incomplete (unmatched target identities have no global
+    id) only go to the child table; the view's outer join returns the column
+    defaults for their parent columns, as the denormalized table did.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    def __init__(
+        self,
+        source: BaseStateTable,
+        parent_key: tuple[str, ...],
+        child_name: str,
+        child_columns: tuple[str, ...],
+    ):
+        source_columns = [definition["column_name"] for definition in source.get_column_list_definition_for_table_ddl()]
+        child_column_set = set(parent_key) | set(child_columns) | set(ROW_COLUMNS)
+        entity = source.get_table_name()[: -len("_STATE")]
+
+        self.source = source
+        self.parent_key = parent_key
+        self.parent_columns = tuple(column for column in source_columns if column not in child_columns)
+        self.child_columns = tuple(column for column in source_columns if column in child_column_set)
+        self.parent = NormalizedPartTable(source, f"{entity}_BASE_STATE", self.parent_columns, parent_key, [], "P")
+        self.child = NormalizedPartTable(
+            source,
+            f"{entity}_{child_name}_STATE",
+            self.child_columns,
+            tuple(source.get_unique_contraint_definition_details()["columns"]),
+            source.get_nullable_constraint_columns(),
+            "C",
+        )
+        self._parent_key_fields = [column.lower() for column in parent_key]
+        self._parent_fields = [column.lower() for column in self.parent_columns]
+        self._child_fields = [column.lower() for column in self.child_columns]
+
+    def split_rows(self, rows: list[Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Return ``(parent_rows, child_rows)``; parent rows are deduplicated by key, the last row winning."""
+        parents: dict[tuple, Any] = {}
+        child_rows = []
+        for row in rows:
+            key = tuple(row.get(field) for field in self._parent_key_fields)
+            if all(value not in (None, "") for value in key):
+                parents[key] = row
+            child_rows.append({field: row.get(field) for field in self._child_fields})
+        parent_rows = [{field: row.get(field) for field in self._parent_fields} for row in parents.values()]
+        return parent_rows, child_rows
+
+    def covers_parent_columns(self, columns: list[str]) -> bool:
+        return {column.upper() for column in columns} <= set(self.parent_columns)
+
+    def get_orphaned_parent_delete_sql(self) -> str:
+        """Delete parents in one tenancy and service instance that no child row references any more."""
+        join = " AND ".join(f'c."{column}" = p."{column}"' for column in self.parent_key)
+        return (
+            f'DELETE FROM "{self.parent.get_table_name()}" p '
+            'WHERE p."TENANCY_ID" = :TENANCY_ID AND p."SERVICE_INSTANCE_ID" = :SERVICE_INSTANCE_ID '
+            f'AND NOT EXISTS (SELECT 1 FROM "{self.child.get_table_name()}" c WHERE {join})'
+        )
+
+    def get_view_ddl(self) -> str:
+        schema = self.source.get_schema()
+        select_list = []
+        for definition in self.source.get_column_list_definition_for_table_ddl():
+            column = definition["column_name"]
+            if column in self.child_columns:
+                select_list.append(f'c."{column}"')
+            elif definition["data_type"] == "CLOB":
+                select_list.append(f'NVL(p."{column}", TO_CLOB(\'{{}}\')) AS "{column}"')
+            else:
+                select_list.append(f'p."{column}"')
+        join = " AND ".join(f'p."{column}" = c."{column}"' for column in self.parent_key)
+        return f"""
+            CREATE OR REPLACE VIEW {schema}.{self.source.get_table_name()} AS
+            SELECT {", ".join(select_list)}
+            FROM {schema}.{self.child.get_table_name()} c
+            LEFT OUTER JOIN {schema}.{self.parent.get_table_name()} p ON {join}
+            """
+
+    def _view_exists(self) -> bool:
+        AdwConnection.get_cursor().execute(
+            """
+            SELECT COUNT(*)
+            FROM ALL_OBJECTS
+            WHERE OWNER = :OWNER AND OBJECT_TYPE = 'VIEW' AND OBJECT_NAME = :OBJECT_NAME
+            """,
+            {"OWNER": self.source.get_schema(), "OBJECT_NAME": self.source.get_table_name()},
+        )
+        view_count = AdwConnection.get_cursor().fetchone()[0]
+        return isinstance(view_count, int) and view_count > 0
+
+    def get_required_catalog_objects(self):
+        return self.parent.get_required_catalog_objects() + self.child.get_required_catalog_objects()
+
+    def create(self):
+        self.parent.create()
+        self.child.create()
+        if ("TABLE", self.source.get_table_name()) in SCHEMA_READINESS.load_catalog(self.source.get_schema()):
+            self.logger.warning(
+                "Table %s exists - not replacing it with the normalized compatibility view; "
+                "drop it to read %s and %s through the view",
+                self.source.get_table_name(),
+                self.parent.get_table_name(),
+                self.child.get_table_name(),
+            )
+            return
+        self.logger.info("Creating compatibility view %s", self.source.get_table_name())
+        AdwConnection.get_cursor().execute(self.get_view_ddl())
+
+    def delete(self):
+        schema = self.source.get_schema()
+        if self._view_exists():
+            self.logger.info("Dropping view %s", self.source.get_table_name())
+            AdwConnection.get_cursor().execute(f"DROP VIEW {schema}.{self.source.get_table_name()}")
+        else:
+            BaseTable.delete(self.source)
+        self.child.delete()
+        self.parent.delete()
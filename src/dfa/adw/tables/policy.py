@@ -2,6 +2,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.normalized import NormalizedStateLayout
 
 
 class PolicyTimeSeriesTable(BaseTable):
@@ -82,3 +83,25 @@ class PolicyStateTable(BaseStateTable, PolicyTimeSeriesTable):
                 "columns": ["ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"],
             }
         ]
+
+    def _build_normalized_layout(self):
+        return NormalizedStateLayout(
+            self,
+            parent_key=("ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"),
+            child_name="RULE",
+            child_columns=(
+                "POLICY_RULE_ID",
+                "POLICY_RULE_ASSIGNMENT_ID",
+                "POLICY_RULE_IDENTITY_GROUP_ID",
+                "POLICY_RULE_PARSED_ON",
+                "POLICY_RULE_VERSION",
+                "POLICY_RULE_ACTION",
+                "POLICY_RULE_STATEMENT",
+                "POLICY_RULE_STATUS",
+                "POLICY_RULE_TYPE",
+                "POLICY_RULE_CREATED_BY",
+                "POLICY_RULE_CREATED_ON",
+                "POLICY_RULE_UPDATED_BY",
+                "POLICY_RULE_UPDATED_ON",
+            ),
+        )
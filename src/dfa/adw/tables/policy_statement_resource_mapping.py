@@ -2,6 +2,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.normalized import NormalizedStateLayout
 
 
 class PolicyStatementResourceMappingTimeSeriesTable(BaseTable):
@@ -56,3 +57,14 @@ class PolicyStatementResourceMappingStateTable(BaseStateTable, PolicyStatementRe
                 ],
             }
         ]
+
+    def _build_normalized_layout(self):
+        return NormalizedStateLayout(
+            self,
+            parent_key=("ID", "POLICY_STATEMENT_ID", "SERVICE_INSTANCE_ID", "TENANCY_ID"),
+            child_name="RESOURCE",
+            child_columns=(
+                "RESOURCE_ID",
+                "RESOURCE_EXTERNAL_ID",
+            ),
+        )
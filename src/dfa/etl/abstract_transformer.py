@@ -1,16 +1,18 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
-import importlib.util
-import inspect
-import os
 from abc import ABC, abstractmethod
-from functools import lru_cache, wraps
-from pathlib import Path
+from functools import wraps
 from time import perf_counter
 from typing import Any
 
-from common.logger.logger import Logger
+from common.logger.logger import Logger, limit_repeated_messages
+from common.metrics.metrics import METRICS
+from common.tracing.tracing import TRACER
+from dfa.etl.transformers.registry import TRANSFORMER_REGISTRY
+
+UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE = "Skipping unsupported %s eventTypeVersion %s"
+limit_repeated_messages(UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE)
 
 
 class AbstractTransformer(ABC):
@@ -40,12 +42,24 @@ class AbstractTransformer(ABC):
     def _get_prepared_events(self):
         return self._prepared_events
 
+    def _record_transform_metrics(self, rows_in, rows_out):
+        tags = {
+            "transformer": self.transformer_name,
+            "entity": self.get_event_object_type(),
+            "operation": self.get_operation_type(),
+        }
+        METRICS.increment("rows_in", rows_in, **tags)
+        METRICS.increment("rows_out", rows_out, **tags)
+
     def get_raw_events(self):
         return self._raw_events
 
     def get_prepared_events(self):
         return self._prepared_events
 
+    def get_prepared_row_count(self):
+        return len(self._prepared_events)
+
     def get_event_object_type(self):
         return self._event_object_type
 
@@ -109,10 +123,21 @@ class AbstractTransformer(ABC):
                 @wraps(method)
                 def _timed(self, *args, **kw):
                     start = perf_counter()
+                    span = TRACER.span(f"transformer.{label}", transformer=self.transformer_name)
                     try:
-                        return method(self, *args, **kw)
+                        with span:
+                            try:
+                                return method(self, *args, **kw)
+                            finally:
+                                span.set_attributes(
+                                    entity=self.get_event_object_type(),
+                                    operation=self.get_operation_type(),
+                                    raw_events=len(self.get_raw_events()),
+                                    prepared_events=self.get_prepared_row_count(),
+                                )
                     finally:
                         duration = perf_counter() - start
+                        METRICS.observe("stage_seconds", duration, stage=label, transformer=self.transformer_name)
                         try:
                             self.logger.info(
                                 "%s %s %s raw_events(%d) prepared_events(%d) runtime: %.3fs",
@@ -120,7 +145,7 @@ class AbstractTransformer(ABC):
                                 self.get_event_object_type(),
                                 label,
                                 len(self.get_raw_events()),
-                                len(self.get_prepared_events()),
+                                self.get_prepared_row_count(),
                                 duration,
                             )
                         except Exception:
@@ -134,24 +159,8 @@ class AbstractTransformer(ABC):
         _wrap_with_timing("load_data", "load_data")
 
     @staticmethod
-    @lru_cache(maxsize=None)
     def _resolve_transformer_class(event_object_type, operation_type):
-        class_name = f"{event_object_type.lower().title().replace('_', '')}\
-{operation_type.lower().title().replace('_', '')}EventTransformer"
-        transformers = Path(__file__).parent / "transformers"
-
-        for file in os.listdir(transformers):
-            full_path = os.path.join(transformers, file)
-            if os.path.isfile(full_path) and file.endswith(".py") and not file.startswith("__"):
-                module_name = file[:-3]
-                if module_name.lower() == event_object_type.lower():
-                    spec = importlib.util.spec_from_file_location(module_name, full_path)
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-                    for cls_name, cls_obj in inspect.getmembers(module):
-                        if inspect.isclass(cls_obj) and cls_name == class_name:
-                            return cls_obj
-        return None
+        return TRANSFORMER_REGISTRY.resolve(event_object_type, operation_type.upper())
 
     def transformer_factory(self):
         try:
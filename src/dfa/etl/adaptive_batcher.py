@@ -0,0 +1,160 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import threading
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Optional
+
+from common.metrics.metrics import METRICS
+from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_TARGET_BIND_BYTES = 8 * 1024 * 1024
+DEFAULT_TARGET_LOAD_SECONDS = 2.0
+DEFAULT_MIN_BATCH_ROWS = 500
+BATCH_SAMPLE_ROWS = 200
+MAX_BATCH_GROWTH_FACTOR = 2.0
+LATENCY_SMOOTHING = 0.5
+NUMBER_BIND_BYTES = 22
+TIMESTAMP_TZ_BIND_BYTES = 13
+
+
+def _get_positive_number_env(name: str, default, cast=int):
+    try:
+        value = cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+@dataclass
+class BatchSizeState:
+    """What the batcher has learned about loading one table."""
+
+    rows_per_chunk: int
+    bytes_per_row: int
+    rows_per_second: Optional[float] = None
+    loaded_chunks: int = 0
+
+
+class AdaptiveBatcher:
+    """Choose executemany chunk sizes per table from bind bytes per row and measured load latency.
+
+    Enabled with ``DFA_ADAPTIVE_BATCH=true``. Each chunk is sized so its bind
+    buffers stay near ``DFA_BATCH_TARGET_BYTES``; bytes per row come from the
+    table's column definitions and the longest values in a sample of the rows,
+    the same way ``setinputsizes`` sizes string buffers. Once a chunk has loaded,
+    its rows per second also cap the next chunk at ``DFA_BATCH_TARGET_SECONDS``
+    of work, and a chunk never grows by more than ``MAX_BATCH_GROWTH_FACTOR``
+    over the previous one. ``DFA_BATCH_SIZE`` stays the upper bound and
+    ``DFA_BATCH_MIN_SIZE`` the lower one. State is kept per table for the life
+    of the process, so warm invocations start from the last good size.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._states: dict[str, BatchSizeState] = {}
+        self._column_definitions: dict[str, list[dict[str, Any]]] = {}
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("DFA_ADAPTIVE_BATCH", "false").lower() == "true"
+
+    def _get_column_definitions(self, table_manager) -> list[dict[str, Any]]:
+        table_name = table_manager.get_table_name()
+        with self._lock:
+            column_definitions = self._column_definitions.get(table_name)
+        if column_definitions is None:
+            column_definitions = [
+                definition
+                for definition in table_manager.get_column_list_definition_for_table_ddl()
+                if not definition.get("skip_column")
+            ]
+            with self._lock:
+                self._column_definitions[table_name] = column_definitions
+        return column_definitions
+
+    @staticmethod
+    def estimate_row_bytes(column_definitions: list[dict[str, Any]], rows: Iterable[dict[str, Any]]) -> int:
+        """Estimate the bind bytes one row needs, sizing each column by its longest sampled value."""
+        sample = list(islice(rows, BATCH_SAMPLE_ROWS))
+        row_bytes = 0
+        for column in column_definitions:
+            data_type = column["data_type"].upper()
+            if data_type in ("NUMBER", "INTEGER"):
+                row_bytes += NUMBER_BIND_BYTES
+                continue
+            if data_type == "TIMESTAMP WITH TIME ZONE":
+                row_bytes += TIMESTAMP_TZ_BIND_BYTES
+                continue
+            column_name = column["column_name"]
+            longest_value = max(
+                (
+                    len(str(value))
+                    for row in sample
+                    for value in (row.get(column_name, row.get(column_name.lower())),)
+                    if value is not None
+                ),
+                default=1,
+            )
+            row_bytes += min(longest_value, column.get("data_length") or BaseQueryBuilder.MAX_DIRECT_STRING_BIND_SIZE)
+        return max(1, row_bytes)
+
+    def get_state(self, table_name: str) -> Optional[BatchSizeState]:
+        with self._lock:
+            return self._states.get(table_name)
+
+    def chunk_size(self, table_manager, rows: Iterable[dict[str, Any]]) -> int:
+        """Return how many rows the next chunk for ``table_manager`` should bind."""
+        max_rows = _get_positive_number_env("DFA_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        min_rows = min(max_rows, _get_positive_number_env("DFA_BATCH_MIN_SIZE", DEFAULT_MIN_BATCH_ROWS))
+        target_bytes = _get_positive_number_env("DFA_BATCH_TARGET_BYTES", DEFAULT_TARGET_BIND_BYTES)
+        target_seconds = _get_positive_number_env("DFA_BATCH_TARGET_SECONDS", DEFAULT_TARGET_LOAD_SECONDS, float)
+
+        table_name = table_manager.get_table_name()
+        bytes_per_row = self.estimate_row_bytes(self._get_column_definitions(table_manager), rows)
+        size = target_bytes // bytes_per_row
+        with self._lock:
+            state = self._states.get(table_name)
+            if state is not None and state.rows_per_second is not None:
+                size = min(
+                    size,
+                    int(state.rows_per_second * target_seconds),
+                    int(state.rows_per_chunk * MAX_BATCH_GROWTH_FACTOR),
+                )
+            size = max(min_rows, min(max_rows, size))
+            if state is None:
+                self._states[table_name] = BatchSizeState(size, bytes_per_row)
+            else:
+                state.rows_per_chunk = size
+                state.bytes_per_row = bytes_per_row
+        return size
+
+    def record_load(self, table_manager, rows: int, seconds: float):
+        """Feed the time one chunk of ``rows`` took to load back into the next size."""
+        if rows <= 0 or seconds <= 0:
+            return
+        table_name = table_manager.get_table_name()
+        rows_per_second = rows / seconds
+        with self._lock:
+            state = self._states.get(table_name)
+            if state is None:
+                return
+            if state.rows_per_second is None:
+                state.rows_per_second = rows_per_second
+            else:
+                state.rows_per_second += LATENCY_SMOOTHING * (rows_per_second - state.rows_per_second)
+            state.loaded_chunks += 1
+            bytes_per_row = state.bytes_per_row
+        METRICS.observe("batch_rows", rows, table=table_name)
+        METRICS.observe("batch_row_bytes", bytes_per_row, table=table_name)
+
+    def reset(self):
+        with self._lock:
+            self._states.clear()
+            self._column_definitions.clear()
+
+
+ADAPTIVE_BATCHER = AdaptiveBatcher()
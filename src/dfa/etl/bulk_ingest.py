@@ -0,0 +1,214 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Optional
+
+from common.logger.logger import Logger
+from common.ocihelpers.storage import BaseObjectStorage
+from dfa.adw.connection import AdwConnection
+from dfa.etl.file_transformer import JSONL_SUFFIXES, FileTransformer
+
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_LOADER_CONNECTIONS = 2
+BULK_OBJECT_SUFFIXES = (*JSONL_SUFFIXES, ".json")
+_END_OF_OBJECTS = object()
+
+logger = Logger(__name__).get_logger()
+
+
+def _get_positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+@dataclass
+class BulkIngestReport:
+    prefix: str
+    objects_listed: int = 0
+    objects_loaded: int = 0
+    objects_skipped: int = 0
+    completion_markers: int = 0
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def objects_failed(self) -> int:
+        return len(self.failures)
+
+    def as_dict(self) -> dict[str, Any]:
+        elapsed_seconds = self.elapsed_seconds or 0.0
+        return {
+            "prefix": self.prefix,
+            "objects_listed": self.objects_listed,
+            "objects_loaded": self.objects_loaded,
+            "objects_skipped": self.objects_skipped,
+            "objects_failed": self.objects_failed,
+            "completion_markers": self.completion_markers,
+            "rows": self.rows,
+            "elapsed_seconds": round(elapsed_seconds, 3),
+            "objects_per_second": round(self.objects_loaded / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "rows_per_second": round(self.rows / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+            "failures": [{"object_name": name, "error": error} for name, error in self.failures],
+        }
+
+
+class BulkFileIngest:
+    """Load every snapshot/event object under an Object Storage prefix in one process.
+
+    Downloads and transforms run on ``download_workers`` threads without touching
+    the database. Prepared objects are handed, in listing order, to
+    ``loader_connections`` loader threads that each hold their own ADW connection.
+    Snapshot completion markers are held back and finalized after every data batch
+    has loaded, so their cleanup sees the complete tracker.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        bucket_name: str,
+        prefix: str,
+        search_for: str = "",
+        is_timeseries: bool = False,
+        download_workers: Optional[int] = None,
+        loader_connections: Optional[int] = None,
+    ):
+        self.namespace = namespace
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.search_for = search_for
+        self.is_timeseries = is_timeseries
+        self.download_workers = download_workers or _get_positive_int_env(
+            "DFA_BULK_DOWNLOAD_WORKERS", DEFAULT_DOWNLOAD_WORKERS
+        )
+        self.loader_connections = loader_connections or _get_positive_int_env(
+            "DFA_BULK_LOADER_CONNECTIONS", DEFAULT_LOADER_CONNECTIONS
+        )
+        self.report = BulkIngestReport(prefix=prefix)
+        self._report_lock = threading.Lock()
+        self._completion_markers: list[tuple[str, FileTransformer]] = []
+
+    def list_object_names(self) -> list[str]:
+        objects = BaseObjectStorage().get_objects_by_prefix_and_search_string(
+            self.namespace,
+            self.bucket_name,
+            self.prefix,
+            self.search_for,
+        )
+        return sorted(
+            object_details.name for object_details in objects if object_details.name.endswith(BULK_OBJECT_SUFFIXES)
+        )
+
+    def _record_failure(self, object_name: str, exc: BaseException):
+        logger.error("Bulk ingest failed for %s: %s", object_name, exc)
+        with self._report_lock:
+            self.report.failures.append((object_name, str(exc)))
+
+    def _prepare_object(self, object_name: str) -> Optional[FileTransformer]:
+        transformer = FileTransformer(self.namespace, self.bucket_name, object_name, is_timeseries=self.is_timeseries)
+        # Download threads hold no ADW connection; loaders check the tracker instead.
+        transformer.check_completed_batches_before_download = False
+        try:
+            transformer.extract_data()
+            transformer.transform_data()
+        except Exception as exc:
+            self._record_failure(object_name, exc)
+            return None
+        return transformer
+
+    def _load_object(self, object_name: str, transformer: FileTransformer):
+        try:
+            if transformer.skip_if_snapshot_batch_completed():
+                with self._report_lock:
+                    self.report.objects_skipped += 1
+                return
+
+            row_count = transformer.get_prepared_row_count()
+            transformer.load_data()
+        except Exception as exc:
+            self._record_failure(object_name, exc)
+            return
+
+        with self._report_lock:
+            self.report.objects_loaded += 1
+            self.report.rows += row_count
+
+    def _run_loader(self, prepared_objects: queue.Queue):
+        with AdwConnection.thread_scope():
+            while True:
+                prepared_object = prepared_objects.get()
+                if prepared_object is _END_OF_OBJECTS:
+                    return
+                self._load_object(*prepared_object)
+
+    def _dispatch_prepared_object(self, object_name: str, transformer: Optional[FileTransformer], prepared_objects):
+        if transformer is None:
+            return
+        if transformer.is_snapshot_completion_marker():
+            self._completion_markers.append((object_name, transformer))
+            return
+        prepared_objects.put((object_name, transformer))
+
+    def _finalize_completion_markers(self):
+        if not self._completion_markers:
+            return
+
+        with AdwConnection.thread_scope():
+            for object_name, transformer in self._completion_markers:
+                self._load_object(object_name, transformer)
+                with self._report_lock:
+                    self.report.completion_markers += 1
+
+    def run(self) -> BulkIngestReport:
+        started = perf_counter()
+        object_names = self.list_object_names()
+        self.report.objects_listed = len(object_names)
+        logger.info(
+            "Bulk ingest of %d objects under %s with %d download workers and %d loader connections",
+            len(object_names),
+            self.prefix,
+            self.download_workers,
+            self.loader_connections,
+        )
+
+        prepared_objects: queue.Queue = queue.Queue(maxsize=self.loader_connections * 2)
+        loaders = [
+            threading.Thread(target=self._run_loader, args=(prepared_objects,), name=f"dfa-bulk-loader-{index}")
+            for index in range(self.loader_connections)
+        ]
+        for loader in loaders:
+            loader.start()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="dfa-bulk-download") as pool:
+                # Keep a bounded window of downloads in flight and hand results over in listing order.
+                in_flight: deque = deque()
+                for object_name in object_names:
+                    in_flight.append((object_name, pool.submit(self._prepare_object, object_name)))
+                    if len(in_flight) >= self.download_workers * 2:
+                        ready_name, ready_future = in_flight.popleft()
+                        self._dispatch_prepared_object(ready_name, ready_future.result(), prepared_objects)
+                while in_flight:
+                    ready_name, ready_future = in_flight.popleft()
+                    self._dispatch_prepared_object(ready_name, ready_future.result(), prepared_objects)
+        finally:
+            for _ in loaders:
+                prepared_objects.put(_END_OF_OBJECTS)
+            for loader in loaders:
+                loader.join()
+
+        self._finalize_completion_markers()
+
+        self.report.elapsed_seconds = perf_counter() - started
+        logger.info("Bulk ingest summary: %s", self.report.as_dict())
+        return self.report
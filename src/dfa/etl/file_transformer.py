@@ -1,20 +1,45 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
+import gzip
+import io
 import json
 import os
-from datetime import datetime, timezone
+import threading
+import zlib
+from collections.abc import Mapping, MutableMapping
+from time import perf_counter
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstd objects are optional
+    zstandard = None
+
+from common.metrics.metrics import METRICS
 from common.ocihelpers.storage import BaseObjectStorage
+from common.tracing.tracing import TRACER
 from dfa.adw.connection import AdwConnection
 from dfa.adw.query_builders.base_query_builder import get_query_builder
-from dfa.etl.abstract_transformer import AbstractTransformer
+from dfa.etl.abstract_transformer import UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE, AbstractTransformer
+from dfa.etl.adaptive_batcher import ADAPTIVE_BATCHER, BATCH_SAMPLE_ROWS
+from dfa.etl.memory_budget import MEMORY_CHECK_ROWS, MemoryBudget, RowSpill, estimate_rows_bytes
+from dfa.etl.transformers.base_event_transformer import parse_event_time
+
+JSONL_SUFFIX = ".jsonl"
+GZIP_JSONL_SUFFIX = ".jsonl.gz"
+ZSTD_JSONL_SUFFIX = ".jsonl.zst"
+JSONL_SUFFIXES = (GZIP_JSONL_SUFFIX, ZSTD_JSONL_SUFFIX, JSONL_SUFFIX)
 
 
 class FileTransformer(AbstractTransformer):
     transformer_name = "dfa_file_transformer"
     is_timeseries = False
     query_builder = None
+    HEADER_PROBE_BYTES = 65536
+    check_completed_batches_before_download = True
+    STREAM_READ_BUFFER_BYTES = 1024 * 1024
+    skipped_redelivery_count = 0
+    _skipped_redelivery_lock = threading.Lock()
 
     _namespace = None
     _bucket_name = None
@@ -24,6 +49,20 @@ class FileTransformer(AbstractTransformer):
     _snapshot_id = None
     _snapshot_status = None
     _is_day0_export = False
+    _headers_applied = False
+    _streamed_raw_event_count = 0
+    _chunk_transformer = None
+    _etag = None
+    _checkpoint_query_builder = None
+    _checkpoint_lookup_done = False
+    _checkpoint_found = False
+    _resume_row_offset = 0
+    _loaded_row_offset = 0
+    _loaded_chunk_index = 0
+    _checkpoint_written = False
+    _is_skipped_redelivery = False
+    _memory_budget = None
+    _spilled_rows = None
 
     def __init__(self, namespace, bucket_name, object_name, is_timeseries=False):
         self.is_timeseries = is_timeseries
@@ -55,6 +94,7 @@ class FileTransformer(AbstractTransformer):
         return False
 
     def _apply_headers(self, headers):
+        self._headers_applied = True
         if "messageType" in headers:
             self._event_object_type = headers["messageType"]
         if "operation" in headers:
@@ -80,39 +120,70 @@ class FileTransformer(AbstractTransformer):
         if parsed_num_of_batches is not None:
             self._num_of_batches = parsed_num_of_batches
 
-    def _set_raw_event_data(self, event_data):
-        content = event_data.data.content.decode("utf-8")
+    def _get_jsonl_suffix(self):
+        return next((suffix for suffix in JSONL_SUFFIXES if self._object_name.endswith(suffix)), None)
+
+    def _open_decompressed_stream(self, event_data, suffix):
+        """Wrap the raw object body in a streaming decompressor so the file is never held in memory whole."""
+        raw_stream = event_data.data.raw
+        if suffix == GZIP_JSONL_SUFFIX:
+            return gzip.GzipFile(fileobj=raw_stream, mode="rb")
+        if zstandard is None:
+            raise Exception(f"Cannot process {self._object_name} - the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(raw_stream, read_size=self.STREAM_READ_BUFFER_BYTES)
+
+    def _iter_jsonl_lines(self, event_data, suffix):
+        if suffix == JSONL_SUFFIX:
+            # Iterate the decoded text in place rather than holding a second copy as a list of lines.
+            for line in io.StringIO(event_data.data.content.decode("utf-8")):
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+            return
+
+        with self._open_decompressed_stream(event_data, suffix) as decompressed_stream:
+            buffered_stream = io.BufferedReader(decompressed_stream, buffer_size=self.STREAM_READ_BUFFER_BYTES)
+            for line in io.TextIOWrapper(buffered_stream, encoding="utf-8"):
+                line = line.rstrip("\r\n")
+                if line:
+                    yield line
+
+    def _iter_raw_events(self, event_data):
+        """Yield raw events from a downloaded object, applying header lines as they are read."""
+        jsonl_suffix = self._get_jsonl_suffix()
 
-        if self._object_name.endswith(".jsonl"):
-            for line in content.splitlines():
+        if jsonl_suffix is not None:
+            for line in self._iter_jsonl_lines(event_data, jsonl_suffix):
                 raw_event = json.loads(line)
                 if "headers" in raw_event:
                     self._apply_headers(raw_event["headers"])
                     continue
-                self._raw_events.append(raw_event)
+                yield raw_event
         else:
-            outer = json.loads(content)
+            outer = json.loads(event_data.data.content.decode("utf-8"))
             try:
                 raw_field = outer.get("data")
                 raw_data = json.loads(raw_field) if isinstance(raw_field, str) else raw_field
             except Exception as e:
                 self.logger.error("Failed to parse payload 'data' field: %s", e)
                 raw_data = None
+            headers = outer.get("headers", {})
+            if headers:
+                self._apply_headers(headers)
             if isinstance(raw_data, dict):
-                self._raw_events = [raw_data]
+                yield raw_data
             elif isinstance(raw_data, list):
-                self._raw_events = raw_data
+                yield from raw_data
             else:
                 self.logger.warning("Cannot process event content - unknown format was found.")
-            headers = outer.get("headers", {})
-            if headers:
-                self._apply_headers(headers)
 
         if not self.is_valid_object_type(self.get_event_object_type()):
             self.logger.info("Skipping processing for event of type %s", self.get_event_object_type())
 
-    def extract_data(self):
-        event_data = self._object_storage_client.download(self._namespace, self._bucket_name, self._object_name)
+    def _set_raw_event_data(self, event_data):
+        self._raw_events.extend(self._iter_raw_events(event_data))
+
+    def _reset_extracted_state(self):
         self._raw_events = []
         self._prepared_events = []
         self._snapshot_id = None
@@ -120,27 +191,221 @@ class FileTransformer(AbstractTransformer):
         self._snapshot_status = None
         self._event_type_version = None
         self._is_day0_export = False
-        self._set_raw_event_data(event_data)
+        self._headers_applied = False
+        self._streamed_raw_event_count = 0
+        self._chunk_transformer = None
+        self._etag = None
+        self._checkpoint_query_builder = None
+        self._checkpoint_lookup_done = False
+        self._checkpoint_found = False
+        self._resume_row_offset = 0
+        self._loaded_row_offset = 0
+        self._loaded_chunk_index = 0
+        self._checkpoint_written = False
+        self._is_skipped_redelivery = False
+        self._release_spilled_rows()
+        self._memory_budget = MemoryBudget()
+
+    def _set_object_etag(self, event_data):
+        headers = getattr(event_data, "headers", None)
+        etag = headers.get("etag") if isinstance(headers, Mapping) else None
+        self._etag = etag if isinstance(etag, str) and etag else None
+
+    def _record_download_size(self, event_data):
+        headers = getattr(event_data, "headers", None)
+        content_length = headers.get("content-length") if isinstance(headers, Mapping) else None
+        parsed_content_length = self._parse_int_header_value(content_length)
+        if parsed_content_length is not None:
+            METRICS.increment("bytes_downloaded", parsed_content_length, transformer=self.transformer_name)
+        return parsed_content_length
+
+    @staticmethod
+    def is_redelivery_check_enabled():
+        return os.getenv("DFA_SKIP_COMPLETED_BATCHES", "true").strip().lower() != "false"
+
+    def _read_header_line(self):
+        """Return the header line of a JSONL object from a ranged read, or None if it cannot be parsed."""
+        try:
+            header_object = self._object_storage_client.download_range(
+                self._namespace,
+                self._bucket_name,
+                self._object_name,
+                0,
+                self.HEADER_PROBE_BYTES - 1,
+            )
+            content = header_object.data.content
+        except Exception as e:
+            self.logger.warning("Header probe failed for %s: %s", self._object_name, e)
+            return None
+
+        if not isinstance(content, bytes):
+            return None
+        probe_is_partial = len(content) >= self.HEADER_PROBE_BYTES
+        try:
+            content = self._decompress_header_probe(content)
+        except Exception as e:
+            self.logger.warning("Header probe could not decompress %s: %s", self._object_name, e)
+            return None
+        first_line, newline, _ = content.partition(b"\n")
+        if not newline and probe_is_partial:
+            return None
+        try:
+            first_event = json.loads(first_line)
+        except ValueError:
+            return None
+
+        headers = first_event.get("headers") if isinstance(first_event, dict) else None
+        return headers if isinstance(headers, dict) else None
+
+    def _decompress_header_probe(self, content):
+        """Decompress the leading bytes of an object; both codecs accept a truncated frame."""
+        suffix = self._get_jsonl_suffix()
+        if suffix == GZIP_JSONL_SUFFIX:
+            return zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(content)
+        if suffix == ZSTD_JSONL_SUFFIX:
+            if zstandard is None:
+                return b""
+            return zstandard.ZstdDecompressor().decompressobj().decompress(content)
+        return content
+
+    def _is_completed_snapshot_batch(self):
+        if not self._should_track_snapshot():
+            return False
+
+        snapshot_query_builder = get_query_builder(
+            self.get_event_object_type(),
+            self.get_operation_type(),
+            [],
+            self.is_timeseries,
+        )
+        return snapshot_query_builder.is_snapshot_batch_completed(
+            snapshot_id=self._get_snapshot_id_for_batch(),
+            batch_id=self._get_batch_id_for_batch(),
+            tenancy_id=self._tenancy_id,
+            service_instance_id=self._service_instance_id,
+        )
+
+    def _is_completed_batch_redelivery(self):
+        """Check the snapshot batch tracker before downloading the full object.
+
+        Only JSONL snapshot batches carry their headers on the first line, so other
+        objects (and time series loads, which are not tracked) are always processed.
+        """
+        if (
+            self.is_timeseries
+            or not self.check_completed_batches_before_download
+            or self._get_jsonl_suffix() is None
+            or not self.is_redelivery_check_enabled()
+        ):
+            return False
+
+        headers = self._read_header_line()
+        if headers is None:
+            return False
+        self._apply_headers(headers)
+        return self._is_completed_snapshot_batch()
+
+    def _mark_skipped_redelivery(self):
+        self._is_skipped_redelivery = True
+        # Bulk ingest marks redeliveries from several loader threads.
+        with FileTransformer._skipped_redelivery_lock:
+            FileTransformer.skipped_redelivery_count += 1
+            skipped_redelivery_count = FileTransformer.skipped_redelivery_count
+        METRICS.increment("skipped_redeliveries", transformer=self.transformer_name)
+        self.logger.info(
+            "%s skipping redelivered %s; snapshot batch %s already completed (skipped redeliveries: %d)",
+            self.transformer_name,
+            self._object_name,
+            self._get_batch_id_for_batch(),
+            skipped_redelivery_count,
+        )
+
+    def _skip_completed_batch_redelivery(self):
+        if not self._is_completed_batch_redelivery():
+            return False
+
+        self._mark_skipped_redelivery()
+        return True
+
+    def skip_if_snapshot_batch_completed(self):
+        """Check the tracker for an object that has already been extracted.
+
+        Used when the download ran without database access (see
+        ``check_completed_batches_before_download``).
+        """
+        if self.is_timeseries or not self.is_redelivery_check_enabled() or not self._is_completed_snapshot_batch():
+            return False
+
+        self._mark_skipped_redelivery()
+        return True
+
+    def is_skipped_redelivery(self):
+        return self._is_skipped_redelivery
+
+    def _download_object(self):
+        with TRACER.span("object_storage.download", bucket=self._bucket_name, object=self._object_name) as span:
+            event_data = self._object_storage_client.download(self._namespace, self._bucket_name, self._object_name)
+            self._set_object_etag(event_data)
+            span.set_attribute("bytes", self._record_download_size(event_data))
+        return event_data
+
+    def extract_data(self):
+        self._reset_extracted_state()
+        if self._skip_completed_batch_redelivery():
+            return
+
+        event_data = self._download_object()
+        with TRACER.span("file.parse", object=self._object_name) as span:
+            self._set_raw_event_data(event_data)
+            span.set_attribute("raw_events", len(self._raw_events))
+        self._memory_budget.set("raw_events", estimate_rows_bytes(self._raw_events))
+
+    def iter_raw_event_chunks(self, chunk_size):
+        """Download the object and yield raw events in chunks for the pipelined path.
+
+        Raw events are not retained on the transformer. Chunks are held back until
+        the header line has been applied so every chunk can be routed.
+        """
+        self._reset_extracted_state()
+        if self._skip_completed_batch_redelivery():
+            return
+
+        event_data = self._download_object()
+
+        chunk = []
+        for raw_event in self._iter_raw_events(event_data):
+            self._streamed_raw_event_count += 1
+            chunk.append(raw_event)
+            if len(chunk) >= chunk_size and self._headers_applied:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
     def _get_snapshot_id_for_batch(self):
         return self._snapshot_id or self._object_name
 
     def _get_batch_id_for_batch(self):
         object_file_name = self._object_name.rsplit("/", 1)[-1]
-        if object_file_name.endswith(".jsonl"):
-            return object_file_name[: -len(".jsonl")]
+        for suffix in JSONL_SUFFIXES:
+            if object_file_name.endswith(suffix):
+                return object_file_name[: -len(suffix)]
         return object_file_name
 
+    def is_snapshot_completion_marker(self):
+        return self._is_snapshot_completion_marker()
+
     def _is_snapshot_completion_marker(self):
         return (
             len(self._raw_events) == 0
+            and self._streamed_raw_event_count == 0
             and self._num_of_batches is not None
             and isinstance(self._snapshot_status, str)
             and self._snapshot_status.strip().upper() == "COMPLETED"
         )
 
     def _get_utc_current_event_timestamp(self):
-        return datetime.fromisoformat(self._event_timestamp).astimezone(timezone.utc).strftime("%d-%b-%y %H:%M:%S.%f")
+        return parse_event_time(self._event_timestamp)
 
     def _mark_export_operation_type(self, transformed_event):
         """Label Day0 CREATE file rows as exports without changing routing."""
@@ -149,107 +414,360 @@ class FileTransformer(AbstractTransformer):
 
         rows = transformed_event if isinstance(transformed_event, list) else [transformed_event]
         for row in rows:
-            if isinstance(row, dict):
+            if isinstance(row, MutableMapping):
                 row["operation_type"] = "EXPORT"
 
-    def transform_data(self):
-        if self.is_valid_object_type(self.get_event_object_type()) and self.is_supported_event_type_version(
+    def _is_transformable(self):
+        return self.is_valid_object_type(self.get_event_object_type()) and self.is_supported_event_type_version(
             self.get_event_object_type(), self._event_type_version
-        ):
+        )
+
+    def _transform_raw_event(self, transformer, raw_event):
+        transformer.set_tenancy_id(self._tenancy_id)
+        transformer.set_service_instance_id(self._service_instance_id)
+        transformer.set_event_timestamp_for_message(self._event_timestamp)
+        transformed_event = transformer.transform_raw_event(raw_event)
+        self._mark_export_operation_type(transformed_event)
+        return transformed_event
+
+    def _log_unsupported_event_type_version(self):
+        self.logger.warning(
+            UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE,
+            self.get_event_object_type(),
+            self._event_type_version,
+        )
+
+    def transform_data(self):
+        if self._is_transformable():
             transformer = self.transformer_factory()
 
             self._prepared_events = []
+            accounted_rows = 0
             for raw_event in self._get_raw_events():
-                transformer.set_tenancy_id(self._tenancy_id)
-                transformer.set_service_instance_id(self._service_instance_id)
-                transformer.set_event_timestamp_for_message(self._event_timestamp)
-                transformed_event = transformer.transform_raw_event(raw_event)
-                self._mark_export_operation_type(transformed_event)
-                self._append_prepared_event(transformed_event)
+                self._append_prepared_event(self._transform_raw_event(transformer, raw_event))
+                if len(self._prepared_events) - accounted_rows >= MEMORY_CHECK_ROWS:
+                    accounted_rows = self._account_prepared_events(accounted_rows)
+            self._account_prepared_events(accounted_rows)
+            self._record_transform_metrics(len(self._get_raw_events()), self.get_prepared_row_count())
 
             self.logger.info(
                 "%s transformed %d %s %s events",
                 self.transformer_name,
-                len(self._prepared_events),
+                self.get_prepared_row_count(),
                 self._event_object_type,
                 self._operation_type,
             )
         elif self.is_valid_object_type(self.get_event_object_type()):
-            self.logger.warning(
-                "Skipping unsupported %s eventTypeVersion %s",
-                self.get_event_object_type(),
-                self._event_type_version,
-            )
+            self._log_unsupported_event_type_version()
+
+    def _account_prepared_events(self, accounted_rows):
+        """Add rows prepared since ``accounted_rows`` to the budget, spilling them all if it is nearly used up.
+
+        Returns how many in-memory rows are now accounted for.
+        """
+        if self._memory_budget is None:
+            self._memory_budget = MemoryBudget()
+        self._memory_budget.add("prepared_events", estimate_rows_bytes(self._prepared_events, accounted_rows))
+        if not self._prepared_events or not self._memory_budget.is_near_limit():
+            return len(self._prepared_events)
+
+        if self._spilled_rows is None:
+            self._spilled_rows = RowSpill()
+        spilled_bytes = self._spilled_rows.append(self._prepared_events)
+        METRICS.increment("rows_spilled", len(self._prepared_events), transformer=self.transformer_name)
+        METRICS.increment("spill_bytes", spilled_bytes, transformer=self.transformer_name)
+        self.logger.info(
+            "%s spilled %d prepared rows (%d bytes) of %s to stay within a %d byte memory budget",
+            self.transformer_name,
+            len(self._prepared_events),
+            spilled_bytes,
+            self._object_name,
+            self._memory_budget.limit_bytes,
+        )
+        self._prepared_events = []
+        self._memory_budget.set("prepared_events", 0)
+        return 0
+
+    def _release_spilled_rows(self):
+        if self._spilled_rows is not None:
+            self._spilled_rows.close()
+            self._spilled_rows = None
+
+    def get_prepared_row_count(self):
+        spilled_row_count = len(self._spilled_rows) if self._spilled_rows is not None else 0
+        return spilled_row_count + len(self._prepared_events)
+
+    def transform_raw_events(self, raw_events):
+        """Transform one chunk of raw events for the pipelined path.
+
+        Returns the prepared rows for the chunk; ``_prepared_events`` is left untouched.
+        """
+        if not self._is_transformable():
+            return []
+
+        if self._chunk_transformer is None:
+            self._chunk_transformer = self.transformer_factory()
+
+        prepared_events = []
+        for raw_event in raw_events:
+            transformed_event = self._transform_raw_event(self._chunk_transformer, raw_event)
+            if transformed_event is not None and len(transformed_event) > 0:
+                if isinstance(transformed_event, list):
+                    prepared_events.extend(transformed_event)
+                else:
+                    prepared_events.append(transformed_event)
+        self._record_transform_metrics(len(raw_events), len(prepared_events))
+        return prepared_events
+
+    @staticmethod
+    def get_batch_size():
+        try:
+            return int(os.getenv("DFA_BATCH_SIZE", "10000"))
+        except ValueError:
+            return 10000
 
     def chunk_prepared_events(self, chunk_size=None):
         """Return load batches without changing the flat prepared-event list."""
         if chunk_size is None:
-            try:
-                chunk_size = int(os.getenv("DFA_BATCH_SIZE", "10000"))
-            except ValueError:
-                chunk_size = 10000
+            chunk_size = self.get_batch_size()
 
         return [self._prepared_events[i : i + chunk_size] for i in range(0, len(self._prepared_events), chunk_size)]
 
-    def load_data(self):
-        try:
-            current_query_builder = None
-            snapshot_query_builder = None
-            should_track_snapshot = (
-                not self.is_timeseries
-                and self.get_operation_type() == "CREATE"
-                and self.is_valid_object_type(self.get_event_object_type())
-                and self.is_supported_event_type_version(
-                    self.get_event_object_type(),
-                    self._event_type_version,
-                )
+    def _get_adaptive_table_manager(self):
+        if not ADAPTIVE_BATCHER.is_enabled():
+            return None
+        query_builder = self._get_checkpoint_query_builder()
+        return query_builder.table_manager if query_builder is not None else None
+
+    def get_load_chunk_size(self, rows):
+        """Return how many of the pending ``rows`` the next load chunk should take."""
+        table_manager = self._get_adaptive_table_manager()
+        if table_manager is None:
+            return self.get_batch_size()
+        return ADAPTIVE_BATCHER.chunk_size(table_manager, rows)
+
+    def _iter_prepared_segments(self):
+        if self._spilled_rows is not None:
+            yield from self._spilled_rows.iter_segments()
+        yield self._prepared_events
+
+    def iter_prepared_chunks(self):
+        """Yield ``(chunk, is_final_chunk)`` load batches, sizing each one after the previous one loaded.
+
+        Spilled rows are read back one segment at a time ahead of the rows still in memory.
+        """
+        total_rows = self.get_prepared_row_count()
+        yielded_rows = 0
+        for segment in self._iter_prepared_segments():
+            offset = 0
+            while offset < len(segment):
+                chunk_size = self.get_load_chunk_size(segment[offset : offset + BATCH_SAMPLE_ROWS])
+                chunk = segment[offset : offset + chunk_size]
+                offset += len(chunk)
+                yielded_rows += len(chunk)
+                yield chunk, yielded_rows >= total_rows
+
+    def _should_track_snapshot(self):
+        return (
+            not self.is_timeseries
+            and self.get_operation_type() == "CREATE"
+            and self.is_valid_object_type(self.get_event_object_type())
+            and self.is_supported_event_type_version(
+                self.get_event_object_type(),
+                self._event_type_version,
             )
-            is_snapshot_completion_marker = self._is_snapshot_completion_marker()
-            should_track_snapshot_batch = should_track_snapshot and not is_snapshot_completion_marker
-            should_finalize_snapshot = should_track_snapshot and is_snapshot_completion_marker
-            if should_track_snapshot_batch or should_finalize_snapshot:
-                snapshot_query_builder = get_query_builder(
-                    self.get_event_object_type(),
-                    self.get_operation_type(),
-                    [],
-                    self.is_timeseries,
-                )
-                self.query_builder = snapshot_query_builder
-
-            if len(self._prepared_events) > 0:
-                for batched_events in self.chunk_prepared_events():
-                    self.logger.info(
-                        "%s building queries for %d %s %s",
-                        self.transformer_name,
-                        len(batched_events),
-                        self.get_event_object_type(),
-                        self.get_operation_type(),
-                    )
-                    current_query_builder = get_query_builder(
-                        self.get_event_object_type(),
-                        self.get_operation_type(),
-                        batched_events,
-                        self.is_timeseries,
-                    )
-                    self.query_builder = current_query_builder
-                    self.query_builder.execute_sql_for_events()
-
-            if should_track_snapshot_batch and snapshot_query_builder is not None:
-                snapshot_query_builder.register_snapshot_batch_completed(
+        )
+
+    def _get_snapshot_tracking_flags(self):
+        should_track_snapshot = self._should_track_snapshot()
+        is_snapshot_completion_marker = self._is_snapshot_completion_marker()
+        should_track_snapshot_batch = should_track_snapshot and not is_snapshot_completion_marker
+        should_finalize_snapshot = should_track_snapshot and is_snapshot_completion_marker
+        return should_track_snapshot_batch, should_finalize_snapshot
+
+    def _get_snapshot_query_builder(self, should_track_snapshot_batch, should_finalize_snapshot):
+        if not should_track_snapshot_batch and not should_finalize_snapshot:
+            return None
+
+        snapshot_query_builder = get_query_builder(
+            self.get_event_object_type(),
+            self.get_operation_type(),
+            [],
+            self.is_timeseries,
+        )
+        self.query_builder = snapshot_query_builder
+        return snapshot_query_builder
+
+    @staticmethod
+    def is_chunk_checkpointing_enabled():
+        return os.getenv("DFA_CHUNK_CHECKPOINTS", "true").strip().lower() != "false"
+
+    def _uses_chunk_checkpoints(self):
+        return self._etag is not None and self.is_chunk_checkpointing_enabled()
+
+    def _get_checkpoint_query_builder(self):
+        if self._checkpoint_query_builder is None:
+            self._checkpoint_query_builder = get_query_builder(
+                self.get_event_object_type(),
+                self.get_operation_type(),
+                [],
+                self.is_timeseries,
+            )
+        return self._checkpoint_query_builder
+
+    def _load_chunk_checkpoint(self):
+        """Read the committed row offset left by an earlier failed attempt on this object version."""
+        self._checkpoint_lookup_done = True
+        if not self._uses_chunk_checkpoints():
+            return
+
+        checkpoint = self._get_checkpoint_query_builder().get_chunk_checkpoint(
+            self._bucket_name,
+            self._object_name,
+            self._etag,
+        )
+        if checkpoint is None:
+            return
+
+        self._checkpoint_found = True
+        chunk_index, self._resume_row_offset = checkpoint
+        self.logger.info(
+            "%s resuming %s after chunk %d (%d rows already committed)",
+            self.transformer_name,
+            self._object_name,
+            chunk_index,
+            self._resume_row_offset,
+        )
+
+    def load_prepared_chunk(self, batched_events, is_final_chunk=False):
+        """Load one batch of prepared rows, skipping rows committed by an earlier attempt.
+
+        Every query builder commits per batch, so after each non-final chunk the row
+        offset is checkpointed against the object's etag. A retry of the same object
+        version resumes from that offset instead of row 0; a chunk that failed part way
+        is reloaded in full, which the merge and insert paths already tolerate.
+        """
+        if not self._checkpoint_lookup_done:
+            self._load_chunk_checkpoint()
+
+        chunk_start_offset = self._loaded_row_offset
+        self._loaded_row_offset += len(batched_events)
+        self._loaded_chunk_index += 1
+        if self._loaded_row_offset <= self._resume_row_offset:
+            self.logger.info(
+                "%s skipping chunk %d of %s; already committed",
+                self.transformer_name,
+                self._loaded_chunk_index,
+                self._object_name,
+            )
+            return
+        if chunk_start_offset < self._resume_row_offset:
+            batched_events = batched_events[self._resume_row_offset - chunk_start_offset :]
+
+        self.logger.info(
+            "%s building queries for %d %s %s",
+            self.transformer_name,
+            len(batched_events),
+            self.get_event_object_type(),
+            self.get_operation_type(),
+        )
+        current_query_builder = get_query_builder(
+            self.get_event_object_type(),
+            self.get_operation_type(),
+            batched_events,
+            self.is_timeseries,
+        )
+        self.query_builder = current_query_builder
+        started = perf_counter()
+        self.query_builder.execute_sql_for_events()
+        table_manager = self._get_adaptive_table_manager()
+        if table_manager is not None:
+            ADAPTIVE_BATCHER.record_load(table_manager, len(batched_events), perf_counter() - started)
+
+        if not is_final_chunk and self._uses_chunk_checkpoints():
+            self._get_checkpoint_query_builder().register_chunk_checkpoint(
+                self._bucket_name,
+                self._object_name,
+                self._etag,
+                self._loaded_chunk_index,
+                self._loaded_row_offset,
+            )
+            self._checkpoint_written = True
+
+    def _clear_chunk_checkpoints(self):
+        # Only an object that resumed from or wrote a checkpoint has rows to clear; skip the DELETE otherwise.
+        if not self._uses_chunk_checkpoints() or not (self._checkpoint_found or self._checkpoint_written):
+            return
+        self._get_checkpoint_query_builder().clear_chunk_checkpoints(self._bucket_name, self._object_name)
+
+    def _complete_snapshot_tracking(
+        self,
+        snapshot_query_builder,
+        should_track_snapshot_batch,
+        should_finalize_snapshot,
+    ):
+        if should_track_snapshot_batch and snapshot_query_builder is not None:
+            snapshot_query_builder.register_snapshot_batch_completed(
+                snapshot_id=self._get_snapshot_id_for_batch(),
+                batch_id=self._get_batch_id_for_batch(),
+                event_timestamp=self._get_utc_current_event_timestamp(),
+                tenancy_id=self._tenancy_id,
+                service_instance_id=self._service_instance_id,
+            )
+        if should_finalize_snapshot and snapshot_query_builder is not None:
+            if self._num_of_batches is not None:
+                snapshot_query_builder.finalize_snapshot_cleanup_if_ready(
                     snapshot_id=self._get_snapshot_id_for_batch(),
-                    batch_id=self._get_batch_id_for_batch(),
-                    event_timestamp=self._get_utc_current_event_timestamp(),
+                    num_of_batches=self._num_of_batches,
                     tenancy_id=self._tenancy_id,
                     service_instance_id=self._service_instance_id,
                 )
-            if should_finalize_snapshot and snapshot_query_builder is not None:
-                if self._num_of_batches is not None:
-                    snapshot_query_builder.finalize_snapshot_cleanup_if_ready(
-                        snapshot_id=self._get_snapshot_id_for_batch(),
-                        num_of_batches=self._num_of_batches,
-                        tenancy_id=self._tenancy_id,
-                        service_instance_id=self._service_instance_id,
-                    )
+
+    def complete_pipelined_load(self):
+        """Register or finalize the snapshot batch once every pipelined chunk has loaded."""
+        if self._is_skipped_redelivery:
+            return
+
+        try:
+            should_track_snapshot_batch, should_finalize_snapshot = self._get_snapshot_tracking_flags()
+            snapshot_query_builder = self._get_snapshot_query_builder(
+                should_track_snapshot_batch,
+                should_finalize_snapshot,
+            )
+            self._complete_snapshot_tracking(
+                snapshot_query_builder,
+                should_track_snapshot_batch,
+                should_finalize_snapshot,
+            )
+            self._clear_chunk_checkpoints()
+        except Exception:
+            AdwConnection.rollback_and_close()
+            raise
+
+    def load_data(self):
+        if self._is_skipped_redelivery:
+            return
+
+        try:
+            should_track_snapshot_batch, should_finalize_snapshot = self._get_snapshot_tracking_flags()
+            snapshot_query_builder = self._get_snapshot_query_builder(
+                should_track_snapshot_batch,
+                should_finalize_snapshot,
+            )
+
+            if self.get_prepared_row_count() > 0:
+                for chunk_index, (batched_events, is_final_chunk) in enumerate(self.iter_prepared_chunks(), start=1):
+                    if chunk_index == 1:
+                        # A single-chunk load has nothing to resume, so skip the checkpoint lookup.
+                        self._checkpoint_lookup_done = is_final_chunk
+                    self.load_prepared_chunk(batched_events, is_final_chunk=is_final_chunk)
+
+            self._complete_snapshot_tracking(
+                snapshot_query_builder,
+                should_track_snapshot_batch,
+                should_finalize_snapshot,
+            )
+            self._clear_chunk_checkpoints()
         except Exception:
             AdwConnection.rollback_and_close()
             raise
@@ -0,0 +1,147 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional, Sequence
+
+DEFAULT_MEMORY_BUDGET_FRACTION = 0.5
+MEMORY_HIGH_WATERMARK = 0.8
+MEMORY_SAMPLE_ROWS = 32
+MEMORY_CHECK_ROWS = 1000
+SPILL_COMPRESSION_LEVEL = 1
+_SEGMENT_HEADER = struct.Struct(">Q")
+
+
+def _get_positive_number_env(name: str, cast=int):
+    try:
+        value = cast(os.getenv(name, ""))
+    except ValueError:
+        return None
+    return value if value > 0 else None
+
+
+def get_memory_budget_bytes() -> Optional[int]:
+    """Return the transform buffer cap, or ``None`` when no budget is configured.
+
+    ``DFA_MEMORY_BUDGET_MB`` sets the cap directly. Otherwise it is
+    ``DFA_MEMORY_BUDGET_FRACTION`` (default ``0.5``) of the function memory the
+    Functions platform exports as ``FN_MEMORY`` (in MB).
+    """
+    budget_mb = _get_positive_number_env("DFA_MEMORY_BUDGET_MB", float)
+    if budget_mb is None:
+        function_memory_mb = _get_positive_number_env("FN_MEMORY")
+        if function_memory_mb is None:
+            return None
+        fraction = _get_positive_number_env("DFA_MEMORY_BUDGET_FRACTION", float) or DEFAULT_MEMORY_BUDGET_FRACTION
+        budget_mb = function_memory_mb * min(fraction, 1.0)
+    return int(budget_mb * 1024 * 1024)
+
+
+def estimate_object_bytes(value: Any) -> int:
+    """Approximate the memory held by ``value`` and everything it contains."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_object_bytes(key) + estimate_object_bytes(item) for key, item in value.items()
+        )
+    if isinstance(value, Mapping):
+        # Compact rows share their keys with every other row of the table.
+        return sys.getsizeof(value) + sum(estimate_object_bytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_object_bytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def estimate_rows_bytes(rows: Sequence[Any], start: int = 0) -> int:
+    """Approximate the memory held by ``rows[start:]`` from an evenly spaced sample of them."""
+    row_count = len(rows) - start
+    if row_count <= 0:
+        return 0
+    step = max(1, row_count // MEMORY_SAMPLE_ROWS)
+    sample_indexes = range(start, len(rows), step)
+    sampled_bytes = sum(estimate_object_bytes(rows[index]) for index in sample_indexes)
+    return sampled_bytes * row_count // len(sample_indexes) + 8 * row_count
+
+
+class MemoryBudget:
+    """Approximate bytes held in one invocation's named buffers, checked against a cap.
+
+    Buffers are tracked by name (``raw_events``, ``prepared_events`` and so on)
+    with estimates from ``estimate_rows_bytes``. ``is_near_limit`` turns true at
+    ``MEMORY_HIGH_WATERMARK`` of the cap so callers can flush or spill before
+    the function runs out of memory. Without a cap it never does.
+    """
+
+    def __init__(self, limit_bytes: Optional[int] = None):
+        self.limit_bytes = limit_bytes if limit_bytes is not None else get_memory_budget_bytes()
+        self.peak_bytes = 0
+        self._lock = threading.Lock()
+        self._buffers: dict[str, int] = {}
+
+    def set(self, buffer: str, nbytes: int):
+        with self._lock:
+            self._buffers[buffer] = max(0, nbytes)
+            self.peak_bytes = max(self.peak_bytes, sum(self._buffers.values()))
+
+    def add(self, buffer: str, nbytes: int):
+        with self._lock:
+            self._buffers[buffer] = max(0, self._buffers.get(buffer, 0) + nbytes)
+            self.peak_bytes = max(self.peak_bytes, sum(self._buffers.values()))
+
+    def release(self, buffer: str):
+        with self._lock:
+            self._buffers.pop(buffer, None)
+
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(self._buffers.values())
+
+    def is_near_limit(self) -> bool:
+        return self.limit_bytes is not None and self.used_bytes() >= self.limit_bytes * MEMORY_HIGH_WATERMARK
+
+
+class RowSpill:
+    """Rows parked in an anonymous local temp file, one compressed pickle segment per ``append``.
+
+    The file lives in ``DFA_SPILL_DIR`` (default: the system temp directory) and
+    is removed on ``close``. Segments are read back in the order they were written.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile(dir=os.getenv("DFA_SPILL_DIR") or None)
+        self.row_count = 0
+        self.segment_count = 0
+        self.bytes_written = 0
+
+    def __len__(self):
+        return self.row_count
+
+    def append(self, rows: list[Any]) -> int:
+        """Write ``rows`` as one segment and return the bytes written."""
+        payload = zlib.compress(pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL), SPILL_COMPRESSION_LEVEL)
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(_SEGMENT_HEADER.pack(len(payload)))
+        self._file.write(payload)
+        self.row_count += len(rows)
+        self.segment_count += 1
+        self.bytes_written += _SEGMENT_HEADER.size + len(payload)
+        return _SEGMENT_HEADER.size + len(payload)
+
+    def iter_segments(self) -> Iterator[list[Any]]:
+        self._file.flush()
+        position = 0
+        for _ in range(self.segment_count):
+            self._file.seek(position)
+            (payload_size,) = _SEGMENT_HEADER.unpack(self._file.read(_SEGMENT_HEADER.size))
+            rows = pickle.loads(zlib.decompress(self._file.read(payload_size)))
+            position += _SEGMENT_HEADER.size + payload_size
+            yield rows
+
+    def close(self):
+        self._file.close()
@@ -0,0 +1,403 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Optional
+
+from common.logger.logger import Logger
+from dfa.adw.connection import AdwConnection
+from dfa.etl.adaptive_batcher import BATCH_SAMPLE_ROWS
+from dfa.etl.memory_budget import MemoryBudget, estimate_rows_bytes
+
+PIPELINE_MODE_THREAD = "thread"
+PIPELINE_MODE_ASYNCIO = "asyncio"
+PIPELINE_MODES = (PIPELINE_MODE_THREAD, PIPELINE_MODE_ASYNCIO)
+DEFAULT_QUEUE_SIZE = 4
+DEFAULT_RAW_CHUNK_SIZE = 1000
+_QUEUE_POLL_SECONDS = 0.1
+_END_OF_STREAM = object()
+
+logger = Logger(__name__).get_logger()
+
+
+def _get_positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def get_pipeline_mode() -> Optional[str]:
+    """Return the configured pipeline mode, or None for sequential processing."""
+    mode = os.getenv("DFA_PIPELINE_MODE", "").strip().lower()
+    if mode in ("", "off", "false", "none", "sequential"):
+        return None
+    if mode in PIPELINE_MODES:
+        return mode
+
+    logger.warning("Unknown DFA_PIPELINE_MODE %s; using sequential processing", mode)
+    return None
+
+
+@dataclass
+class StageStats:
+    name: str
+    busy_seconds: float = 0.0
+    items: int = 0
+    rows: int = 0
+
+    def record(self, duration: float, rows: int = 0):
+        self.busy_seconds += duration
+        self.items += 1
+        self.rows += rows
+
+    def utilization(self, wall_seconds: float) -> float:
+        if wall_seconds <= 0:
+            return 0.0
+        return min(1.0, self.busy_seconds / wall_seconds)
+
+
+@dataclass
+class QueueStats:
+    name: str
+    maxsize: int
+    max_depth: int = 0
+    depth_total: int = 0
+    samples: int = 0
+
+    def sample(self, depth: int):
+        self.max_depth = max(self.max_depth, depth)
+        self.depth_total += depth
+        self.samples += 1
+
+    @property
+    def avg_depth(self) -> float:
+        return self.depth_total / self.samples if self.samples else 0.0
+
+
+@dataclass
+class PipelineReport:
+    mode: str
+    wall_seconds: float = 0.0
+    early_flushes: int = 0
+    stages: list[StageStats] = field(default_factory=list)
+    queues: list[QueueStats] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "early_flushes": self.early_flushes,
+            "stages": {
+                stage.name: {
+                    "busy_seconds": round(stage.busy_seconds, 6),
+                    "utilization": round(stage.utilization(self.wall_seconds), 4),
+                    "items": stage.items,
+                    "rows": stage.rows,
+                }
+                for stage in self.stages
+            },
+            "queues": {
+                queue_stats.name: {
+                    "maxsize": queue_stats.maxsize,
+                    "max_depth": queue_stats.max_depth,
+                    "avg_depth": round(queue_stats.avg_depth, 3),
+                }
+                for queue_stats in self.queues
+            },
+        }
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+class FilePipeline:
+    """Run a FileTransformer's extract, transform and load stages concurrently.
+
+    Extract produces raw event chunks, transform produces load-sized prepared
+    chunks, and a single loader consumes them in order on one ADW connection.
+    Stages are connected by bounded queues so a slow loader applies back
+    pressure instead of buffering the whole object. Snapshot registration runs
+    only after every chunk has loaded, matching ``FileTransformer.load_data``.
+    """
+
+    def __init__(
+        self,
+        transformer,
+        mode: str = PIPELINE_MODE_THREAD,
+        queue_size: Optional[int] = None,
+        raw_chunk_size: Optional[int] = None,
+    ):
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"Unsupported pipeline mode {mode}")
+        self.transformer = transformer
+        self.mode = mode
+        self.queue_size = queue_size or _get_positive_int_env("DFA_PIPELINE_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)
+        self.raw_chunk_size = raw_chunk_size or _get_positive_int_env(
+            "DFA_PIPELINE_RAW_CHUNK_SIZE", DEFAULT_RAW_CHUNK_SIZE
+        )
+        self.report = PipelineReport(
+            mode=mode,
+            stages=[StageStats("extract"), StageStats("transform"), StageStats("load")],
+            queues=[QueueStats("raw", self.queue_size), QueueStats("prepared", self.queue_size)],
+        )
+        self.memory_budget = MemoryBudget()
+        self._pending_rows: list[Any] = []
+
+    def _stage(self, name: str) -> StageStats:
+        return next(stage for stage in self.report.stages if stage.name == name)
+
+    def _queue_stats(self, name: str) -> QueueStats:
+        return next(queue_stats for queue_stats in self.report.queues if queue_stats.name == name)
+
+    # Stage bodies shared by both execution modes
+
+    def _next_raw_chunk(self, raw_chunks):
+        start = perf_counter()
+        raw_chunk = next(raw_chunks, _END_OF_STREAM)
+        if raw_chunk is not _END_OF_STREAM:
+            self._stage("extract").record(perf_counter() - start, len(raw_chunk))
+        return raw_chunk
+
+    def _transform_chunk(self, raw_chunk) -> list[list[Any]]:
+        start = perf_counter()
+        self._pending_rows.extend(self.transformer.transform_raw_events(raw_chunk))
+        ready_chunks = []
+        while self._pending_rows:
+            batch_size = self.transformer.get_load_chunk_size(self._pending_rows[:BATCH_SAMPLE_ROWS])
+            if len(self._pending_rows) < batch_size:
+                break
+            ready_chunks.append(self._pending_rows[:batch_size])
+            del self._pending_rows[:batch_size]
+        if self._pending_rows and self.memory_budget.limit_bytes is not None:
+            self.memory_budget.set("pending_rows", estimate_rows_bytes(self._pending_rows))
+            if self.memory_budget.is_near_limit():
+                # Hand the partial chunk to the loader now rather than growing it to a full batch.
+                self.report.early_flushes += 1
+                ready_chunks.append(self._pending_rows)
+                self._pending_rows = []
+        self.memory_budget.release("pending_rows")
+        for ready_chunk in ready_chunks:
+            self._track_in_flight(ready_chunk, 1)
+        self._stage("transform").record(perf_counter() - start, len(raw_chunk))
+        return ready_chunks
+
+    def _flush_transform(self) -> list[list[Any]]:
+        if not self._pending_rows:
+            return []
+        remaining, self._pending_rows = self._pending_rows, []
+        self._track_in_flight(remaining, 1)
+        return [remaining]
+
+    def _track_in_flight(self, prepared_chunk, sign):
+        if self.memory_budget.limit_bytes is not None:
+            self.memory_budget.add("prepared_chunks", sign * estimate_rows_bytes(prepared_chunk))
+
+    def _load_chunk(self, prepared_chunk, is_final_chunk=False):
+        start = perf_counter()
+        self.transformer.load_prepared_chunk(prepared_chunk, is_final_chunk=is_final_chunk)
+        self._track_in_flight(prepared_chunk, -1)
+        self._stage("load").record(perf_counter() - start, len(prepared_chunk))
+
+    # Thread mode
+
+    @staticmethod
+    def _put(work_queue: queue.Queue, queue_stats: QueueStats, item, cancelled: threading.Event):
+        while True:
+            if cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                work_queue.put(item, timeout=_QUEUE_POLL_SECONDS)
+                queue_stats.sample(work_queue.qsize())
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _get(work_queue: queue.Queue, cancelled: threading.Event):
+        while True:
+            if cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                return work_queue.get(timeout=_QUEUE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _run_threads(self):
+        raw_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        prepared_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        raw_stats = self._queue_stats("raw")
+        prepared_stats = self._queue_stats("prepared")
+        cancelled = threading.Event()
+        errors: list[BaseException] = []
+
+        def extract_worker():
+            try:
+                raw_chunks = iter(self.transformer.iter_raw_event_chunks(self.raw_chunk_size))
+                while True:
+                    raw_chunk = self._next_raw_chunk(raw_chunks)
+                    if raw_chunk is _END_OF_STREAM:
+                        break
+                    self._put(raw_queue, raw_stats, raw_chunk, cancelled)
+                self._put(raw_queue, raw_stats, _END_OF_STREAM, cancelled)
+            except PipelineCancelled:
+                pass
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+                cancelled.set()
+
+        def transform_worker():
+            try:
+                while True:
+                    raw_chunk = self._get(raw_queue, cancelled)
+                    if raw_chunk is _END_OF_STREAM:
+                        break
+                    for prepared_chunk in self._transform_chunk(raw_chunk):
+                        self._put(prepared_queue, prepared_stats, prepared_chunk, cancelled)
+                for prepared_chunk in self._flush_transform():
+                    self._put(prepared_queue, prepared_stats, prepared_chunk, cancelled)
+                self._put(prepared_queue, prepared_stats, _END_OF_STREAM, cancelled)
+            except PipelineCancelled:
+                pass
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+                cancelled.set()
+
+        workers = [
+            threading.Thread(target=extract_worker, name="dfa-pipeline-extract", daemon=True),
+            threading.Thread(target=transform_worker, name="dfa-pipeline-transform", daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            # Hold each chunk back until the next one arrives so the last one loads as the final chunk.
+            pending_chunk = None
+            while True:
+                prepared_chunk = self._get(prepared_queue, cancelled)
+                if prepared_chunk is _END_OF_STREAM:
+                    break
+                if pending_chunk is not None:
+                    self._load_chunk(pending_chunk)
+                pending_chunk = prepared_chunk
+            if pending_chunk is not None:
+                self._load_chunk(pending_chunk, is_final_chunk=True)
+        except PipelineCancelled:
+            pass
+        except BaseException as e:
+            errors.append(e)
+            cancelled.set()
+        finally:
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            raise errors[0]
+
+    # Asyncio mode
+
+    async def _run_async(self):
+        raw_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        prepared_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        raw_stats = self._queue_stats("raw")
+        prepared_stats = self._queue_stats("prepared")
+
+        async def put(work_queue: asyncio.Queue, queue_stats: QueueStats, item):
+            await work_queue.put(item)
+            queue_stats.sample(work_queue.qsize())
+
+        async def extract_stage():
+            # Building the generator runs none of its body; the download happens in the first pull.
+            raw_chunks = iter(self.transformer.iter_raw_event_chunks(self.raw_chunk_size))
+            while True:
+                raw_chunk = await asyncio.to_thread(self._next_raw_chunk, raw_chunks)
+                if raw_chunk is _END_OF_STREAM:
+                    break
+                await put(raw_queue, raw_stats, raw_chunk)
+            await put(raw_queue, raw_stats, _END_OF_STREAM)
+
+        async def transform_stage():
+            while True:
+                raw_chunk = await raw_queue.get()
+                if raw_chunk is _END_OF_STREAM:
+                    break
+                for prepared_chunk in await asyncio.to_thread(self._transform_chunk, raw_chunk):
+                    await put(prepared_queue, prepared_stats, prepared_chunk)
+            for prepared_chunk in self._flush_transform():
+                await put(prepared_queue, prepared_stats, prepared_chunk)
+            await put(prepared_queue, prepared_stats, _END_OF_STREAM)
+
+        async def load_stage():
+            pending_chunk = None
+            while True:
+                prepared_chunk = await prepared_queue.get()
+                if prepared_chunk is _END_OF_STREAM:
+                    break
+                if pending_chunk is not None:
+                    await asyncio.to_thread(self._load_chunk, pending_chunk)
+                pending_chunk = prepared_chunk
+            if pending_chunk is not None:
+                await asyncio.to_thread(self._load_chunk, pending_chunk, True)
+
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(extract_stage())
+            task_group.create_task(transform_stage())
+            task_group.create_task(load_stage())
+
+    def _run_asyncio(self):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(self._run_async())
+            return
+
+        # fdk invokes handlers from its own event loop, so the pipeline gets a
+        # private loop on a helper thread rather than nesting asyncio.run.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dfa-pipeline-loop") as executor:
+            executor.submit(asyncio.run, self._run_async()).result()
+
+    def run(self) -> PipelineReport:
+        start = perf_counter()
+        try:
+            if self.mode == PIPELINE_MODE_ASYNCIO:
+                try:
+                    self._run_asyncio()
+                except BaseExceptionGroup as group:
+                    raise group.exceptions[0] from group
+            else:
+                self._run_threads()
+            self.transformer.complete_pipelined_load()
+        except Exception:
+            AdwConnection.rollback_and_close()
+            raise
+        finally:
+            self.report.wall_seconds = perf_counter() - start
+            self._log_report()
+
+        return self.report
+
+    def _log_report(self):
+        report = self.report.as_dict()
+        logger.info(
+            "%s %s pipeline(%s) wall: %.3fs stages: %s queues: %s",
+            self.transformer.transformer_name,
+            self.transformer.get_event_object_type(),
+            report["mode"],
+            self.report.wall_seconds,
+            ", ".join(
+                f"{name} busy={stage['busy_seconds']:.3f}s util={stage['utilization']:.0%} rows={stage['rows']}"
+                for name, stage in report["stages"].items()
+            ),
+            ", ".join(
+                f"{name} max={queue_report['max_depth']}/{queue_report['maxsize']} avg={queue_report['avg_depth']}"
+                for name, queue_report in report["queues"].items()
+            ),
+        )
@@ -2,9 +2,10 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 from common.ocihelpers.stream import DataEnablementStream
+from common.tracing.tracing import TRACER
 from dfa.adw.connection import AdwConnection
 from dfa.adw.query_builders.base_query_builder import get_query_builder
-from dfa.etl.abstract_transformer import AbstractTransformer
+from dfa.etl.abstract_transformer import UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE, AbstractTransformer
 
 
 class StreamTransformer(AbstractTransformer):
@@ -32,6 +33,19 @@ class StreamTransformer(AbstractTransformer):
     def extract_data(self):
         pass
 
+    def consume_stream(self, max_batches=None):
+        """Pull batches from every stream partition and transform and load each; returns the rows prepared."""
+        row_count = 0
+
+        def process_batch(sorted_messages):
+            nonlocal row_count
+            self.transform_messages(sorted_messages)
+            row_count += len(self.get_prepared_events())
+            self.load_data()
+
+        self._stream_manager.consume(process_batch, max_batches)
+        return row_count
+
     @staticmethod
     def _get_message_headers(message):
         if isinstance(message, dict):
@@ -54,19 +68,24 @@ class StreamTransformer(AbstractTransformer):
                 self._operation_type = operation
                 transformer = self.transformer_factory()
                 event_type_ops_messages = self._get_raw_events()[event_type][operation]
-
-                for message in event_type_ops_messages:
-                    headers = self._get_message_headers(message)
-                    event_type_version = headers.get("eventTypeVersion")
-                    if not self.is_supported_event_type_version(event_type, event_type_version):
-                        self.logger.warning(
-                            "Skipping unsupported %s eventTypeVersion %s",
-                            event_type,
-                            event_type_version,
-                        )
-                        continue
-                    transformer.set_event_type_version(event_type_version)
-                    self._append_prepared_event(transformer.transform_stream_message(message))
+                prepared_before = len(self._prepared_events)
+
+                with TRACER.span("transformer.entity", entity=event_type, operation=operation) as span:
+                    for message in event_type_ops_messages:
+                        headers = self._get_message_headers(message)
+                        event_type_version = headers.get("eventTypeVersion")
+                        if not self.is_supported_event_type_version(event_type, event_type_version):
+                            self.logger.warning(
+                                UNSUPPORTED_EVENT_TYPE_VERSION_LOG_MESSAGE,
+                                event_type,
+                                event_type_version,
+                            )
+                            continue
+                        transformer.set_event_type_version(event_type_version)
+                        self._append_prepared_event(transformer.transform_stream_message(message))
+                    prepared_rows = len(self._prepared_events) - prepared_before
+                    self._record_transform_metrics(len(event_type_ops_messages), prepared_rows)
+                    span.set_attributes(raw_events=len(event_type_ops_messages), prepared_events=prepared_rows)
 
         self.logger.info(
             "%s transformed %d %s %s events",
@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.access_bundle import AccessBundleStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class AccessBundleEventTransformer(BaseEventTransformer):
@@ -157,7 +158,7 @@ class AccessBundleEventTransformer(BaseEventTransformer):
             access_bundle_list.append(base_access_bundle)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return access_bundle_list
 
@@ -172,13 +173,16 @@ class AccessBundleEventTransformer(BaseEventTransformer):
         return transformed_access_bundle
 
 
+@register_transformer("ACCESS_BUNDLE", "CREATE")
 class AccessBundleCreateEventTransformer(AccessBundleEventTransformer):
     pass
 
 
+@register_transformer("ACCESS_BUNDLE", "UPDATE")
 class AccessBundleUpdateEventTransformer(AccessBundleEventTransformer):
     pass
 
 
+@register_transformer("ACCESS_BUNDLE", "DELETE")
 class AccessBundleDeleteEventTransformer(AccessBundleEventTransformer):
     pass
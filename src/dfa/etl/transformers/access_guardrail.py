@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.access_guardrail import AccessGuardrailStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class AccessGuardrailEventTransformer(BaseEventTransformer):
@@ -109,7 +110,7 @@ class AccessGuardrailEventTransformer(BaseEventTransformer):
             access_guardrail_list.append(base_access_guardrail)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return access_guardrail_list
 
@@ -124,13 +125,16 @@ class AccessGuardrailEventTransformer(BaseEventTransformer):
         return transformed_access_guardrail
 
 
+@register_transformer("ACCESS_GUARDRAIL", "CREATE")
 class AccessGuardrailCreateEventTransformer(AccessGuardrailEventTransformer):
     pass
 
 
+@register_transformer("ACCESS_GUARDRAIL", "UPDATE")
 class AccessGuardrailUpdateEventTransformer(AccessGuardrailEventTransformer):
     pass
 
 
+@register_transformer("ACCESS_GUARDRAIL", "DELETE")
 class AccessGuardrailDeleteEventTransformer(AccessGuardrailEventTransformer):
     pass
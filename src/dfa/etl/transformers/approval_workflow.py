@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.approval_workflow import ApprovalWorkflowStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class ApprovalWorkflowEventTransformer(BaseEventTransformer):
@@ -68,7 +69,7 @@ class ApprovalWorkflowEventTransformer(BaseEventTransformer):
             approval_workflow["operation_type"] = self.get_operation_type()
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         aw_list.append(approval_workflow)
         return aw_list
@@ -84,13 +85,16 @@ class ApprovalWorkflowEventTransformer(BaseEventTransformer):
         return transformed_aw
 
 
+@register_transformer("APPROVAL_WORKFLOW", "CREATE")
 class ApprovalWorkflowCreateEventTransformer(ApprovalWorkflowEventTransformer):
     pass
 
 
+@register_transformer("APPROVAL_WORKFLOW", "UPDATE")
 class ApprovalWorkflowUpdateEventTransformer(ApprovalWorkflowEventTransformer):
     pass
 
 
+@register_transformer("APPROVAL_WORKFLOW", "DELETE")
 class ApprovalWorkflowDeleteEventTransformer(ApprovalWorkflowEventTransformer):
     pass
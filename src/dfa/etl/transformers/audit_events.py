@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.audit_events import AuditEventsTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class AuditEventsEventTransformer(BaseEventTransformer):
@@ -107,11 +108,12 @@ class AuditEventsEventTransformer(BaseEventTransformer):
             audit_events_list.append(base_audit_event)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return audit_events_list
 
 
+@register_transformer("AUDIT_EVENTS", "CREATE")
 class AuditEventsCreateEventTransformer(AuditEventsEventTransformer):
     def transform_stream_message(self, message):
         transformed_audit_events = []
@@ -3,8 +3,23 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from common.logger.logger import Logger
+from common.logger.logger import Logger, limit_repeated_messages
+
+MISSING_KEY_LOG_MESSAGE = "Cannot process event due to KeyError - %s is missing from event data"
+limit_repeated_messages(MISSING_KEY_LOG_MESSAGE)
+EVENT_TIME_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=EVENT_TIME_CACHE_SIZE)
+def parse_event_time(event_time: str) -> datetime:
+    """Parse an ISO-8601 header ``eventTime`` into a timezone-aware UTC ``datetime``.
+
+    Every message and raw event of a batch carries one of a handful of header
+    timestamps, so results are memoized and each distinct value is parsed once.
+    """
+    return datetime.fromisoformat(event_time).astimezone(timezone.utc)
 
 
 class BaseEventTransformer(ABC):
@@ -30,6 +45,9 @@ class BaseEventTransformer(ABC):
     def get_event_object_type(self):
         return self.__event_object_type
 
+    def _log_missing_key(self, error: KeyError):
+        self.logger.error(MISSING_KEY_LOG_MESSAGE, error)
+
     def get_operation_type(self):
         return self.__operation_type
 
@@ -55,8 +73,7 @@ class BaseEventTransformer(ABC):
         return self._service_instance_id
 
     def set_event_timestamp_for_message(self, event_timestamp):
-        date_object = datetime.fromisoformat(event_timestamp).astimezone(timezone.utc)
-        self._event_timestamp = date_object.strftime("%d-%b-%y %I:%M:%S.%f %p")
+        self._event_timestamp = parse_event_time(event_timestamp)
 
     def _get_event_timestamp(self):
         return self._event_timestamp
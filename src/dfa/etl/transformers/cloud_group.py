@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.cloud_group import CloudGroupStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class CloudGroupEventTransformer(BaseEventTransformer):
@@ -86,7 +87,7 @@ class CloudGroupEventTransformer(BaseEventTransformer):
                 group_list.append(base_group)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return group_list
 
@@ -103,13 +104,16 @@ class CloudGroupEventTransformer(BaseEventTransformer):
         return transformed_groups
 
 
+@register_transformer("CLOUD_GROUP", "CREATE")
 class CloudGroupCreateEventTransformer(CloudGroupEventTransformer):
     pass
 
 
+@register_transformer("CLOUD_GROUP", "UPDATE")
 class CloudGroupUpdateEventTransformer(CloudGroupEventTransformer):
     pass
 
 
+@register_transformer("CLOUD_GROUP", "DELETE")
 class CloudGroupDeleteEventTransformer(CloudGroupEventTransformer):
     pass
@@ -7,6 +7,7 @@ import json
 from dfa.adw.tables.cloud_policy import CloudPolicyStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
 from dfa.etl.transformers.policy_utils import parse_policy_statement
+from dfa.etl.transformers.registry import register_transformer
 
 
 class CloudPolicyEventTransformer(BaseEventTransformer):
@@ -63,9 +64,6 @@ class CloudPolicyEventTransformer(BaseEventTransformer):
             if "verb" in raw_event:
                 base_policy_statement["verb"] = raw_event["verb"]
 
-            if "customAttributes" in raw_event:
-                base_policy_statement["attributes"] = json.dumps(raw_event["customAttributes"])
-
             base_policy_statement["event_object_type"] = self.get_event_object_type()
             base_policy_statement["operation_type"] = self.get_operation_type()
 
@@ -79,19 +77,14 @@ class CloudPolicyEventTransformer(BaseEventTransformer):
 
             # Compute permissiveness for the base statement once
             # It may be duplicated per resource/subject pair but same score
-            temp_attrs = base_policy_statement.get("attributes")
             temp_statement = base_policy_statement.get("statement", "")
             score = 0
             results = parse_policy_statement(temp_statement)
             score = results.get("permissive_score", 0)
 
-            # Embed score into attributes JSON
-            try:
-                attrs_obj = json.loads(temp_attrs) if temp_attrs else {}
-                if not isinstance(attrs_obj, dict):
-                    attrs_obj = {}
-            except Exception:
-                attrs_obj = {}
+            # Embed score into the custom attributes and serialize them once; subject rows share the string
+            custom_attributes = raw_event.get("customAttributes")
+            attrs_obj = dict(custom_attributes) if isinstance(custom_attributes, dict) else {}
             attrs_obj["permissive_score"] = int(score)
             attrs_obj["reasons"] = results.get("reasons", [])
             base_policy_statement["attributes"] = json.dumps(attrs_obj)
@@ -106,7 +99,7 @@ class CloudPolicyEventTransformer(BaseEventTransformer):
             else:
                 policies.append(base_policy_statement)
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return policies
 
@@ -123,13 +116,16 @@ class CloudPolicyEventTransformer(BaseEventTransformer):
         return transformed_policies
 
 
+@register_transformer("CLOUD_POLICY", "CREATE")
 class CloudPolicyCreateEventTransformer(CloudPolicyEventTransformer):
     pass
 
 
+@register_transformer("CLOUD_POLICY", "UPDATE")
 class CloudPolicyUpdateEventTransformer(CloudPolicyEventTransformer):
     pass
 
 
+@register_transformer("CLOUD_POLICY", "DELETE")
 class CloudPolicyDeleteEventTransformer(CloudPolicyEventTransformer):
     pass
@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.global_identity_collection import GlobalIdentityCollectionStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class GlobalIdentityCollectionEventTransformer(BaseEventTransformer):
@@ -148,7 +149,7 @@ class GlobalIdentityCollectionEventTransformer(BaseEventTransformer):
                         gic_list.append(gic_copy)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return gic_list
 
@@ -163,13 +164,16 @@ class GlobalIdentityCollectionEventTransformer(BaseEventTransformer):
         return transformed_gic
 
 
+@register_transformer("GLOBAL_IDENTITY_COLLECTION", "CREATE")
 class GlobalIdentityCollectionCreateEventTransformer(GlobalIdentityCollectionEventTransformer):
     pass
 
 
+@register_transformer("GLOBAL_IDENTITY_COLLECTION", "UPDATE")
 class GlobalIdentityCollectionUpdateEventTransformer(GlobalIdentityCollectionEventTransformer):
     pass
 
 
+@register_transformer("GLOBAL_IDENTITY_COLLECTION", "DELETE")
 class GlobalIdentityCollectionDeleteEventTransformer(GlobalIdentityCollectionEventTransformer):
     pass
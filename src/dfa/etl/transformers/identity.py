@@ -1,10 +1,10 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
-import json
-
 from dfa.adw.tables.identity import IdentityStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.json_fragments import EMPTY_JSON_OBJECT, JsonFragmentCache
+from dfa.etl.transformers.registry import register_transformer
 
 
 class IdentityEventTransformer(BaseEventTransformer):
@@ -12,6 +12,7 @@ class IdentityEventTransformer(BaseEventTransformer):
     def transform_raw_event(self, raw_event):
         identity = IdentityStateTable().get_default_row()
         identities_list = []
+        fragments = JsonFragmentCache()
 
         try:
 
@@ -48,7 +49,7 @@ class IdentityEventTransformer(BaseEventTransformer):
                 if "agRisk" in raw_event["globalIdentity"]["identity"]:
                     identity["risk"] = raw_event["globalIdentity"]["identity"]["agRisk"]["value"]
                     if "customAttributes" in raw_event["globalIdentity"]["identity"]["agRisk"]:
-                        identity["ag_risk_attributes"] = json.dumps(
+                        identity["ag_risk_attributes"] = fragments.dumps(
                             raw_event["globalIdentity"]["identity"]["agRisk"]["customAttributes"]
                         )
 
@@ -64,7 +65,7 @@ class IdentityEventTransformer(BaseEventTransformer):
                     if "givenName" in raw_event["globalIdentity"]["identity"]["name"]:
                         identity["first_name"] = raw_event["globalIdentity"]["identity"]["name"]["givenName"]
 
-                identity["identity_attributes"] = json.dumps(raw_event["globalIdentity"]["identity"])
+                identity["identity_attributes"] = fragments.dumps(raw_event["globalIdentity"]["identity"])
 
             if "targetIdentities" in raw_event["globalIdentity"]:
                 identity["ti_operation_type"] = self.get_operation_type()
@@ -82,15 +83,15 @@ class IdentityEventTransformer(BaseEventTransformer):
                                 target_identity["ti_id"].startswith("targetId.account")
                             ):
                                 # retain identity attributes for target identity, for target account, set to empty
-                                target_identity["identity_attributes"] = json.dumps({})
+                                target_identity["identity_attributes"] = EMPTY_JSON_OBJECT
                         if "targetId" in ti:
                             target_identity["ti_target_id"] = ti["targetId"]
                         if "identity" in ti:
-                            target_identity["ti_attributes"] = json.dumps(ti["identity"])
+                            target_identity["ti_attributes"] = fragments.dumps(ti["identity"])
                             if "status" in ti["identity"]:
                                 target_identity["ti_identity_status"] = ti["identity"]["status"]
                             if "name" in ti["identity"]:
-                                target_identity["ti_identity_name"] = json.dumps(ti["identity"]["name"])
+                                target_identity["ti_identity_name"] = fragments.dumps(ti["identity"]["name"])
                         identities_list.append(target_identity)
                 else:
                     identities_list.append(identity)
@@ -100,7 +101,7 @@ class IdentityEventTransformer(BaseEventTransformer):
             return identities_list
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return identities_list
 
@@ -115,13 +116,16 @@ class IdentityEventTransformer(BaseEventTransformer):
         return transformed_identities
 
 
+@register_transformer("IDENTITY", "CREATE")
 class IdentityCreateEventTransformer(IdentityEventTransformer):
     pass
 
 
+@register_transformer("IDENTITY", "UPDATE")
 class IdentityUpdateEventTransformer(IdentityEventTransformer):
     pass
 
 
+@register_transformer("IDENTITY", "DELETE")
 class IdentityDeleteEventTransformer(IdentityEventTransformer):
     pass
@@ -0,0 +1,40 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import json
+from typing import Any
+
+EMPTY_JSON_OBJECT = json.dumps({})
+EMPTY_JSON_ARRAY = json.dumps([])
+
+
+class JsonFragmentCache:
+    """Serialized JSON for the nested objects of one raw event, produced once per object.
+
+    Fan-out transformers write the same nested object into many child rows.
+    ``dumps`` returns the string serialized the first time it saw that object,
+    so every child row shares one immutable string instead of its own copy, and
+    the bind layer sees identical values it can size once. Empty containers map
+    to module-level constants shared across events.
+
+    Entries are keyed by object identity and hold a reference to the object, so
+    build one cache per raw event and let it go with the event.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self):
+        self._fragments: dict[int, tuple[Any, str]] = {}
+
+    def dumps(self, value: Any) -> str:
+        cached = self._fragments.get(id(value))
+        if cached is not None and cached[0] is value:
+            return cached[1]
+        if isinstance(value, dict) and not value:
+            fragment = EMPTY_JSON_OBJECT
+        elif isinstance(value, list) and not value:
+            fragment = EMPTY_JSON_ARRAY
+        else:
+            fragment = json.dumps(value)
+        self._fragments[id(value)] = (value, fragment)
+        return fragment
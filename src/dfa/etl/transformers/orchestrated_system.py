@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.orchestrated_system import OrchestratedSystemStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class OrchestratedSystemEventTransformer(BaseEventTransformer):
@@ -70,7 +71,7 @@ class OrchestratedSystemEventTransformer(BaseEventTransformer):
             orchestrated_system_list.append(orchestrated_system)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return orchestrated_system_list
 
@@ -87,13 +88,16 @@ class OrchestratedSystemEventTransformer(BaseEventTransformer):
         return transformed_orchestrated_systems
 
 
+@register_transformer("ORCHESTRATED_SYSTEM", "CREATE")
 class OrchestratedSystemCreateEventTransformer(OrchestratedSystemEventTransformer):
     pass
 
 
+@register_transformer("ORCHESTRATED_SYSTEM", "UPDATE")
 class OrchestratedSystemUpdateEventTransformer(OrchestratedSystemEventTransformer):
     pass
 
 
+@register_transformer("ORCHESTRATED_SYSTEM", "DELETE")
 class OrchestratedSystemDeleteEventTransformer(OrchestratedSystemEventTransformer):
     pass
@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.ownership_collection import OwnershipCollectionStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class OwnershipCollectionEventTransformer(BaseEventTransformer):
@@ -59,7 +60,7 @@ class OwnershipCollectionEventTransformer(BaseEventTransformer):
             ownership_collection_list.append(ownership_collection)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return ownership_collection_list
 
@@ -76,13 +77,16 @@ class OwnershipCollectionEventTransformer(BaseEventTransformer):
         return transformed_ownership_collections
 
 
+@register_transformer("OWNERSHIP_COLLECTION", "CREATE")
 class OwnershipCollectionCreateEventTransformer(OwnershipCollectionEventTransformer):
     pass
 
 
+@register_transformer("OWNERSHIP_COLLECTION", "UPDATE")
 class OwnershipCollectionUpdateEventTransformer(OwnershipCollectionEventTransformer):
     pass
 
 
+@register_transformer("OWNERSHIP_COLLECTION", "DELETE")
 class OwnershipCollectionDeleteEventTransformer(OwnershipCollectionEventTransformer):
     pass
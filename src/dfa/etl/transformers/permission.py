@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.permission import PermissionStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class PermissionEventTransformer(BaseEventTransformer):
@@ -72,7 +73,7 @@ class PermissionEventTransformer(BaseEventTransformer):
             permission_list.append(base_permission)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return permission_list
 
@@ -89,13 +90,16 @@ class PermissionEventTransformer(BaseEventTransformer):
         return transformed_permission
 
 
+@register_transformer("PERMISSION", "CREATE")
 class PermissionCreateEventTransformer(PermissionEventTransformer):
     pass
 
 
+@register_transformer("PERMISSION", "UPDATE")
 class PermissionUpdateEventTransformer(PermissionEventTransformer):
     pass
 
 
+@register_transformer("PERMISSION", "DELETE")
 class PermissionDeleteEventTransformer(PermissionEventTransformer):
     pass
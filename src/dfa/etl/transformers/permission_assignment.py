@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.permission_assignment import PermissionAssignmentStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class PermissionAssignmentEventTransformer(BaseEventTransformer):
@@ -201,13 +202,16 @@ class PermissionAssignmentEventTransformer(BaseEventTransformer):
         return transformed_pa
 
 
+@register_transformer("PERMISSION_ASSIGNMENT", "CREATE")
 class PermissionAssignmentCreateEventTransformer(PermissionAssignmentEventTransformer):
     pass
 
 
+@register_transformer("PERMISSION_ASSIGNMENT", "UPDATE")
 class PermissionAssignmentUpdateEventTransformer(PermissionAssignmentEventTransformer):
     pass
 
 
+@register_transformer("PERMISSION_ASSIGNMENT", "DELETE")
 class PermissionAssignmentDeleteEventTransformer(PermissionAssignmentEventTransformer):
     pass
@@ -1,16 +1,17 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
-import json
-
 from dfa.adw.tables.policy import PolicyStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.json_fragments import JsonFragmentCache
+from dfa.etl.transformers.registry import register_transformer
 
 
 class PolicyEventTransformer(BaseEventTransformer):
     def transform_raw_event(self, raw_event):
         base_policy = PolicyStateTable().get_default_row()
         policy_list = []
+        fragments = JsonFragmentCache()
 
         try:
             if self._get_tenancy_id():
@@ -106,13 +107,13 @@ class PolicyEventTransformer(BaseEventTransformer):
                     base_policy["ag_risk"] = raw_event["agRisk"]["value"]
 
             if "managedByIds" in raw_event:
-                base_policy["managed_by_ids"] = json.dumps(raw_event["managedByIds"])
+                base_policy["managed_by_ids"] = fragments.dumps(raw_event["managedByIds"])
 
             if "ownerUIDs" in raw_event:
-                base_policy["owner_uids"] = json.dumps(raw_event["ownerUIDs"])
+                base_policy["owner_uids"] = fragments.dumps(raw_event["ownerUIDs"])
 
             if "customAttributes" in raw_event:
-                base_policy["attributes"] = json.dumps(raw_event["customAttributes"])
+                base_policy["attributes"] = fragments.dumps(raw_event["customAttributes"])
 
             base_policy["event_object_type"] = self.get_event_object_type()
             base_policy["operation_type"] = self.get_operation_type()
@@ -154,7 +155,7 @@ class PolicyEventTransformer(BaseEventTransformer):
                 policy_list.append(base_policy)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return policy_list
 
@@ -169,13 +170,16 @@ class PolicyEventTransformer(BaseEventTransformer):
         return transformed_policy
 
 
+@register_transformer("POLICY", "CREATE")
 class PolicyCreateEventTransformer(PolicyEventTransformer):
     pass
 
 
+@register_transformer("POLICY", "UPDATE")
 class PolicyUpdateEventTransformer(PolicyEventTransformer):
     pass
 
 
+@register_transformer("POLICY", "DELETE")
 class PolicyDeleteEventTransformer(PolicyEventTransformer):
     pass
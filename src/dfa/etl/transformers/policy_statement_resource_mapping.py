@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.policy_statement_resource_mapping import PolicyStatementResourceMappingStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class PolicyStatementResourceMappingEventTransformer(BaseEventTransformer):
@@ -61,7 +62,7 @@ class PolicyStatementResourceMappingEventTransformer(BaseEventTransformer):
                 psrm_list.append(base_policy_statement_resource_mapping)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return psrm_list
 
@@ -78,13 +79,16 @@ class PolicyStatementResourceMappingEventTransformer(BaseEventTransformer):
         return transformed_psrm_events
 
 
+@register_transformer("POLICY_STATEMENT_RESOURCE_MAPPING", "CREATE")
 class PolicyStatementResourceMappingCreateEventTransformer(PolicyStatementResourceMappingEventTransformer):
     pass
 
 
+@register_transformer("POLICY_STATEMENT_RESOURCE_MAPPING", "UPDATE")
 class PolicyStatementResourceMappingUpdateEventTransformer(PolicyStatementResourceMappingEventTransformer):
     pass
 
 
+@register_transformer("POLICY_STATEMENT_RESOURCE_MAPPING", "DELETE")
 class PolicyStatementResourceMappingDeleteEventTransformer(PolicyStatementResourceMappingEventTransformer):
     pass
@@ -0,0 +1,8 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+from dfa.registry import LazyClassRegistry
+
+# Keys are (event_object_type, operation_type).
+TRANSFORMER_REGISTRY = LazyClassRegistry("dfa.etl.transformers")
+register_transformer = TRANSFORMER_REGISTRY.register
@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.resource import ResourceStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class ResourceEventTransformer(BaseEventTransformer):
@@ -52,7 +53,7 @@ class ResourceEventTransformer(BaseEventTransformer):
             resource_list.append(resource)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return resource_list
 
@@ -69,13 +70,16 @@ class ResourceEventTransformer(BaseEventTransformer):
         return transformed_resources
 
 
+@register_transformer("RESOURCE", "CREATE")
 class ResourceCreateEventTransformer(ResourceEventTransformer):
     pass
 
 
+@register_transformer("RESOURCE", "UPDATE")
 class ResourceUpdateEventTransformer(ResourceEventTransformer):
     pass
 
 
+@register_transformer("RESOURCE", "DELETE")
 class ResourceDeleteEventTransformer(ResourceEventTransformer):
     pass
@@ -5,6 +5,7 @@ import json
 
 from dfa.adw.tables.role import RoleStateTable
 from dfa.etl.transformers.base_event_transformer import BaseEventTransformer
+from dfa.etl.transformers.registry import register_transformer
 
 
 class RoleEventTransformer(BaseEventTransformer):
@@ -102,7 +103,7 @@ class RoleEventTransformer(BaseEventTransformer):
                 role_list.append(role)
 
         except KeyError as e:
-            self.logger.error("Cannot process event due to KeyError - %s is missing from event data", e)
+            self._log_missing_key(e)
 
         return role_list
 
@@ -117,13 +118,16 @@ class RoleEventTransformer(BaseEventTransformer):
         return transformed_role
 
 
+@register_transformer("ROLE", "CREATE")
 class RoleCreateEventTransformer(RoleEventTransformer):
     pass
 
 
+@register_transformer("ROLE", "UPDATE")
 class RoleUpdateEventTransformer(RoleEventTransformer):
     pass
 
 
+@register_transformer("ROLE", "DELETE")
 class RoleDeleteEventTransformer(RoleEventTransformer):
     pass
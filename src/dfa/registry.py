@@ -0,0 +1,72 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import importlib
+import threading
+from typing import Callable, Hashable, Optional
+
+# Event object type -> module name, shared by the transformer and query builder packages.
+ENTITY_MODULES = {
+    "ACCESS_BUNDLE": "access_bundle",
+    "ACCESS_GUARDRAIL": "access_guardrail",
+    "APPROVAL_WORKFLOW": "approval_workflow",
+    "AUDIT_EVENTS": "audit_events",
+    "CLOUD_GROUP": "cloud_group",
+    "CLOUD_POLICY": "cloud_policy",
+    "GLOBAL_IDENTITY_COLLECTION": "global_identity_collection",
+    "IDENTITY": "identity",
+    "ORCHESTRATED_SYSTEM": "orchestrated_system",
+    "OWNERSHIP_COLLECTION": "ownership_collection",
+    "PERMISSION": "permission",
+    "PERMISSION_ASSIGNMENT": "permission_assignment",
+    "POLICY": "policy",
+    "POLICY_STATEMENT_RESOURCE_MAPPING": "policy_statement_resource_mapping",
+    "RESOURCE": "resource",
+    "ROLE": "role",
+}
+
+
+class LazyClassRegistry:
+    """Map ``(event_object_type, *qualifiers)`` keys to classes registered with a decorator.
+
+    An entity's module is imported through the normal import system the first
+    time one of its keys is resolved, so only the entities a process actually
+    sees are loaded and every lookup returns the class object in ``sys.modules``.
+    """
+
+    def __init__(self, package: str, entity_modules: dict[str, str] = ENTITY_MODULES):
+        self.package = package
+        self.entity_modules = entity_modules
+        self._classes: dict[tuple, type] = {}
+        self._lock = threading.Lock()
+
+    def register(self, event_object_type: str, *qualifiers: Hashable) -> Callable[[type], type]:
+        key = (event_object_type.upper(), *qualifiers)
+
+        def decorator(cls: type) -> type:
+            with self._lock:
+                registered = self._classes.get(key)
+                if registered is not None and registered is not cls:
+                    raise ValueError(f"{key} is already registered to {registered.__qualname__}")
+                self._classes[key] = cls
+            return cls
+
+        return decorator
+
+    def import_entity(self, event_object_type: str) -> bool:
+        module_name = self.entity_modules.get(event_object_type.upper())
+        if module_name is None:
+            return False
+        importlib.import_module(f"{self.package}.{module_name}")
+        return True
+
+    def resolve(self, event_object_type: str, *qualifiers: Hashable) -> Optional[type]:
+        key = (event_object_type.upper(), *qualifiers)
+        registered = self._classes.get(key)
+        if registered is None and self.import_entity(event_object_type):
+            registered = self._classes.get(key)
+        return registered
+
+    def registered_keys(self) -> list[tuple]:
+        with self._lock:
+            return sorted(self._classes)
@@ -0,0 +1,288 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import multiprocessing
+import os
+import queue
+import signal
+from dataclasses import asdict, dataclass, replace
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Optional
+
+from common.logger.logger import Logger, flush_logs
+from common.metrics.metrics import METRICS
+from common.tracing.sql_profiler import SQL_PROFILER
+from common.tracing.tracing import TRACER
+from dfa.adw.connection import AdwConnection
+from dfa.worker.sources import WorkItem, WorkSource
+from dfa.worker.tasks import run_work_item
+
+DEFAULT_POLL_INTERVAL_SECONDS = 2.0
+DEFAULT_STATS_INTERVAL_SECONDS = 60.0
+_RESULT_POLL_SECONDS = 0.2
+_STOP_PUT_TIMEOUT_SECONDS = 5.0
+_STOP_WORKER = None
+
+logger = Logger(__name__).get_logger()
+
+
+def _get_positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+@dataclass
+class WorkerStats:
+    worker_id: int
+    pid: int
+    items: int = 0
+    failures: int = 0
+    rows: int = 0
+    busy_seconds: float = 0.0
+    started_at: float = 0.0
+
+    def as_dict(self, now: Optional[float] = None) -> dict[str, Any]:
+        uptime_seconds = max((now or monotonic()) - self.started_at, 0.0)
+        return {
+            **asdict(self),
+            "uptime_seconds": round(uptime_seconds, 3),
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(self.items / uptime_seconds, 3) if uptime_seconds else 0.0,
+            "rows_per_second": round(self.rows / uptime_seconds, 3) if uptime_seconds else 0.0,
+            "utilization": round(min(1.0, self.busy_seconds / uptime_seconds), 4) if uptime_seconds else 0.0,
+        }
+
+
+def _worker_main(
+    worker_id: int,
+    task_queue,
+    result_queue,
+    run_item: Callable[[str, Any], int] = run_work_item,
+    started_queue=None,
+):
+    """Process work items until the parent sends a stop marker.
+
+    The ADW connection is opened on first use and kept warm across items. After a
+    failed item it is rolled back and closed so the next item reconnects. Each
+    item is announced on ``started_queue`` before it runs, so the parent knows
+    which item to fail if this process dies.
+    """
+    # The parent owns shutdown; a Ctrl-C or SIGTERM must not kill an item mid-load.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    stats = WorkerStats(worker_id=worker_id, pid=os.getpid(), started_at=monotonic())
+    try:
+        while True:
+            item = task_queue.get()
+            if item is _STOP_WORKER:
+                return
+            if started_queue is not None:
+                # SimpleQueue.put writes to the pipe before returning, so the parent sees it even after a SIGKILL.
+                started_queue.put((worker_id, item.item_id))
+
+            started = perf_counter()
+            error = None
+            try:
+                with (
+                    METRICS.invocation(item.kind),
+                    TRACER.trace("invocation", function=item.kind),
+                    SQL_PROFILER.invocation(item.kind),
+                ):
+                    stats.rows += run_item(item.kind, item.body) or 0
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                stats.failures += 1
+                AdwConnection.rollback_and_close()
+            finally:
+                flush_logs()
+            stats.items += 1
+            stats.busy_seconds += perf_counter() - started
+            # Queue.put pickles on a feeder thread, so hand over a snapshot of the counters.
+            result_queue.put((item, error, replace(stats)))
+    finally:
+        AdwConnection.close()
+
+
+class WorkerPool:
+    """Run file, stream and audit work items across worker processes outside OCI Functions.
+
+    The parent process claims items from a ``WorkSource`` and feeds a bounded task
+    queue; each worker process keeps its own warm ADW connection. SIGINT/SIGTERM
+    (or ``request_drain``) stops claiming new work, lets in-flight items finish,
+    and then stops the workers. A worker process that dies (OOM kill, segfault)
+    has its current item failed and is replaced.
+    """
+
+    def __init__(
+        self,
+        source: WorkSource,
+        processes: Optional[int] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        stats_interval: float = DEFAULT_STATS_INTERVAL_SECONDS,
+        exit_when_idle: bool = False,
+        start_method: Optional[str] = None,
+        run_item: Callable[[str, Any], int] = run_work_item,
+    ):
+        self.source = source
+        self.processes = processes or _get_positive_int_env("DFA_WORKER_PROCESSES", os.cpu_count() or 1)
+        self.poll_interval = poll_interval
+        self.stats_interval = stats_interval
+        self.exit_when_idle = exit_when_idle
+        self.run_item = run_item
+        self._context = multiprocessing.get_context(start_method or os.getenv("DFA_WORKER_START_METHOD", "spawn"))
+        self._draining = False
+        self._in_flight: dict[str, WorkItem] = {}
+        self._running: dict[int, str] = {}
+        self.worker_stats: dict[int, WorkerStats] = {}
+
+    def request_drain(self, *_):
+        if not self._draining:
+            logger.info("Worker pool draining; %d item(s) in flight", len(self._in_flight))
+        self._draining = True
+
+    def _install_signal_handlers(self):
+        previous_handlers = {}
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                previous_handlers[signal_number] = signal.signal(signal_number, self.request_drain)
+            except ValueError:
+                # Not the main thread; callers drain through request_drain().
+                pass
+        return previous_handlers
+
+    def _fill_task_queue(self, task_queue) -> int:
+        capacity = self.processes * 2 - len(self._in_flight)
+        if capacity <= 0 or self._draining:
+            return 0
+
+        items = self.source.claim(capacity)
+        for item in items:
+            self._in_flight[item.item_id] = item
+            task_queue.put(item)
+        return len(items)
+
+    def _collect_started(self, started_queue):
+        while not started_queue.empty():
+            worker_id, item_id = started_queue.get()
+            self._running[worker_id] = item_id
+
+    def _handle_result(self, result):
+        item, error, stats = result
+        self._in_flight.pop(item.item_id, None)
+        if self._running.get(stats.worker_id) == item.item_id:
+            del self._running[stats.worker_id]
+        self.worker_stats[stats.worker_id] = stats
+        if error is None:
+            self.source.complete(item)
+        else:
+            self.source.fail(item, error)
+
+    def _collect_results(self, result_queue, timeout: float) -> int:
+        handled = 0
+        try:
+            self._handle_result(result_queue.get(timeout=timeout))
+            handled += 1
+            while True:
+                self._handle_result(result_queue.get_nowait())
+                handled += 1
+        except queue.Empty:
+            pass
+        return handled
+
+    def _start_worker(self, worker_id: int, task_queue, result_queue, started_queue):
+        worker = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, task_queue, result_queue, self.run_item, started_queue),
+            name=f"dfa-worker-{worker_id}",
+        )
+        worker.start()
+        return worker
+
+    def _replace_dead_workers(self, workers, task_queue, result_queue, started_queue) -> int:
+        """Fail the item each dead worker was running and start a replacement; returns the number replaced."""
+        dead_worker_ids = [worker_id for worker_id, worker in enumerate(workers) if not worker.is_alive()]
+        if not dead_worker_ids:
+            return 0
+        # Pick up anything the dead workers reported before exiting.
+        self._collect_started(started_queue)
+        self._collect_results(result_queue, 0)
+        for worker_id in dead_worker_ids:
+            exitcode = workers[worker_id].exitcode
+            workers[worker_id].join()
+            item_id = self._running.pop(worker_id, None)
+            item = self._in_flight.pop(item_id, None) if item_id is not None else None
+            logger.error(
+                "Worker %d exited with code %s while running %s; starting a replacement",
+                worker_id,
+                exitcode,
+                item_id,
+            )
+            METRICS.increment("worker_restarts")
+            if item is not None:
+                self.source.fail(item, f"WorkerExited: worker {worker_id} exited with code {exitcode}")
+            workers[worker_id] = self._start_worker(worker_id, task_queue, result_queue, started_queue)
+        return len(dead_worker_ids)
+
+    def _stop_workers(self, workers, task_queue):
+        for _ in workers:
+            try:
+                task_queue.put(_STOP_WORKER, timeout=_STOP_PUT_TIMEOUT_SECONDS)
+            except queue.Full:
+                # Nothing is taking items off the queue, so the remaining workers cannot be told to stop.
+                logger.warning("Task queue still full at shutdown; terminating worker processes")
+                task_queue.cancel_join_thread()
+                for worker in workers:
+                    if worker.is_alive():
+                        worker.terminate()
+                break
+        for worker in workers:
+            worker.join()
+
+    def summary(self) -> dict[str, Any]:
+        now = monotonic()
+        workers = [stats.as_dict(now) for _, stats in sorted(self.worker_stats.items())]
+        return {
+            "processes": self.processes,
+            "items": sum(worker["items"] for worker in workers),
+            "failures": sum(worker["failures"] for worker in workers),
+            "rows": sum(worker["rows"] for worker in workers),
+            "workers": workers,
+        }
+
+    def run(self) -> dict[str, Any]:
+        task_queue = self._context.Queue(maxsize=self.processes * 2)
+        result_queue = self._context.Queue()
+        started_queue = self._context.SimpleQueue()
+        workers = [
+            self._start_worker(worker_id, task_queue, result_queue, started_queue)
+            for worker_id in range(self.processes)
+        ]
+
+        previous_handlers = self._install_signal_handlers()
+        next_stats_at = monotonic() + self.stats_interval
+        try:
+            while not self._draining or self._in_flight:
+                claimed = self._fill_task_queue(task_queue)
+                self._collect_started(started_queue)
+                handled = self._collect_results(result_queue, _RESULT_POLL_SECONDS)
+                handled += self._replace_dead_workers(workers, task_queue, result_queue, started_queue)
+                if claimed == 0 and handled == 0 and not self._in_flight:
+                    if self.exit_when_idle:
+                        break
+                    sleep(self.poll_interval)
+
+                if monotonic() >= next_stats_at:
+                    logger.info("Worker pool stats: %s", self.summary())
+                    next_stats_at = monotonic() + self.stats_interval
+        finally:
+            self._stop_workers(workers, task_queue)
+            for signal_number, handler in previous_handlers.items():
+                signal.signal(signal_number, handler)
+
+        summary = self.summary()
+        logger.info("Worker pool stopped: %s", summary)
+        return summary
@@ -0,0 +1,225 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import fcntl
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from common.logger.logger import Logger
+from common.ocihelpers.storage import BaseObjectStorage
+from dfa.etl.bulk_ingest import BULK_OBJECT_SUFFIXES
+from dfa.worker.tasks import WORK_KIND_FILE, WORK_KINDS, build_file_event_body
+
+
+@dataclass
+class WorkItem:
+    item_id: str
+    kind: str
+    body: Any
+
+
+def parse_work_item(item_id: str, payload: Any) -> WorkItem:
+    """Validate a ``{"kind": ..., "body": ...}`` work item document."""
+    if not isinstance(payload, dict) or payload.get("kind") not in WORK_KINDS or "body" not in payload:
+        raise ValueError(f"Work item {item_id} must be an object with a kind in {WORK_KINDS} and a body")
+    return WorkItem(item_id=item_id, kind=payload["kind"], body=payload["body"])
+
+
+class WorkSource(ABC):
+    """Hands out work items to the worker pool.
+
+    Only the pool's parent process talks to a source, so implementations do not
+    need to coordinate between worker processes.
+    """
+
+    logger = Logger(__name__).get_logger()
+
+    @abstractmethod
+    def claim(self, max_items: int) -> list[WorkItem]:
+        pass
+
+    def complete(self, item: WorkItem):
+        pass
+
+    def fail(self, item: WorkItem, error: str):
+        self.logger.error("Work item %s failed: %s", item.item_id, error)
+
+
+class DirectoryWorkSource(WorkSource):
+    """Each ``*.json`` file in ``path`` is one work item.
+
+    Claimed files are renamed to ``.processing`` and moved to ``done/`` or
+    ``failed/`` once they finish, so a restarted worker never replays finished work.
+    """
+
+    PROCESSING_SUFFIX = ".processing"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done_path = os.path.join(path, "done")
+        self.failed_path = os.path.join(path, "failed")
+        os.makedirs(self.done_path, exist_ok=True)
+        os.makedirs(self.failed_path, exist_ok=True)
+
+    def claim(self, max_items: int) -> list[WorkItem]:
+        items = []
+        for file_name in sorted(os.listdir(self.path)):
+            if len(items) >= max_items:
+                break
+            if not file_name.endswith(".json"):
+                continue
+
+            claimed_path = os.path.join(self.path, file_name + self.PROCESSING_SUFFIX)
+            try:
+                os.rename(os.path.join(self.path, file_name), claimed_path)
+            except FileNotFoundError:
+                continue
+
+            try:
+                with open(claimed_path, "r", encoding="utf-8") as f:
+                    items.append(parse_work_item(file_name, json.load(f)))
+            except ValueError as e:
+                self._finish(file_name, self.failed_path)
+                self.logger.error("Skipping unreadable work item %s: %s", file_name, e)
+        return items
+
+    def _finish(self, file_name: str, target_dir: str):
+        os.replace(
+            os.path.join(self.path, file_name + self.PROCESSING_SUFFIX),
+            os.path.join(target_dir, file_name),
+        )
+
+    def complete(self, item: WorkItem):
+        self._finish(item.item_id, self.done_path)
+
+    def fail(self, item: WorkItem, error: str):
+        super().fail(item, error)
+        self._finish(item.item_id, self.failed_path)
+
+
+class QueueFileWorkSource(WorkSource):
+    """A JSONL file with one work item per line, consumed from a persisted offset.
+
+    Producers may keep appending to the file. The byte offset of the oldest
+    unfinished line lives in ``<path>.offset``, so items that were in flight when a
+    worker died are replayed on restart. Failed items are appended to
+    ``<path>.failed``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.offset_path = f"{path}.offset"
+        self.failed_path = f"{path}.failed"
+        self._cursor: Optional[int] = None
+        self._in_flight: dict[str, int] = {}
+
+    def _read_offset(self) -> int:
+        try:
+            with open(self.offset_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _write_offset(self):
+        offset = min(self._in_flight.values(), default=self._cursor)
+        temp_path = f"{self.offset_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(str(offset))
+        os.replace(temp_path, self.offset_path)
+
+    def claim(self, max_items: int) -> list[WorkItem]:
+        if not os.path.exists(self.path):
+            return []
+        if self._cursor is None:
+            self._cursor = self._read_offset()
+
+        items = []
+        with open(self.path, "rb") as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            try:
+                f.seek(self._cursor)
+                while len(items) < max_items:
+                    line = f.readline()
+                    # A line without a newline is still being written by the producer.
+                    if not line.endswith(b"\n"):
+                        break
+                    line_offset = self._cursor
+                    self._cursor += len(line)
+                    if not line.strip():
+                        continue
+                    item_id = f"{os.path.basename(self.path)}@{line_offset}"
+                    try:
+                        items.append(parse_work_item(item_id, json.loads(line)))
+                    except ValueError as e:
+                        self.logger.error("Skipping unreadable work item %s: %s", item_id, e)
+                        self._append_failed(line)
+                        continue
+                    self._in_flight[item_id] = line_offset
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        self._write_offset()
+        return items
+
+    def _append_failed(self, line: bytes):
+        with open(self.failed_path, "ab") as f:
+            f.write(line if line.endswith(b"\n") else line + b"\n")
+
+    def complete(self, item: WorkItem):
+        self._in_flight.pop(item.item_id, None)
+        self._write_offset()
+
+    def fail(self, item: WorkItem, error: str):
+        super().fail(item, error)
+        self._append_failed(json.dumps({"kind": item.kind, "body": item.body, "error": error}).encode("utf-8"))
+        self.complete(item)
+
+
+class ObjectStorageWorkSource(WorkSource):
+    """Poll an Object Storage prefix and turn each new object into a file work item.
+
+    Works against OCI Object Storage or any endpoint ``BaseObjectStorage`` is
+    configured for. Object names that have been handed out are remembered for the
+    lifetime of the worker.
+    """
+
+    def __init__(self, namespace: str, bucket_name: str, prefix: str, kind: str = WORK_KIND_FILE):
+        self.namespace = namespace
+        self.bucket_name = bucket_name
+        self.prefix = prefix
+        self.kind = kind
+        self._storage = BaseObjectStorage()
+        self._seen_object_names: set[str] = set()
+        self._pending_object_names: list[str] = []
+
+    def _refresh(self):
+        objects = self._storage.get_objects_by_prefix_and_search_string(
+            self.namespace,
+            self.bucket_name,
+            self.prefix,
+            "",
+        )
+        new_object_names = sorted(
+            object_details.name
+            for object_details in objects
+            if object_details.name.endswith(BULK_OBJECT_SUFFIXES) and object_details.name not in self._seen_object_names
+        )
+        self._seen_object_names.update(new_object_names)
+        self._pending_object_names.extend(new_object_names)
+
+    def claim(self, max_items: int) -> list[WorkItem]:
+        if not self._pending_object_names:
+            self._refresh()
+
+        claimed_names = self._pending_object_names[:max_items]
+        del self._pending_object_names[:max_items]
+        return [
+            WorkItem(
+                item_id=object_name,
+                kind=self.kind,
+                body=build_file_event_body(self.namespace, self.bucket_name, object_name),
+            )
+            for object_name in claimed_names
+        ]
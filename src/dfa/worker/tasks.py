@@ -0,0 +1,99 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+from typing import Any
+
+from common.ocihelpers.stream import DataEnablementStream
+from dfa.etl.audit_transformer import AuditTransformer
+from dfa.etl.file_transformer import FileTransformer
+from dfa.etl.pipeline import FilePipeline, get_pipeline_mode
+from dfa.etl.stream_transformer import StreamTransformer
+
+WORK_KIND_FILE = "file"
+WORK_KIND_FILE_TO_TS = "file_to_ts"
+WORK_KIND_STREAM = "stream"
+WORK_KIND_STREAM_TO_TS = "stream_to_ts"
+WORK_KIND_STREAM_CONSUME = "stream_consume"
+WORK_KIND_AUDIT = "audit"
+WORK_KINDS = (
+    WORK_KIND_FILE,
+    WORK_KIND_FILE_TO_TS,
+    WORK_KIND_STREAM,
+    WORK_KIND_STREAM_TO_TS,
+    WORK_KIND_STREAM_CONSUME,
+    WORK_KIND_AUDIT,
+)
+
+
+def build_file_event_body(namespace: str, bucket_name: str, object_name: str) -> dict[str, Any]:
+    """Build the Object Storage event body the file handlers receive."""
+    return {
+        "data": {
+            "resourceName": object_name,
+            "additionalDetails": {"bucketName": bucket_name, "namespace": namespace},
+        }
+    }
+
+
+def _get_file_location(body: dict[str, Any]) -> tuple[str, str, str]:
+    data = body.get("data")
+    if not isinstance(data, dict) or "resourceName" not in data:
+        raise Exception("Cannot process file - no object name provded.")
+    details = data.get("additionalDetails", {})
+    if "bucketName" not in details or "namespace" not in details:
+        raise Exception("Cannot process file - not all of the necessary details have been provided.")
+    return details["namespace"], details["bucketName"], data["resourceName"]
+
+
+def process_file(body: dict[str, Any], is_timeseries: bool = False) -> int:
+    namespace, bucket_name, object_name = _get_file_location(body)
+    transformer = FileTransformer(namespace, bucket_name, object_name, is_timeseries=is_timeseries)
+    pipeline_mode = get_pipeline_mode()
+    if pipeline_mode is not None:
+        return FilePipeline(transformer, mode=pipeline_mode).run().as_dict()["stages"]["load"]["rows"]
+
+    transformer.extract_data()
+    transformer.transform_data()
+    row_count = transformer.get_prepared_row_count()
+    transformer.load_data()
+    return row_count
+
+
+def process_messages(messages: Any, transformer: StreamTransformer) -> int:
+    messages = DataEnablementStream.decode_connector_hub_source_stream_messages(messages)
+    messages = DataEnablementStream.sort_connector_hub_source_stream_messages(messages)
+    transformer.transform_messages(messages)
+    row_count = len(transformer.get_prepared_events())
+    transformer.load_data()
+    return row_count
+
+
+def consume_stream(body: Any) -> int:
+    """Pull from every stream partition directly instead of waiting for Connector Hub batches."""
+    body = body or {}
+    if not isinstance(body, dict):
+        raise ValueError("Stream consume body must be an object")
+    max_batches = body.get("maxBatches")
+    if max_batches is not None and (
+        isinstance(max_batches, bool) or not isinstance(max_batches, int) or max_batches <= 0
+    ):
+        raise ValueError("maxBatches must be a positive integer")
+    transformer = StreamTransformer(is_timeseries=bool(body.get("isTimeseries", False)))
+    return transformer.consume_stream(max_batches)
+
+
+def run_work_item(kind: str, body: Any) -> int:
+    """Run one unit of work the way the matching Functions handler would; returns rows prepared."""
+    if kind == WORK_KIND_FILE:
+        return process_file(body)
+    if kind == WORK_KIND_FILE_TO_TS:
+        return process_file(body, is_timeseries=True)
+    if kind == WORK_KIND_STREAM:
+        return process_messages(body, StreamTransformer())
+    if kind == WORK_KIND_STREAM_TO_TS:
+        return process_messages(body, StreamTransformer(is_timeseries=True))
+    if kind == WORK_KIND_STREAM_CONSUME:
+        return consume_stream(body)
+    if kind == WORK_KIND_AUDIT:
+        return process_messages(body, AuditTransformer())
+    raise ValueError(f"Unknown work item kind {kind}")
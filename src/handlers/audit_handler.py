@@ -18,6 +18,7 @@ def handler(ctx, data: Optional[io.BytesIO] = None):
     try:
         cfg = ctx.Config()
         bootstrap_base_environment_variables(cfg)
+        AdwConnection.prefetch_connection_material()
 
         if data is None:
             raise ValueError("No request body provided")
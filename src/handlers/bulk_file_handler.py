@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import io
+import json
+from typing import Optional
+
+from common.logger.logger import Logger
+from dfa.adw.connection import AdwConnection
+from dfa.bootstrap.envvars import bootstrap_base_environment_variables
+from dfa.etl.bulk_ingest import BulkFileIngest
+
+
+def _get_optional_positive_int(body, field_name) -> Optional[int]:
+    value = body.get(field_name)
+    if value is None:
+        return None
+    # bool is an int subclass, but "true" is not a worker count.
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"Cannot run bulk ingest - {field_name} must be a positive integer, got {value!r}")
+    return value
+
+
+def handler(ctx, data: Optional[io.BytesIO] = None):
+    logger = Logger(__name__).get_logger()
+    try:
+        cfg = ctx.Config()
+        bootstrap_base_environment_variables(cfg)
+        AdwConnection.prefetch_connection_material()
+
+        if data is None:
+            raise ValueError("No request body provided")
+        body = json.loads(data.getvalue())
+
+        for required_field in ("namespace", "bucketName", "prefix"):
+            if required_field not in body:
+                raise Exception(f"Cannot run bulk ingest - no {required_field} provided.")
+        download_workers = _get_optional_positive_int(body, "downloadWorkers")
+        loader_connections = _get_optional_positive_int(body, "loaderConnections")
+
+        report = BulkFileIngest(
+            body["namespace"],
+            body["bucketName"],
+            body["prefix"],
+            search_for=body.get("searchFor", ""),
+            is_timeseries=bool(body.get("isTimeseries", False)),
+            download_workers=download_workers,
+            loader_connections=loader_connections,
+        ).run()
+        if report.objects_failed:
+            raise Exception(f"Bulk ingest failed for {report.objects_failed} of {report.objects_listed} objects")
+
+    except Exception as e:
+        AdwConnection.rollback_and_close()
+        logger.exception("Bulk file handler caught exception - %s", e)
+        raise Exception("Bulk file handler exception") from e
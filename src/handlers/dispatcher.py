@@ -1,19 +1,34 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
+import importlib
 import io
-from typing import Optional
+from typing import Callable, Optional
 
 from fdk import response
 
-from common.logger.logger import Logger
-from handlers import (
-    audit_handler,
-    file_handler,
-    file_to_timeseries_handler,
-    stream_handler,
-    stream_to_timeseries_handler,
-)
+from common.logger.logger import Logger, flush_logs
+from common.metrics.metrics import METRICS
+from common.tracing.sql_profiler import SQL_PROFILER
+from common.tracing.tracing import TRACER
+
+# A function only ever serves one DFA_FUNCTION_NAME, so handler modules (and the
+# OCI, oracledb and ETL modules they pull in) are imported on first dispatch.
+ROUTES = {
+    "audit": "handlers.audit_handler",
+    "stream": "handlers.stream_handler",
+    "file": "handlers.file_handler",
+    "stream_to_ts": "handlers.stream_to_timeseries_handler",
+    "file_to_ts": "handlers.file_to_timeseries_handler",
+    "bulk_file": "handlers.bulk_file_handler",
+}
+
+
+def resolve_handler(function_name: str) -> Optional[Callable]:
+    module_name = ROUTES.get(function_name)
+    if module_name is None:
+        return None
+    return importlib.import_module(module_name).handler
 
 
 def dispatch(ctx, data: Optional[io.BytesIO] = None):
@@ -29,15 +44,7 @@ def dispatch(ctx, data: Optional[io.BytesIO] = None):
             headers={"Content-Type": "application/json"},
         )
 
-    routes = {
-        "audit": audit_handler.handler,
-        "stream": stream_handler.handler,
-        "file": file_handler.handler,
-        "stream_to_ts": stream_to_timeseries_handler.handler,
-        "file_to_ts": file_to_timeseries_handler.handler,
-    }
-
-    handler_fn = routes.get(function_name)
+    handler_fn = resolve_handler(function_name)
     if handler_fn is None:
         logger.error("Unknown function name %s", function_name)
         return response.Response(
@@ -47,7 +54,15 @@ def dispatch(ctx, data: Optional[io.BytesIO] = None):
             headers={"Content-Type": "application/json"},
         )
 
-    handler_fn(ctx, data)
+    try:
+        with (
+            METRICS.invocation(function_name),
+            TRACER.trace("invocation", function=function_name),
+            SQL_PROFILER.invocation(function_name),
+        ):
+            handler_fn(ctx, data)
+    finally:
+        flush_logs()
 
     return response.Response(
         ctx,
@@ -10,6 +10,7 @@ from common.logger.logger import Logger
 from dfa.adw.connection import AdwConnection
 from dfa.bootstrap.envvars import bootstrap_base_environment_variables
 from dfa.etl.file_transformer import FileTransformer
+from dfa.etl.pipeline import FilePipeline, get_pipeline_mode
 
 
 def handler(ctx, data: Optional[io.BytesIO] = None):
@@ -17,6 +18,7 @@ def handler(ctx, data: Optional[io.BytesIO] = None):
     try:
         cfg = ctx.Config()
         bootstrap_base_environment_variables(cfg)
+        AdwConnection.prefetch_connection_material()
 
         if data is None:
             raise ValueError("No request body provided")
@@ -42,9 +44,13 @@ def handler(ctx, data: Optional[io.BytesIO] = None):
         namespace = body["data"]["additionalDetails"]["namespace"]
 
         transformer = FileTransformer(namespace, bucket_name, object_name)
-        transformer.extract_data()
-        transformer.transform_data()
-        transformer.load_data()
+        pipeline_mode = get_pipeline_mode()
+        if pipeline_mode is not None:
+            FilePipeline(transformer, mode=pipeline_mode).run()
+        else:
+            transformer.extract_data()
+            transformer.transform_data()
+            transformer.load_data()
 
     except Exception as e:
         AdwConnection.rollback_and_close()
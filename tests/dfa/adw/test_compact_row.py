@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.tables.compact_row import CompactRow
+from dfa.adw.tables.identity import IdentityStateTable
+from dfa.etl.memory_budget import RowSpill
+
+
+@pytest.fixture(autouse=True)
+def _schema(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.delenv("DFA_COMPACT_ROWS", raising=False)
+
+
+def test_default_rows_share_one_column_index_and_match_dict_rows(monkeypatch):
+    first = IdentityStateTable().get_default_row()
+    second = IdentityStateTable().get_default_row()
+    monkeypatch.setenv("DFA_COMPACT_ROWS", "false")
+    dict_row = IdentityStateTable().get_default_row()
+
+    assert isinstance(first, CompactRow) and type(dict_row) is dict
+    assert first._index is second._index
+    assert first == dict_row and dict_row == first
+    assert list(first) == list(dict_row) == IdentityStateTable().get_ordered_column_names_for_transformer()
+    assert first["identity_attributes"] == "{}" and first["id"] == ""
+
+
+def test_fan_out_copies_and_overrides_are_independent():
+    identity = IdentityStateTable().get_default_row()
+    identity["id"] = "globalId.1"
+    target_identity = identity.copy()
+    target_identity["operation_type"] = "EXPORT"
+    target_identity["not_a_column"] = 1
+
+    assert identity["operation_type"] == "" and "not_a_column" not in identity
+    assert target_identity["id"] == "globalId.1"
+    assert dict(target_identity.items())["not_a_column"] == 1
+    assert target_identity.get("missing", "default") == "default"
+    assert len(target_identity) == len(identity) + 1
+    del target_identity["not_a_column"]
+    assert "not_a_column" not in target_identity
+    with pytest.raises(TypeError):
+        del target_identity["ti_id"]
+
+
+def test_compact_rows_bind_and_spill_like_dict_rows():
+    identity = IdentityStateTable().get_default_row()
+    identity["id"] = "globalId.1"
+    with_extra = identity.copy()
+    with_extra["ti_id"] = "targetId.1"
+    with_extra["TI_ID"] = "targetId.2"
+    bind_rows = BaseQueryBuilder._bind_rows_for_sql(
+        [identity, with_extra], "INSERT INTO T (ID, TI_ID) VALUES (:ID, :TI_ID)"
+    )
+
+    assert bind_rows == [{"ID": "globalId.1", "TI_ID": ""}, {"ID": "globalId.1", "TI_ID": "targetId.2"}]
+    assert pickle.loads(pickle.dumps(identity)) == identity
+
+    spill = RowSpill()
+    try:
+        spill.append([identity, identity.copy()])
+        restored = next(spill.iter_segments())
+    finally:
+        spill.close()
+    assert restored == [identity, identity]
+    assert restored[0]._index is restored[1]._index
@@ -1,6 +1,7 @@
 import os
 from unittest.mock import MagicMock, patch
 
+import oracledb
 import pytest
 
 from dfa.adw.connection import AdwConnection
@@ -11,6 +12,7 @@ def _reset_adw_connection_state():
     AdwConnection._AdwConnection__cursor = None
     AdwConnection._AdwConnection__username = None
     AdwConnection._AdwConnection__wallet_dir = None
+    AdwConnection._AdwConnection__wallet_digest = None
 
 
 def _adw_env(**overrides):
@@ -358,3 +360,126 @@ def test_get_connection_uses_one_consolidated_secret_bundle(mock_secrets_cls, mo
         mock_secrets.get_dfa_user_password.assert_not_called()
     finally:
         _reset_adw_connection_state()
+
+
+@patch("dfa.adw.connection.oracledb.connect")
+@patch("dfa.adw.connection.AdwSecrets")
+def test_thread_scope_uses_private_connection_and_restores_shared_one(mock_secrets_cls, mock_connect):
+    mock_secrets_cls.return_value.get_connection_material.return_value = {
+        "dfa_user_password": "password",
+        "wallet": b"wallet",
+        "wallet_password": "wallet-password",
+        "ewallet_pem": "pem",
+    }
+    shared_connection = MagicMock()
+    scoped_connection = MagicMock()
+    scoped_cursor = MagicMock()
+    scoped_cursor.connection = scoped_connection
+    scoped_connection.cursor.return_value = scoped_cursor
+    mock_connect.return_value = scoped_connection
+    AdwConnection._AdwConnection__connection = shared_connection
+    AdwConnection._AdwConnection__username = "DFA"
+
+    try:
+        with patch.dict(os.environ, _adw_env(), clear=False):
+            with AdwConnection.thread_scope():
+                assert AdwConnection.get_cursor() is scoped_cursor
+                AdwConnection.commit()
+
+            scoped_connection.commit.assert_called_once()
+            scoped_connection.close.assert_called_once()
+            shared_connection.commit.assert_not_called()
+            shared_connection.close.assert_not_called()
+            assert AdwConnection._AdwConnection__connection is shared_connection
+    finally:
+        _reset_adw_connection_state()
+
+
+def _connection_material(password="password", wallet=b"wallet", ewallet_pem="pem"):
+    return {
+        "dfa_user_password": password,
+        "wallet": wallet,
+        "wallet_password": "wallet-password",
+        "ewallet_pem": ewallet_pem,
+    }
+
+
+@patch("dfa.adw.connection.oracledb.connect")
+@patch("dfa.adw.connection.AdwSecrets")
+def test_get_connection_reloads_rotated_credentials_once(mock_secrets_cls, mock_connect):
+    _reset_adw_connection_state()
+    mock_secrets = mock_secrets_cls.return_value
+    mock_secrets.get_connection_material.side_effect = [
+        _connection_material(password="old-password"),
+        _connection_material(password="new-password", wallet=b"new-wallet"),
+    ]
+    connection = MagicMock()
+    mock_connect.side_effect = [oracledb.DatabaseError("ORA-01017: invalid credential or not authorized"), connection]
+
+    try:
+        with patch.dict(os.environ, _adw_env(), clear=False):
+            assert AdwConnection.get_connection() is connection
+
+        assert mock_secrets.get_connection_material.call_args_list[-1].kwargs == {"force_refresh": True}
+        assert [call.kwargs["password"] for call in mock_connect.call_args_list] == ["old-password", "new-password"]
+        wallet_location = mock_connect.call_args.kwargs["wallet_location"]
+        with open(os.path.join(wallet_location, "cwallet.sso"), "rb") as f:
+            assert f.read() == b"new-wallet"
+    finally:
+        _reset_adw_connection_state()
+
+
+@patch("dfa.adw.connection.oracledb.connect")
+@patch("dfa.adw.connection.AdwSecrets")
+def test_get_connection_does_not_reload_secrets_for_other_errors(mock_secrets_cls, mock_connect):
+    _reset_adw_connection_state()
+    mock_secrets_cls.return_value.get_connection_material.return_value = _connection_material()
+    mock_connect.side_effect = oracledb.DatabaseError("ORA-12514: cannot connect to database")
+
+    try:
+        with patch.dict(os.environ, _adw_env(), clear=False), pytest.raises(oracledb.DatabaseError):
+            AdwConnection.get_connection()
+
+        mock_secrets_cls.return_value.get_connection_material.assert_called_once_with()
+    finally:
+        _reset_adw_connection_state()
+
+
+def test_ensure_wallet_dir_reuses_content_addressed_directory(tmp_path):
+    _reset_adw_connection_state()
+    try:
+        with patch.dict(os.environ, {"DFA_WALLET_DIR": str(tmp_path)}, clear=False):
+            wallet_dir = AdwConnection._ensure_wallet_dir(_connection_material())
+            # A new process on the same host starts without the cached directory.
+            _reset_adw_connection_state()
+            with patch("dfa.adw.connection.tempfile.mkdtemp") as mock_mkdtemp:
+                assert AdwConnection._ensure_wallet_dir(_connection_material()) == wallet_dir
+            mock_mkdtemp.assert_not_called()
+
+            rotated_dir = AdwConnection._ensure_wallet_dir(_connection_material(wallet=b"rotated"))
+
+        assert os.path.dirname(wallet_dir) == str(tmp_path)
+        assert rotated_dir != wallet_dir
+        with open(os.path.join(rotated_dir, "cwallet.sso"), "rb") as f:
+            assert f.read() == b"rotated"
+    finally:
+        _reset_adw_connection_state()
+
+
+@patch("dfa.adw.connection.AdwSecrets")
+def test_prefetch_connection_material_respects_toggle_and_existing_connection(mock_secrets_cls):
+    _reset_adw_connection_state()
+    try:
+        with patch.dict(os.environ, {"DFA_ADW_CONNECTION_SECRET_OCID": "ocid1.secret"}, clear=False):
+            AdwConnection.prefetch_connection_material()
+            mock_secrets_cls.return_value.prefetch_connection_material.assert_called_once_with()
+
+            with patch.dict(os.environ, {"DFA_SECRET_PREFETCH": "false"}):
+                assert AdwConnection.prefetch_connection_material() is None
+
+            AdwConnection._AdwConnection__connection = MagicMock()
+            assert AdwConnection.prefetch_connection_material() is None
+
+        assert mock_secrets_cls.return_value.prefetch_connection_material.call_count == 1
+    finally:
+        _reset_adw_connection_state()
@@ -0,0 +1,208 @@
+import re
+from datetime import datetime, timezone
+
+import oracledb
+import pytest
+
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.identity import IdentityStateUpdateQueryBuilder
+from dfa.adw.query_builders.policy import PolicyStateDeleteQueryBuilder, PolicyStateUpdateQueryBuilder
+from dfa.adw.query_builders.policy_statement_resource_mapping import (
+    PolicyStatementResourceMappingStateDeleteQueryBuilder,
+)
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.identity import IdentityStateTable
+from dfa.adw.tables.policy import PolicyStateTable
+
+EVENT_TIMESTAMP = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def _normalized_schema(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.setenv("DFA_NORMALIZED_SCHEMA", "true")
+    BaseTable._ensured_index_names.clear()
+    BaseStateTable._ensured_delete_index_names.clear()
+    SCHEMA_READINESS.reset()
+    yield
+    AdwConnection.close()
+
+
+def _policy_rows(policy_id, rule_count):
+    rows = []
+    for index in range(rule_count):
+        row = PolicyStateTable().get_default_row()
+        row.update(
+            {
+                "id": policy_id,
+                "name": f"policy {policy_id}",
+                "attributes": '{"owner": "team-1"}',
+                "policy_rule_id": f"{policy_id}.rule-{index}",
+                "policy_rule_statement": f"allow rule {index}",
+                "event_object_type": "POLICY",
+                "operation_type": "UPDATE",
+                "event_timestamp": EVENT_TIMESTAMP,
+                "tenancy_id": "tenancy-1",
+                "service_instance_id": "si-1",
+            }
+        )
+        rows.append(row)
+    return rows
+
+
+def _identity_row(global_id, target_id):
+    row = IdentityStateTable().get_default_row()
+    row.update(
+        {
+            "id": global_id,
+            "username": "user-1" if global_id else "",
+            "ti_id": target_id,
+            "event_object_type": "IDENTITY",
+            "operation_type": "CREATE",
+            "event_timestamp": EVENT_TIMESTAMP,
+            "tenancy_id": "tenancy-1",
+            "service_instance_id": "si-1",
+        }
+    )
+    return row
+
+
+def _install(*table_managers, **kwargs):
+    connection = RecordingConnection(
+        FakeKeyStore(unique_keys_for_tables(*table_managers)), database_error=oracledb.DatabaseError, **kwargs
+    )
+    AdwConnection.install_connection(connection)
+    return connection
+
+
+def test_split_rows_deduplicates_parents_and_keeps_unmatched_targets_as_children():
+    layout = IdentityStateTable().get_normalized_layout()
+    rows = [
+        _identity_row("globalId.1", "targetId.user.1"),
+        _identity_row("globalId.1", "targetId.user.2"),
+        _identity_row("", "targetId.user.3"),
+    ]
+
+    parent_rows, child_rows = layout.split_rows(rows)
+
+    assert [row["id"] for row in parent_rows] == ["globalId.1"]
+    assert parent_rows[0]["username"] == "user-1" and "ti_id" not in parent_rows[0]
+    assert [row["ti_id"] for row in child_rows] == ["targetId.user.1", "targetId.user.2", "targetId.user.3"]
+    assert "username" not in child_rows[0] and child_rows[0]["event_timestamp"] == EVENT_TIMESTAMP
+    assert (layout.parent.get_table_name(), layout.child.get_table_name()) == (
+        "IDENTITY_BASE_STATE",
+        "IDENTITY_TARGET_STATE",
+    )
+
+
+def test_view_reproduces_the_denormalized_columns_in_order():
+    layout = PolicyStateTable().get_normalized_layout()
+    view_ddl = layout.get_view_ddl()
+
+    selected = view_ddl.split("SELECT", 1)[1].split("FROM", 1)[0]
+    expressions = re.sub(r"NVL\(.*?\)\) AS ", "", selected).split(",")
+    selected_columns = [expression.strip().rsplit(" ", 1)[-1].split(".")[-1] for expression in expressions]
+    assert selected_columns == [
+        f'"{column.upper()}"' for column in PolicyStateTable().get_ordered_column_names_for_transformer()
+    ]
+    assert 'c."POLICY_RULE_STATEMENT"' in view_ddl and 'p."NAME"' in view_ddl
+    assert "LEFT OUTER JOIN DFA.POLICY_BASE_STATE p" in view_ddl
+    assert PolicyStateTable().get_normalized_layout() is layout
+
+
+def test_state_upsert_writes_one_parent_row_per_policy_and_one_child_row_per_rule():
+    layout = PolicyStateTable().get_normalized_layout()
+    connection = _install(layout.parent, layout.child)
+
+    PolicyStateUpdateQueryBuilder(_policy_rows("policy-1", 3) + _policy_rows("policy-2", 2)).execute_sql_for_events()
+
+    inserts = connection.statements("executemany")
+    assert inserts[0].startswith('INSERT INTO "POLICY_BASE_STATE"') and "POLICY_RULE_ID" not in inserts[0]
+    assert inserts[1].startswith('INSERT INTO "POLICY_RULE_STATE"') and '"NAME"' not in inserts[1]
+    assert connection.key_store.count("POLICY_BASE_STATE") == 2
+    assert connection.key_store.count("POLICY_RULE_STATE") == 5
+    assert connection.stats()["rows_bound"] == 7
+
+
+def test_unmatched_target_identities_only_reach_the_child_table():
+    layout = IdentityStateTable().get_normalized_layout()
+    connection = _install(layout.parent, layout.child)
+
+    IdentityStateUpdateQueryBuilder(
+        [_identity_row("globalId.1", "targetId.user.1"), _identity_row("", "targetId.user.2")]
+    ).execute_sql_for_events()
+
+    assert connection.key_store.count("IDENTITY_BASE_STATE") == 1
+    assert connection.key_store.count("IDENTITY_TARGET_STATE") == 2
+
+
+def test_deletes_by_parent_key_remove_children_and_parents():
+    layout = PolicyStateTable().get_normalized_layout()
+    connection = _install(layout.parent, layout.child)
+
+    PolicyStateDeleteQueryBuilder(_policy_rows("policy-1", 1)).execute_sql_for_events()
+
+    deletes = [statement for statement in connection.statements("executemany") if statement.startswith("DELETE")]
+    assert [statement.split('"')[1] for statement in deletes] == ["POLICY_RULE_STATE", "POLICY_BASE_STATE"]
+
+
+def test_deletes_by_child_columns_sweep_orphaned_parents_per_scope():
+    connection = _install()
+    rows = [
+        {
+            "policy_statement_id": "statement-1",
+            "resource_id": f"resource-{index}",
+            "tenancy_id": "tenancy-1",
+            "service_instance_id": "si-1",
+        }
+        for index in range(2)
+    ]
+
+    PolicyStatementResourceMappingStateDeleteQueryBuilder(rows).execute_sql_for_events()
+
+    child_delete, orphan_delete = connection.statements("executemany")
+    assert child_delete.startswith('DELETE FROM "POLICY_STATEMENT_RESOURCE_MAPPING_RESOURCE_STATE"')
+    assert orphan_delete.startswith('DELETE FROM "POLICY_STATEMENT_RESOURCE_MAPPING_BASE_STATE" p')
+    assert "NOT EXISTS" in orphan_delete
+    assert [call.row_count for call in connection.calls if call.method == "executemany"] == [2, 1]
+
+
+def test_snapshot_cleanup_covers_child_and_parent_tables():
+    connection = _install()
+
+    PolicyStateUpdateQueryBuilder([]).delete_rows_older_than_event_timestamp(
+        EVENT_TIMESTAMP, tenancy_id="tenancy-1", service_instance_id="si-1"
+    )
+
+    deletes = connection.statements("execute")
+    assert [statement.split('"')[1] for statement in deletes] == ["POLICY_RULE_STATE", "POLICY_BASE_STATE"]
+    assert connection.stats()["commit"] == 1
+
+
+def test_create_adds_parent_child_and_compatibility_view():
+    missing = [(0,)]
+    connection = _install(
+        query_results={
+            "object_name = 'POLICY_BASE_STATE'": missing,
+            "object_name = 'POLICY_RULE_STATE'": missing,
+        }
+    )
+
+    PolicyStateTable().create()
+
+    statements = [" ".join(statement.split()) for statement in connection.statements("execute")]
+    assert any(statement.startswith("CREATE TABLE DFA.POLICY_BASE_STATE") for statement in statements)
+    assert any(statement.startswith("CREATE TABLE DFA.POLICY_RULE_STATE") for statement in statements)
+    assert any('ADD CONSTRAINT "DFA_UNQ_POL_ST_CONST_P"' in statement for statement in statements)
+    assert statements[-1].startswith("CREATE OR REPLACE VIEW DFA.POLICY_STATE AS")
+    assert not any(statement.startswith("CREATE TABLE DFA.POLICY_STATE ") for statement in statements)
+
+
+def test_create_keeps_an_existing_denormalized_table_without_a_view():
+    connection = _install(query_results={"ALL_TABLES": [("TABLE", "POLICY_STATE")]})
+
+    PolicyStateTable().create()
+
+    assert not any("CREATE OR REPLACE VIEW" in statement for statement in connection.statements("execute"))
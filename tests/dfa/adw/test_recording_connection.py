@@ -0,0 +1,148 @@
+import time
+
+import oracledb
+import pytest
+
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.resource import (
+    ResourceStateDeleteQueryBuilder,
+    ResourceStateUpdateQueryBuilder,
+    ResourceTimeSeriesCreateQueryBuilder,
+)
+from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.resource import ResourceStateTable
+
+
+@pytest.fixture(autouse=True)
+def _set_adw_schema(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    BaseTable._ensured_index_names.clear()
+    BaseStateTable._ensured_delete_index_names.clear()
+    yield
+    AdwConnection.close()
+
+
+def _resource_event(index, name="resource"):
+    return {
+        "id": f"res-{index}",
+        "description": None,
+        "external_id": f"ext-{index}",
+        "resource_name": name,
+        "resource_type": "bucket",
+        "target_id": "target-1",
+        "tenancy_id": "tenancy-1",
+        "event_object_type": "RESOURCE",
+        "operation_type": "UPDATE",
+        "event_timestamp": "2025-01-01T00:00:00.000+00:00",
+        "attributes": "{}",
+        "service_instance_id": "si-1",
+    }
+
+
+def _install(key_store=None, **kwargs):
+    connection = RecordingConnection(
+        key_store or FakeKeyStore(unique_keys_for_tables(ResourceStateTable())),
+        database_error=oracledb.DatabaseError,
+        **kwargs,
+    )
+    AdwConnection.install_connection(connection)
+    return connection
+
+
+def test_time_series_insert_uses_one_executemany_and_one_commit():
+    connection = _install()
+
+    ResourceTimeSeriesCreateQueryBuilder([_resource_event(i) for i in range(3)]).execute_sql_for_events()
+
+    stats = connection.stats()
+    assert stats["executemany"] == 1
+    assert stats["commit"] == 1
+    assert stats["rows_bound"] == 3
+    assert stats["bind_bytes"] > 0
+    assert stats["round_trips"] == stats["executemany"] + stats["commit"] + stats["ping"]
+    assert connection.statements("executemany")[0].startswith('INSERT INTO "RESOURCE_TS"')
+
+
+def test_state_upsert_falls_back_to_updates_for_existing_keys():
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    table_name = ResourceStateTable().get_table_name()
+    key_store.seed(table_name, [_resource_event(0), _resource_event(1)])
+    connection = _install(key_store)
+
+    ResourceStateUpdateQueryBuilder([_resource_event(i, "renamed") for i in range(5)]).execute_sql_for_events()
+
+    stats = connection.stats()
+    assert stats["batch_errors"] == 2
+    assert stats["executemany"] == 2
+    assert stats["commit"] == 2
+    assert stats["rows_bound"] == 7
+    assert connection.statements("executemany")[1].startswith(f'UPDATE "{table_name}"')
+    assert key_store.count(table_name) == 5
+    assert key_store.rows[table_name][("res-0", "si-1", "tenancy-1")]["RESOURCE_NAME"] == "renamed"
+
+
+def test_state_upsert_without_existing_keys_skips_the_update_fallback():
+    connection = _install()
+
+    ResourceStateUpdateQueryBuilder([_resource_event(i) for i in range(5)]).execute_sql_for_events()
+
+    stats = connection.stats()
+    assert (stats["executemany"], stats["commit"], stats["batch_errors"]) == (1, 1, 0)
+
+
+def test_state_delete_removes_keys_from_the_store():
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    table_name = ResourceStateTable().get_table_name()
+    key_store.seed(table_name, [_resource_event(i) for i in range(3)])
+    connection = _install(key_store)
+
+    ResourceStateDeleteQueryBuilder([_resource_event(1)]).execute_sql_for_events()
+
+    assert key_store.count(table_name) == 2
+    assert connection.stats()["executemany"] == 1
+
+
+def test_injected_batch_errors_are_reported_without_update_fallback():
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    key_store.fail_rows(lambda row: row.get("ID") == "res-2")
+    connection = _install(key_store)
+
+    ResourceStateUpdateQueryBuilder([_resource_event(i) for i in range(4)]).execute_sql_for_events()
+
+    stats = connection.stats()
+    assert stats["batch_errors"] == 1
+    assert stats["executemany"] == 1
+    assert key_store.count(ResourceStateTable().get_table_name()) == 3
+
+
+def test_duplicate_key_outside_batch_mode_raises_the_configured_error():
+    key_store = FakeKeyStore({"T": ["ID"]})
+    key_store.seed("T", [{"id": 1}])
+    connection = _install(key_store)
+
+    with pytest.raises(oracledb.DatabaseError, match="ORA-00001"):
+        connection.cursor().executemany('INSERT INTO "T" (ID) VALUES (:ID)', [{"ID": 1}])
+
+
+def test_latency_is_applied_per_round_trip():
+    connection = _install(latency_seconds=0.01)
+
+    started = time.perf_counter()
+    ResourceTimeSeriesCreateQueryBuilder([_resource_event(0)]).execute_sql_for_events()
+
+    assert time.perf_counter() - started >= connection.stats()["round_trips"] * 0.01
+
+
+def test_catalog_and_count_queries_return_defaults_unless_overridden():
+    connection = RecordingConnection(query_results={"SNAPSHOT_BATCH": [(3,)]})
+    cursor = connection.cursor()
+
+    cursor.execute("SELECT COUNT(*) FROM ALL_OBJECTS WHERE OBJECT_NAME = 'X'")
+    assert cursor.fetchone() == (1,)
+    cursor.execute("SELECT COUNT(*) FROM OTHER")
+    assert cursor.fetchone() == (0,)
+    cursor.execute("SELECT COUNT(*) FROM SNAPSHOT_BATCH_TRACKER")
+    assert cursor.fetchone() == (3,)
+    cursor.execute("SELECT CHECKPOINT FROM CHUNKS")
+    assert cursor.fetchone() is None
@@ -0,0 +1,87 @@
+import pytest
+
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import RecordingConnection
+from dfa.adw.query_builders.resource import ResourceStateUpdateQueryBuilder
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.base_table import BaseStateTable, BaseTable, SnapshotBatchTrackerTable
+from dfa.adw.tables.policy_statement_resource_mapping import PolicyStatementResourceMappingStateTable
+
+TRACKER_CATALOG = [
+    ("TABLE", "SNAPSHOT_BATCH_TRACKER"),
+    ("CONSTRAINT", "PK_SNAPSHOT_BATCH_TRACKER"),
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_readiness(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.delenv("DFA_SCHEMA_VERSION", raising=False)
+    BaseTable._ensured_index_names.clear()
+    BaseStateTable._ensured_delete_index_names.clear()
+    SCHEMA_READINESS.reset()
+    yield
+    SCHEMA_READINESS.reset()
+    AdwConnection.close()
+
+
+def _install(catalog_rows):
+    connection = RecordingConnection(query_results={"UNION ALL": catalog_rows})
+    AdwConnection.install_connection(connection)
+    return connection
+
+
+def _catalog_statements(connection):
+    return [statement for statement in connection.statements("execute") if "ALL_" in statement]
+
+
+def test_listed_helper_table_needs_one_catalog_query_per_process():
+    connection = _install(TRACKER_CATALOG)
+    query_builder = ResourceStateUpdateQueryBuilder([])
+
+    for _ in range(3):
+        query_builder._ensure_helper_table_exists(SnapshotBatchTrackerTable())
+
+    assert len(_catalog_statements(connection)) == 1
+    assert connection.stats()["commit"] == 0
+
+
+def test_missing_objects_go_through_create_once():
+    connection = _install([("TABLE", "SNAPSHOT_BATCH_TRACKER")])
+    query_builder = ResourceStateUpdateQueryBuilder([])
+
+    for _ in range(3):
+        query_builder._ensure_helper_table_exists(SnapshotBatchTrackerTable())
+
+    catalog_statements = _catalog_statements(connection)
+    assert len(catalog_statements) == 2
+    assert "ALL_CONSTRAINTS" in catalog_statements[1] and "COUNT(*)" in catalog_statements[1]
+    assert connection.stats()["commit"] == 1
+
+
+def test_loaded_catalog_answers_existence_checks_without_queries():
+    connection = _install([("TABLE", "POLICY_STATEMENT_RESOURCE_MAPPING_STATE"), ("INDEX", "DFA_PSRM_ST_ET_IDX")])
+    table = PolicyStatementResourceMappingStateTable()
+
+    assert SCHEMA_READINESS.ensure_ready(table) is True
+
+    catalog_statements = _catalog_statements(connection)
+    assert len(catalog_statements) == 2
+    assert "ALL_INDEXES" in catalog_statements[1] and "COUNT(*)" in catalog_statements[1]
+    assert SCHEMA_READINESS.has_object("DFA", "INDEX", "dfa_psrm_st_et_idx")
+    assert not SCHEMA_READINESS.has_object("OTHER", "TABLE", "POLICY_STATEMENT_RESOURCE_MAPPING_STATE")
+
+
+def test_schema_version_stamp_and_drop_invalidate_the_cache(monkeypatch):
+    connection = _install(TRACKER_CATALOG)
+    table = SnapshotBatchTrackerTable()
+
+    SCHEMA_READINESS.ensure_ready(table)
+    monkeypatch.setenv("DFA_SCHEMA_VERSION", "2")
+    assert not SCHEMA_READINESS.is_ready(table)
+    SCHEMA_READINESS.ensure_ready(table)
+    assert len(_catalog_statements(connection)) == 2
+
+    table.delete()
+    assert not SCHEMA_READINESS.is_ready(table)
+    assert not SCHEMA_READINESS.has_object("DFA", "TABLE", "SNAPSHOT_BATCH_TRACKER")
@@ -0,0 +1,77 @@
+import pytest
+
+from common.tracing.sql_profiler import SQL_PROFILER, ProfilingCursor, SqlProfiler
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.resource import ResourceStateUpdateQueryBuilder
+from dfa.adw.tables.base_table import BaseStateTable, BaseTable
+from dfa.adw.tables.resource import ResourceStateTable
+
+
+@pytest.fixture(autouse=True)
+def _profiling_enabled(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    BaseTable._ensured_index_names.clear()
+    BaseStateTable._ensured_delete_index_names.clear()
+    SQL_PROFILER.configure(True)
+    SQL_PROFILER.reset()
+    yield
+    SQL_PROFILER.configure(None)
+    SQL_PROFILER.reset()
+    AdwConnection.close()
+
+
+def _resource_event(index):
+    return {
+        "id": f"res-{index}",
+        "resource_name": "bucket",
+        "tenancy_id": "tenancy-1",
+        "service_instance_id": "si-1",
+        "event_timestamp": "2025-01-01T00:00:00.000+00:00",
+    }
+
+
+def test_cursor_is_only_wrapped_when_profiling_is_enabled(monkeypatch):
+    AdwConnection.install_connection(RecordingConnection())
+    assert isinstance(AdwConnection.get_cursor(), ProfilingCursor)
+
+    SQL_PROFILER.configure(None)
+    monkeypatch.delenv("DFA_SQL_PROFILE", raising=False)
+    AdwConnection.install_connection(RecordingConnection())
+    assert not isinstance(AdwConnection.get_cursor(), ProfilingCursor)
+
+
+def test_statements_are_aggregated_by_normalized_text():
+    profiler = SqlProfiler(enabled=True)
+    cursor = profiler.wrap_cursor(RecordingConnection().cursor())
+
+    cursor.execute("SELECT COUNT(*) FROM ALL_OBJECTS WHERE OBJECT_NAME = 'A'")
+    cursor.execute("select count(*)\n from all_objects where object_name = 'B'")
+    cursor.executemany('INSERT INTO "T" (ID) VALUES (:ID)', [{"ID": 1}, {"ID": 2}], batcherrors=True)
+    assert cursor.fetchone() is None
+
+    insert, catalog = sorted(profiler.top(), key=lambda stats: stats.statement)
+    assert catalog.executions == 2
+    assert catalog.statement == "SELECT COUNT(*) FROM ALL_OBJECTS WHERE OBJECT_NAME = ?"
+    assert (insert.executions, insert.rows, insert.batch_errors) == (1, 2, 0)
+
+
+def test_load_reports_catalog_checks_and_batch_errors():
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    key_store.seed(ResourceStateTable().get_table_name(), [_resource_event(0)])
+    AdwConnection.install_connection(RecordingConnection(key_store))
+
+    with SQL_PROFILER.invocation("file") as profiler:
+        for _ in range(3):
+            ResourceStateTable()._table_exists()
+        ResourceStateUpdateQueryBuilder([_resource_event(0), _resource_event(1)]).execute_sql_for_events()
+        statements = {stats.statement.split(" ", 1)[0]: stats for stats in profiler.top()}
+        report = profiler.report(limit=2)
+
+    assert statements["SELECT"].executions == 3
+    assert "ALL_OBJECTS" in statements["SELECT"].statement
+    assert statements["INSERT"].batch_errors == 1
+    assert statements["UPDATE"].rows == 1
+    assert report.startswith("SQL profile: 3 statement(s), 5 execution(s)")
+    assert len(report.splitlines()) == 4
+    assert SQL_PROFILER.top() == []
@@ -1,5 +1,5 @@
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import oracledb
@@ -23,11 +23,17 @@ from dfa.adw.query_builders.policy_statement_resource_mapping import (
     PolicyStatementResourceMappingStateDeleteQueryBuilder,
 )
 from dfa.adw.query_builders.resource import ResourceStateDeleteQueryBuilder
+from dfa.adw.schema_readiness import SCHEMA_READINESS
 from dfa.adw.tables.access_bundle import AccessBundleStateTable, AccessBundleTimeSeriesTable
 from dfa.adw.tables.access_guardrail import AccessGuardrailStateTable, AccessGuardrailTimeSeriesTable
 from dfa.adw.tables.approval_workflow import ApprovalWorkflowStateTable, ApprovalWorkflowTimeSeriesTable
 from dfa.adw.tables.audit_events import AuditEventsTable
-from dfa.adw.tables.base_table import BaseStateTable, BaseTable, SnapshotBatchTrackerTable
+from dfa.adw.tables.base_table import (
+    BaseStateTable,
+    BaseTable,
+    SnapshotBatchTrackerTable,
+    SnapshotChunkCheckpointTable,
+)
 from dfa.adw.tables.cloud_group import CloudGroupStateTable, CloudGroupTimeSeriesTable
 from dfa.adw.tables.cloud_policy import CloudPolicyStateTable, CloudPolicyTimeSeriesTable
 from dfa.adw.tables.global_identity_collection import (
@@ -53,6 +59,7 @@ def _set_adw_schema(monkeypatch):
     monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
     BaseTable._ensured_index_names.clear()
     BaseStateTable._ensured_delete_index_names.clear()
+    SCHEMA_READINESS.reset()
 
 
 def _normalize_sql(sql: str) -> str:
@@ -816,7 +823,7 @@ def test_permission_assignment_delete_with_permission_filters_input_sizes_to_sql
     assert cursor.setinputsizes.call_args.kwargs == {
         "TARGET_IDENTITY_ID": len("identity-1"),
         "PERMISSION_ID": len("permission-1"),
-        "EVENT_TIMESTAMP": None,
+        "EVENT_TIMESTAMP": oracledb.DB_TYPE_TIMESTAMP_TZ,
         "SERVICE_INSTANCE_ID": len("svc-1"),
         "TENANCY_ID": len("tenant-1"),
     }
@@ -914,7 +921,7 @@ def test_permission_assignment_delete_without_permission_filters_input_sizes_to_
     }
     assert cursor.setinputsizes.call_args.kwargs == {
         "TARGET_IDENTITY_ID": len("identity-1"),
-        "EVENT_TIMESTAMP": None,
+        "EVENT_TIMESTAMP": oracledb.DB_TYPE_TIMESTAMP_TZ,
         "SERVICE_INSTANCE_ID": len("svc-1"),
         "TENANCY_ID": len("tenant-1"),
     }
@@ -1107,11 +1114,12 @@ def test_delete_rows_older_than_event_timestamp_scopes_by_tenant_and_service(moc
     bind_values = cursor.execute.call_args.args[1]
     normalized = _normalize_sql(executed_sql).upper()
     assert 'DELETE FROM "ACCESS_BUNDLE_STATE"' in normalized
-    assert '"EVENT_TIMESTAMP" < TO_TIMESTAMP(:COMPLETION_TIMESTAMP,' in normalized
+    assert '"EVENT_TIMESTAMP" < :COMPLETION_TIMESTAMP' in normalized
     assert '"TENANCY_ID" = :TENANCY_ID' in normalized
     assert '"SERVICE_INSTANCE_ID" = :SERVICE_INSTANCE_ID' in normalized
-    assert "DD-MON-RR HH24:MI:SS.FF6" in normalized
-    assert bind_values["COMPLETION_TIMESTAMP"] == "14-Apr-26 21:40:20.331306"
+    assert "TO_TIMESTAMP" not in normalized
+    assert bind_values["COMPLETION_TIMESTAMP"] == datetime(2026, 4, 14, 21, 40, 20, 331306, tzinfo=timezone.utc)
+    cursor.setinputsizes.assert_called_once_with(COMPLETION_TIMESTAMP=oracledb.DB_TYPE_TIMESTAMP_TZ)
     assert bind_values["TENANCY_ID"] == "tenant-1"
     assert bind_values["SERVICE_INSTANCE_ID"] == "svc-1"
     mock_commit.assert_called_once()
@@ -1140,7 +1148,29 @@ def test_snapshot_helper_queries_use_scope_and_snapshot(mock_get_cursor):
 
 
 @patch("dfa.adw.connection.AdwConnection.get_cursor")
-def test_snapshot_get_earliest_batch_timestamp_uses_scope_and_formats_datetime(mock_get_cursor):
+@patch("dfa.adw.connection.AdwConnection.commit")
+def test_register_snapshot_batch_completed_binds_utc_datetime(mock_commit, mock_get_cursor):
+    cursor = MagicMock()
+    mock_get_cursor.return_value = cursor
+
+    qb = AccessBundleStateUpdateQueryBuilder([])
+    qb._ensure_helper_table_exists = MagicMock()
+    qb.register_snapshot_batch_completed(
+        "snapshot-1",
+        "access_bundle.snapshot-1.batch-1",
+        datetime(2026, 4, 14, 21, 40, 20, 331306, tzinfo=timezone.utc),
+        tenancy_id="tenant-1",
+        service_instance_id="svc-1",
+    )
+
+    executed_sql, bind_values = cursor.execute.call_args.args
+    assert "TO_TIMESTAMP" not in executed_sql.upper()
+    assert bind_values["UPDATED_AT"] == datetime(2026, 4, 14, 21, 40, 20, 331306)
+    mock_commit.assert_called_once()
+
+
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_snapshot_get_earliest_batch_timestamp_uses_scope_and_returns_utc_datetime(mock_get_cursor):
     cursor = MagicMock()
     mock_get_cursor.return_value = cursor
     cursor.fetchone.side_effect = [(datetime(2026, 4, 14, 21, 40, 20, 331306),)]
@@ -1152,7 +1182,7 @@ def test_snapshot_get_earliest_batch_timestamp_uses_scope_and_formats_datetime(m
 
     earliest_timestamp = qb._snapshot_get_earliest_batch_timestamp("snapshot-1", "tenant-1", "svc-1")
 
-    assert earliest_timestamp == "14-Apr-26 21:40:20.331306"
+    assert earliest_timestamp == datetime(2026, 4, 14, 21, 40, 20, 331306, tzinfo=timezone.utc)
     first_bind = cursor.execute.call_args_list[0].args[1]
     assert first_bind["ENTITY_TYPE"] == "ACCESS_BUNDLE"
     assert first_bind["TENANCY_ID"] == "tenant-1"
@@ -1180,11 +1210,14 @@ def test_snapshot_cleanup_lock_targets_deterministic_tracker_row(mock_get_cursor
     assert "FOR UPDATE NOWAIT" in lock_sql
 
 
+@patch("dfa.adw.schema_readiness.SchemaReadiness.load_catalog", return_value=frozenset())
 @patch("dfa.adw.query_builders.base_query_builder.AdwConnection.commit")
-def test_ensure_helper_table_exists_uses_table_create_as_single_entry_point(mock_commit):
+def test_ensure_helper_table_exists_uses_table_create_as_single_entry_point(mock_commit, _mock_load_catalog):
     qb = AccessBundleStateUpdateQueryBuilder([])
     tracker_table = MagicMock()
+    tracker_table.get_required_catalog_objects.return_value = [("TABLE", "SNAPSHOT_BATCH_TRACKER")]
 
+    qb._ensure_helper_table_exists(tracker_table)
     qb._ensure_helper_table_exists(tracker_table)
 
     tracker_table.create.assert_called_once()
@@ -1423,3 +1456,114 @@ def test_finalize_snapshot_cleanup_if_ready_returns_when_lock_busy(mock_rollback
     qb.delete_rows_older_than_event_timestamp.assert_not_called()
     qb._delete_snapshot_batch_tracking.assert_not_called()
     mock_rollback.assert_called_once()
+
+
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_snapshot_chunk_checkpoint_table_primary_key_covers_object_version(mock_get_cursor):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (0,)
+    mock_get_cursor.return_value = cursor
+
+    checkpoint_table = SnapshotChunkCheckpointTable()
+    checkpoint_table._schema = "DFA"
+
+    checkpoint_table.ensure_supporting_objects()
+
+    add_constraint_sql = _normalize_sql(cursor.execute.call_args_list[1].args[0])
+    assert "DFA.SNAPSHOT_CHUNK_CHECKPOINT" in add_constraint_sql
+    assert 'PRIMARY KEY ("BUCKET_NAME", "OBJECT_NAME", "ETAG")' in add_constraint_sql
+
+
+@patch("dfa.adw.query_builders.base_query_builder.AdwConnection.commit")
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_chunk_checkpoint_read_and_register_are_scoped_by_object_version(mock_get_cursor, mock_commit):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (2, 20000)
+    mock_get_cursor.return_value = cursor
+
+    qb = AccessBundleStateUpdateQueryBuilder([])
+    qb._ensure_helper_table_exists = MagicMock()
+    qb._snapshot_chunk_checkpoint_table = MagicMock()
+    qb._snapshot_chunk_checkpoint_table.get_schema.return_value = "DFA"
+    qb._snapshot_chunk_checkpoint_table.get_table_name.return_value = "SNAPSHOT_CHUNK_CHECKPOINT"
+
+    assert qb.get_chunk_checkpoint("bucket", "object.jsonl", "etag-1") == (2, 20000)
+    qb._ensure_helper_table_exists.assert_called_once_with(qb._snapshot_chunk_checkpoint_table)
+    assert cursor.execute.call_args.args[1] == {
+        "BUCKET_NAME": "bucket",
+        "OBJECT_NAME": "object.jsonl",
+        "ETAG": "etag-1",
+    }
+
+    qb.register_chunk_checkpoint("bucket", "object.jsonl", "etag-1", 3, 30000)
+
+    merge_sql = _normalize_sql(cursor.execute.call_args.args[0]).upper()
+    assert "MERGE INTO DFA.SNAPSHOT_CHUNK_CHECKPOINT" in merge_sql
+    assert cursor.execute.call_args.args[1]["CHUNK_INDEX"] == 3
+    assert cursor.execute.call_args.args[1]["ROW_OFFSET"] == 30000
+    mock_commit.assert_called_once()
+
+
+@patch("dfa.adw.query_builders.base_query_builder.AdwConnection.rollback")
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_chunk_checkpoint_register_failure_is_non_blocking(mock_get_cursor, mock_rollback):
+    cursor = MagicMock()
+    cursor.execute.side_effect = RuntimeError("merge failed")
+    mock_get_cursor.return_value = cursor
+
+    qb = AccessBundleStateUpdateQueryBuilder([])
+    qb._ensure_helper_table_exists = MagicMock()
+    qb._snapshot_chunk_checkpoint_table = MagicMock()
+    qb._snapshot_chunk_checkpoint_table.get_schema.return_value = "DFA"
+    qb._snapshot_chunk_checkpoint_table.get_table_name.return_value = "SNAPSHOT_CHUNK_CHECKPOINT"
+
+    qb.register_chunk_checkpoint("bucket", "object.jsonl", "etag-1", 1, 10000)
+
+    mock_rollback.assert_called_once()
+
+
+@patch("dfa.adw.query_builders.base_query_builder.AdwConnection.commit")
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_chunk_checkpoint_register_and_clear_create_the_table_first(mock_get_cursor, mock_commit):
+    cursor = MagicMock()
+    mock_get_cursor.return_value = cursor
+    qb = AccessBundleStateUpdateQueryBuilder([])
+    qb._snapshot_chunk_checkpoint_table = MagicMock()
+    qb._snapshot_chunk_checkpoint_table.get_schema.return_value = "DFA"
+    qb._snapshot_chunk_checkpoint_table.get_table_name.return_value = "SNAPSHOT_CHUNK_CHECKPOINT"
+    calls = []
+    qb._ensure_helper_table_exists = MagicMock(side_effect=lambda table: calls.append("ensure"))
+    cursor.execute.side_effect = lambda sql, binds: calls.append(_normalize_sql(sql).split()[0].upper())
+
+    qb.register_chunk_checkpoint("bucket", "object.jsonl", "etag-1", 1, 10000)
+    qb.clear_chunk_checkpoints("bucket", "object.jsonl")
+
+    assert calls == ["ensure", "MERGE", "ensure", "DELETE"]
+    qb._ensure_helper_table_exists.assert_called_with(qb._snapshot_chunk_checkpoint_table)
+
+
+@patch("dfa.adw.connection.AdwConnection.get_cursor")
+def test_is_snapshot_batch_completed_looks_up_tracker_row(mock_get_cursor):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (1,)
+    mock_get_cursor.return_value = cursor
+
+    qb = AccessBundleStateUpdateQueryBuilder([])
+    qb._snapshot_batch_tracker_table = MagicMock()
+    qb._snapshot_batch_tracker_table.get_schema.return_value = "DFA"
+    qb._snapshot_batch_tracker_table.get_table_name.return_value = "SNAPSHOT_BATCH_TRACKER"
+
+    assert qb.is_snapshot_batch_completed("snapshot-1", "batch-1", "tenant-1", "svc-1")
+
+    query_sql = cursor.execute.call_args.args[0]
+    assert "BATCH_ID = :BATCH_ID" in query_sql
+    assert cursor.execute.call_args.args[1] == {
+        "ENTITY_TYPE": "ACCESS_BUNDLE",
+        "TENANCY_ID": "tenant-1",
+        "SERVICE_INSTANCE_ID": "svc-1",
+        "SNAPSHOT_ID": "snapshot-1",
+        "BATCH_ID": "batch-1",
+    }
+
+    cursor.execute.side_effect = oracledb.DatabaseError("ORA-00942: table or view does not exist")
+    assert not qb.is_snapshot_batch_completed("snapshot-1", "batch-1", "tenant-1", "svc-1")
@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from common.metrics.metrics import METRICS
+from dfa.adw.tables.resource import ResourceStateTable
+from dfa.etl.adaptive_batcher import ADAPTIVE_BATCHER, AdaptiveBatcher
+from dfa.etl.file_transformer import FileTransformer
+
+
+@pytest.fixture(autouse=True)
+def _adaptive_batching(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.setenv("DFA_ADAPTIVE_BATCH", "true")
+    monkeypatch.setenv("DFA_BATCH_MIN_SIZE", "1")
+    ADAPTIVE_BATCHER.reset()
+    METRICS.reset()
+    yield
+    ADAPTIVE_BATCHER.reset()
+    METRICS.reset()
+
+
+def _resource_rows(count, attributes_length=10):
+    return [{"id": f"resource-{index}", "attributes": "x" * attributes_length} for index in range(count)]
+
+
+def test_wider_rows_get_smaller_chunks_within_the_configured_bounds(monkeypatch):
+    monkeypatch.setenv("DFA_BATCH_TARGET_BYTES", "100000")
+    batcher = AdaptiveBatcher()
+    table = ResourceStateTable()
+
+    narrow = batcher.chunk_size(table, _resource_rows(5))
+    wide = batcher.chunk_size(table, _resource_rows(5, attributes_length=5000))
+
+    assert batcher.get_state(table.get_table_name()).bytes_per_row > 5000
+    assert 0 < wide < narrow <= 10000
+    monkeypatch.setenv("DFA_BATCH_SIZE", "50")
+    assert batcher.chunk_size(table, _resource_rows(5)) == 50
+    monkeypatch.setenv("DFA_BATCH_MIN_SIZE", "40")
+    assert batcher.chunk_size(table, _resource_rows(5, attributes_length=32767)) == 40
+
+
+def test_measured_latency_shrinks_and_regrows_chunks_across_invocations(monkeypatch):
+    monkeypatch.setenv("DFA_BATCH_TARGET_SECONDS", "1")
+    table = ResourceStateTable()
+    rows = _resource_rows(5)
+
+    first = ADAPTIVE_BATCHER.chunk_size(table, rows)
+    ADAPTIVE_BATCHER.record_load(table, 1000, 10.0)
+    assert ADAPTIVE_BATCHER.chunk_size(table, rows) == 100 < first
+
+    ADAPTIVE_BATCHER.record_load(table, 100, 0.01)
+    assert ADAPTIVE_BATCHER.chunk_size(table, rows) == 200
+
+    state = ADAPTIVE_BATCHER.get_state(table.get_table_name())
+    assert (state.rows_per_chunk, state.loaded_chunks) == (200, 2)
+    histograms = {histogram["name"]: histogram for histogram in METRICS.snapshot()["histograms"]}
+    assert histograms["batch_rows"]["tags"] == {"table": table.get_table_name()}
+    assert histograms["batch_rows"]["count"] == 2
+
+
+@patch("dfa.etl.file_transformer.AdwConnection.rollback_and_close")
+@patch("dfa.etl.file_transformer.BaseObjectStorage", autospec=True)
+@patch("dfa.etl.file_transformer.get_query_builder")
+def test_load_data_sizes_each_chunk_from_the_batcher(mock_get_query_builder, _storage, _rollback, monkeypatch):
+    monkeypatch.setenv("DFA_BATCH_TARGET_BYTES", "1000")
+    mock_query_builder = MagicMock()
+    mock_query_builder.table_manager = ResourceStateTable()
+    mock_query_builder.get_chunk_checkpoint.return_value = None
+    mock_get_query_builder.return_value = mock_query_builder
+    transformer = FileTransformer("ns", "bucket", "resource.jsonl")
+    transformer._event_object_type = "RESOURCE"
+    transformer._operation_type = "UPDATE"
+    transformer._prepared_events = _resource_rows(30, attributes_length=100)
+
+    transformer.load_data()
+
+    loaded_chunks = [call.args[2] for call in mock_get_query_builder.call_args_list if call.args[2] != []]
+    assert [row for chunk in loaded_chunks for row in chunk] == transformer._prepared_events
+    assert len(loaded_chunks) > 1
+    assert all(len(chunk) == len(loaded_chunks[0]) for chunk in loaded_chunks[:-1])
+    assert METRICS.snapshot()["histograms"][0]["count"] == len(loaded_chunks)
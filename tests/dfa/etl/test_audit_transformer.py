@@ -2,6 +2,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 from common.ocihelpers.stream import DataEnablementStream
@@ -15,6 +16,13 @@ class TestAuditTransformer(unittest.TestCase):
         self.mock_adw_manager = self.adw_patcher.start()
         self.addCleanup(self.adw_patcher.stop)
 
+        # Query builders are regular modules now, so patch the name they actually use.
+        self.query_builder_adw_patcher = patch(
+            "dfa.adw.query_builders.audit_events.AdwConnection", new=self.mock_adw_manager
+        )
+        self.query_builder_adw_patcher.start()
+        self.addCleanup(self.query_builder_adw_patcher.stop)
+
         self.patcher_stream = patch("dfa.etl.stream_transformer.DataEnablementStream", autospec=True)
         self.mock_stream = self.patcher_stream.start()
         self.addCleanup(self.patcher_stream.stop)
@@ -49,7 +57,7 @@ class TestAuditTransformer(unittest.TestCase):
         self.assertEqual(self.transformer._prepared_events[0]["operation_type"], "CREATE")
         self.assertEqual(
             self.transformer._prepared_events[0]["event_timestamp"],
-            "18-Aug-25 06:15:18.820311 PM",
+            datetime(2025, 8, 18, 18, 15, 18, 820311, tzinfo=timezone.utc),
         )
         self.assertEqual(
             self.transformer._prepared_events[0]["tenancy_id"],
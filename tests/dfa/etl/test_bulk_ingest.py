@@ -0,0 +1,101 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import json
+import os
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from dfa.etl.bulk_ingest import BulkFileIngest
+
+
+def _jsonl_object(row_count, extra_headers=None):
+    headers = {
+        "eventTime": "2025-08-15T17:38:23.645616585Z",
+        "eventTypeVersion": "1.0",
+        "operation": "CREATE",
+        "messageType": "RESOURCE",
+        "tenancyId": "tenant-1",
+        "serviceInstanceId": "svc-1",
+        "correlationId": "snapshot-1",
+    }
+    headers.update(extra_headers or {})
+    rows = [{"id": f"resource-{index}", "name": f"Resource {index}", "targetId": "t-1"} for index in range(row_count)]
+    content = "\n".join(json.dumps(row) for row in [{"headers": headers}, *rows])
+    return SimpleNamespace(data=SimpleNamespace(content=content.encode("utf-8")), headers={})
+
+
+class TestBulkFileIngest(unittest.TestCase):
+
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {"DFA_ADW_DFA_SCHEMA": "DFA"})
+        self.env_patcher.start()
+        self.addCleanup(self.env_patcher.stop)
+
+        self.objects = {
+            "snapshots/resource.snapshot-1.batch-1.jsonl": _jsonl_object(5),
+            "snapshots/resource.snapshot-1.batch-2.jsonl": _jsonl_object(3),
+            "snapshots/resource.snapshot-1.complete.jsonl": _jsonl_object(
+                0, {"status": "COMPLETED", "numOfBatches": "2"}
+            ),
+        }
+        listed_names = ["snapshots/README.txt", "snapshots/resource.snapshot-1.batch-3.jsonl", *self.objects]
+
+        listing_patcher = patch("dfa.etl.bulk_ingest.BaseObjectStorage")
+        mock_listing_storage = listing_patcher.start().return_value
+        self.addCleanup(listing_patcher.stop)
+        mock_listing_storage.get_objects_by_prefix_and_search_string.return_value = [
+            SimpleNamespace(name=name) for name in listed_names
+        ]
+
+        storage_patcher = patch("dfa.etl.file_transformer.BaseObjectStorage")
+        mock_storage = storage_patcher.start().return_value
+        self.addCleanup(storage_patcher.stop)
+        mock_storage.download.side_effect = self._download
+
+        query_builder_patcher = patch("dfa.etl.file_transformer.get_query_builder")
+        self.mock_get_query_builder = query_builder_patcher.start()
+        self.addCleanup(query_builder_patcher.stop)
+        self.calls = []
+        self.mock_query_builder = MagicMock()
+        self.mock_query_builder.is_snapshot_batch_completed.return_value = False
+        self.mock_query_builder.execute_sql_for_events.side_effect = lambda: self.calls.append("load")
+        self.mock_query_builder.register_snapshot_batch_completed.side_effect = lambda **kwargs: self.calls.append(
+            f"register:{kwargs['batch_id']}"
+        )
+        self.mock_query_builder.finalize_snapshot_cleanup_if_ready.side_effect = lambda **kwargs: self.calls.append(
+            "finalize"
+        )
+        self.mock_get_query_builder.return_value = self.mock_query_builder
+
+    def _download(self, namespace, bucket_name, object_name):
+        if object_name not in self.objects:
+            raise RuntimeError(f"object {object_name} not found")
+        return self.objects[object_name]
+
+    def test_run_loads_batches_then_finalizes_completion_marker(self):
+        report = BulkFileIngest("ns", "bucket", "snapshots/", download_workers=2, loader_connections=2).run()
+
+        summary = report.as_dict()
+        self.assertEqual(summary["objects_listed"], 4)
+        self.assertEqual(summary["objects_loaded"], 3)
+        self.assertEqual(summary["completion_markers"], 1)
+        self.assertEqual(summary["rows"], 8)
+        self.assertEqual(summary["objects_failed"], 1)
+        self.assertEqual(summary["failures"][0]["object_name"], "snapshots/resource.snapshot-1.batch-3.jsonl")
+        self.assertEqual(self.calls.count("load"), 2)
+        self.assertEqual(self.calls[-1], "finalize")
+        self.assertIn("register:resource.snapshot-1.batch-1", self.calls)
+        self.assertIn("register:resource.snapshot-1.batch-2", self.calls)
+
+    def test_run_skips_batches_already_completed(self):
+        self.mock_query_builder.is_snapshot_batch_completed.side_effect = (
+            lambda **kwargs: kwargs["batch_id"] == "resource.snapshot-1.batch-1"
+        )
+
+        report = BulkFileIngest("ns", "bucket", "snapshots/", download_workers=1, loader_connections=1).run()
+
+        self.assertEqual(report.objects_skipped, 1)
+        self.assertEqual(report.rows, 3)
+        self.assertNotIn("register:resource.snapshot-1.batch-1", self.calls)
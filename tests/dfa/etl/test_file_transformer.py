@@ -1,11 +1,16 @@
 # Copyright (c) 2025, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
 
+import gzip
+import io
 import json
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
-from dfa.etl.file_transformer import FileTransformer
+import oracledb
+
+from dfa.etl.file_transformer import FileTransformer, zstandard
 
 
 class TestFileTransformer(unittest.TestCase):
@@ -136,7 +141,7 @@ class TestFileTransformer(unittest.TestCase):
         mock_query_builder.register_snapshot_batch_completed.assert_called_once_with(
             snapshot_id="snapshot-1",
             batch_id="access_bundle.snapshot-1.batch-1",
-            event_timestamp="15-Aug-25 17:38:23.645616",
+            event_timestamp=datetime(2025, 8, 15, 17, 38, 23, 645616, tzinfo=timezone.utc),
             tenancy_id="tenant-1",
             service_instance_id="svc-1",
         )
@@ -387,6 +392,9 @@ class TestFileTransformer(unittest.TestCase):
         self.assertEqual(len(self.transformer._prepared_events), 2)
         self.assertEqual(self.transformer._prepared_events[0]["assignment_id"], "assignment-1")
         self.assertEqual(self.transformer._prepared_events[1]["assignment_id"], "assignment-2")
+        first_timestamp, second_timestamp = (row["event_timestamp"] for row in self.transformer._prepared_events)
+        self.assertEqual(first_timestamp, datetime(2026, 8, 3, 18, 0, tzinfo=timezone.utc))
+        self.assertIs(first_timestamp, second_timestamp)
 
     def test_permission_assignment_v2_jsonl_fixture_timestamps(self):
         content = self.read_file_content("tests/dfa/etl/test_data/file/permission_assignment_2.0.jsonl")
@@ -627,3 +635,246 @@ class TestFileTransformer(unittest.TestCase):
 
         self.transformer.load_data()
         self.mock_cursor.executemany.assert_called_once()
+
+    def _prepare_chunked_resource_load(self, mock_get_query_builder, row_count, checkpoint):
+        mock_query_builder = MagicMock()
+        mock_query_builder.get_chunk_checkpoint.return_value = checkpoint
+        mock_get_query_builder.return_value = mock_query_builder
+
+        self.transformer._object_name = "snapshots/resource.snapshot-1.batch-1.jsonl"
+        self.transformer._etag = "etag-1"
+        self.transformer._event_object_type = "RESOURCE"
+        self.transformer._operation_type = "UPDATE"
+        self.transformer._event_timestamp = "2025-08-15T17:38:23.645616585Z"
+        self.transformer._prepared_events = [{"id": f"resource-{index}"} for index in range(row_count)]
+        return mock_query_builder
+
+    def _loaded_chunks(self, mock_get_query_builder):
+        return [call.args[2] for call in mock_get_query_builder.call_args_list if call.args[2] != []]
+
+    @patch.dict("os.environ", {"DFA_BATCH_SIZE": "4"})
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_load_data_checkpoints_each_committed_chunk(self, mock_get_query_builder):
+        mock_query_builder = self._prepare_chunked_resource_load(mock_get_query_builder, 10, None)
+
+        self.transformer.load_data()
+
+        mock_query_builder.get_chunk_checkpoint.assert_called_once_with(
+            "test_bucket", "snapshots/resource.snapshot-1.batch-1.jsonl", "etag-1"
+        )
+        self.assertEqual(
+            [call.args[3:] for call in mock_query_builder.register_chunk_checkpoint.call_args_list],
+            [(1, 4), (2, 8)],
+        )
+        mock_query_builder.clear_chunk_checkpoints.assert_called_once_with(
+            "test_bucket", "snapshots/resource.snapshot-1.batch-1.jsonl"
+        )
+
+    @patch.dict("os.environ", {"DFA_BATCH_SIZE": "4"})
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_load_data_resumes_after_checkpointed_chunks(self, mock_get_query_builder):
+        mock_query_builder = self._prepare_chunked_resource_load(mock_get_query_builder, 10, (1, 4))
+
+        self.transformer.load_data()
+
+        loaded_chunks = self._loaded_chunks(mock_get_query_builder)
+        self.assertEqual(
+            [[row["id"] for row in chunk] for chunk in loaded_chunks],
+            [[f"resource-{index}" for index in range(4, 8)], ["resource-8", "resource-9"]],
+        )
+        self.assertEqual(mock_query_builder.execute_sql_for_events.call_count, 2)
+        mock_query_builder.register_chunk_checkpoint.assert_called_once_with(
+            "test_bucket", "snapshots/resource.snapshot-1.batch-1.jsonl", "etag-1", 2, 8
+        )
+        mock_query_builder.clear_chunk_checkpoints.assert_called_once()
+
+    @patch.dict("os.environ", {"DFA_BATCH_SIZE": "4"})
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_load_data_keeps_checkpoint_when_a_later_chunk_fails(self, mock_get_query_builder):
+        mock_query_builder = self._prepare_chunked_resource_load(mock_get_query_builder, 10, None)
+        mock_query_builder.execute_sql_for_events.side_effect = [None, RuntimeError("load failed")]
+
+        with self.assertRaisesRegex(RuntimeError, "load failed"):
+            self.transformer.load_data()
+
+        mock_query_builder.register_chunk_checkpoint.assert_called_once_with(
+            "test_bucket", "snapshots/resource.snapshot-1.batch-1.jsonl", "etag-1", 1, 4
+        )
+        mock_query_builder.clear_chunk_checkpoints.assert_not_called()
+        self.mock_adw_rollback_and_close.assert_called_once()
+
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_load_data_skips_checkpoints_for_single_chunk_or_disabled(self, mock_get_query_builder):
+        mock_query_builder = self._prepare_chunked_resource_load(mock_get_query_builder, 3, (1, 2))
+
+        self.transformer.load_data()
+
+        mock_query_builder.get_chunk_checkpoint.assert_not_called()
+        mock_query_builder.register_chunk_checkpoint.assert_not_called()
+        mock_query_builder.clear_chunk_checkpoints.assert_not_called()
+        self.assertEqual(len(self._loaded_chunks(mock_get_query_builder)[0]), 3)
+
+        with patch.dict("os.environ", {"DFA_BATCH_SIZE": "1", "DFA_CHUNK_CHECKPOINTS": "false"}):
+            self.transformer._checkpoint_lookup_done = False
+            self.transformer.load_data()
+
+        mock_query_builder.get_chunk_checkpoint.assert_not_called()
+        mock_query_builder.register_chunk_checkpoint.assert_not_called()
+        mock_query_builder.clear_chunk_checkpoints.assert_not_called()
+
+    def test_single_chunk_load_does_not_touch_a_missing_checkpoint_table(self):
+        def execute(sql, *args, **kwargs):
+            if "SNAPSHOT_CHUNK_CHECKPOINT" in sql:
+                raise oracledb.DatabaseError("ORA-00942: table or view does not exist")
+
+        self.mock_cursor.execute.side_effect = execute
+        self._prepare_chunked_resource_load(MagicMock(), 1, None)
+
+        self.transformer.load_data()
+
+        checkpoint_statements = [
+            call.args[0]
+            for call in self.mock_cursor.execute.call_args_list
+            if "SNAPSHOT_CHUNK_CHECKPOINT" in call.args[0]
+        ]
+        self.assertEqual(checkpoint_statements, [])
+        self.mock_cursor.executemany.assert_called_once()
+
+    def test_extract_data_records_object_etag(self):
+        mock_object = MagicMock()
+        mock_object.headers = {"etag": "etag-42"}
+        mock_object.data.content.decode.return_value = '{"headers": {"messageType": "RESOURCE"}}'
+        self.mock_storage.download.return_value = mock_object
+
+        self.transformer.extract_data()
+
+        self.assertEqual(self.transformer._etag, "etag-42")
+
+    def _set_header_probe(self, headers):
+        header_object = MagicMock()
+        header_object.data.content = (json.dumps({"headers": headers}) + '\n{"id": "partial').encode("utf-8")
+        self.mock_storage.download_range.return_value = header_object
+
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_extract_data_skips_already_completed_snapshot_batch(self, mock_get_query_builder):
+        mock_query_builder = MagicMock()
+        mock_query_builder.is_snapshot_batch_completed.return_value = True
+        mock_get_query_builder.return_value = mock_query_builder
+        self.transformer._object_name = "snapshots/resource.snapshot-1.batch-2.jsonl"
+        self._set_header_probe(
+            {
+                "messageType": "RESOURCE",
+                "operation": "CREATE",
+                "eventTypeVersion": "1.0",
+                "correlationId": "snapshot-1",
+                "tenancyId": "tenant-1",
+                "serviceInstanceId": "svc-1",
+            }
+        )
+        skipped_before = FileTransformer.skipped_redelivery_count
+
+        self.transformer.extract_data()
+        self.transformer.transform_data()
+        self.transformer.load_data()
+
+        self.mock_storage.download_range.assert_called_once_with(
+            "test_namespace", "test_bucket", "snapshots/resource.snapshot-1.batch-2.jsonl", 0, 65535
+        )
+        self.mock_storage.download.assert_not_called()
+        mock_query_builder.is_snapshot_batch_completed.assert_called_once_with(
+            snapshot_id="snapshot-1",
+            batch_id="resource.snapshot-1.batch-2",
+            tenancy_id="tenant-1",
+            service_instance_id="svc-1",
+        )
+        mock_query_builder.execute_sql_for_events.assert_not_called()
+        mock_query_builder.register_snapshot_batch_completed.assert_not_called()
+        self.assertEqual(FileTransformer.skipped_redelivery_count, skipped_before + 1)
+
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_extract_data_processes_batch_not_yet_completed(self, mock_get_query_builder):
+        mock_query_builder = MagicMock()
+        mock_query_builder.is_snapshot_batch_completed.return_value = False
+        mock_get_query_builder.return_value = mock_query_builder
+        content = self.read_file_content("tests/dfa/etl/test_data/file/access_bundle.jsonl")
+        self._set_header_probe(json.loads(content.splitlines()[0])["headers"])
+        mock_object = MagicMock()
+        mock_object.data.content.decode.return_value = content
+        self.mock_storage.download.return_value = mock_object
+
+        self.transformer.extract_data()
+
+        mock_query_builder.is_snapshot_batch_completed.assert_called_once()
+        self.mock_storage.download.assert_called_once()
+        self.assertEqual(len(self.transformer._raw_events), 5)
+
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_extract_data_does_not_probe_non_snapshot_files(self, mock_get_query_builder):
+        self._set_header_probe({"messageType": "RESOURCE", "operation": "UPDATE"})
+        self.mock_storage.download.return_value.data.content.decode.return_value = (
+            '{"headers": {"messageType": "RESOURCE", "operation": "UPDATE"}}'
+        )
+
+        self.transformer.extract_data()
+
+        mock_get_query_builder.assert_not_called()
+        self.mock_storage.download.assert_called_once()
+
+        self.mock_storage.download_range.reset_mock()
+        with patch.dict("os.environ", {"DFA_SKIP_COMPLETED_BATCHES": "false"}):
+            self.transformer.extract_data()
+        self.mock_storage.download_range.assert_not_called()
+
+    def _set_compressed_object(self, compressed_content):
+        mock_object = MagicMock()
+        mock_object.data.raw = io.BytesIO(compressed_content)
+        self.mock_storage.download.return_value = mock_object
+
+    def test_gzip_jsonl_is_streamed_with_header_semantics(self):
+        content = self.read_file_content("tests/dfa/etl/test_data/file/access_bundle.jsonl")
+        self.transformer._object_name = "snapshots/access_bundle.snapshot-1.batch-4.jsonl.gz"
+        self._set_compressed_object(gzip.compress(content.encode("utf-8")))
+
+        self.transformer.extract_data()
+
+        self.assertEqual(len(self.transformer._raw_events), 5)
+        self.assertEqual(self.transformer._event_object_type, "ACCESS_BUNDLE")
+        self.assertEqual(self.transformer._operation_type, "CREATE")
+        self.assertEqual(self.transformer._get_batch_id_for_batch(), "access_bundle.snapshot-1.batch-4")
+
+        self.transformer.transform_data()
+        self.assertEqual(len(self.transformer._prepared_events), 5)
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd_jsonl_is_streamed_with_header_semantics(self):
+        content = self.read_file_content("tests/dfa/etl/test_data/file/access_bundle.jsonl")
+        self.transformer._object_name = "snapshots/access_bundle.snapshot-1.batch-5.jsonl.zst"
+        self._set_compressed_object(zstandard.ZstdCompressor().compress(content.encode("utf-8")))
+
+        self.transformer.extract_data()
+
+        self.assertEqual(len(self.transformer._raw_events), 5)
+        self.assertEqual(self.transformer._event_object_type, "ACCESS_BUNDLE")
+        self.assertEqual(self.transformer._get_batch_id_for_batch(), "access_bundle.snapshot-1.batch-5")
+
+    @patch("dfa.etl.file_transformer.get_query_builder")
+    def test_header_probe_decompresses_partial_gzip_range(self, mock_get_query_builder):
+        mock_query_builder = MagicMock()
+        mock_query_builder.is_snapshot_batch_completed.return_value = True
+        mock_get_query_builder.return_value = mock_query_builder
+        self.transformer._object_name = "snapshots/resource.snapshot-1.batch-2.jsonl.gz"
+        headers = {"messageType": "RESOURCE", "operation": "CREATE", "eventTypeVersion": "1.0"}
+        rows = "\n".join(json.dumps({"id": f"resource-{index}", "pad": "x" * index}) for index in range(5000))
+        compressed = gzip.compress((json.dumps({"headers": headers}) + "\n" + rows).encode("utf-8"))
+        header_object = MagicMock()
+        header_object.data.content = compressed[:512]
+        self.mock_storage.download_range.return_value = header_object
+
+        self.transformer.extract_data()
+
+        mock_query_builder.is_snapshot_batch_completed.assert_called_once()
+        self.assertEqual(
+            mock_query_builder.is_snapshot_batch_completed.call_args.kwargs["batch_id"],
+            "resource.snapshot-1.batch-2",
+        )
+        self.mock_storage.download.assert_not_called()
@@ -0,0 +1,52 @@
+import json
+
+import oracledb
+import pytest
+
+from dfa.adw.query_builders.base_query_builder import BaseQueryBuilder
+from dfa.adw.tables.identity import IdentityStateTable
+from dfa.etl.transformers.identity import IdentityEventTransformer
+from dfa.etl.transformers.json_fragments import EMPTY_JSON_OBJECT, JsonFragmentCache
+
+
+@pytest.fixture(autouse=True)
+def _schema(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+
+
+def test_fragments_are_serialized_once_per_object():
+    fragments = JsonFragmentCache()
+    attributes = {"commonName": "user-1", "groups": ["a", "b"]}
+
+    first = fragments.dumps(attributes)
+    assert first == json.dumps(attributes)
+    assert fragments.dumps(attributes) is first
+    assert fragments.dumps(dict(attributes)) == first
+    assert fragments.dumps({}) is EMPTY_JSON_OBJECT
+
+
+@pytest.mark.parametrize("compact_rows", ["true", "false"])
+def test_target_identity_rows_share_fragments_and_are_sized_once(monkeypatch, compact_rows):
+    monkeypatch.setenv("DFA_COMPACT_ROWS", compact_rows)
+    raw_event = {
+        "globalIdentity": {
+            "id": "globalId.ICF.1",
+            "identity": {"userName": "user-1", "customAttributes": {"fullDN": "CN=user-1"}},
+            "targetIdentities": [
+                {"id": f"targetId.user.{index}", "identity": {"status": "ACTIVE"}} for index in range(3)
+            ]
+            + [{"id": "targetId.account.1", "identity": {"status": "ACTIVE"}}],
+        }
+    }
+
+    rows = IdentityEventTransformer("IDENTITY", "CREATE").transform_raw_event(raw_event)
+    input_sizes = BaseQueryBuilder().get_input_sizes_for_events(
+        IdentityStateTable().get_column_list_definition_for_table_ddl(), rows
+    )
+
+    assert len(rows) == 4
+    assert len({id(row["identity_attributes"]) for row in rows[:3]}) == 1
+    assert rows[3]["identity_attributes"] is EMPTY_JSON_OBJECT
+    assert input_sizes["IDENTITY_ATTRIBUTES"] == len(rows[0]["identity_attributes"])
+    assert input_sizes["TI_ID"] == len("targetId.account.1")
+    assert input_sizes["EVENT_TIMESTAMP"] == oracledb.DB_TYPE_TIMESTAMP_TZ
@@ -0,0 +1,115 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from common.metrics.metrics import METRICS
+from dfa.etl.file_transformer import FileTransformer
+from dfa.etl.memory_budget import MemoryBudget, RowSpill, get_memory_budget_bytes
+from dfa.etl.pipeline import FilePipeline
+
+
+@pytest.fixture(autouse=True)
+def _environment(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.setenv("DFA_BATCH_SIZE", "4")
+    monkeypatch.delenv("DFA_MEMORY_BUDGET_MB", raising=False)
+    monkeypatch.delenv("FN_MEMORY", raising=False)
+    METRICS.reset()
+    yield
+    METRICS.reset()
+
+
+@pytest.fixture
+def mock_get_query_builder():
+    with (
+        patch("dfa.etl.file_transformer.BaseObjectStorage", autospec=True) as mock_storage_class,
+        patch("dfa.etl.file_transformer.get_query_builder") as mock_get_query_builder,
+        patch("dfa.etl.file_transformer.AdwConnection.rollback_and_close"),
+    ):
+        headers = {
+            "eventTime": "2025-08-15T17:38:23.645616585Z",
+            "eventTypeVersion": "1.0",
+            "operation": "UPDATE",
+            "messageType": "RESOURCE",
+            "tenancyId": "tenant-1",
+            "serviceInstanceId": "svc-1",
+        }
+        rows = [{"id": f"resource-{index}", "name": "x" * 500} for index in range(12)]
+        content = "\n".join(json.dumps(row) for row in [{"headers": headers}, *rows])
+        mock_storage_class.return_value.download.return_value.data.content.decode.return_value = content
+        mock_get_query_builder.return_value.get_chunk_checkpoint.return_value = None
+        yield mock_get_query_builder
+
+
+def _loaded_ids(mock_get_query_builder):
+    chunks = [call.args[2] for call in mock_get_query_builder.call_args_list if call.args[2] != []]
+    return [[row["id"] for row in chunk] for chunk in chunks]
+
+
+def test_budget_comes_from_explicit_cap_or_function_memory(monkeypatch):
+    assert get_memory_budget_bytes() is None
+    assert not MemoryBudget().is_near_limit()
+
+    monkeypatch.setenv("FN_MEMORY", "512")
+    monkeypatch.setenv("DFA_MEMORY_BUDGET_FRACTION", "0.25")
+    assert get_memory_budget_bytes() == 128 * 1024 * 1024
+    monkeypatch.setenv("DFA_MEMORY_BUDGET_MB", "0.5")
+    assert get_memory_budget_bytes() == 512 * 1024
+
+    budget = MemoryBudget(limit_bytes=1000)
+    budget.set("raw_events", 500)
+    budget.add("prepared_events", 299)
+    assert not budget.is_near_limit()
+    budget.add("prepared_events", 1)
+    assert budget.is_near_limit()
+    budget.release("raw_events")
+    assert (budget.used_bytes(), budget.peak_bytes) == (300, 800)
+
+
+def test_row_spill_round_trips_segments_in_order():
+    spill = RowSpill()
+    try:
+        spill.append([{"id": 1, "name": "a" * 1000}])
+        spill.append([{"id": 2, "name": None}, {"id": 3, "name": "c"}])
+
+        assert len(spill) == 3
+        assert spill.bytes_written < 1000
+        assert list(spill.iter_segments()) == [
+            [{"id": 1, "name": "a" * 1000}],
+            [{"id": 2, "name": None}, {"id": 3, "name": "c"}],
+        ]
+        assert len(list(spill.iter_segments())) == 2
+    finally:
+        spill.close()
+
+
+def test_transform_spills_prepared_rows_and_load_reads_them_back(monkeypatch, mock_get_query_builder):
+    monkeypatch.setenv("DFA_MEMORY_BUDGET_MB", "0.001")
+    transformer = FileTransformer("ns", "bucket", "resource.jsonl")
+
+    with patch("dfa.etl.file_transformer.MEMORY_CHECK_ROWS", 5):
+        transformer.extract_data()
+        transformer.transform_data()
+
+    assert transformer.get_prepared_row_count() == 12
+    assert len(transformer.get_prepared_events()) < 12
+    assert METRICS.counter_value("rows_spilled") == 12 - len(transformer.get_prepared_events())
+
+    transformer.load_data()
+
+    loaded_ids = _loaded_ids(mock_get_query_builder)
+    assert [row_id for chunk in loaded_ids for row_id in chunk] == [f"resource-{index}" for index in range(12)]
+    assert max(len(chunk) for chunk in loaded_ids) == 4
+
+
+def test_pipeline_flushes_partial_chunks_when_the_budget_is_nearly_used(monkeypatch, mock_get_query_builder):
+    monkeypatch.setenv("DFA_MEMORY_BUDGET_MB", "0.001")
+    transformer = FileTransformer("ns", "bucket", "resource.jsonl")
+
+    report = FilePipeline(transformer, raw_chunk_size=3).run().as_dict()
+
+    loaded_ids = _loaded_ids(mock_get_query_builder)
+    assert [len(chunk) for chunk in loaded_ids] == [3, 3, 3, 3]
+    assert report["early_flushes"] == 4
+    assert report["stages"]["load"]["rows"] == 12
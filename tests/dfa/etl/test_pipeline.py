@@ -0,0 +1,193 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import asyncio
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from dfa.etl.file_transformer import FileTransformer
+from dfa.etl.pipeline import (
+    PIPELINE_MODE_ASYNCIO,
+    PIPELINE_MODE_THREAD,
+    FilePipeline,
+    get_pipeline_mode,
+)
+
+
+def _resource_rows(count):
+    return [
+        {
+            "id": f"resource-{index}",
+            "name": f"Resource {index}",
+            "targetId": "target-1",
+        }
+        for index in range(count)
+    ]
+
+
+def _jsonl_content(rows, operation="CREATE", extra_headers=None):
+    headers = {
+        "eventTime": "2025-08-15T17:38:23.645616585Z",
+        "eventTypeVersion": "1.0",
+        "operation": operation,
+        "messageType": "RESOURCE",
+        "tenancyId": "tenant-1",
+        "serviceInstanceId": "svc-1",
+        "correlationId": "snapshot-1",
+    }
+    headers.update(extra_headers or {})
+    return "\n".join(json.dumps(row) for row in [{"headers": headers}, *rows])
+
+
+class TestFilePipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {"DFA_ADW_DFA_SCHEMA": "DFA", "DFA_BATCH_SIZE": "4"})
+        self.env_patcher.start()
+        self.addCleanup(self.env_patcher.stop)
+
+        self.rollback_and_close_patcher = patch("dfa.etl.pipeline.AdwConnection.rollback_and_close")
+        self.mock_rollback_and_close = self.rollback_and_close_patcher.start()
+        self.addCleanup(self.rollback_and_close_patcher.stop)
+
+        self.storage_patcher = patch("dfa.etl.file_transformer.BaseObjectStorage", autospec=True)
+        self.mock_storage = self.storage_patcher.start().return_value
+        self.addCleanup(self.storage_patcher.stop)
+
+        self.query_builder_patcher = patch("dfa.etl.file_transformer.get_query_builder")
+        self.mock_get_query_builder = self.query_builder_patcher.start()
+        self.addCleanup(self.query_builder_patcher.stop)
+        self.mock_query_builder = MagicMock()
+        self.mock_get_query_builder.return_value = self.mock_query_builder
+
+        self.transformer = FileTransformer("ns", "bucket", "snapshots/resource.snapshot-1.batch-1.jsonl")
+
+    def _set_object_content(self, content):
+        mock_object = MagicMock()
+        mock_object.data.content.decode.return_value = content
+        self.mock_storage.download.return_value = mock_object
+
+    def _loaded_chunks(self):
+        return [
+            call.args[2]
+            for call in self.mock_get_query_builder.call_args_list
+            if call.args[2] != []  # snapshot query builders are created with no events
+        ]
+
+    def _assert_pipeline_matches_sequential(self, mode):
+        self._set_object_content(_jsonl_content(_resource_rows(10)))
+
+        report = FilePipeline(self.transformer, mode=mode, raw_chunk_size=3).run()
+
+        loaded_chunks = self._loaded_chunks()
+        self.assertEqual([len(chunk) for chunk in loaded_chunks], [4, 4, 2])
+        self.assertEqual(
+            [row["id"] for chunk in loaded_chunks for row in chunk],
+            [f"resource-{index}" for index in range(10)],
+        )
+        self.assertEqual(self.mock_query_builder.execute_sql_for_events.call_count, 3)
+        self.mock_query_builder.register_snapshot_batch_completed.assert_called_once_with(
+            snapshot_id="snapshot-1",
+            batch_id="resource.snapshot-1.batch-1",
+            event_timestamp=datetime(2025, 8, 15, 17, 38, 23, 645616, tzinfo=timezone.utc),
+            tenancy_id="tenant-1",
+            service_instance_id="svc-1",
+        )
+
+        summary = report.as_dict()
+        self.assertEqual(summary["mode"], mode)
+        self.assertEqual(summary["stages"]["extract"]["rows"], 10)
+        self.assertEqual(summary["stages"]["extract"]["items"], 4)
+        self.assertEqual(summary["stages"]["transform"]["rows"], 10)
+        self.assertEqual(summary["stages"]["load"]["rows"], 10)
+        self.assertEqual(summary["stages"]["load"]["items"], 3)
+        self.assertGreaterEqual(summary["queues"]["raw"]["max_depth"], 1)
+        self.assertLessEqual(summary["queues"]["prepared"]["max_depth"], summary["queues"]["prepared"]["maxsize"])
+        self.assertEqual(self.transformer.get_prepared_events(), [])
+
+    def test_thread_pipeline_loads_same_chunks_as_sequential_load(self):
+        self._assert_pipeline_matches_sequential(PIPELINE_MODE_THREAD)
+
+    def test_asyncio_pipeline_loads_same_chunks_as_sequential_load(self):
+        self._assert_pipeline_matches_sequential(PIPELINE_MODE_ASYNCIO)
+
+    def test_pipeline_does_not_checkpoint_the_final_chunk(self):
+        for mode in (PIPELINE_MODE_THREAD, PIPELINE_MODE_ASYNCIO):
+            with self.subTest(mode=mode):
+                self.mock_query_builder.reset_mock()
+                self.mock_query_builder.get_chunk_checkpoint.return_value = None
+                self._set_object_content(_jsonl_content(_resource_rows(10)))
+                self.mock_storage.download.return_value.headers = {"etag": "etag-1"}
+                transformer = FileTransformer("ns", "bucket", "snapshots/resource.snapshot-1.batch-1.jsonl")
+
+                FilePipeline(transformer, mode=mode, raw_chunk_size=3).run()
+
+                self.assertEqual(
+                    [call.args[3:] for call in self.mock_query_builder.register_chunk_checkpoint.call_args_list],
+                    [(1, 4), (2, 8)],
+                )
+                self.mock_query_builder.clear_chunk_checkpoints.assert_called_once()
+
+    def test_asyncio_pipeline_runs_inside_an_active_event_loop(self):
+        self._set_object_content(_jsonl_content(_resource_rows(5)))
+
+        async def invoke():
+            return FilePipeline(self.transformer, mode=PIPELINE_MODE_ASYNCIO, raw_chunk_size=2).run()
+
+        report = asyncio.run(invoke())
+
+        self.assertEqual(report.as_dict()["stages"]["load"]["rows"], 5)
+
+    def test_pipeline_preserves_day0_export_labels(self):
+        self._set_object_content(_jsonl_content(_resource_rows(3), extra_headers={"isDay0": True}))
+
+        FilePipeline(self.transformer, raw_chunk_size=2).run()
+
+        loaded_rows = [row for chunk in self._loaded_chunks() for row in chunk]
+        self.assertEqual(len(loaded_rows), 3)
+        self.assertTrue(all(row["operation_type"] == "EXPORT" for row in loaded_rows))
+
+    def test_pipeline_finalizes_snapshot_for_completion_marker(self):
+        self._set_object_content(_jsonl_content([], extra_headers={"status": "COMPLETED", "numOfBatches": "3"}))
+
+        FilePipeline(self.transformer).run()
+
+        self.mock_query_builder.execute_sql_for_events.assert_not_called()
+        self.mock_query_builder.register_snapshot_batch_completed.assert_not_called()
+        self.mock_query_builder.finalize_snapshot_cleanup_if_ready.assert_called_once_with(
+            snapshot_id="snapshot-1",
+            num_of_batches=3,
+            tenancy_id="tenant-1",
+            service_instance_id="svc-1",
+        )
+
+    def test_pipeline_load_failure_stops_stages_and_skips_snapshot_registration(self):
+        self._set_object_content(_jsonl_content(_resource_rows(40)))
+        self.mock_query_builder.execute_sql_for_events.side_effect = RuntimeError("load failed")
+
+        for mode in (PIPELINE_MODE_THREAD, PIPELINE_MODE_ASYNCIO):
+            with self.subTest(mode=mode):
+                self.mock_rollback_and_close.reset_mock()
+                with self.assertRaisesRegex(RuntimeError, "load failed"):
+                    FilePipeline(self.transformer, mode=mode, raw_chunk_size=2, queue_size=1).run()
+
+                self.mock_rollback_and_close.assert_called()
+                self.mock_query_builder.register_snapshot_batch_completed.assert_not_called()
+
+    def test_get_pipeline_mode_reads_environment(self):
+        for value, expected in (
+            ("", None),
+            ("off", None),
+            ("THREAD", PIPELINE_MODE_THREAD),
+            ("asyncio", PIPELINE_MODE_ASYNCIO),
+            ("bogus", None),
+        ):
+            with self.subTest(value=value), patch.dict(os.environ, {"DFA_PIPELINE_MODE": value}):
+                self.assertEqual(get_pipeline_mode(), expected)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FilePipeline(self.transformer, mode="processes")
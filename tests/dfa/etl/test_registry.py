@@ -0,0 +1,107 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from dfa.adw.query_builders.base_query_builder import _resolve_query_builder_class, get_query_builder
+from dfa.adw.query_builders.registry import QUERY_BUILDER_REGISTRY
+from dfa.etl.abstract_transformer import AbstractTransformer
+from dfa.etl.transformers.registry import TRANSFORMER_REGISTRY
+from dfa.registry import ENTITY_MODULES, LazyClassRegistry
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
+# Generous enough for a loaded CI runner; the file-scanning resolver paid this per entity.
+COLD_START_IMPORT_BUDGET_SECONDS = 3.0
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_resolves_registered_classes_from_sys_modules(self):
+        from dfa.adw.query_builders import resource as resource_query_builders
+        from dfa.etl.transformers import resource as resource_transformers
+
+        self.assertIs(
+            AbstractTransformer._resolve_transformer_class("RESOURCE", "CREATE"),
+            resource_transformers.ResourceCreateEventTransformer,
+        )
+        self.assertIs(
+            _resolve_query_builder_class("RESOURCE", "DELETE", True),
+            resource_query_builders.ResourceTimeSeriesDeleteQueryBuilder,
+        )
+        self.assertIs(
+            _resolve_query_builder_class("RESOURCE", "UPDATE", False),
+            resource_query_builders.ResourceStateUpdateQueryBuilder,
+        )
+
+    def test_audit_events_ignore_timeseries_flag(self):
+        self.assertIs(
+            _resolve_query_builder_class("AUDIT_EVENTS", "CREATE", True),
+            _resolve_query_builder_class("AUDIT_EVENTS", "CREATE", False),
+        )
+
+    def test_every_entity_registers_each_operation(self):
+        for event_object_type in ENTITY_MODULES:
+            operations = ("CREATE",) if event_object_type == "AUDIT_EVENTS" else ("CREATE", "UPDATE", "DELETE")
+            for operation in operations:
+                with self.subTest(event_object_type=event_object_type, operation=operation):
+                    self.assertIsNotNone(TRANSFORMER_REGISTRY.resolve(event_object_type, operation))
+                    self.assertIsNotNone(QUERY_BUILDER_REGISTRY.resolve(event_object_type, operation, False))
+
+    def test_unknown_keys_resolve_to_none(self):
+        self.assertIsNone(AbstractTransformer._resolve_transformer_class("POLICY_UTILS", "CREATE"))
+        self.assertIsNone(AbstractTransformer._resolve_transformer_class("RESOURCE", "UPSERT"))
+        self.assertIsNone(get_query_builder("NOT_AN_ENTITY", "CREATE", []))
+
+    def test_conflicting_registration_is_rejected(self):
+        registry = LazyClassRegistry("dfa.etl.transformers", entity_modules={})
+
+        @registry.register("thing", "CREATE")
+        class First:
+            pass
+
+        with self.assertRaises(ValueError):
+
+            @registry.register("THING", "CREATE")
+            class Second:
+                pass
+
+        self.assertIs(registry.resolve("THING", "CREATE"), First)
+        self.assertEqual(registry.registered_keys(), [("THING", "CREATE")])
+
+    def test_cold_start_resolution_stays_within_import_budget(self):
+        probe = """
+import json, sys
+from time import perf_counter
+started = perf_counter()
+from dfa.adw.query_builders.base_query_builder import get_query_builder
+from dfa.etl.abstract_transformer import AbstractTransformer
+AbstractTransformer._resolve_transformer_class("RESOURCE", "CREATE")
+get_query_builder("RESOURCE", "CREATE", [])
+print(json.dumps({
+    "seconds": perf_counter() - started,
+    "transformer_modules": sorted(m for m in sys.modules if m.startswith("dfa.etl.transformers.")),
+}))
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            env={**os.environ, "PYTHONPATH": os.path.abspath(SRC_DIR)},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.assertLess(report["seconds"], COLD_START_IMPORT_BUDGET_SECONDS)
+        # Only the requested entity is imported.
+        self.assertEqual(
+            report["transformer_modules"],
+            [
+                "dfa.etl.transformers.base_event_transformer",
+                "dfa.etl.transformers.registry",
+                "dfa.etl.transformers.resource",
+            ],
+        )
@@ -4,6 +4,7 @@
 import base64
 import json
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 from common.ocihelpers.stream import DataEnablementStream
@@ -65,6 +66,21 @@ class TestStreamTransformer(unittest.TestCase):
         self.transformer._append_prepared_event(event2)
         self.assertEqual(len(self.transformer._prepared_events), 2)
 
+    def test_consume_stream_transforms_and_loads_each_batch(self):
+        messages = {"TYPE1": {"INSERT": [{}]}}
+        self.transformer.transform_messages = MagicMock()
+        self.transformer.load_data = MagicMock()
+        self.transformer.get_prepared_events = MagicMock(return_value=[{}, {}])
+        self.transformer._stream_manager.consume.side_effect = lambda process_batch, max_batches: process_batch(
+            messages
+        )
+
+        self.assertEqual(self.transformer.consume_stream(max_batches=2), 2)
+
+        self.transformer._stream_manager.consume.assert_called_once()
+        self.transformer.transform_messages.assert_called_once_with(messages)
+        self.transformer.load_data.assert_called_once()
+
     def test_transform_messages_calls(self):
         messages = {"TYPE1": {"INSERT": [{}]}}
         self.transformer._set_raw_event_data = MagicMock()
@@ -575,7 +591,7 @@ class TestStreamTransformer(unittest.TestCase):
         self.assertEqual(self.transformer._prepared_events[0]["operation_type"], "UPDATE")
         self.assertEqual(
             self.transformer._prepared_events[0]["event_timestamp"],
-            "18-Aug-25 06:15:19.032641 PM",
+            datetime(2025, 8, 18, 18, 15, 19, 32641, tzinfo=timezone.utc),
         )
         self.assertEqual(
             self.transformer._prepared_events[0]["tenancy_id"],
@@ -603,7 +619,7 @@ class TestStreamTransformer(unittest.TestCase):
         )
         self.assertEqual(
             self.transformer._prepared_events[0]["event_timestamp"],
-            "25-Aug-25 08:47:33.535442 PM",
+            datetime(2025, 8, 25, 20, 47, 33, 535442, tzinfo=timezone.utc),
         )
         self.assertEqual(
             self.transformer._prepared_events[0]["tenancy_id"],
@@ -691,7 +707,7 @@ class TestStreamTransformer(unittest.TestCase):
         self.assertEqual(self.transformer._prepared_events[0]["operation_type"], "CREATE")
         self.assertEqual(
             self.transformer._prepared_events[0]["event_timestamp"],
-            "29-Jan-26 07:00:02.145097 PM",
+            datetime(2026, 1, 29, 19, 0, 2, 145097, tzinfo=timezone.utc),
         )
         self.assertEqual(
             self.transformer._prepared_events[0]["tenancy_id"],
@@ -717,7 +733,7 @@ class TestStreamTransformer(unittest.TestCase):
         self.assertEqual(self.transformer._prepared_events[3]["operation_type"], "CREATE")
         self.assertEqual(
             self.transformer._prepared_events[3]["event_timestamp"],
-            "29-Jan-26 07:00:02.145097 PM",
+            datetime(2026, 1, 29, 19, 0, 2, 145097, tzinfo=timezone.utc),
         )
         self.assertEqual(
             self.transformer._prepared_events[3]["tenancy_id"],
@@ -0,0 +1,241 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import json
+import os
+import signal
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from dfa.worker.runner import WorkerPool
+from dfa.worker.sources import (
+    DirectoryWorkSource,
+    ObjectStorageWorkSource,
+    QueueFileWorkSource,
+    WorkItem,
+)
+from dfa.worker.tasks import (
+    WORK_KIND_AUDIT,
+    WORK_KIND_FILE,
+    WORK_KIND_FILE_TO_TS,
+    WORK_KIND_STREAM,
+    WORK_KIND_STREAM_CONSUME,
+    build_file_event_body,
+    run_work_item,
+)
+
+
+def _fake_run_item(kind, body):
+    if body == "boom":
+        raise RuntimeError("load failed")
+    if body == "crash":
+        os.kill(os.getpid(), signal.SIGKILL)
+    return len(body)
+
+
+def _write_item(path, kind, body):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"kind": kind, "body": body}, f)
+
+
+class TestDirectoryWorkSource(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = self.temp_dir.name
+
+    def test_claims_items_and_moves_them_when_finished(self):
+        _write_item(os.path.join(self.path, "a.json"), WORK_KIND_STREAM, ["m1"])
+        _write_item(os.path.join(self.path, "b.json"), WORK_KIND_AUDIT, ["m2"])
+        with open(os.path.join(self.path, "c.json"), "w", encoding="utf-8") as f:
+            f.write("not json")
+        source = DirectoryWorkSource(self.path)
+
+        items = source.claim(10)
+
+        self.assertEqual([(item.item_id, item.kind) for item in items], [("a.json", "stream"), ("b.json", "audit")])
+        self.assertEqual(source.claim(10), [])
+        self.assertTrue(os.path.exists(os.path.join(self.path, "failed", "c.json")))
+
+        source.complete(items[0])
+        source.fail(items[1], "RuntimeError: load failed")
+
+        self.assertTrue(os.path.exists(os.path.join(self.path, "done", "a.json")))
+        self.assertTrue(os.path.exists(os.path.join(self.path, "failed", "b.json")))
+        self.assertEqual(sorted(os.listdir(self.path)), ["done", "failed"])
+
+
+class TestQueueFileWorkSource(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = os.path.join(self.temp_dir.name, "work.jsonl")
+
+    def _append(self, text):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_persists_oldest_unfinished_offset_and_replays_after_restart(self):
+        self._append("".join(json.dumps({"kind": "stream", "body": [index]}) + "\n" for index in range(3)))
+        self._append('{"kind": "stream", "bo')  # still being written
+        source = QueueFileWorkSource(self.path)
+
+        items = source.claim(10)
+        self.assertEqual([item.body for item in items], [[0], [1], [2]])
+
+        source.complete(items[1])
+        source.complete(items[2])
+
+        restarted = QueueFileWorkSource(self.path)
+        self.assertEqual([item.body for item in restarted.claim(10)], [[0], [1], [2]])
+
+        source.complete(items[0])
+        self._append('dy": [3]}\n')
+        restarted = QueueFileWorkSource(self.path)
+        self.assertEqual([item.body for item in restarted.claim(10)], [[3]])
+
+    def test_failed_and_unreadable_lines_go_to_failed_file(self):
+        self._append('{"kind": "bogus", "body": 1}\n' + json.dumps({"kind": "audit", "body": ["m"]}) + "\n")
+        source = QueueFileWorkSource(self.path)
+
+        items = source.claim(10)
+        source.fail(items[0], "RuntimeError: load failed")
+
+        with open(f"{self.path}.failed", "r", encoding="utf-8") as f:
+            failed_lines = [json.loads(line) for line in f]
+        self.assertEqual(failed_lines[0]["kind"], "bogus")
+        self.assertEqual(failed_lines[1], {"kind": "audit", "body": ["m"], "error": "RuntimeError: load failed"})
+        self.assertEqual(QueueFileWorkSource(self.path).claim(10), [])
+
+
+class TestObjectStorageWorkSource(unittest.TestCase):
+
+    @patch("dfa.worker.sources.BaseObjectStorage", autospec=True)
+    def test_hands_out_each_new_object_once(self, mock_storage_class):
+        mock_storage = mock_storage_class.return_value
+        mock_storage.get_objects_by_prefix_and_search_string.side_effect = [
+            [SimpleNamespace(name="p/b.jsonl"), SimpleNamespace(name="p/a.jsonl.gz"), SimpleNamespace(name="p/x.txt")],
+            [SimpleNamespace(name="p/a.jsonl.gz"), SimpleNamespace(name="p/c.jsonl")],
+        ]
+        source = ObjectStorageWorkSource("ns", "bucket", "p/", kind=WORK_KIND_FILE_TO_TS)
+
+        first = source.claim(1) + source.claim(1)
+        second = source.claim(10)
+
+        self.assertEqual([item.item_id for item in first], ["p/a.jsonl.gz", "p/b.jsonl"])
+        self.assertEqual([item.item_id for item in second], ["p/c.jsonl"])
+        self.assertEqual(second[0].kind, WORK_KIND_FILE_TO_TS)
+        self.assertEqual(second[0].body, build_file_event_body("ns", "bucket", "p/c.jsonl"))
+
+
+class TestRunWorkItem(unittest.TestCase):
+
+    @patch("dfa.worker.tasks.get_pipeline_mode", return_value=None)
+    @patch("dfa.worker.tasks.FileTransformer")
+    def test_file_item_runs_file_transformer(self, mock_transformer_class, _):
+        mock_transformer_class.return_value.get_prepared_row_count.return_value = 2
+
+        rows = run_work_item(WORK_KIND_FILE_TO_TS, build_file_event_body("ns", "bucket", "a.jsonl"))
+
+        self.assertEqual(rows, 2)
+        mock_transformer_class.assert_called_once_with("ns", "bucket", "a.jsonl", is_timeseries=True)
+        mock_transformer_class.return_value.load_data.assert_called_once()
+
+    @patch("dfa.worker.tasks.DataEnablementStream")
+    @patch("dfa.worker.tasks.AuditTransformer")
+    def test_audit_item_decodes_and_loads_messages(self, mock_transformer_class, mock_stream):
+        mock_stream.decode_connector_hub_source_stream_messages.return_value = ["decoded"]
+        mock_stream.sort_connector_hub_source_stream_messages.return_value = ["sorted"]
+        mock_transformer_class.return_value.get_prepared_events.return_value = [{}]
+
+        self.assertEqual(run_work_item(WORK_KIND_AUDIT, ["raw"]), 1)
+
+        mock_transformer_class.return_value.transform_messages.assert_called_once_with(["sorted"])
+        mock_transformer_class.return_value.load_data.assert_called_once()
+
+    @patch("dfa.worker.tasks.StreamTransformer")
+    def test_stream_consume_item_pulls_from_the_stream(self, mock_transformer_class):
+        mock_transformer_class.return_value.consume_stream.return_value = 7
+
+        self.assertEqual(run_work_item(WORK_KIND_STREAM_CONSUME, {"isTimeseries": True, "maxBatches": 3}), 7)
+
+        mock_transformer_class.assert_called_once_with(is_timeseries=True)
+        mock_transformer_class.return_value.consume_stream.assert_called_once_with(3)
+
+        with self.assertRaisesRegex(ValueError, "maxBatches"):
+            run_work_item(WORK_KIND_STREAM_CONSUME, {"maxBatches": 0})
+
+    def test_unknown_kind_is_rejected(self):
+        with self.assertRaises(ValueError):
+            run_work_item("bogus", {})
+
+        with self.assertRaisesRegex(Exception, "no object name"):
+            run_work_item(WORK_KIND_FILE, {"data": {}})
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def test_processes_items_until_idle_and_reports_per_worker_stats(self):
+        source = MagicMock()
+        source.claim.side_effect = [
+            [WorkItem("a", WORK_KIND_STREAM, [1, 2]), WorkItem("b", WORK_KIND_STREAM, "boom")],
+            [WorkItem("c", WORK_KIND_AUDIT, [3])],
+        ] + [[]] * 100
+
+        summary = WorkerPool(
+            source,
+            processes=2,
+            poll_interval=0,
+            exit_when_idle=True,
+            start_method="fork",
+            run_item=_fake_run_item,
+        ).run()
+
+        self.assertEqual(summary["items"], 3)
+        self.assertEqual(summary["failures"], 1)
+        self.assertEqual(summary["rows"], 3)
+        self.assertEqual(sum(worker["items"] for worker in summary["workers"]), 3)
+        self.assertEqual(sorted(call.args[0].item_id for call in source.complete.call_args_list), ["a", "c"])
+        source.fail.assert_called_once()
+        self.assertEqual(source.fail.call_args.args[1], "RuntimeError: load failed")
+
+    def test_killed_worker_fails_its_item_and_is_replaced(self):
+        source = MagicMock()
+        source.claim.side_effect = [
+            [WorkItem("a", WORK_KIND_STREAM, "crash")],
+            [WorkItem("b", WORK_KIND_STREAM, [1, 2])],
+        ] + [[]] * 100
+
+        summary = WorkerPool(
+            source,
+            processes=1,
+            poll_interval=0,
+            exit_when_idle=True,
+            start_method="fork",
+            run_item=_fake_run_item,
+        ).run()
+
+        source.fail.assert_called_once()
+        self.assertEqual(source.fail.call_args.args[0].item_id, "a")
+        self.assertIn("exited with code -9", source.fail.call_args.args[1])
+        source.complete.assert_called_once()
+        self.assertEqual(source.complete.call_args.args[0].item_id, "b")
+        self.assertEqual(summary["rows"], 2)
+
+    def test_drain_stops_claiming_new_work(self):
+        source = MagicMock()
+        pool = WorkerPool(source, processes=1, poll_interval=0, start_method="fork", run_item=_fake_run_item)
+        pool.request_drain()
+
+        summary = pool.run()
+
+        source.claim.assert_not_called()
+        self.assertEqual(summary["items"], 0)
+
+    def test_worker_processes_default_from_environment(self):
+        with patch.dict(os.environ, {"DFA_WORKER_PROCESSES": "3"}):
+            self.assertEqual(WorkerPool(MagicMock()).processes, 3)
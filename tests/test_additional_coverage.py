@@ -2,6 +2,7 @@
 # These tests avoid external services by using simple fakes/mocks.
 
 import os
+import sys
 import types
 from types import SimpleNamespace
 from typing import Any, Dict
@@ -49,6 +50,58 @@ def test_logger_respects_explicit_oci_sdk_log_level(monkeypatch):
     assert logging.getLogger("oci.circuit_breaker.circuit_breaker").level == logging.ERROR
 
 
+def test_repeated_messages_are_limited_and_summarized_on_flush(monkeypatch):
+    import logging
+
+    from common.logger.logger import REPEATED_MESSAGES, flush_logs, limit_repeated_messages
+
+    monkeypatch.setenv("DFA_LOG_REPEAT_LIMIT", "3")
+    REPEATED_MESSAGES.drain_dropped()
+    loggers = [Logger("unit.repeated").get_logger(), Logger("dfa.logger").get_logger()]
+    records = []
+    capture = logging.Handler()
+    capture.emit = records.append
+    for logger in loggers:
+        logger.addHandler(capture)
+    limit_repeated_messages("unit repeated %s")
+    try:
+        for index in range(15):
+            loggers[0].warning("unit repeated %s", index)
+            loggers[0].warning("unit unique %s", index)
+        flush_logs()
+    finally:
+        for logger in loggers:
+            logger.removeHandler(capture)
+
+    assert [record.args[0] for record in records if record.msg == "unit repeated %s"] == [0, 1, 2]
+    assert len([record for record in records if record.msg == "unit unique %s"]) == 15
+    assert records[-1].getMessage() == "Suppressed 12 repeated log record(s): 'unit repeated %s'"
+
+
+def test_async_log_writer_flushes_queued_records_and_counts_drops(capsys):
+    import logging
+    import queue
+
+    from common.logger.logger import _AsyncLogWriter, _BoundedQueueHandler
+
+    writer = _AsyncLogWriter()
+    logger = logging.getLogger("unit.async")
+    logger.propagate = False
+    logger.addHandler(writer.get_handler())
+    try:
+        logger.warning("queued %d", 1)
+        assert writer.flush(1.0)
+    finally:
+        logger.removeHandler(writer.handler)
+        writer.stop()
+    assert "unit.async - WARNING - queued 1" in capsys.readouterr().err
+
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=1))
+    for index in range(3):
+        handler.emit(logging.makeLogRecord({"msg": "record %d", "args": (index,)}))
+    assert handler.dropped == 2
+
+
 def test_vault_clients_use_retry_strategy(monkeypatch):
     import common.ocihelpers.vault as vault_mod
 
@@ -283,7 +336,7 @@ def test_dispatcher_routes_to_known_handler(monkeypatch):
 
     # Monkeypatch handlers and response
     monkeypatch.setattr(dispatcher, "response", types.SimpleNamespace(Response=DummyResponse))
-    monkeypatch.setattr(dispatcher, "file_handler", types.SimpleNamespace(handler=fake_handler))
+    monkeypatch.setitem(sys.modules, "handlers.file_handler", types.SimpleNamespace(handler=fake_handler))
     ctx = FakeCtx({"DFA_FUNCTION_NAME": "file"})
     resp = dispatcher.dispatch(ctx, None)
     assert isinstance(resp, DummyResponse)
@@ -309,6 +362,29 @@ def test_dispatcher_missing_function_name_returns_400(monkeypatch):
     assert "not set" in resp.response_data.get("error", "").lower()
 
 
+def test_dispatcher_imports_only_the_selected_handler():
+    import subprocess
+
+    probe = (
+        "import sys\n"
+        "import handlers.dispatcher as dispatcher\n"
+        "before = sorted(m for m in sys.modules if m.startswith(('handlers.', 'dfa.', 'oci', 'oracledb')))\n"
+        "dispatcher.resolve_handler('file')\n"
+        "after = [m for m in sys.modules if m.startswith('handlers.')]\n"
+        "print(before, sorted(after))\n"
+    )
+    src_dir = os.path.join(os.path.dirname(__file__), "..", "src")
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        env={**os.environ, "PYTHONPATH": os.path.abspath(src_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "['handlers.dispatcher'] ['handlers.dispatcher', 'handlers.file_handler']"
+    assert dispatcher.resolve_handler("does_not_exist") is None
+
+
 # 4) FileTransformer chunking behavior and jsonl detection
 from dfa.etl.file_transformer import FileTransformer
 
@@ -387,3 +463,86 @@ def test_file_transformer_jsonl_detection(monkeypatch):
     # Should have set object type and one raw event
     assert t.get_event_object_type() == "PERMISSION"
     assert isinstance(t._raw_events, list) and len(t._raw_events) == 1  # type: ignore[attr-defined]
+
+
+def test_oci_client_registry_shares_signer_and_clients_across_helpers(monkeypatch):
+    import common.ocihelpers.clients as clients_mod
+    from common.ocihelpers.storage import BaseObjectStorage
+
+    signer_calls = []
+    client_calls = []
+
+    class FakeObjectStorageClient:
+        def __init__(self, **kwargs):
+            client_calls.append(kwargs)
+
+    monkeypatch.setenv("DFA_SIGNER_TYPE", "resource")
+    monkeypatch.setattr(
+        clients_mod.oci.auth.signers,
+        "get_resource_principals_signer",
+        lambda: signer_calls.append(1) or SimpleNamespace(),
+    )
+    monkeypatch.setattr(clients_mod.oci.object_storage, "ObjectStorageClient", FakeObjectStorageClient)
+    registry = clients_mod.OciClientRegistry()
+    monkeypatch.setattr("common.ocihelpers.storage.OCI_CLIENT_REGISTRY", registry)
+
+    first = BaseObjectStorage()._get_client()
+    second = BaseObjectStorage()._get_client()
+
+    assert first is second
+    assert len(signer_calls) == 1
+    assert len(client_calls) == 1
+    assert registry.stats() == {
+        "signer_creations": 1,
+        "client_creations": 1,
+        "client_reuses": 1,
+        "token_refreshes": 0,
+    }
+
+
+def test_oci_client_registry_keys_clients_by_service_endpoint(monkeypatch):
+    import common.ocihelpers.clients as clients_mod
+
+    class FakeStreamClient:
+        def __init__(self, **kwargs):
+            self.service_endpoint = kwargs["service_endpoint"]
+
+    registry = clients_mod.OciClientRegistry()
+    signer = object()
+    first = registry.get_client(FakeStreamClient, config={}, signer=signer, service_endpoint="https://a")
+    second = registry.get_client(FakeStreamClient, config={}, signer=signer, service_endpoint="https://b")
+
+    assert first is not second
+    assert registry.get_client(FakeStreamClient, config={}, signer=signer, service_endpoint="https://a") is first
+    assert registry.stats()["client_creations"] == 2
+
+
+def test_oci_client_registry_refreshes_expiring_session_token(monkeypatch):
+    import common.ocihelpers.clients as clients_mod
+
+    class FakeToken:
+        def __init__(self, valid):
+            self.valid = valid
+
+        def valid_with_jitter(self, jitter):
+            return self.valid
+
+    class FakeSigner:
+        def __init__(self):
+            self.security_token = FakeToken(valid=False)
+            self.refreshes = 0
+
+        def refresh_security_token(self):
+            self.refreshes += 1
+            self.security_token = FakeToken(valid=True)
+
+    signer = FakeSigner()
+    monkeypatch.setenv("DFA_SIGNER_TYPE", "resource")
+    monkeypatch.setattr(clients_mod.oci.auth.signers, "get_resource_principals_signer", lambda: signer)
+    registry = clients_mod.OciClientRegistry()
+
+    assert registry.get_signer() is signer
+    assert registry.get_signer() is signer
+
+    assert signer.refreshes == 1
+    assert registry.stats()["token_refreshes"] == 1
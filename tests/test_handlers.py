@@ -216,3 +216,76 @@ def test_stream_handler_rolls_back_and_closes_adw_on_load_failure(monkeypatch):
         stream_handler.handler(ctx, data)
 
     cleanup.assert_called_once()
+
+
+def test_file_handler_uses_pipeline_when_configured(monkeypatch):
+    monkeypatch.setattr(file_handler, "bootstrap_base_environment_variables", lambda cfg: None)
+    monkeypatch.setenv("DFA_PIPELINE_MODE", "thread")
+
+    created = []
+
+    class DummyFileTransformer:
+        def __init__(self, namespace, bucket, object_name, is_timeseries: bool = False):
+            created.append(self)
+
+        def extract_data(self):
+            raise AssertionError("sequential extract should not run in pipeline mode")
+
+    runs = []
+
+    class DummyPipeline:
+        def __init__(self, transformer, mode):
+            runs.append((transformer, mode))
+
+        def run(self):
+            return None
+
+    monkeypatch.setattr(file_handler, "FileTransformer", DummyFileTransformer)
+    monkeypatch.setattr(file_handler, "FilePipeline", DummyPipeline)
+
+    body = {
+        "data": {
+            "resourceName": "obj.jsonl",
+            "additionalDetails": {"bucketName": "b", "namespace": "ns"},
+        }
+    }
+    file_handler.handler(FakeCtx({}), io.BytesIO(json.dumps(body).encode("utf-8")))
+
+    assert runs == [(created[0], "thread")]
+
+
+def test_bulk_file_handler_runs_bulk_ingest_for_prefix(monkeypatch):
+    import handlers.bulk_file_handler as bulk_file_handler
+
+    monkeypatch.setattr(bulk_file_handler, "bootstrap_base_environment_variables", lambda cfg: None)
+    captured = {}
+
+    class DummyBulkFileIngest:
+        def __init__(self, namespace, bucket_name, prefix, **kwargs):
+            captured.update(namespace=namespace, bucket_name=bucket_name, prefix=prefix, **kwargs)
+
+        def run(self):
+            return types.SimpleNamespace(objects_failed=0, objects_listed=3)
+
+    monkeypatch.setattr(bulk_file_handler, "BulkFileIngest", DummyBulkFileIngest)
+
+    body = {"namespace": "ns", "bucketName": "b", "prefix": "snapshots/", "loaderConnections": 4}
+    bulk_file_handler.handler(FakeCtx({}), io.BytesIO(json.dumps(body).encode("utf-8")))
+
+    assert captured["prefix"] == "snapshots/"
+    assert captured["loader_connections"] == 4
+    assert captured["is_timeseries"] is False
+
+
+def test_bulk_file_handler_rejects_invalid_worker_counts(monkeypatch):
+    import handlers.bulk_file_handler as bulk_file_handler
+
+    monkeypatch.setattr(bulk_file_handler, "bootstrap_base_environment_variables", lambda cfg: None)
+    monkeypatch.setattr(bulk_file_handler, "BulkFileIngest", lambda *args, **kwargs: pytest.fail("ingest started"))
+
+    for field_name, value in (("downloadWorkers", "4"), ("loaderConnections", 0), ("downloadWorkers", -2)):
+        body = {"namespace": "ns", "bucketName": "b", "prefix": "snapshots/", field_name: value}
+        with pytest.raises(Exception, match="Bulk file handler exception") as raised:
+            bulk_file_handler.handler(FakeCtx({}), io.BytesIO(json.dumps(body).encode("utf-8")))
+        assert isinstance(raised.value.__cause__, ValueError)
+        assert field_name in str(raised.value.__cause__)
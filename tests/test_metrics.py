@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from common.metrics.metrics import (
+    METRICS,
+    HttpBatchSink,
+    InMemorySink,
+    JsonLogSink,
+    MetricsRegistry,
+    build_sinks_from_env,
+)
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.resource import ResourceStateUpdateQueryBuilder
+from dfa.adw.tables.resource import ResourceStateTable
+
+
+def test_registry_aggregates_counters_and_histograms_by_tags():
+    registry = MetricsRegistry(sinks=[])
+    registry.increment("rows_out", 3, entity="IDENTITY", operation="CREATE")
+    registry.increment("rows_out", 2, entity="IDENTITY", operation="CREATE")
+    registry.increment("rows_out", 7, entity="POLICY", operation="CREATE")
+    registry.observe("execute_seconds", 0.5, table="T")
+    registry.observe("execute_seconds", 1.5, table="T")
+
+    assert registry.counter_value("rows_out", entity="IDENTITY") == 5
+    assert registry.counter_value("rows_out", operation="CREATE") == 12
+    histogram = registry.snapshot()["histograms"][0]
+    assert histogram == {
+        "name": "execute_seconds",
+        "tags": {"table": "T"},
+        "count": 2,
+        "sum": 2.0,
+        "min": 0.5,
+        "max": 1.5,
+    }
+
+
+def test_flush_sends_payload_to_sinks_and_resets():
+    sink = InMemorySink()
+    registry = MetricsRegistry(sinks=[sink])
+    registry.increment("bytes_downloaded", 1024)
+
+    registry.flush(function="file")
+    registry.flush(function="file")
+
+    assert len(sink.payloads) == 1
+    assert sink.payloads[0]["function"] == "file"
+    assert sink.payloads[0]["counters"] == [{"name": "bytes_downloaded", "tags": {}, "value": 1024}]
+    assert registry.snapshot() == {"counters": [], "histograms": []}
+
+
+def test_invocation_flushes_and_counts_failures():
+    sink = InMemorySink()
+    registry = MetricsRegistry(sinks=[sink])
+
+    with pytest.raises(ValueError):
+        with registry.invocation("stream"):
+            registry.increment("rows_in", 4)
+            raise ValueError("boom")
+
+    payload = sink.payloads[0]
+    counters = {counter["name"]: counter["value"] for counter in payload["counters"]}
+    assert payload["function"] == "stream"
+    assert counters == {"invocation_failures": 1, "rows_in": 4}
+    assert payload["histograms"][0]["name"] == "invocation_seconds"
+
+
+def test_http_batch_sink_posts_full_batches_and_remainder_on_close():
+    posted = []
+    sink = HttpBatchSink("http://collector.local/metrics", batch_size=2, post=lambda *args: posted.append(args))
+
+    for index in range(3):
+        sink.emit({"index": index})
+    assert len(posted) == 1
+    sink.close()
+
+    assert [json.loads(body) for _, body, _ in posted] == [[{"index": 0}, {"index": 1}], [{"index": 2}]]
+    assert posted[0][0] == "http://collector.local/metrics"
+
+
+def test_http_batch_sink_swallows_post_failures():
+    def failing_post(*_):
+        raise OSError("connection refused")
+
+    sink = HttpBatchSink("http://collector.local/metrics", batch_size=1, post=failing_post)
+
+    sink.emit({"index": 0})
+
+
+def test_sinks_are_built_from_environment(monkeypatch):
+    monkeypatch.setenv("DFA_METRICS_SINKS", "log, http, memory")
+    monkeypatch.setenv("DFA_METRICS_ENDPOINT", "http://collector.local/metrics")
+    monkeypatch.setenv("DFA_METRICS_BATCH_SIZE", "5")
+
+    sinks = build_sinks_from_env()
+
+    assert [type(sink) for sink in sinks] == [JsonLogSink, HttpBatchSink, InMemorySink]
+    assert sinks[1].batch_size == 5
+
+    monkeypatch.delenv("DFA_METRICS_ENDPOINT")
+    monkeypatch.setenv("DFA_METRICS_SINKS", "http")
+    assert build_sinks_from_env() == []
+
+
+def test_query_builder_records_load_metrics(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    table_name = ResourceStateTable().get_table_name()
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    event = {
+        "id": "res-0",
+        "resource_name": "bucket",
+        "tenancy_id": "tenancy-1",
+        "service_instance_id": "si-1",
+        "event_timestamp": "2025-01-01T00:00:00.000+00:00",
+    }
+    key_store.seed(table_name, [event])
+    AdwConnection.install_connection(RecordingConnection(key_store))
+    METRICS.reset()
+    try:
+        ResourceStateUpdateQueryBuilder([event, {**event, "id": "res-1"}]).execute_sql_for_events()
+
+        assert METRICS.counter_value("rows_bound", table=table_name, operation="insert") == 2
+        assert METRICS.counter_value("rows_bound", table=table_name, operation="update") == 1
+        assert METRICS.counter_value("update_fallback_rows", table=table_name) == 1
+        assert METRICS.counter_value("batch_errors", code="ORA-00001") == 1
+        assert METRICS.counter_value("db_round_trips", call="executemany") == 2
+        assert METRICS.counter_value("db_round_trips", call="commit") == 2
+    finally:
+        METRICS.reset()
+        AdwConnection.close()
@@ -0,0 +1,128 @@
+# Copyright (c) 2025, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/.
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from common.ocihelpers.secret_cache import SecretCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr("common.ocihelpers.secret_cache.monotonic", clock)
+    monkeypatch.setenv("DFA_SECRET_CACHE_TTL_SECONDS", "100")
+    monkeypatch.setenv("DFA_SECRET_REFRESH_AHEAD_SECONDS", "20")
+    return clock
+
+
+def test_get_reuses_value_until_ttl_expires(clock):
+    cache = SecretCache()
+    values = iter(["first", "second"])
+
+    assert cache.get("key", lambda: next(values)) == "first"
+    clock.now += 50
+    assert cache.get("key", lambda: next(values)) == "first"
+    clock.now += 60
+    assert cache.get("key", lambda: next(values)) == "second"
+
+
+def test_get_returns_cached_value_and_refreshes_ahead_of_expiry(clock):
+    cache = SecretCache()
+    refreshed = threading.Event()
+
+    def refresh():
+        refreshed.set()
+        return "rotated"
+
+    cache.get("key", lambda: "original")
+    clock.now += 85
+    assert cache.get("key", refresh) == "original"
+
+    assert refreshed.wait(5)
+    cache._get_executor().shutdown(wait=True)
+    assert cache.get("key", lambda: "unused") == "rotated"
+
+
+def test_zero_ttl_keeps_values_until_invalidated(clock, monkeypatch):
+    monkeypatch.setenv("DFA_SECRET_CACHE_TTL_SECONDS", "0")
+    cache = SecretCache()
+
+    cache.get("key", lambda: "first")
+    clock.now += 10**9
+    assert cache.get("key", lambda: "second") == "first"
+
+    cache.invalidate("key")
+    assert "key" not in cache
+    assert cache.get("key", lambda: "second") == "second"
+
+
+def test_concurrent_gets_share_one_fetch(clock):
+    cache = SecretCache()
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("key", slow_loader))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+
+
+def test_failed_fetch_is_not_cached(clock):
+    cache = SecretCache()
+
+    with pytest.raises(RuntimeError):
+        cache.get("key", lambda: (_ for _ in ()).throw(RuntimeError("vault unavailable")))
+
+    assert cache.get("key", lambda: "value") == "value"
+
+
+def test_prefetch_fetches_missing_keys_concurrently(clock):
+    cache = SecretCache(max_workers=3)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def loader(value):
+        # Every loader must be running at once to get past the barrier.
+        barrier.wait()
+        return value
+
+    cache.get("cached", lambda: "already")
+    with patch.object(cache, "_load", wraps=cache._load) as mock_load:
+        futures = cache.prefetch(
+            {
+                "cached": lambda: "unused",
+                "a": lambda: loader("a"),
+                "b": lambda: loader("b"),
+                "c": lambda: loader("c"),
+            }
+        )
+
+    assert {key: future.result() for key, future in futures.items()} == {
+        "cached": "already",
+        "a": "a",
+        "b": "b",
+        "c": "c",
+    }
+    assert mock_load.call_count == 3
+    assert all(key in cache for key in ("a", "b", "c"))
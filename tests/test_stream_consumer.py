@@ -0,0 +1,200 @@
+import base64
+import json
+import threading
+from types import SimpleNamespace
+
+import oci
+import pytest
+
+from common.ocihelpers.stream import DataEnablementStream
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection
+from dfa.adw.query_builders.base_query_builder import StreamOffsetTrackerQueryBuilder
+from dfa.adw.schema_readiness import SCHEMA_READINESS
+from dfa.adw.tables.base_table import BaseTable, StreamOffsetTrackerTable
+
+
+def _message(offset, message_type="IDENTITY", operation="CREATE"):
+    payload = json.dumps({"headers": {"messageType": message_type, "operation": operation}, "data": "{}"})
+    return SimpleNamespace(offset=offset, value=base64.b64encode(base64.b64encode(payload.encode())).decode())
+
+
+class FakeStreamClient:
+    """Serves ``pages[partition][page]`` for cursors named ``<partition>:<page>``."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.cursors = []
+        self.reads = []
+        self._lock = threading.Lock()
+
+    def create_cursor(self, stream_id, create_cursor_details):
+        with self._lock:
+            self.cursors.append(
+                (create_cursor_details.partition, create_cursor_details.type, create_cursor_details.offset)
+            )
+        return SimpleNamespace(data=SimpleNamespace(value=f"{create_cursor_details.partition}:0"))
+
+    def get_messages(self, stream_id, cursor, limit):
+        partition, page = cursor.split(":")
+        with self._lock:
+            self.reads.append((cursor, threading.current_thread().name))
+        pages = self.pages.get(partition, [])
+        messages = pages[int(page)] if int(page) < len(pages) else []
+        return SimpleNamespace(data=list(messages), headers={"opc-next-cursor": f"{partition}:{int(page) + 1}"})
+
+
+@pytest.fixture(autouse=True)
+def _stream_environment(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    monkeypatch.setenv("DFA_SIGNER_TYPE", "resource")
+    monkeypatch.setenv("DFA_STREAM_ID", "ocid1.stream.oc1..aaaa")
+    monkeypatch.setenv("DFA_STREAM_SERVICE_ENDPOINT", "https://example.com")
+    monkeypatch.setenv("AUDIT_FILE_SIZE", "100")
+    monkeypatch.setenv("DFA_STREAM_PARTITIONS", "3")
+    StreamOffsetTrackerTable._ensured_partition_columns.clear()
+    BaseTable._ensured_index_names.clear()
+    SCHEMA_READINESS.reset()
+    yield
+    AdwConnection.close()
+
+
+TRACKER_KEY = ["APPLICATION", "STREAM_PARTITION", "START_OFFSET"]
+
+
+def _stream(pages, **kwargs):
+    connection = RecordingConnection(FakeKeyStore({"STREAM_OFFSET_TRACKER": TRACKER_KEY}), **kwargs)
+    AdwConnection.install_connection(connection)
+    stream = DataEnablementStream("dfa_identity_transformer")
+    stream._stream_client = FakeStreamClient(pages)
+    return stream, connection
+
+
+def test_hydrate_reads_every_partition_concurrently_and_tracks_a_range_per_partition():
+    stream, connection = _stream({"0": [[_message(5), _message(6)]], "2": [[_message(40)]]})
+
+    events = stream.get_unsorted_latest_events()
+
+    assert sorted(message.offset for message in events) == [5, 6, 40]
+    assert {partition for partition, _, _ in stream._stream_client.cursors} == {"0", "1", "2"}
+    assert all(name.startswith("dfa-stream-partition") for _, name in stream._stream_client.reads[:3])
+    ranges = connection.key_store.rows["STREAM_OFFSET_TRACKER"]
+    assert sorted((key[1], row["START_OFFSET"], row["END_OFFSET"]) for key, row in ranges.items()) == [
+        ("0", 5, 6),
+        ("2", 40, 40),
+    ]
+    assert all(key[0] == "dfa_identity_transformer" for key in ranges)
+
+
+def test_next_pages_are_prefetched_and_reused_after_completion():
+    stream, connection = _stream({"0": [[_message(1)], [_message(2)]], "1": [[_message(10)]]})
+
+    processed = []
+    batches = stream.consume(lambda sorted_messages: processed.append(sorted_messages), max_batches=5)
+
+    assert batches == 2
+    assert [len(batch["IDENTITY"]["CREATE"]) for batch in processed] == [2, 1]
+    # Cursors are only created for the first read; later pages come from the returned next cursors.
+    assert len(stream._stream_client.cursors) == 3
+    assert [cursor for cursor, _ in stream._stream_client.reads].count("0:1") == 1
+    ranges = connection.key_store.rows["STREAM_OFFSET_TRACKER"]
+    assert len(ranges) == 3 and all(row.get("END_DATE") is not None for row in ranges.values())
+    merges = [
+        statement.split()[0] for statement in connection.statements("execute") if "CHECKPOINT_OFFSET" in statement
+    ]
+    assert merges == ["MERGE", "DELETE"]
+
+
+def test_consume_stops_after_max_batches_without_reading_ahead(monkeypatch):
+    monkeypatch.setenv("DFA_STREAM_MAX_BATCHES", "1")
+    stream, _ = _stream({"0": [[_message(1)], [_message(2)]]})
+
+    assert stream.consume(lambda sorted_messages: None) == 1
+    assert [cursor for cursor, _ in stream._stream_client.reads if cursor.startswith("0:")] == ["0:0"]
+    assert stream._prefetched_pages is None and stream._prefetch_executor is None
+
+
+def test_consume_drops_the_prefetch_when_a_batch_fails():
+    stream, _ = _stream({"0": [[_message(1)], [_message(2)]]})
+
+    def fail(sorted_messages):
+        raise RuntimeError("load failed")
+
+    with pytest.raises(RuntimeError, match="load failed"):
+        stream.consume(fail, max_batches=5)
+
+    assert stream._prefetched_pages is None and stream._prefetch_executor is None
+
+
+def test_lost_offset_falls_back_to_the_trim_horizon():
+    stream, _ = _stream({"0": [[_message(1)]]})
+    client = stream._stream_client
+    create_cursor = client.create_cursor
+
+    def create_cursor_or_fail(stream_id, create_cursor_details):
+        if create_cursor_details.type == oci.streaming.models.CreateCursorDetails.TYPE_AFTER_OFFSET:
+            raise oci.exceptions.ServiceError(400, "InvalidParameter", {}, "offset trimmed")
+        return create_cursor(stream_id, create_cursor_details)
+
+    client.create_cursor = create_cursor_or_fail
+
+    assert [message.offset for message in stream.get_unsorted_latest_events()] == [1]
+    assert {cursor_type for _, cursor_type, _ in client.cursors} == {"TRIM_HORIZON"}
+
+
+def test_partition_column_is_added_to_existing_tracker_once():
+    stream, connection = _stream({})
+
+    stream.hydrate()
+    stream.hydrate()
+
+    alters = [statement for statement in connection.statements("execute") if statement.startswith("ALTER TABLE")]
+    assert alters == ["ALTER TABLE DFA.STREAM_OFFSET_TRACKER ADD (STREAM_PARTITION VARCHAR2(20) DEFAULT '0')"]
+
+
+def test_tracker_statements_bind_every_value():
+    query_builder = StreamOffsetTrackerQueryBuilder()
+
+    statements = [
+        query_builder.get_statement_for_select_max_offset_for_transformer("app'1", "3"),
+        query_builder.get_insert_statement_for_stream_offset(7, 9, "app'1", "3"),
+        query_builder.get_statement_for_latest_unfinished_stream_offset_range("app'1", "3"),
+        query_builder.get_statement_for_offset_range_completion(7, 9, "app'1", "3"),
+        *query_builder.get_statements_for_offset_compaction("app'1"),
+    ]
+
+    for statement, binds in statements:
+        assert "app'1" not in statement and "TO_DATE" not in statement
+        assert binds["APPLICATION"] == "app'1"
+        assert all(f":{name}" in statement for name in binds)
+    assert '"ID"' not in statements[0][0] and 'ORDER BY "END_OFFSET" DESC' in statements[0][0]
+
+
+def test_existing_tracker_is_deduplicated_before_its_key_is_added():
+    stream, connection = _stream(
+        {}, query_results={"CONSTRAINT_NAME = :CONSTRAINT_NAME": [(0,)], "INDEX_NAME = :INDEX_NAME": [(0,)]}
+    )
+
+    stream.hydrate()
+
+    statements = [" ".join(statement.split()) for statement in connection.statements("execute")]
+    ddl = [statement for statement in statements if statement.startswith(("ALTER", "CREATE", "DELETE"))]
+    assert [statement.split(" (")[0] for statement in ddl] == [
+        "ALTER TABLE DFA.STREAM_OFFSET_TRACKER ADD",
+        "CREATE INDEX DFA.DFA_SOT_END_OFFSET_IDX ON DFA.STREAM_OFFSET_TRACKER",
+        'DELETE FROM DFA.STREAM_OFFSET_TRACKER WHERE "APPLICATION" IS NULL OR "OFFSET" IS NULL OR ROWID IN',
+        'ALTER TABLE DFA.STREAM_OFFSET_TRACKER ADD CONSTRAINT "PK_STREAM_OFFSET_TRACKER" PRIMARY KEY',
+    ]
+
+
+def test_compaction_keeps_an_expired_unfinished_range_below_the_checkpoint():
+    _, delete = StreamOffsetTrackerQueryBuilder().get_statements_for_offset_compaction("app")
+    statement = " ".join(delete[0].split())
+    completed, unfinished = statement.split(' OR ( t."END_DATE" IS NULL')
+
+    # An expired unfinished range below the checkpoint only goes once a completed range re-read all of it.
+    assert 't."END_DATE" IS NOT NULL AND t."END_OFFSET" <= ( SELECT p."END_OFFSET"' in completed
+    assert "START_DATE" not in completed
+    assert 't."START_DATE" < :START_DATE' in unfinished and "EXISTS" in unfinished
+    assert 'c."END_DATE" IS NOT NULL AND c."OFFSET" <= t."OFFSET" AND c."END_OFFSET" >= t."END_OFFSET"' in unfinished
+    assert 'c."OFFSET" <> :CHECKPOINT_OFFSET' in unfinished
@@ -0,0 +1,138 @@
+import json
+
+import pytest
+
+from common.tracing.tracing import (
+    NOOP_SPAN,
+    TRACER,
+    FileSpanExporter,
+    HttpSpanExporter,
+    InMemorySpanExporter,
+    Tracer,
+    build_exporters_from_env,
+    sql_fingerprint,
+)
+from dfa.adw.connection import AdwConnection
+from dfa.adw.fake_connection import FakeKeyStore, RecordingConnection, unique_keys_for_tables
+from dfa.adw.query_builders.resource import ResourceStateUpdateQueryBuilder
+from dfa.adw.tables.resource import ResourceStateTable
+
+
+def _attributes(span):
+    return {attribute["key"]: next(iter(attribute["value"].values())) for attribute in span["attributes"]}
+
+
+def test_nested_spans_are_exported_once_per_trace_in_otlp_shape():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporters=[exporter], sample_rate=1)
+
+    with tracer.trace("invocation", function="file"):
+        with tracer.span("transformer.transform", entity="IDENTITY") as span:
+            span.set_attribute("rows", 3)
+        assert exporter.documents == []
+
+    assert len(exporter.documents) == 1
+    resource = exporter.documents[0]["resourceSpans"][0]
+    assert _attributes(resource["resource"]) == {"service.name": "dfa"}
+    child, root = exporter.spans()
+    assert root["name"] == "invocation" and "parentSpanId" not in root
+    assert child["parentSpanId"] == root["spanId"]
+    assert child["traceId"] == root["traceId"]
+    assert _attributes(child) == {"entity": "IDENTITY", "rows": "3"}
+    assert int(child["startTimeUnixNano"]) <= int(child["endTimeUnixNano"])
+
+
+def test_failed_span_records_error_status():
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporters=[exporter], sample_rate=1)
+
+    with pytest.raises(ValueError):
+        with tracer.trace("invocation"):
+            raise ValueError("boom")
+
+    assert exporter.spans()[0]["status"] == {"code": 2, "message": "ValueError: boom"}
+
+
+def test_unsampled_or_unconfigured_tracer_returns_noop_spans():
+    exporter = InMemorySpanExporter()
+
+    assert Tracer(exporters=[exporter], sample_rate=0).trace("invocation") is NOOP_SPAN
+    assert Tracer(exporters=[], sample_rate=1).trace("invocation") is NOOP_SPAN
+    assert Tracer(exporters=[exporter], sample_rate=1).span("orphan") is NOOP_SPAN
+    assert exporter.documents == []
+
+
+def test_spans_over_the_limit_are_dropped_and_counted(monkeypatch):
+    monkeypatch.setenv("DFA_TRACE_MAX_SPANS", "3")
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporters=[exporter], sample_rate=1)
+
+    with tracer.trace("invocation"):
+        for index in range(5):
+            with tracer.span("chunk", index=index):
+                pass
+
+    spans = exporter.spans()
+    assert [span["name"] for span in spans] == ["chunk", "chunk", "invocation"]
+    assert _attributes(spans[-1])["dfa.dropped_spans"] == "3"
+
+
+def test_file_and_http_exporters(tmp_path, monkeypatch):
+    trace_file = tmp_path / "traces.jsonl"
+    posted = []
+    tracer = Tracer(
+        exporters=[
+            FileSpanExporter(str(trace_file)),
+            HttpSpanExporter("http://collector.local/v1/traces", post=lambda *args: posted.append(args)),
+        ],
+        sample_rate=1,
+    )
+
+    for _ in range(2):
+        with tracer.trace("invocation"):
+            pass
+
+    lines = trace_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["name"] == "invocation"
+    assert [endpoint for endpoint, _, _ in posted] == ["http://collector.local/v1/traces"] * 2
+
+    monkeypatch.setenv("DFA_TRACE_FILE", str(trace_file))
+    monkeypatch.setenv("DFA_TRACE_ENDPOINT", "http://collector.local/v1/traces")
+    assert [type(exporter) for exporter in build_exporters_from_env()] == [FileSpanExporter, HttpSpanExporter]
+
+
+def test_sql_fingerprint_ignores_literals_and_whitespace():
+    assert sql_fingerprint("SELECT * FROM T WHERE ID = 'a' AND N = 1") == sql_fingerprint(
+        "select *\n  from t where id = 'b' and n = 22"
+    )
+    assert sql_fingerprint("SELECT * FROM T") != sql_fingerprint("SELECT * FROM U")
+
+
+def test_query_builder_spans_carry_statement_fingerprints(monkeypatch):
+    monkeypatch.setenv("DFA_ADW_DFA_SCHEMA", "DFA")
+    key_store = FakeKeyStore(unique_keys_for_tables(ResourceStateTable()))
+    event = {
+        "id": "res-0",
+        "resource_name": "bucket",
+        "tenancy_id": "tenancy-1",
+        "service_instance_id": "si-1",
+        "event_timestamp": "2025-01-01T00:00:00.000+00:00",
+    }
+    key_store.seed(ResourceStateTable().get_table_name(), [event])
+    AdwConnection.install_connection(RecordingConnection(key_store))
+    exporter = InMemorySpanExporter()
+    TRACER.configure([exporter], 1)
+    try:
+        with TRACER.trace("invocation", function="test"):
+            ResourceStateUpdateQueryBuilder([event, {**event, "id": "res-1"}]).execute_sql_for_events()
+    finally:
+        TRACER.configure(None, None)
+        AdwConnection.close()
+
+    spans = exporter.spans()
+    executemany_spans = [_attributes(span) for span in spans if span["name"] == "adw.executemany"]
+    assert [span["db.operation"] for span in executemany_spans] == ["INSERT", "UPDATE"]
+    assert executemany_spans[0]["batch_errors"] == "1"
+    assert len(executemany_spans[0]["db.statement.fingerprint"]) == 16
+    assert {"adw.bind", "adw.update_fallback", "adw.commit"} <= {span["name"] for span in spans}